@@ -0,0 +1,91 @@
+"""Compare two benchmark result files and flag regressions.
+
+Compares median latency for queries and time/peak memory for loads, for every
+benchmark present in both runs. Exits non-zero when any metric regressed by
+more than the threshold, so it can gate CI.
+
+Usage:
+    python benchmarks/compare.py benchmarks/results/<base>.json benchmarks/results/<head>.json
+    python benchmarks/compare.py base.json head.json --threshold 0.25
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Metric compared per benchmark kind
+METRICS = {
+    "load": ["seconds", "peak_kib"],
+    "query": ["median_ms"],
+}
+
+# Timings below this many milliseconds are too noisy to flag
+MIN_SIGNIFICANT_MS = 0.05
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any]) -> List[Tuple[str, str, float, float, float]]:
+    """
+    Relative change of each shared metric between two runs.
+
+    Returns:
+        Rows of (benchmark, metric, base value, head value, relative change),
+        largest regressions first
+    """
+    rows = []
+    for name, head_result in head["benchmarks"].items():
+        base_result = base["benchmarks"].get(name)
+        if not base_result or base_result["kind"] != head_result["kind"]:
+            continue
+        for metric in METRICS[head_result["kind"]]:
+            before, after = base_result.get(metric), head_result.get(metric)
+            if not before or after is None:
+                continue
+            rows.append((name, metric, before, after, (after - before) / before))
+    rows.sort(key=lambda row: row[4], reverse=True)
+    return rows
+
+
+def _is_regression(metric: str, after: float, change: float, threshold: float) -> bool:
+    if change <= threshold:
+        return False
+    in_ms = after * 1000 if metric == "seconds" else after
+    return metric == "peak_kib" or in_ms >= MIN_SIGNIFICANT_MS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs")
+    parser.add_argument("base", type=Path, help="Result file of the baseline commit")
+    parser.add_argument("head", type=Path, help="Result file of the commit under test")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown treated as a regression")
+    args = parser.parse_args()
+
+    base = json.loads(args.base.read_text())
+    head = json.loads(args.head.read_text())
+    print(f"Base {base['commit'][:10]} (scale {base['scale']})  ->  head {head['commit'][:10]} (scale {head['scale']})")
+    if base["scale"] != head["scale"]:
+        print("⚠ Runs used different fixture scales; changes are not comparable")
+
+    regressions = 0
+    for name, metric, before, after, change in compare(base, head):
+        flag = ""
+        if _is_regression(metric, after, change, args.threshold):
+            flag = "  ✗ regression"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "  ✓ faster" if metric != "peak_kib" else "  ✓ smaller"
+        print(f"  {name:<55} {metric:<10} {before:>12,.3f} -> {after:>12,.3f}  {change:+7.1%}{flag}")
+
+    missing = sorted(set(base["benchmarks"]) - set(head["benchmarks"]))
+    if missing:
+        print(f"\nMissing from head: {', '.join(missing)}")
+
+    if regressions:
+        print(f"\n{regressions} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
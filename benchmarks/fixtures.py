@@ -0,0 +1,276 @@
+"""Build size-scaled benchmark fixtures from the recorded samples in ``samples/``.
+
+The samples are small excerpts in the exact formats the clients download:
+contracts/grants/contributions CSVs, the lobbying registry exports, a Hansard
+sitting and the petitions feed as XML, and OpenParliament JSON listings.
+``build_fixtures(scale)`` replicates each sample ``scale`` times into a cache
+directory laid out like the clients' own caches, so a client pointed at it
+with ``cache_dir=`` loads it without touching the network.
+
+Every copy after the first gets fresh ids, shifted dates, jittered amounts
+and a name suffix drawn from a bounded pool, so searches stay selective and
+aggregations see a realistic (sub-linear) number of distinct entities.
+Output is deterministic for a given scale.
+"""
+
+import copy
+import csv
+import json
+import random
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from xml.etree import ElementTree as ET
+
+SAMPLES_DIR = Path(__file__).resolve().parent / "samples"
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "benchmarks"
+
+# Distinct name suffixes per entity, so top-N aggregations have bounded cardinality
+NAME_VARIANTS = 50
+
+# Years a copy's dates may be shifted back by
+YEAR_SPREAD = 6
+
+# Which columns of each CSV are ids, entity names, amounts and dates
+CONTRACT_COLUMNS = {
+    "ids": ["reference_number", "procurement_id"],
+    "names": ["vendor_name"],
+    "amounts": ["contract_value", "original_value", "amendment_value"],
+    "dates": ["contract_date", "delivery_date"],
+}
+GRANT_COLUMNS = {
+    "ids": ["ref_number"],
+    "names": ["recipient_legal_name"],
+    "amounts": ["agreement_value"],
+    "dates": ["agreement_date", "expected_start_date", "expected_end_date"],
+}
+CONTRIBUTION_COLUMNS = {
+    "ids": ["Recipient ID"],
+    "names": ["Contributor name"],
+    "amounts": ["Contribution amount"],
+    "dates": ["Contribution date", "Fiscal year"],
+}
+REGISTRATION_COLUMNS = {
+    "ids": ["REG_ID_ENR"],
+    "names": ["EN_CLIENT_ORG_CORP_NM_AN"],
+    "amounts": [],
+    "dates": ["EFFECTIVE_DATE_VIGUEUR", "END_DATE_FIN", "POSTED_DATE_PUBLICATION"],
+}
+COMMUNICATION_COLUMNS = {
+    "ids": ["COMLOG_ID"],
+    "names": ["EN_CLIENT_ORG_CORP_NM_AN"],
+    "amounts": [],
+    "dates": ["COMM_DATE", "SUBMISSION_DATE_SOUMISSION", "POSTED_DATE_PUBLICATION"],
+}
+
+# Lobbying child exports only need their foreign key renumbered
+LOBBYING_EXPORTS = {
+    "registrations": (
+        "Registration_PrimaryExport.csv",
+        REGISTRATION_COLUMNS,
+        ["Registration_SubjectMatterDetailsExport.csv", "Registration_GovernmentInstExport.csv"],
+    ),
+    "communications": (
+        "Communication_PrimaryExport.csv",
+        COMMUNICATION_COLUMNS,
+        ["Communication_DpohExport.csv", "Communication_SubjectMatterDetailsExport.csv"],
+    ),
+}
+
+OPENPARLIAMENT_LISTINGS = ["debates", "politicians", "votes"]
+
+
+def _shift_year(value: str, years: int) -> str:
+    """Move a ``YYYY...`` date (or bare year) back by ``years``."""
+    if not value or len(value) < 4 or not value[:4].isdigit():
+        return value
+    return f"{int(value[:4]) - years}{value[4:]}"
+
+
+def _scale_amount(value: str, factor: float) -> str:
+    if not value:
+        return value
+    try:
+        amount = float(value.replace(",", "").replace("$", ""))
+    except ValueError:
+        return value
+    return f"{amount * factor:,.2f}"
+
+
+def _vary_row(row: Dict[str, str], copy_index: int, columns: Dict[str, List[str]], rng: random.Random) -> Dict[str, str]:
+    """Copy ``copy_index`` of a sample row (copy 0 is the sample itself)."""
+    if copy_index == 0:
+        return dict(row)
+    row = dict(row)
+    years = copy_index % YEAR_SPREAD
+    factor = rng.uniform(0.5, 1.5)
+    for column in columns["ids"]:
+        if row.get(column):
+            row[column] = f"{row[column]}-{copy_index}"
+    for column in columns["names"]:
+        if row.get(column):
+            row[column] = f"{row[column]} {copy_index % NAME_VARIANTS}"
+    for column in columns["amounts"]:
+        row[column] = _scale_amount(row.get(column, ""), factor)
+    for column in columns["dates"]:
+        row[column] = _shift_year(row.get(column, ""), years)
+    return row
+
+
+def _read_csv(path: Path, encoding: str = "utf-8") -> List[Dict[str, str]]:
+    with open(path, "r", encoding=encoding, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def _write_csv(path: Path, rows: List[Dict[str, str]], fieldnames: List[str], encoding: str = "utf-8") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding=encoding, newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _scale_csv(
+    sample: Path,
+    target: Path,
+    scale: int,
+    columns: Dict[str, List[str]],
+    encoding: str = "utf-8",
+) -> int:
+    rows = _read_csv(sample, encoding)
+    rng = random.Random(sample.name)
+    scaled = [_vary_row(row, i, columns, rng) for i in range(scale) for row in rows]
+    _write_csv(target, scaled, list(rows[0].keys()), encoding)
+    return len(scaled)
+
+
+def _zip_dir(directory: Path, zip_path: Path) -> None:
+    """Write the archive the client checks for before deciding to download."""
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(directory.iterdir()):
+            zf.write(path, path.name)
+
+
+def _build_lobbying(out_dir: Path, scale: int) -> Dict[str, int]:
+    counts = {}
+    for kind, (primary, columns, children) in LOBBYING_EXPORTS.items():
+        extract_dir = out_dir / "lobbying" / f"{kind}_official"
+        counts[f"lobbying_{kind}"] = _scale_csv(
+            SAMPLES_DIR / "lobbying" / primary, extract_dir / primary, scale, columns, "latin-1"
+        )
+        for child in children:
+            id_columns = {"ids": columns["ids"], "names": [], "amounts": [], "dates": []}
+            _scale_csv(SAMPLES_DIR / "lobbying" / child, extract_dir / child, scale, id_columns, "latin-1")
+        _zip_dir(extract_dir, out_dir / "lobbying" / f"{kind}_official.zip")
+    return counts
+
+
+def _scale_xml(
+    sample: Path,
+    target: Path,
+    scale: int,
+    parent_path: str,
+    item_tag: str,
+    vary: Callable[[ET.Element, int], None],
+) -> int:
+    tree = ET.parse(sample)
+    parent = tree.getroot().find(parent_path) if parent_path else tree.getroot()
+    items = parent.findall(item_tag)
+    for copy_index in range(1, scale):
+        for item in items:
+            clone = copy.deepcopy(item)
+            vary(clone, copy_index)
+            parent.append(clone)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tree.write(target, encoding="utf-8", xml_declaration=True)
+    return len(items) * scale
+
+
+def _vary_subject(subject: ET.Element, copy_index: int) -> None:
+    title = subject.find("SubjectOfBusinessTitle")
+    if title is not None:
+        title.text = f"{title.text} ({copy_index})"
+    for intervention in subject.iter("Intervention"):
+        intervention.set("id", f"{intervention.get('id')}{copy_index:05d}")
+
+
+def _vary_petition(petition: ET.Element, copy_index: int) -> None:
+    petition.set("Id", f"{petition.get('Id')}{copy_index:05d}")
+    number = petition.find("PetitionNumber")
+    number.text = f"{number.text}-{copy_index}"
+    petition.set("SignatureCount", str(int(petition.get("SignatureCount", "0")) + copy_index))
+
+
+def _build_openparliament(out_dir: Path, scale: int) -> Dict[str, int]:
+    counts = {}
+    for listing in OPENPARLIAMENT_LISTINGS:
+        objects = json.loads((SAMPLES_DIR / "openparliament" / f"{listing}.json").read_text())["objects"]
+        scaled = []
+        for copy_index in range(scale):
+            for obj in objects:
+                obj = copy.deepcopy(obj)
+                if copy_index:
+                    obj["url"] = f"{obj['url'].rstrip('/')}-{copy_index}/"
+                    if "date" in obj:
+                        obj["date"] = _shift_year(obj["date"], copy_index % YEAR_SPREAD)
+                scaled.append(obj)
+        target = out_dir / "openparliament" / f"{listing}.json"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(scaled, ensure_ascii=False))
+        counts[f"openparliament_{listing}"] = len(scaled)
+    return counts
+
+
+def build_fixtures(scale: int = 1, out_dir: Path = None) -> Path:
+    """
+    Write fixtures at ``scale`` times the recorded sample size.
+
+    Args:
+        scale: Copies of each sample record (1 = the samples as recorded)
+        out_dir: Target directory (default: ~/.cache/fedmcp/benchmarks/scale-<scale>)
+
+    Returns:
+        The fixture directory; ``manifest.json`` in it lists the record counts
+    """
+    if scale < 1:
+        raise ValueError("scale must be at least 1")
+    out_dir = out_dir or CACHE_DIR / f"scale-{scale}"
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+
+    counts = {
+        "contracts": _scale_csv(
+            SAMPLES_DIR / "contracts.csv", out_dir / "contracts" / "contracts.csv", scale, CONTRACT_COLUMNS
+        ),
+        "grants": _scale_csv(SAMPLES_DIR / "grants.csv", out_dir / "grants" / "grants.csv", scale, GRANT_COLUMNS),
+        "contributions": _scale_csv(
+            SAMPLES_DIR / "contributions.csv",
+            out_dir / "political_contributions" / "contributions_en" / "contributions.csv",
+            scale,
+            CONTRIBUTION_COLUMNS,
+        ),
+        "hansard_subjects": _scale_xml(
+            SAMPLES_DIR / "hansard_sitting.xml",
+            out_dir / "hansard" / "sitting.xml",
+            scale,
+            "HansardBody/OrderOfBusiness",
+            "SubjectOfBusiness",
+            _vary_subject,
+        ),
+        "petitions": _scale_xml(
+            SAMPLES_DIR / "petitions.xml", out_dir / "petitions" / "petitions.xml", scale, "", "Petition", _vary_petition
+        ),
+    }
+    _zip_dir(
+        out_dir / "political_contributions" / "contributions_en",
+        out_dir / "political_contributions" / "contributions_en.zip",
+    )
+    counts["hansard_interventions"] = sum(1 for _ in ET.parse(out_dir / "hansard" / "sitting.xml").iter("Intervention"))
+    counts.update(_build_lobbying(out_dir, scale))
+    counts.update(_build_openparliament(out_dir, scale))
+
+    manifest: Dict[str, Any] = {"scale": scale, "records": counts}
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return out_dir
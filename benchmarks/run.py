@@ -0,0 +1,470 @@
+"""Offline benchmark suite for FedMCP clients, parsers and tools.
+
+Builds size-scaled fixtures (see ``fixtures.py``), then measures:
+
+- load time and peak memory of every bulk-data client (contracts, grants,
+  political contributions, lobbying registrations/communications, petitions)
+- per-query latency of each client search/aggregation method
+- ``OurCommonsHansardClient.parse_sitting`` on a scaled sitting
+- the TF-IDF keyword extractor and the Hansard thread detector (data pipeline)
+- end-to-end ``call_tool`` for the main tools, with OpenParliament and the
+  petitions feed served by a local HTTP stand-in (``standin.py``)
+
+Nothing touches the network. Results are written as JSON keyed by benchmark
+name, with the git commit they were taken at; compare two runs with
+``compare.py``.
+
+Usage:
+    python benchmarks/run.py --scale 100 --repeat 5
+    python benchmarks/run.py --only contracts lobbying tools
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from xml.etree import ElementTree as ET
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+RESULTS_DIR = BENCH_DIR / "results"
+
+sys.path.insert(0, str(REPO_ROOT / "packages" / "fedmcp" / "src"))
+sys.path.insert(0, str(REPO_ROOT / "packages" / "data-pipeline"))
+
+from fixtures import build_fixtures  # noqa: E402
+from standin import StandInServer  # noqa: E402
+
+from fedmcp.http import RateLimitedSession  # noqa: E402
+from fedmcp.clients import OpenParliamentClient, OurCommonsHansardClient  # noqa: E402
+from fedmcp.clients.federal_contracts import FederalContractsClient  # noqa: E402
+from fedmcp.clients.grants_contributions import GrantsContributionsClient  # noqa: E402
+from fedmcp.clients.lobbying import LobbyingRegistryClient  # noqa: E402
+from fedmcp.clients.petitions import PetitionsClient  # noqa: E402
+from fedmcp.clients.political_contributions import PoliticalContributionsClient  # noqa: E402
+
+Query = Tuple[str, Callable[[Any], Any]]
+
+CONTRACT_QUERIES: List[Query] = [
+    ("search_contracts[vendor_name]", lambda c: c.search_contracts(vendor_name="IBM", limit=50)),
+    ("search_contracts[department,min_value]", lambda c: c.search_contracts(department="National Defence", min_value=1_000_000)),
+    ("search_contracts[year]", lambda c: c.search_contracts(year=2023, limit=100)),
+    ("get_top_vendors", lambda c: c.get_top_vendors(limit=20)),
+    ("get_top_vendors[year]", lambda c: c.get_top_vendors(limit=20, year=2023)),
+    ("get_department_spending", lambda c: c.get_department_spending()),
+]
+
+GRANT_QUERIES: List[Query] = [
+    ("search_grants[recipient_name]", lambda c: c.search_grants(recipient_name="University", limit=50)),
+    ("search_grants[program_name,province]", lambda c: c.search_grants(program_name="Housing", province="BC")),
+    ("search_grants[min_value,year]", lambda c: c.search_grants(min_value=1_000_000, year=2023, limit=100)),
+    ("get_top_recipients", lambda c: c.get_top_recipients(limit=20)),
+    ("get_program_spending", lambda c: c.get_program_spending()),
+    ("get_department_spending", lambda c: c.get_department_spending()),
+]
+
+CONTRIBUTION_QUERIES: List[Query] = [
+    ("search_contributions[contributor_name]", lambda c: c.search_contributions(contributor_name="Smith", limit=50)),
+    ("search_contributions[political_party,year]", lambda c: c.search_contributions(political_party="Liberal", year=2023)),
+    ("search_contributions[min_amount,province]", lambda c: c.search_contributions(min_amount=1000, province="ON", limit=100)),
+    ("get_top_donors", lambda c: c.get_top_donors(limit=20)),
+    ("get_party_fundraising", lambda c: c.get_party_fundraising()),
+]
+
+LOBBYING_QUERIES: List[Query] = [
+    ("search_registrations[client_name]", lambda c: c.search_registrations(client_name="Shopify", limit=50)),
+    ("search_registrations[subject_keyword]", lambda c: c.search_registrations(subject_keyword="tax", active_only=False)),
+    ("search_registrations[institution]", lambda c: c.search_registrations(institution="Finance Canada", limit=100)),
+    ("search_communications[official_name]", lambda c: c.search_communications(official_name="Freeland", limit=50)),
+    ("search_communications[date_range]", lambda c: c.search_communications(date_from="2023-01-01", date_to="2023-12-31")),
+    ("get_top_clients", lambda c: c.get_top_clients(limit=20)),
+    ("get_top_lobbyists", lambda c: c.get_top_lobbyists(limit=20)),
+]
+
+PETITION_QUERIES: List[Query] = [
+    ("list_petitions", lambda c: c.list_petitions(limit=100)),
+    ("search_petitions[keyword]", lambda c: c.search_petitions(keyword="pharmacare")),
+    ("search_petitions[sponsor_name]", lambda c: c.search_petitions(sponsor_name="Davies")),
+    ("get_petition", lambda c: c.get_petition("e-4501")),
+    ("search_by_topic", lambda c: c.search_by_topic("Health care system")),
+    ("get_petitions_by_mp", lambda c: c.get_petitions_by_mp("Elizabeth May")),
+    ("get_petitions_by_status", lambda c: c.get_petitions_by_status("Government response tabled")),
+]
+
+TOOL_CALLS: List[Tuple[str, Dict[str, Any]]] = [
+    ("list_debates", {"limit": 50}),
+    ("search_debates", {"query": "housing", "limit": 10}),
+    ("list_mps", {"limit": 100}),
+    ("list_votes", {"limit": 50}),
+    ("search_petitions", {"keyword": "pharmacare"}),
+    ("get_petition_details", {"petition_number": "e-4501"}),
+    ("search_federal_contracts", {"vendor_name": "IBM", "limit": 20}),
+    ("get_top_contractors", {"limit": 20}),
+    ("search_federal_grants", {"recipient_name": "University", "limit": 20}),
+    ("get_top_grant_recipients", {"limit": 20}),
+    ("search_political_contributions", {"contributor_name": "Smith", "limit": 20}),
+    ("get_top_political_donors", {"limit": 20}),
+    ("search_lobbying_registrations", {"client_name": "Shopify", "limit": 20}),
+    ("search_lobbying_communications", {"official_name": "Freeland", "limit": 20}),
+    ("get_top_lobbying_clients", {"limit": 20}),
+]
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+def _count(result: Any) -> Optional[int]:
+    if result is None:
+        return 0
+    try:
+        return len(result)
+    except TypeError:
+        return 1
+
+
+def measure_load(func: Callable[[], Any]) -> Tuple[Dict[str, Any], Any]:
+    """Time one call and record its peak traced allocation."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "kind": "load",
+        "seconds": round(elapsed, 6),
+        "peak_kib": round(peak / 1024, 1),
+        "items": _count(result),
+    }, result
+
+
+def measure_latency(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """
+    Latency of repeated calls (untraced, so tracemalloc does not skew timings).
+
+    The first call is reported separately as ``first_ms``: it includes any
+    lazily built index or cache, which later calls reuse.
+    """
+    start = time.perf_counter()
+    result = func()
+    first = time.perf_counter() - start
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "kind": "query",
+        "first_ms": round(first * 1000, 3),
+        "min_ms": round(timings[0] * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "p95_ms": round(timings[min(int(len(timings) * 0.95), len(timings) - 1)] * 1000, 3),
+        "runs": repeat,
+        "items": _count(result),
+    }
+
+
+def _bench_client(
+    group: str,
+    make_client: Callable[[], Any],
+    loaders: Dict[str, Callable[[Any], Any]],
+    queries: List[Query],
+    repeat: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Load benchmarks on fresh clients, then query latency on a loaded one."""
+    results = {}
+    for name, load in loaders.items():
+        client = make_client()
+        results[f"{group}.{name}"], _ = measure_load(lambda: load(client))
+    client = make_client()
+    for load in loaders.values():
+        load(client)
+    for name, query in queries:
+        results[f"{group}.{name}"] = measure_latency(lambda: query(client), repeat)
+    return results
+
+
+# ----------------------------------------------------------------------
+# Benchmark groups
+# ----------------------------------------------------------------------
+def bench_contracts(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return _bench_client(
+        "contracts",
+        lambda: FederalContractsClient(cache_dir=ctx["fixtures"] / "contracts"),
+        {"load": lambda c: c._load_contracts()},
+        CONTRACT_QUERIES,
+        ctx["repeat"],
+    )
+
+
+def bench_grants(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return _bench_client(
+        "grants",
+        lambda: GrantsContributionsClient(cache_dir=ctx["fixtures"] / "grants"),
+        {"load": lambda c: c._load_grants()},
+        GRANT_QUERIES,
+        ctx["repeat"],
+    )
+
+
+def bench_contributions(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return _bench_client(
+        "contributions",
+        lambda: PoliticalContributionsClient(cache_dir=ctx["fixtures"] / "political_contributions"),
+        {"load": lambda c: c._load_contributions()},
+        CONTRIBUTION_QUERIES,
+        ctx["repeat"],
+    )
+
+
+def bench_lobbying(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return _bench_client(
+        "lobbying",
+        lambda: LobbyingRegistryClient(cache_dir=ctx["fixtures"] / "lobbying"),
+        {
+            "load_registrations": lambda c: c._load_registrations(),
+            "load_communications": lambda c: c._load_communications(),
+        },
+        LOBBYING_QUERIES,
+        ctx["repeat"],
+    )
+
+
+def _petitions_client(server: StandInServer) -> PetitionsClient:
+    client = PetitionsClient(session=RateLimitedSession(max_attempts=1), cache_ttl=24 * 3600)
+    client.base_url = f"{server.url}/petitions"
+    return client
+
+
+def bench_petitions(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return _bench_client(
+        "petitions",
+        lambda: _petitions_client(ctx["server"]),
+        {"load": lambda c: c._get_index("All").petitions},
+        PETITION_QUERIES,
+        ctx["repeat"],
+    )
+
+
+def _read_sitting(ctx: Dict[str, Any]) -> str:
+    return (ctx["fixtures"] / "hansard" / "sitting.xml").read_text(encoding="utf-8")
+
+
+def bench_hansard(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    client = OurCommonsHansardClient()
+    xml_text = _read_sitting(ctx)
+
+    def parse():
+        sitting = client.parse_sitting(xml_text, source_url="fixture://hansard/sitting.xml")
+        return [speech for section in sitting.sections for speech in section.speeches]
+
+    results = {}
+    results["hansard.parse_sitting[memory]"], speeches = measure_load(parse)
+    results["hansard.parse_sitting"] = measure_latency(parse, ctx["repeat"])
+    ctx["speeches"] = [speech.text for speech in speeches if speech.text]
+    return results
+
+
+def bench_keywords(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    from fedmcp_pipeline.utils.keyword_extraction import build_session_corpus, extract_keywords_tfidf
+
+    if "speeches" not in ctx:
+        bench_hansard(ctx)
+    documents = [{"text": text} for text in ctx["speeches"]]
+
+    results = {}
+    results["keywords.build_session_corpus[memory]"], corpus = measure_load(lambda: build_session_corpus(documents))
+    results["keywords.build_session_corpus"] = measure_latency(lambda: build_session_corpus(documents), ctx["repeat"])
+    results["keywords.extract_keywords_tfidf"] = measure_latency(
+        lambda: [extract_keywords_tfidf(doc["text"], corpus, len(documents)) for doc in documents],
+        ctx["repeat"],
+    )
+    return results
+
+
+def _load_threading_analyzer():
+    """Import ThreadingAnalyzer from the pipeline script (it is not part of the package)."""
+    path = REPO_ROOT / "packages" / "data-pipeline" / "scripts" / "populate_threading.py"
+    spec = importlib.util.spec_from_file_location("populate_threading", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ThreadingAnalyzer
+
+
+def _sitting_statements(xml_text: str) -> List[Dict[str, Any]]:
+    """Statement rows shaped like ThreadingAnalyzer's Neo4j query, from the sitting XML."""
+    statements = []
+    root = ET.fromstring(xml_text)
+    base = datetime(2024, 2, 14, 14, 15)
+    for subject in root.iter("SubjectOfBusiness"):
+        topic = subject.findtext("SubjectOfBusinessTitle")
+        for intervention in subject.iter("Intervention"):
+            affiliation = intervention.find("PersonSpeaking/Affiliation")
+            text = " ".join("".join(p.itertext()) for p in intervention.iter("ParaText"))
+            statements.append({
+                "id": intervention.get("id"),
+                "time": base + timedelta(minutes=len(statements)),
+                "type": (intervention.get("Type") or "").lower(),
+                "politician_id": affiliation.get("DbId") if affiliation is not None else None,
+                "h1": "Oral Questions",
+                "h2": topic,
+                "procedural": False,
+                "wordcount": len(text.split()),
+            })
+    return statements
+
+
+def bench_threads(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    analyzer = _load_threading_analyzer()(driver=None)
+    statements = _sitting_statements(_read_sitting(ctx))
+
+    def detect():
+        groups = analyzer._group_by_topic(statements)
+        return [thread for group in groups.values() for thread in analyzer._detect_threads(group)]
+
+    results = {}
+    results["threads.detect[memory]"], _ = measure_load(detect)
+    results["threads.detect"] = measure_latency(detect, ctx["repeat"])
+    return results
+
+
+def bench_tools(ctx: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    from fedmcp import server as fedmcp_server
+
+    fixtures = ctx["fixtures"]
+    standin = ctx["server"]
+    # Point the server's module-level clients at the fixtures and the stand-in
+    fedmcp_server.op_client = OpenParliamentClient(
+        base_url=standin.url, session=RateLimitedSession(max_attempts=1)
+    )
+    fedmcp_server.petitions_client = _petitions_client(standin)
+    fedmcp_server.contracts_client = FederalContractsClient(cache_dir=fixtures / "contracts")
+    fedmcp_server.grants_client = GrantsContributionsClient(cache_dir=fixtures / "grants")
+    fedmcp_server.political_contrib_client = PoliticalContributionsClient(
+        cache_dir=fixtures / "political_contributions"
+    )
+    fedmcp_server.lobbying_client = LobbyingRegistryClient(cache_dir=fixtures / "lobbying")
+
+    loop = asyncio.new_event_loop()
+    results = {}
+    try:
+        for name, arguments in TOOL_CALLS:
+            def call():
+                return loop.run_until_complete(fedmcp_server.call_tool(name, dict(arguments)))
+
+            requests_before = standin.requests_served
+            result = measure_latency(call, ctx["repeat"])
+            text = call()[0].text
+            result["ok"] = not text.startswith(("Error", "Invalid input"))
+            result["http_requests"] = standin.requests_served - requests_before
+            results[f"tools.{name}"] = result
+    finally:
+        loop.close()
+    return results
+
+
+GROUPS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Dict[str, Any]]]] = {
+    "contracts": bench_contracts,
+    "grants": bench_grants,
+    "contributions": bench_contributions,
+    "lobbying": bench_lobbying,
+    "petitions": bench_petitions,
+    "hansard": bench_hansard,
+    "keywords": bench_keywords,
+    "threads": bench_threads,
+    "tools": bench_tools,
+}
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run(scale: int, repeat: int, groups: List[str]) -> Dict[str, Any]:
+    """
+    Run the selected benchmark groups.
+
+    Args:
+        scale: Fixture scale (copies of each recorded sample record)
+        repeat: Timed repetitions per query (after one untimed warm-up)
+        groups: Names from ``GROUPS``
+
+    Returns:
+        Result document: run metadata, fixture record counts, benchmarks and
+        groups skipped because an optional dependency is missing
+    """
+    fixture_dir = build_fixtures(scale)
+    manifest = json.loads((fixture_dir / "manifest.json").read_text())
+    report: Dict[str, Any] = {
+        "commit": _git("rev-parse", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "records": manifest["records"],
+        "benchmarks": {},
+        "skipped": {},
+    }
+
+    with StandInServer(fixture_dir) as server:
+        ctx = {"fixtures": fixture_dir, "repeat": repeat, "server": server}
+        for group in groups:
+            print(f"Running {group}...")
+            try:
+                report["benchmarks"].update(GROUPS[group](ctx))
+            except ImportError as e:
+                # keywords/threads need the data pipeline's dependencies installed
+                print(f"  ⚠ Skipped {group}: {e}")
+                report["skipped"][group] = str(e)
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\nScale {report['scale']} ({report['records']['contracts']:,} contracts), commit {report['commit'][:10]}")
+    for name, result in report["benchmarks"].items():
+        if result["kind"] == "load":
+            print(f"  {name:<55} {result['seconds'] * 1000:>10.2f} ms  peak {result['peak_kib']:>10,.1f} KiB")
+        else:
+            status = "" if result.get("ok", True) else "  (tool returned an error)"
+            print(f"  {name:<55} {result['median_ms']:>10.2f} ms  p95 {result['p95_ms']:>9.2f} ms{status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline FedMCP benchmark suite")
+    parser.add_argument("--scale", type=int, default=10, help="Copies of each recorded sample record")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per query")
+    parser.add_argument("--only", nargs="+", choices=list(GROUPS), help="Benchmark groups to run")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/<commit>-scale<N>.json)")
+    args = parser.parse_args()
+
+    report = run(args.scale, args.repeat, args.only or list(GROUPS))
+    print_report(report)
+
+    output = args.output or RESULTS_DIR / f"{report['commit'][:10]}-scale{args.scale}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
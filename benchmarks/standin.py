@@ -0,0 +1,95 @@
+"""Local HTTP stand-in for the upstream APIs used by the benchmarked tools.
+
+Serves a fixture directory built by ``fixtures.build_fixtures``:
+
+- ``/debates/``, ``/politicians/``, ``/votes/``: OpenParliament-style pages
+  (``objects`` + ``pagination.next_url``) honouring ``limit``/``offset``
+- ``/petitions``: the petitions XML feed (the ``Category`` filter is ignored)
+
+Other OpenParliament filters (``date__gte`` etc.) are ignored, so tools see
+the same pages on every run.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from fixtures import OPENPARLIAMENT_LISTINGS
+
+DEFAULT_PAGE_SIZE = 20
+
+
+class StandInServer:
+    """
+    Serve benchmark fixtures over HTTP on a free local port.
+
+    Example:
+        >>> with StandInServer(fixture_dir) as server:
+        ...     client = OpenParliamentClient(base_url=server.url)
+    """
+
+    def __init__(self, fixture_dir: Path):
+        self.listings: Dict[str, List[Dict[str, Any]]] = {
+            listing: json.loads((fixture_dir / "openparliament" / f"{listing}.json").read_text())
+            for listing in OPENPARLIAMENT_LISTINGS
+        }
+        self.petitions_xml = (fixture_dir / "petitions" / "petitions.xml").read_bytes()
+        self.requests_served = 0
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def page(self, listing: str, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """One OpenParliament-style page of ``listing``."""
+        objects = self.listings[listing]
+        limit = int(query.get("limit", [DEFAULT_PAGE_SIZE])[0])
+        offset = int(query.get("offset", [0])[0])
+        next_url = None
+        if offset + limit < len(objects):
+            next_url = f"/{listing}/?{urlencode({'limit': limit, 'offset': offset + limit})}"
+        return {
+            "objects": objects[offset:offset + limit],
+            "pagination": {"offset": offset, "limit": limit, "next_url": next_url, "previous_url": None},
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests_served += 1
+                parsed = urlparse(self.path)
+                listing = parsed.path.strip("/")
+                if listing in server.listings:
+                    self._send(json.dumps(server.page(listing, parse_qs(parsed.query))).encode(), "application/json")
+                elif listing.startswith("petitions"):
+                    self._send(server.petitions_xml, "application/xml")
+                else:
+                    self.send_error(404)
+
+            def _send(self, body: bytes, content_type: str) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
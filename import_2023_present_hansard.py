@@ -22,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent / "packages" / "data-pipeline"))
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 from fedmcp_pipeline.utils.postgres_client import PostgresClient
 from fedmcp_pipeline.utils.config import Config
+from fedmcp_pipeline.utils.run_report import RunReport, stage_scope
 from fedmcp_pipeline.ingest.hansard import (
     ingest_hansard_documents,
     ingest_hansard_statements,
@@ -224,10 +225,9 @@ def ingest_statements_since_2023(neo4j_client, postgres_client, batch_size=5000)
 
         statements_data.append(statement_data)
 
-    # Create nodes in Neo4j with smaller batches (1000 instead of 5000)
-    # to avoid transaction timeout
+    # Neo4jClient adapts the transaction size to statement text length, so
+    # large imports no longer need a hand-tuned smaller batch size
     logger.info("Creating Statement nodes in Neo4j...")
-    effective_batch_size = 1000  # Smaller batches for large imports
     tracker = ProgressTracker(total=len(statements_data), desc="Creating Statement nodes")
 
     cypher = """
@@ -258,15 +258,13 @@ def ingest_statements_since_2023(neo4j_client, postgres_client, batch_size=5000)
     """
 
     created_total = 0
-    for i in range(0, len(statements_data), effective_batch_size):
-        batch = statements_data[i:i + effective_batch_size]
+    for i in range(0, len(statements_data), batch_size):
+        batch = statements_data[i:i + batch_size]
         try:
-            result = neo4j_client.run_query(cypher, {"statements": batch})
-            created = result[0]["created"] if result else 0
-            created_total += created
+            created_total += neo4j_client.batch_write(cypher, batch, param="statements", batch_size=batch_size)
             tracker.update(len(batch))
         except Exception as e:
-            logger.error(f"Error processing batch {i//effective_batch_size + 1}: {e}")
+            logger.error(f"Error processing batch {i//batch_size + 1}: {e}")
             # Continue with next batch
             continue
 
@@ -367,40 +365,47 @@ def main():
         print(f"   Expected documents:          {len(document_ids):,}")
         print()
 
-        # Import documents
-        print("3. Importing documents...")
-        print("-" * 80)
-        docs_created = ingest_documents_by_ids(neo4j_client, pg_client, document_ids)
-        print(f"✅ Imported {docs_created:,} documents")
-        print()
-
-        # Import statements
-        print("4. Importing statements (this will take ~10-15 minutes)...")
-        print("-" * 80)
-        statements_created = ingest_statements_since_2023(neo4j_client, pg_client)
-        print(f"✅ Imported {statements_created:,} statements")
-        print()
-
-        # Create PART_OF relationships
-        print("5. Creating PART_OF relationships (Statement → Document)...")
-        print("-" * 80)
-        part_of_created = link_statements_to_documents(neo4j_client, batch_size=10000)
-        print(f"✅ Created {part_of_created:,} PART_OF relationships")
-        print()
-
-        # Create MADE_BY relationships
-        print("6. Creating MADE_BY relationships (Statement → MP)...")
-        print("-" * 80)
-        made_by_created = link_statements_to_mps(neo4j_client, batch_size=10000)
-        print(f"✅ Created {made_by_created:,} MADE_BY relationships")
-        print()
-
-        # Create MENTIONS relationships
-        print("7. Creating MENTIONS relationships (Statement → Bill)...")
-        print("-" * 80)
-        mentions_created = link_statements_to_bills(neo4j_client, batch_size=10000)
-        print(f"✅ Created {mentions_created:,} MENTIONS relationships")
-        print()
+        # Import and link, recording a run report
+        with RunReport("hansard_2023_import", threshold=config.report_regression_threshold):
+            # Import documents
+            print("3. Importing documents...")
+            print("-" * 80)
+            with stage_scope("documents"):
+                docs_created = ingest_documents_by_ids(neo4j_client, pg_client, document_ids)
+            print(f"✅ Imported {docs_created:,} documents")
+            print()
+
+            # Import statements
+            print("4. Importing statements (this will take ~10-15 minutes)...")
+            print("-" * 80)
+            with stage_scope("statements"):
+                statements_created = ingest_statements_since_2023(neo4j_client, pg_client)
+            print(f"✅ Imported {statements_created:,} statements")
+            print()
+
+            # Create PART_OF relationships
+            print("5. Creating PART_OF relationships (Statement → Document)...")
+            print("-" * 80)
+            with stage_scope("part_of"):
+                part_of_created = link_statements_to_documents(neo4j_client, batch_size=10000)
+            print(f"✅ Created {part_of_created:,} PART_OF relationships")
+            print()
+
+            # Create MADE_BY relationships
+            print("6. Creating MADE_BY relationships (Statement → MP)...")
+            print("-" * 80)
+            with stage_scope("made_by"):
+                made_by_created = link_statements_to_mps(neo4j_client, batch_size=10000)
+            print(f"✅ Created {made_by_created:,} MADE_BY relationships")
+            print()
+
+            # Create MENTIONS relationships
+            print("7. Creating MENTIONS relationships (Statement → Bill)...")
+            print("-" * 80)
+            with stage_scope("mentions"):
+                mentions_created = link_statements_to_bills(neo4j_client, batch_size=10000)
+            print(f"✅ Created {mentions_created:,} MENTIONS relationships")
+            print()
 
         # Validate results
         print("8. Validating import results...")
@@ -22,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent / "packages" / "data-pipeline"))
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 from fedmcp_pipeline.utils.postgres_client import PostgresClient
 from fedmcp_pipeline.utils.config import Config
+from fedmcp_pipeline.utils.run_report import RunReport
 from fedmcp_pipeline.ingest.hansard import ingest_hansard_full
 
 
@@ -123,8 +124,10 @@ def main():
         print("=" * 80)
         print()
 
-        # Run the full import
-        results = ingest_hansard_full(neo4j_client, pg_client)
+        # Run the full import, recording a run report
+        with RunReport("hansard_full_import", threshold=config.report_regression_threshold) as report:
+            with report.stage("hansard"):
+                results = ingest_hansard_full(neo4j_client, pg_client)
 
         # Calculate duration
         end_time = datetime.now()
@@ -13,6 +13,9 @@ sys.path.insert(0, str(Path.home() / "FedMCP/packages/data-pipeline"))
 
 from fedmcp_pipeline.utils.postgres_client import PostgresClient
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
+from fedmcp_pipeline.utils.checkpoints import Checkpoint, DeadLetterQueue, write_or_dead_letter
+from fedmcp_pipeline.utils.run_report import RunReport, stage_scope
+from fedmcp_pipeline.ingest.ballot_matrix import export_ballot_matrix
 import os
 from dotenv import load_dotenv
 
@@ -44,145 +47,170 @@ def main():
     )
 
     try:
-        # Step 1: Get total count
-        print("\n1. Counting vote records...")
-        count_query = "SELECT COUNT(*) as total FROM bills_membervote"
-        total_votes = pg.execute_query(count_query)[0]['total']
-        print(f"   Total individual votes to import: {total_votes:,}")
-
-        if LIMIT:
-            print(f"   LIMIT set to {LIMIT:,} for testing")
-            total_votes = min(total_votes, LIMIT)
-
-        # Step 2: Create mapping of PostgreSQL Vote IDs in Neo4j
-        print("\n2. Building PostgreSQL Vote ID mapping from Neo4j...")
-        neo4j_votes = neo4j.run_query("""
-            MATCH (v:Vote)
-            WHERE v.pg_vote_id IS NOT NULL
-            RETURN v.pg_vote_id as pg_vote_id
-        """)
-        valid_vote_ids = {v['pg_vote_id'] for v in neo4j_votes}
-        print(f"   Found {len(valid_vote_ids):,} Vote nodes with PostgreSQL IDs")
-
-        # Step 3: Create slug-to-name mapping for MPs
-        print("\n3. Building MP slug mapping from Neo4j...")
-        neo4j_mps = neo4j.run_query("""
-            MATCH (mp:MP)
-            WHERE mp.slug IS NOT NULL
-            RETURN mp.slug as slug, mp.name as name
-        """)
-        slug_to_name = {mp['slug']: mp['name'] for mp in neo4j_mps}
-        print(f"   Found {len(slug_to_name):,} MPs with slugs")
-
-        # Step 4: Fetch and process votes in batches
-        print(f"\n4. Processing votes in batches of {BATCH_SIZE:,}...")
-
-        # Query to get votes with politician and vote question details
-        query = f"""
-        SELECT
-            mv.id,
-            mv.vote,
-            mv.dissent,
-            pol.slug as politician_slug,
-            vq.id as vote_question_id
-        FROM bills_membervote mv
-        JOIN core_politician pol ON mv.politician_id = pol.id
-        JOIN bills_votequestion vq ON mv.votequestion_id = vq.id
-        WHERE pol.slug IS NOT NULL
-        ORDER BY mv.id
-        {"LIMIT " + str(LIMIT) if LIMIT else ""}
-        """
-
-        votes = pg.execute_query(query)
-        print(f"   Fetched {len(votes):,} vote records from PostgreSQL")
-
-        # Step 5: Filter and batch import
-        print("\n5. Creating CAST_VOTE relationships...")
-
-        relationships = []
-        matched = 0
-        missing_mp = 0
-        missing_vote = 0
-
-        for vote in votes:
-            vote_question_id = vote['vote_question_id']
-            politician_slug = vote['politician_slug']
-
-            # Check if Vote exists in Neo4j
-            if vote_question_id not in valid_vote_ids:
-                missing_vote += 1
-                continue
-
-            # Check if MP exists in Neo4j
-            if politician_slug not in slug_to_name:
-                missing_mp += 1
-                continue
-
-            mp_name = slug_to_name[politician_slug]
-
-            relationships.append({
-                "from_id": mp_name,  # MP.name
-                "to_id": vote_question_id,  # Vote.pg_vote_id
-                "properties": {
-                    "position": vote['vote'],  # Y, N, or P (paired)
-                    "dissent": vote['dissent']  # Whether voted against party line
-                }
-            })
-            matched += 1
-
-        print(f"   Matched votes: {matched:,}")
-        print(f"   Skipped (missing MP): {missing_mp:,}")
-        print(f"   Skipped (missing Vote): {missing_vote:,}")
-
-        # Import in batches
-        if relationships:
-            print(f"\n6. Importing {len(relationships):,} relationships in batches...")
-            created = neo4j.batch_create_relationships(
-                rel_type="CAST_VOTE",
-                relationships=relationships,
-                from_label="MP",
-                to_label="Vote",
-                from_key="name",  # Match MPs by name
-                to_key="pg_vote_id",  # Match Votes by PostgreSQL ID
-                batch_size=BATCH_SIZE
-            )
-            print(f"   Created {created:,} CAST_VOTE relationships")
-        else:
-            print("\n6. No relationships to import!")
-
-        # Step 7: Verify results
-        print("\n7. Verification...")
-        stats = neo4j.run_query("""
-            MATCH (mp:MP)-[r:CAST_VOTE]->(v:Vote)
-            RETURN
-                count(r) as total_votes,
-                count(DISTINCT mp) as mps_with_votes,
-                count(DISTINCT v) as votes_with_mps
-        """)
-
-        if stats:
-            print(f"   Total CAST_VOTE relationships: {stats[0]['total_votes']:,}")
-            print(f"   MPs with votes: {stats[0]['mps_with_votes']:,}")
-            print(f"   Votes with MP votes: {stats[0]['votes_with_mps']:,}")
-
-        # Sample query
-        print("\n8. Sample data:")
-        sample = neo4j.run_query("""
-            MATCH (mp:MP)-[r:CAST_VOTE]->(v:Vote)
-            RETURN
-                mp.name as mp_name,
-                r.position as position,
-                r.dissent as dissent,
-                v.date as vote_date,
-                v.description as description
-            LIMIT 3
-        """)
-
-        for s in sample:
-            print(f"\n   {s['mp_name']} voted {s['position']} on {s['vote_date']}")
-            print(f"   Dissent: {s['dissent']}")
-            desc = s.get('description') or 'No description'
-            print(f"   Description: {desc[:80]}...")
+        # Record a run report (PIPELINE_REPORT_THRESHOLD as in canadagpt-ingest)
+        threshold = float(os.getenv("PIPELINE_REPORT_THRESHOLD", "0.25"))
+        with RunReport("member_votes", threshold=threshold):
+            with stage_scope("cast_votes"):
+                # Step 1: Get total count
+                print("\n1. Counting vote records...")
+                count_query = "SELECT COUNT(*) as total FROM bills_membervote"
+                total_votes = pg.execute_query(count_query)[0]['total']
+                print(f"   Total individual votes to import: {total_votes:,}")
+
+                if LIMIT:
+                    print(f"   LIMIT set to {LIMIT:,} for testing")
+                    total_votes = min(total_votes, LIMIT)
+
+                # Step 2: Create mapping of PostgreSQL Vote IDs in Neo4j
+                print("\n2. Building PostgreSQL Vote ID mapping from Neo4j...")
+                neo4j_votes = neo4j.run_query("""
+                    MATCH (v:Vote)
+                    WHERE v.pg_vote_id IS NOT NULL
+                    RETURN v.pg_vote_id as pg_vote_id
+                """)
+                valid_vote_ids = {v['pg_vote_id'] for v in neo4j_votes}
+                print(f"   Found {len(valid_vote_ids):,} Vote nodes with PostgreSQL IDs")
+
+                # Step 3: Create slug-to-name mapping for MPs
+                print("\n3. Building MP slug mapping from Neo4j...")
+                neo4j_mps = neo4j.run_query("""
+                    MATCH (mp:MP)
+                    WHERE mp.slug IS NOT NULL
+                    RETURN mp.slug as slug, mp.name as name
+                """)
+                slug_to_name = {mp['slug']: mp['name'] for mp in neo4j_mps}
+                print(f"   Found {len(slug_to_name):,} MPs with slugs")
+
+                # Step 4: Fetch and process votes in batches
+                print(f"\n4. Processing votes in batches of {BATCH_SIZE:,}...")
+
+                # Resume after the last committed batch of an interrupted run
+                checkpoint = Checkpoint("member_votes")
+                dead_letters = DeadLetterQueue("member_votes")
+                last_id = checkpoint.load().get("last_id", 0) if not LIMIT else 0
+                if last_id:
+                    print(f"   Resuming after membervote id {last_id:,}")
+
+                # Query to get votes with politician and vote question details
+                query = f"""
+                SELECT
+                    mv.id,
+                    mv.vote,
+                    mv.dissent,
+                    pol.slug as politician_slug,
+                    vq.id as vote_question_id
+                FROM bills_membervote mv
+                JOIN core_politician pol ON mv.politician_id = pol.id
+                JOIN bills_votequestion vq ON mv.votequestion_id = vq.id
+                WHERE pol.slug IS NOT NULL AND mv.id > %s
+                ORDER BY mv.id
+                {"LIMIT " + str(LIMIT) if LIMIT else ""}
+                """
+
+                # Step 5: Stream votes via COPY, writing and checkpointing each batch
+                print("\n5. Streaming votes and creating CAST_VOTE relationships...")
+
+                fetched = 0
+                matched = 0
+                written = 0
+                missing_mp = 0
+                missing_vote = 0
+
+                for batch in pg.copy_batches(query, (last_id,), batch_size=BATCH_SIZE):
+                    fetched += len(batch)
+                    relationships = []
+                    for vote_id, position, dissent, politician_slug, vote_question_id in batch.rows:
+                        # Check if Vote exists in Neo4j
+                        if vote_question_id not in valid_vote_ids:
+                            missing_vote += 1
+                            continue
+
+                        # Check if MP exists in Neo4j
+                        mp_name = slug_to_name.get(politician_slug)
+                        if mp_name is None:
+                            missing_mp += 1
+                            continue
+
+                        relationships.append({
+                            "from_id": mp_name,  # MP.name
+                            "to_id": vote_question_id,  # Vote.pg_vote_id
+                            "properties": {
+                                "position": position,  # Y, N, or P (paired)
+                                "dissent": dissent  # Whether voted against party line
+                            }
+                        })
+                        matched += 1
+
+                    # MERGE so a batch replayed after a crash doesn't duplicate relationships
+                    if relationships:
+                        written += write_or_dead_letter(
+                            neo4j, dead_letters, "batch_merge_relationships",
+                            rel_type="CAST_VOTE",
+                            relationships=relationships,
+                            from_label="MP",
+                            to_label="Vote",
+                            from_key="name",  # Match MPs by name
+                            to_key="pg_vote_id",  # Match Votes by PostgreSQL ID
+                            batch_size=BATCH_SIZE,
+                        ) or 0
+                    if not LIMIT:
+                        checkpoint.save(last_id=batch.rows[-1][0])
+                    print(f"   {fetched:,} fetched, {written:,} written", end="\r")
+
+                if not LIMIT:
+                    checkpoint.clear()
+
+                print(f"\n   Fetched {fetched:,} vote records from PostgreSQL")
+                print(f"   Matched votes: {matched:,}")
+                print(f"   Skipped (missing MP): {missing_mp:,}")
+                print(f"   Skipped (missing Vote): {missing_vote:,}")
+
+                # Step 6: Report batches that failed to write
+                print(f"\n6. Wrote {written:,} CAST_VOTE relationships")
+                if dead_letters.path.exists():
+                    print(f"   ⚠️  {len(dead_letters):,} failed batches queued in {dead_letters.path}")
+                    print("   Retry with: canadagpt-ingest --replay-dead-letters")
+
+            # Step 7: Verify results
+            print("\n7. Verification...")
+            stats = neo4j.run_query("""
+                MATCH (mp:MP)-[r:CAST_VOTE]->(v:Vote)
+                RETURN
+                    count(r) as total_votes,
+                    count(DISTINCT mp) as mps_with_votes,
+                    count(DISTINCT v) as votes_with_mps
+            """)
+
+            if stats:
+                print(f"   Total CAST_VOTE relationships: {stats[0]['total_votes']:,}")
+                print(f"   MPs with votes: {stats[0]['mps_with_votes']:,}")
+                print(f"   Votes with MP votes: {stats[0]['votes_with_mps']:,}")
+
+            # Sample query
+            print("\n8. Sample data:")
+            sample = neo4j.run_query("""
+                MATCH (mp:MP)-[r:CAST_VOTE]->(v:Vote)
+                RETURN
+                    mp.name as mp_name,
+                    r.position as position,
+                    r.dissent as dissent,
+                    v.date as vote_date,
+                    v.description as description
+                LIMIT 3
+            """)
+
+            for s in sample:
+                print(f"\n   {s['mp_name']} voted {s['position']} on {s['vote_date']}")
+                print(f"   Dissent: {s['dissent']}")
+                desc = s.get('description') or 'No description'
+                print(f"   Description: {desc[:80]}...")
+
+            # Step 9: Rebuild the ballot matrix read by the voting-analytics tools
+            if not LIMIT:
+                print("\n9. Building ballot matrix...")
+                with stage_scope("ballot_matrix"):
+                    summary = export_ballot_matrix(pg)
+                print(f"   {summary['votes']:,} votes x {summary['mps']:,} MPs")
 
     finally:
         pg.close()
@@ -4,13 +4,14 @@ from pathlib import Path
 from neo4j import GraphDatabase
 import os
 from dotenv import load_dotenv
-from difflib import SequenceMatcher
 
 # Add fedmcp to path
 sys.path.insert(0, str(Path.home() / "FedMCP/packages/fedmcp/src"))
+sys.path.insert(0, str(Path.home() / "FedMCP/packages/data-pipeline"))
 
 from fedmcp.clients.committee_membership import CommitteeMembershipClient
 from fedmcp.http import RateLimitedSession
+from fedmcp_pipeline.utils.name_matching import MPNameResolver
 
 # Load env
 load_dotenv(Path.home() / "FedMCP/packages/data-pipeline/.env")
@@ -55,41 +56,14 @@ COMMITTEE_CODES = [
 ]
 
 
-def similarity_score(a: str, b: str) -> float:
-    """Calculate similarity score between two strings."""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
-
-
-def find_mp_by_name(session, member_name: str) -> str | None:
-    """Find MP ID by name with fuzzy matching."""
-    # Try exact match first
-    result = session.run("""
-        MATCH (mp:MP {name: $name})
-        RETURN mp.id as mp_id
-    """, name=member_name)
-
-    record = result.single()
-    if record:
-        return record['mp_id']
-
-    # Try fuzzy matching with all current MPs
+def build_resolver(session) -> MPNameResolver:
+    """Index current MPs by name once, so members are matched in memory."""
     result = session.run("""
         MATCH (mp:MP)
         WHERE mp.current = true
-        RETURN mp.id as mp_id, mp.name as mp_name
+        RETURN mp.id as id, mp.name as name, mp.given_name as given_name, mp.family_name as family_name
     """)
-
-    best_match = None
-    best_score = 0.8  # Minimum threshold
-
-    for record in result:
-        mp_name = record['mp_name']
-        score = similarity_score(member_name, mp_name)
-        if score > best_score:
-            best_score = score
-            best_match = record['mp_id']
-
-    return best_match
+    return MPNameResolver([record.data() for record in result])
 
 
 def ingest_committee_memberships():
@@ -97,6 +71,8 @@ def ingest_committee_memberships():
     # Create client with longer timeout
     session_http = RateLimitedSession(default_timeout=60.0)
     client = CommitteeMembershipClient(session=session_http)
+    with driver.session() as neo_session:
+        resolver = build_resolver(neo_session)
 
     total_members = 0
     total_matched = 0
@@ -132,7 +108,8 @@ def ingest_committee_memberships():
                     seen_members.add(member_key)
 
                     # Find matching MP
-                    mp_id = find_mp_by_name(neo_session, member.name)
+                    match = resolver.resolve(member.name)
+                    mp_id = match.mp_id if match else None
 
                     if mp_id:
                         # Create MEMBER_OF relationship
@@ -1,16 +1,22 @@
 """Command-line interface for CanadaGPT data pipeline."""
 
 import argparse
+import os
 import sys
+from datetime import timedelta
 from pathlib import Path
+from typing import List, Optional
 
 from .utils.config import Config
 from .utils.neo4j_client import Neo4jClient
 from .utils.progress import logger
+from .utils.run_report import RunReport, compare_reports
+from .utils.stages import Stage, StageRunner, StageStateStore
 
-from .ingest.parliament import ingest_parliament_data
+from .ingest.parliament import ingest_parliament_data, parliament_stages
 from .ingest.lobbying import ingest_lobbying_data
 from .ingest.finances import ingest_financial_data
+from .ingest.activity_summary import materialize_mp_activity
 
 from .relationships.political import build_political_structure
 from .relationships.legislative import build_legislative_relationships
@@ -18,34 +24,71 @@ from .relationships.lobbying import build_lobbying_network
 from .relationships.financial import build_financial_flows
 
 
-def run_full_pipeline(config: Config) -> None:
-    """Run complete data ingestion pipeline."""
+def full_pipeline_stages(client: Neo4jClient, config: Config) -> List[Stage]:
+    """All ingestion and relationship stages of the full pipeline, with dependencies."""
+    batch_size = config.batch_size
+    stages = parliament_stages(client, batch_size)
+    stages += [
+        Stage("lobbying", lambda: ingest_lobbying_data(client, batch_size=batch_size), resources=("http", "neo4j")),
+        Stage("finances", lambda: ingest_financial_data(client, batch_size=batch_size),
+              depends_on=["mps", "parties"], resources=("http", "neo4j")),
+        Stage("political_structure", lambda: build_political_structure(client, batch_size=batch_size),
+              depends_on=["mps", "parties", "ridings"]),
+        Stage("legislative_relationships", lambda: build_legislative_relationships(client, batch_size=batch_size),
+              depends_on=["bills", "votes"]),
+        Stage("lobbying_network", lambda: build_lobbying_network(client, batch_size=batch_size),
+              depends_on=["lobbying", "mps"]),
+        Stage("financial_flows", lambda: build_financial_flows(client, batch_size=batch_size),
+              depends_on=["finances"]),
+        Stage("activity_summary", lambda: materialize_mp_activity(client),
+              depends_on=["bills", "finances", "lobbying_network"], resources=("http",)),
+    ]
+    if config.stage_fresh_hours > 0:
+        for stage in stages:
+            stage.max_age = timedelta(hours=config.stage_fresh_hours)
+    return stages
+
+
+def run_report(name: str, config: Config) -> RunReport:
+    """Run report for a pipeline mode, recording the settings that affect throughput."""
+    return RunReport(
+        name,
+        threshold=config.report_regression_threshold,
+        settings={
+            "batch_size": config.batch_size,
+            "http_concurrency": config.http_concurrency,
+            "neo4j_write_concurrency": config.neo4j_write_concurrency,
+        },
+    )
+
+
+def run_full_pipeline(config: Config, force: bool = False) -> None:
+    """Run complete data ingestion pipeline, overlapping independent stages."""
     logger.info("🚀 Starting FULL PIPELINE")
     logger.info(f"Neo4j URI: {config.neo4j_uri}")
     logger.info(f"Batch size: {config.batch_size:,}")
+    logger.info(f"Concurrency: {config.http_concurrency} HTTP, {config.neo4j_write_concurrency} Neo4j write")
     logger.info("")
 
-    with Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
+    with run_report("full", config) as report, \
+            Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
         # Test connection
         client.test_connection()
 
-        # 1. Parliament data
-        ingest_parliament_data(client, batch_size=config.batch_size)
-
-        # 2. Lobbying data
-        ingest_lobbying_data(client, batch_size=config.batch_size)
-
-        # 3. Financial data
-        ingest_financial_data(client, batch_size=config.batch_size)
-
-        # 4. Build relationships
-        build_political_structure(client, batch_size=config.batch_size)
-        build_legislative_relationships(client, batch_size=config.batch_size)
-        build_lobbying_network(client, batch_size=config.batch_size)
-        build_financial_flows(client, batch_size=config.batch_size)
-
-        # 5. Show final stats
+        runner = StageRunner(
+            full_pipeline_stages(client, config),
+            limits={"http": config.http_concurrency, "neo4j": config.neo4j_write_concurrency},
+            state=StageStateStore(client),
+            force=force,
+        )
+        run = runner.run()
+        run.log_report(runner.stages)
+        if run.failed:
+            raise RuntimeError(f"Stages failed: {', '.join(run.failed)}")
+
+        # Show final stats
         stats = client.get_stats()
+        report.graph = {"nodes": stats["total_nodes"], "relationships": stats["total_relationships"]}
         logger.info("=" * 60)
         logger.success("✅ FULL PIPELINE COMPLETE")
         logger.info(f"Total nodes: {stats['total_nodes']:,}")
@@ -65,40 +108,267 @@ def run_parliament_only(config: Config) -> None:
     """Run only parliamentary data ingestion."""
     logger.info("🏛️  Starting PARLIAMENT INGESTION")
 
-    with Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
+    with run_report("parliament", config) as report, \
+            Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
         client.test_connection()
-        ingest_parliament_data(client, batch_size=config.batch_size)
-        build_political_structure(client, batch_size=config.batch_size)
+        ingest_parliament_data(
+            client,
+            batch_size=config.batch_size,
+            limits={"http": config.http_concurrency, "neo4j": config.neo4j_write_concurrency},
+        )
+        with report.stage("political_structure"):
+            build_political_structure(client, batch_size=config.batch_size)
 
 
 def run_lobbying_only(config: Config) -> None:
     """Run only lobbying data ingestion."""
     logger.info("🤝 Starting LOBBYING INGESTION")
 
-    with Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
+    with run_report("lobbying", config) as report, \
+            Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
         client.test_connection()
-        ingest_lobbying_data(client, batch_size=config.batch_size)
+        with report.stage("lobbying"):
+            ingest_lobbying_data(client, batch_size=config.batch_size)
 
 
 def run_finances_only(config: Config) -> None:
     """Run only financial data ingestion."""
     logger.info("💰 Starting FINANCIAL INGESTION")
 
-    with Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
+    with run_report("finances", config) as report, \
+            Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
         client.test_connection()
-        ingest_financial_data(client, batch_size=config.batch_size)
+        with report.stage("finances"):
+            ingest_financial_data(client, batch_size=config.batch_size)
 
 
 def run_relationships_only(config: Config) -> None:
     """Build relationships only (assumes data already loaded)."""
     logger.info("🔗 Starting RELATIONSHIP BUILDING")
 
+    with run_report("relationships", config) as report, \
+            Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
+        client.test_connection()
+        with report.stage("political_structure"):
+            build_political_structure(client, batch_size=config.batch_size)
+        with report.stage("legislative_relationships"):
+            build_legislative_relationships(client, batch_size=config.batch_size)
+        with report.stage("lobbying_network"):
+            build_lobbying_network(client, batch_size=config.batch_size)
+        with report.stage("financial_flows"):
+            build_financial_flows(client, batch_size=config.batch_size)
+
+
+def run_incremental(config: Config) -> None:
+    """
+    Bring the graph up to date with the OpenParliament PostgreSQL mirror.
+
+    Extracts only rows past each source's stored watermark (see
+    utils/watermarks.py), so a daily run costs the day's volume rather than
+    the full 3.67M-statement table.
+    """
+    from .utils.postgres_client import PostgresClient
+    from .utils.watermarks import WatermarkRegistry
+    from .ingest.hansard import ingest_hansard_incremental, index_hansard_statements
+    from .search import HansardIndex
+    from .ingest.ballot_matrix import export_ballot_matrix, DEFAULT_MATRIX_PATH
+    from .ingest.activity_summary import DEFAULT_SUMMARY_PATH
+    from .ingest.bill_text import ingest_bill_texts, link_texts_to_bills
+    from .ingest.elections import ingest_election_candidacies, link_candidacies_to_politicians
+
+    if not config.postgres_uri:
+        raise ValueError("POSTGRES_URI must be set for an incremental update")
+
+    logger.info("🔄 Starting INCREMENTAL UPDATE")
+    logger.info(f"Document lookback: {config.incremental_lookback_days} days")
+
+    with run_report("incremental", config) as report, \
+            Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client, \
+            PostgresClient.from_uri(config.postgres_uri) as postgres_client:
+        watermarks = WatermarkRegistry(client)
+
+        with report.stage("hansard"):
+            ingest_hansard_incremental(
+                client, postgres_client,
+                lookback_days=config.incremental_lookback_days,
+                content_storage=config.content_storage,
+            )
+
+        with report.stage("bill_texts"):
+            since_id = watermarks.get("bills_billtext").get("id")
+            ingest_bill_texts(client, postgres_client, incremental=True, content_storage=config.content_storage)
+            link_texts_to_bills(client, since_id=since_id)
+
+        with report.stage("elections"):
+            since_id = watermarks.get("elections_candidacy").get("id")
+            ingest_election_candidacies(client, postgres_client, incremental=True)
+            link_candidacies_to_politicians(client, since_id=since_id)
+
+        # Keep the local search index, ballot matrix and activity summaries current once they have been built
+        index = HansardIndex()
+        if index.exists():
+            with report.stage("search_index"):
+                index_hansard_statements(
+                    postgres_client, index, lookback_days=config.incremental_lookback_days
+                )
+        if DEFAULT_MATRIX_PATH.exists():
+            with report.stage("ballot_matrix"):
+                export_ballot_matrix(postgres_client)
+        if DEFAULT_SUMMARY_PATH.exists():
+            with report.stage("activity_summary"):
+                materialize_mp_activity(client)
+
+        for watermark in watermarks.all():
+            logger.info(f"Watermark {watermark.pop('source')}: {watermark}")
+
+    logger.success("✅ INCREMENTAL UPDATE COMPLETE")
+
+
+def count_existing_nodes(config: Config) -> Optional[int]:
+    """Number of nodes in the target database, or None if it cannot be reached."""
+    try:
+        with Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
+            return client.run_query("MATCH (n) RETURN count(n) AS count")[0]["count"]
+    except Exception as e:
+        logger.debug(f"Could not count existing nodes: {e}")
+        return None
+
+
+def run_bulk_load(
+    config: Config,
+    import_dir: Path,
+    lipad_dir: Optional[Path] = None,
+    docker: bool = True,
+    force: bool = False,
+) -> None:
+    """
+    Rebuild the graph from scratch with neo4j-admin (offline bulk import).
+
+    Writes Hansard, the OpenParliament MPs, bills and committees and
+    (optionally) Lipad as import CSVs, replaces the database with
+    ``neo4j-admin database import``, then applies the scripts/neo4j-optimization
+    constraints and indexes.
+
+    The import covers only those sources, so loading over a populated graph
+    would lose everything else (votes, finances, lobbying, ...). Unless
+    ``force`` is set, the load refuses to run unless the target database is
+    reachable and empty.
+    """
+    from .utils.admin_import import AdminImportWriter, apply_optimizations, run_admin_import
+    from .utils.postgres_client import PostgresClient
+    from .ingest.hansard import export_hansard_full
+    from .ingest.bulk_import import OpenParliamentBulkImporter
+    from .ingest.lipad_import import LipadHistoricalImporter
+
+    if not config.postgres_uri:
+        raise ValueError("POSTGRES_URI must be set for a bulk load")
+
+    if not force:
+        existing = count_existing_nodes(config)
+        if existing is None:
+            raise RuntimeError(
+                "Cannot confirm the target database is empty; --bulk-load replaces it. "
+                "Pass --force to load anyway"
+            )
+        if existing:
+            raise RuntimeError(
+                f"Target database holds {existing:,} nodes; --bulk-load would replace them with the "
+                "Hansard/OpenParliament subset only. Pass --force to overwrite"
+            )
+
+    logger.info("📦 Starting OFFLINE BULK LOAD")
+    logger.info(f"Import directory: {import_dir}")
+
+    with run_report("bulk_load", config) as report:
+        writer = AdminImportWriter(import_dir)
+        with report.stage("hansard_export"), PostgresClient.from_uri(config.postgres_uri) as postgres_client:
+            export_hansard_full(writer, postgres_client, content_storage=config.content_storage)
+        with report.stage("openparliament_export"):
+            # Hansard comes from export_hansard_full, keyed like the online ingest,
+            # so the importer's slug-keyed debates are not exported
+            importer = OpenParliamentBulkImporter(writer, config.postgres_uri)
+            importer.import_mps()
+            importer.import_bills()
+            importer.import_committees()
+        if lipad_dir:
+            with report.stage("lipad_export"):
+                LipadHistoricalImporter(writer).import_all(source="csv", data_dir=lipad_dir)
+        plan = writer.finalize()
+
+        with report.stage("admin_import"):
+            run_admin_import(plan, docker=docker)
+        with report.stage("optimizations"):
+            apply_optimizations(config.neo4j_uri, config.neo4j_user, config.neo4j_password)
+    logger.success("✅ BULK LOAD COMPLETE")
+
+
+def run_search_index(config: Config, rebuild: bool = False) -> None:
+    """
+    Build or update the local Hansard full-text index (see search/index.py).
+
+    Only statements newer than the index are read, so after the first build
+    this takes about as long as the day's new statements.
+    """
+    from .utils.postgres_client import PostgresClient
+    from .ingest.hansard import index_hansard_statements
+
+    if not config.postgres_uri:
+        raise ValueError("POSTGRES_URI must be set to build the search index")
+
+    logger.info("🔎 Updating Hansard SEARCH INDEX" + (" (rebuild)" if rebuild else ""))
+    with run_report("search_index", config) as report, \
+            report.stage("search_index"), \
+            PostgresClient.from_uri(config.postgres_uri) as postgres_client:
+        index_hansard_statements(postgres_client, rebuild=rebuild)
+    logger.success("✅ SEARCH INDEX UPDATED")
+
+
+def run_ballot_matrix(config: Config) -> None:
+    """Rebuild the MP x vote ballot matrix read by the FedMCP voting-analytics tools."""
+    from .utils.postgres_client import PostgresClient
+    from .ingest.ballot_matrix import export_ballot_matrix
+
+    if not config.postgres_uri:
+        raise ValueError("POSTGRES_URI must be set to build the ballot matrix")
+
+    logger.info("🗳️  Building BALLOT MATRIX")
+    with run_report("ballot_matrix", config) as report, \
+            report.stage("ballot_matrix"), \
+            PostgresClient.from_uri(config.postgres_uri) as postgres_client:
+        export_ballot_matrix(postgres_client)
+    logger.success("✅ BALLOT MATRIX BUILT")
+
+
+def run_activity_summary(config: Config, rebuild: bool = False) -> None:
+    """Update the per-MP activity summaries read by the FedMCP scorecard tools."""
+    logger.info("📊 Updating MP ACTIVITY SUMMARIES" + (" (rebuild)" if rebuild else ""))
+    with run_report("activity_summary", config) as report, \
+            report.stage("activity_summary"), \
+            Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
+        client.test_connection()
+        materialize_mp_activity(client, rebuild=rebuild)
+    logger.success("✅ ACTIVITY SUMMARIES UPDATED")
+
+
+def replay_dead_letters(config: Config) -> None:
+    """Retry the batches that failed during earlier runs (see utils/checkpoints.py)."""
+    from .utils.checkpoints import DeadLetterQueue
+
+    queues = DeadLetterQueue.all()
+    if not queues:
+        logger.info("No dead letters queued")
+        return
+
     with Neo4jClient(config.neo4j_uri, config.neo4j_user, config.neo4j_password) as client:
         client.test_connection()
-        build_political_structure(client, batch_size=config.batch_size)
-        build_legislative_relationships(client, batch_size=config.batch_size)
-        build_lobbying_network(client, batch_size=config.batch_size)
-        build_financial_flows(client, batch_size=config.batch_size)
+        still_failing = 0
+        for queue in queues:
+            _, failed = queue.replay(client)
+            still_failing += failed
+
+    if still_failing:
+        raise RuntimeError(f"{still_failing:,} batches still failing; see the error recorded in each dead-letter file")
+    logger.success("✅ All dead letters replayed")
 
 
 def test_connection(config: Config) -> None:
@@ -149,6 +419,28 @@ Examples:
 
   # Validate configuration
   canadagpt-ingest --validate
+
+  # Daily update: only Hansard/bill text/candidacy rows since the last run
+  canadagpt-ingest --incremental
+
+  # Retry batches that failed to write (runs resume from their checkpoints on rerun)
+  canadagpt-ingest --replay-dead-letters
+
+  # Rebuild an empty local Neo4j with neo4j-admin (minutes instead of hours; --force overwrites a populated one)
+  canadagpt-ingest --bulk-load --import-dir /tmp/canadagpt-import
+
+  # Build or update the local Hansard search index (--force rebuilds it)
+  canadagpt-ingest --search-index
+  python -m fedmcp_pipeline.search '"carbon tax" rebate' --party Liberal
+
+  # Rebuild the MP x vote ballot matrix for the party-cohesion/similarity tools
+  canadagpt-ingest --ballot-matrix
+
+  # Update the per-MP activity summaries behind the scorecard tools (--force recomputes every MP)
+  canadagpt-ingest --activity-summary
+
+  # Compare a run report with the previous one (exit status 1 on regressions)
+  canadagpt-ingest --compare-reports ~/.cache/fedmcp/pipeline/reports/full/<timestamp>.json
         """,
     )
 
@@ -161,15 +453,46 @@ Examples:
     mode_group.add_argument("--relationships", action="store_true", help="Build relationships only")
     mode_group.add_argument("--test", action="store_true", help="Test connection and show stats")
     mode_group.add_argument("--validate", action="store_true", help="Validate configuration")
-    mode_group.add_argument("--incremental", action="store_true", help="Incremental update (TODO)")
+    mode_group.add_argument("--incremental", action="store_true", help="Ingest only PostgreSQL rows added since the last run")
+    mode_group.add_argument("--replay-dead-letters", action="store_true",
+                            help="Retry batches that failed to write during earlier runs")
+    mode_group.add_argument("--bulk-load", action="store_true", help="Rebuild from scratch via neo4j-admin import (replaces the database)")
+    mode_group.add_argument("--search-index", action="store_true",
+                            help="Build or update the local Hansard full-text search index")
+    mode_group.add_argument("--ballot-matrix", action="store_true",
+                            help="Rebuild the MP x vote ballot matrix for the voting-analytics tools")
+    mode_group.add_argument("--activity-summary", action="store_true",
+                            help="Update the per-MP activity summaries for the scorecard tools")
+    mode_group.add_argument("--compare-reports", nargs="+", type=Path, metavar="REPORT",
+                            help="Compare run reports: HEAD, or BASE HEAD (BASE defaults to the run before HEAD)")
 
     # Configuration options
     parser.add_argument("--env-file", type=Path, help="Path to .env file (default: auto-detect)")
     parser.add_argument("--batch-size", type=int, help="Batch size for Neo4j operations (default: 10000)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run stages that completed recently (--full); rebuild the index (--search-index) "
+                             "or every summary (--activity-summary); overwrite a populated database (--bulk-load)")
+    parser.add_argument("--import-dir", type=Path, default=Path("/tmp/canadagpt-import"),
+                        help="Directory for neo4j-admin CSVs (--bulk-load)")
+    parser.add_argument("--lipad-dir", type=Path, help="Lipad CSV directory to include (--bulk-load)")
+    parser.add_argument("--no-docker", action="store_true",
+                        help="Run neo4j-admin from PATH instead of the docker-compose service (--bulk-load)")
 
     args = parser.parse_args()
 
+    # Comparing reports needs no database configuration
+    if args.compare_reports:
+        if len(args.compare_reports) > 2:
+            parser.error("--compare-reports takes at most two reports")
+        threshold = float(os.getenv("PIPELINE_REPORT_THRESHOLD", "0.25"))
+        try:
+            regressions = compare_reports(args.compare_reports, threshold)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not compare reports: {e}")
+            sys.exit(2)
+        sys.exit(1 if regressions else 0)
+
     # Load configuration
     try:
         config = Config(env_file=args.env_file)
@@ -199,7 +522,7 @@ Examples:
             test_connection(config)
 
         elif args.full:
-            run_full_pipeline(config)
+            run_full_pipeline(config, force=args.force)
 
         elif args.parliament:
             run_parliament_only(config)
@@ -214,8 +537,22 @@ Examples:
             run_relationships_only(config)
 
         elif args.incremental:
-            logger.error("Incremental mode not yet implemented")
-            sys.exit(1)
+            run_incremental(config)
+
+        elif args.replay_dead_letters:
+            replay_dead_letters(config)
+
+        elif args.bulk_load:
+            run_bulk_load(config, args.import_dir, lipad_dir=args.lipad_dir, docker=not args.no_docker, force=args.force)
+
+        elif args.search_index:
+            run_search_index(config, rebuild=args.force)
+
+        elif args.ballot_matrix:
+            run_ballot_matrix(config)
+
+        elif args.activity_summary:
+            run_activity_summary(config, rebuild=args.force)
 
     except KeyboardInterrupt:
         logger.warning("\n⚠️  Pipeline interrupted by user")
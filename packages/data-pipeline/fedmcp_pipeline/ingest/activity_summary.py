@@ -0,0 +1,212 @@
+"""Materialize per-MP activity summaries for the FedMCP scorecard tools.
+
+Bills, expenses and lobbying contacts are read from the graph (SPONSORED,
+INCURRED and CONTACTED relationships); petitions come from the House of
+Commons petitions feed, resolved to MPs by sponsor name. After the first
+build, only MPs touched since the previous run are recomputed: MPs whose node,
+sponsored bills, expenses or lobbying communications have a newer
+``updated_at``, plus MPs whose petition totals changed.
+"""
+
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add fedmcp package to path
+FEDMCP_PATH = Path(__file__).parent.parent.parent.parent / "fedmcp" / "src"
+sys.path.insert(0, str(FEDMCP_PATH))
+
+from fedmcp.activity import (
+    DEFAULT_SUMMARY_PATH,
+    LOBBY_SINCE,
+    ActivitySummaries,
+    MPActivitySummary,
+    expense_period,
+)
+from fedmcp.clients.petitions import PetitionsClient
+
+from ..utils.name_matching import MPNameResolver
+from ..utils.neo4j_client import Neo4jClient
+from ..utils.progress import logger
+
+
+# updated_at is an ISO string on most labels and a datetime on some; toString compares both
+TOUCHED_MPS_QUERY = """
+    MATCH (m:MP) WHERE toString(m.updated_at) > $since RETURN m.id AS mp_id
+    UNION
+    MATCH (m:MP)-[:SPONSORED]->(b:Bill) WHERE toString(b.updated_at) > $since RETURN m.id AS mp_id
+    UNION
+    MATCH (m:MP)-[:INCURRED]->(e:Expense) WHERE toString(e.updated_at) > $since RETURN m.id AS mp_id
+    UNION
+    MATCH (c:LobbyCommunication)-[:CONTACTED]->(m:MP) WHERE toString(c.updated_at) > $since RETURN m.id AS mp_id
+"""
+
+MP_METRICS_QUERY = """
+    MATCH (m:MP)
+    WHERE $mp_ids IS NULL OR m.id IN $mp_ids
+    CALL {
+        WITH m
+        OPTIONAL MATCH (m)-[:SPONSORED]->(b:Bill)
+        RETURN count(b) AS bills_sponsored,
+               count(CASE WHEN b.royal_assent IS NOT NULL
+                            OR toLower(coalesce(b.status, '')) CONTAINS 'royal assent' THEN 1 END) AS bills_passed
+    }
+    CALL {
+        WITH m
+        OPTIONAL MATCH (m)-[:INCURRED]->(e:Expense)
+        RETURN collect([e.fiscal_year, e.quarter, e.category, e.amount]) AS expenses
+    }
+    CALL {
+        WITH m
+        OPTIONAL MATCH (c:LobbyCommunication)-[:CONTACTED]->(m)
+        WHERE c.date >= $lobby_since
+        RETURN count(DISTINCT c) AS lobby_communications,
+               count(DISTINCT c.client_org_name) AS lobby_organizations
+    }
+    RETURN m.id AS mp_id, m.name AS name, m.party AS party, m.riding AS riding,
+           coalesce(m.current, false) AS current,
+           bills_sponsored, bills_passed, expenses, lobby_communications, lobby_organizations
+"""
+
+PetitionTotals = Tuple[int, int, int]
+
+
+def _stored_petitions(record: Optional[MPActivitySummary]) -> PetitionTotals:
+    if record is None:
+        return (0, 0, 0)
+    return (record.petitions_sponsored, record.petition_signatures, record.petitions_responded)
+
+
+def petition_totals(
+    neo4j_client: Neo4jClient,
+    petitions_client: Optional[PetitionsClient] = None,
+) -> Optional[Dict[str, PetitionTotals]]:
+    """
+    Petitions sponsored, signatures and government responses per MP id.
+
+    Args:
+        neo4j_client: Neo4j client (MP names for sponsor resolution)
+        petitions_client: Client to reuse (a new one by default)
+
+    Returns:
+        Mapping of MP id to totals, or None if the feed could not be read
+    """
+    try:
+        petitions = (petitions_client or PetitionsClient()).list_petitions(category="All")
+    except Exception as e:
+        logger.warning(f"Could not load petitions feed, keeping previous petition totals: {e}")
+        return None
+
+    by_sponsor = defaultdict(list)
+    for petition in petitions:
+        if petition.sponsor:
+            by_sponsor[f"{petition.sponsor.first_name} {petition.sponsor.last_name}"].append(petition)
+
+    matches = MPNameResolver.from_neo4j(neo4j_client).resolve_many(by_sponsor, label="petition sponsors")
+    totals: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+    for sponsor, sponsored in by_sponsor.items():
+        match = matches.get(sponsor)
+        if not match:
+            continue
+        total = totals[match.mp_id]
+        total[0] += len(sponsored)
+        total[1] += sum(petition.signature_count for petition in sponsored)
+        total[2] += sum(1 for petition in sponsored if petition.government_response_date)
+    return {mp_id: tuple(total) for mp_id, total in totals.items()}
+
+
+def _latest_expenses(rows: List[List[Any]]) -> Dict[str, Any]:
+    """Period label and totals of the most recent quarter among [fiscal_year, quarter, category, amount] rows."""
+    rows = [row for row in rows if row[0] is not None and row[1] is not None]
+    if not rows:
+        return {}
+    latest = max((row[0], row[1]) for row in rows)
+    by_category = defaultdict(float)
+    for fiscal_year, quarter, category, amount in rows:
+        if (fiscal_year, quarter) == latest:
+            by_category[category] += amount or 0.0
+    return {
+        "expenses_period": expense_period(*latest),
+        "expenses_total": round(sum(by_category.values()), 2),
+        "expenses_travel": round(by_category["travel"], 2),
+        "expenses_hospitality": round(by_category["hospitality"], 2),
+    }
+
+
+def materialize_mp_activity(
+    neo4j_client: Neo4jClient,
+    path: Path = DEFAULT_SUMMARY_PATH,
+    rebuild: bool = False,
+    petitions_client: Optional[PetitionsClient] = None,
+) -> Dict[str, int]:
+    """
+    Build or update the per-MP activity summaries read by the scorecard tools.
+
+    Args:
+        neo4j_client: Neo4j client instance
+        path: Summary file (default: ~/.cache/fedmcp/activity/mp_activity.json.gz)
+        rebuild: Recompute every MP instead of only those touched since the last run
+        petitions_client: Petitions client to reuse
+
+    Returns:
+        Dictionary with the number of MPs recomputed and held in the file
+    """
+    # Taken before reading, so writes that land during this run are picked up next time
+    started = datetime.utcnow().isoformat()
+    summaries = None if rebuild else ActivitySummaries.load(path)
+    petitions = petition_totals(neo4j_client, petitions_client)
+
+    if summaries is None or "graph" not in summaries.sources:
+        logger.info("Computing activity summaries for all MPs...")
+        summaries = ActivitySummaries()
+        mp_ids = None
+    else:
+        since = summaries.sources["graph"]
+        touched = {row["mp_id"] for row in neo4j_client.run_query(TOUCHED_MPS_QUERY, {"since": since})}
+        if petitions is not None:
+            touched.update(
+                mp_id for mp_id in set(petitions) | set(summaries.records)
+                if petitions.get(mp_id, (0, 0, 0)) != _stored_petitions(summaries.get(mp_id))
+            )
+        mp_ids = sorted(mp_id for mp_id in touched if mp_id)
+        logger.info(f"{len(mp_ids):,} MPs touched since {since}")
+
+    rows = []
+    if mp_ids != []:
+        rows = neo4j_client.run_query(MP_METRICS_QUERY, {"mp_ids": mp_ids, "lobby_since": LOBBY_SINCE})
+    records = []
+    for row in rows:
+        previous = summaries.get(row["mp_id"])
+        if petitions is not None:
+            sponsored, signatures, responded = petitions.get(row["mp_id"], (0, 0, 0))
+        else:
+            sponsored, signatures, responded = _stored_petitions(previous)
+        records.append(MPActivitySummary(
+            mp_id=row["mp_id"],
+            name=row["name"] or row["mp_id"],
+            party=row["party"],
+            riding=row["riding"],
+            current=bool(row["current"]),
+            bills_sponsored=row["bills_sponsored"],
+            bills_passed=row["bills_passed"],
+            petitions_sponsored=sponsored,
+            petition_signatures=signatures,
+            petitions_responded=responded,
+            lobby_communications=row["lobby_communications"],
+            lobby_organizations=row["lobby_organizations"],
+            updated_at=started,
+            **_latest_expenses(row["expenses"]),
+        ))
+
+    updated = summaries.update(records)
+    summaries.generated_at = started
+    summaries.sources["graph"] = started
+    if petitions is not None:
+        summaries.sources["petitions"] = started
+    summaries.save(path)
+
+    logger.info(f"Updated {updated:,} MP activity summaries ({len(summaries):,} in {path})")
+    return {"updated": updated, "mps": len(summaries)}
+
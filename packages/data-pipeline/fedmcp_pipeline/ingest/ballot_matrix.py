@@ -0,0 +1,99 @@
+"""Build the MP x vote ballot matrix used by the FedMCP voting-analytics tools."""
+
+import sys
+from pathlib import Path
+from typing import Dict
+
+# Add fedmcp package to path
+FEDMCP_PATH = Path(__file__).parent.parent.parent.parent / "fedmcp" / "src"
+sys.path.insert(0, str(FEDMCP_PATH))
+
+from fedmcp.ballots import DEFAULT_MATRIX_PATH, MatrixMP, MatrixVote, build_ballot_matrix
+
+from ..utils.postgres_client import PostgresClient
+from ..utils.progress import logger
+
+
+VOTES_QUERY = """
+    SELECT vq.id, vq.session_id, vq.number, vq.date, vq.description_en, vq.result, b.number AS bill_number
+    FROM bills_votequestion vq
+    LEFT JOIN bills_bill b ON b.id = vq.bill_id
+"""
+
+POLITICIANS_QUERY = "SELECT id, name, slug FROM core_politician"
+
+# Same rows import_member_votes.py writes as CAST_VOTE, with the party the MP sat for at the time
+BALLOTS_QUERY = """
+    SELECT mv.votequestion_id, mv.politician_id, mv.vote, party.short_name_en
+    FROM bills_membervote mv
+    LEFT JOIN core_electedmember em ON em.id = mv.member_id
+    LEFT JOIN core_party party ON party.id = em.party_id
+"""
+
+# Seats held, so sitting members without a ballot count as absent
+TERMS_QUERY = """
+    SELECT em.politician_id, party.short_name_en, em.start_date, em.end_date
+    FROM core_electedmember em
+    LEFT JOIN core_party party ON party.id = em.party_id
+"""
+
+
+def export_ballot_matrix(
+    postgres_client: PostgresClient,
+    path: Path = DEFAULT_MATRIX_PATH,
+    batch_size: int = 200000,
+) -> Dict[str, int]:
+    """
+    Rebuild the ballot matrix from the OpenParliament PostgreSQL mirror.
+
+    The whole matrix is rebuilt each time: the 1.46M ballots stream through COPY
+    in seconds and the result is a few MB, so there is nothing to gain from
+    patching it in place.
+
+    Args:
+        postgres_client: PostgreSQL client instance
+        path: Output file (default: ~/.cache/fedmcp/ballots/ballot_matrix.bin.gz)
+        batch_size: Rows per COPY batch
+
+    Returns:
+        Dictionary with counts of votes, MPs and ballots in the matrix
+    """
+    logger.info("Building ballot matrix from PostgreSQL...")
+
+    votes = [
+        MatrixVote(
+            vote_id=vote_id,
+            session=session,
+            number=number,
+            date=str(vote_date)[:10] if vote_date else "",
+            description=description or "",
+            result=result or "",
+            bill_number=bill_number,
+        )
+        for batch in postgres_client.copy_batches(VOTES_QUERY, batch_size=batch_size)
+        for vote_id, session, number, vote_date, description, result, bill_number in batch.rows
+    ]
+    mps = [
+        MatrixMP(politician_id=politician_id, name=name or "", slug=slug or "")
+        for batch in postgres_client.copy_batches(POLITICIANS_QUERY, batch_size=batch_size)
+        for politician_id, name, slug in batch.rows
+    ]
+    ballots = [
+        row
+        for batch in postgres_client.copy_batches(BALLOTS_QUERY, batch_size=batch_size)
+        for row in batch.rows
+    ]
+    terms = [
+        row
+        for batch in postgres_client.copy_batches(TERMS_QUERY, batch_size=batch_size)
+        for row in batch.rows
+    ]
+    logger.info(f"Fetched {len(votes):,} votes, {len(ballots):,} ballots and {len(terms):,} terms")
+
+    matrix = build_ballot_matrix(votes, mps, ballots, terms, path=path)
+    results = {"votes": len(matrix), "mps": matrix.n_mps, "ballots": len(ballots)}
+    logger.info(
+        f"Wrote ballot matrix ({results['votes']:,} votes x {results['mps']:,} MPs, "
+        f"{path.stat().st_size / 2**20:.1f} MB) to {path}"
+    )
+    return results
@@ -12,8 +12,12 @@ Neo4j Schema:
     Nodes:
         - BillText: Full text and summaries of bills
 
+        - BillTextContent: text_en/text_fr when PIPELINE_CONTENT_STORAGE=nodes
+          (BillText then keeps text_en_preview/text_fr_preview instead)
+
     Relationships:
         - (Bill)-[:HAS_TEXT]->(BillText): Links bills to their full text
+        - (BillText)-[:HAS_CONTENT]->(BillTextContent): Full text ("nodes" mode)
 
     Indexes:
         - BillText(id): Unique constraint
@@ -38,9 +42,19 @@ from typing import Optional, Dict, Any, List
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.postgres_client import PostgresClient
 from ..utils.progress import ProgressTracker, logger
-
-
-def create_bill_text_schema(neo4j_client: Neo4jClient) -> None:
+from ..utils.watermarks import WatermarkRegistry
+from ..utils.content_store import (
+    CONTENT_LABELS,
+    ContentBlobStore,
+    content_storage_mode,
+    create_content_constraints,
+    log_content_storage,
+    split_content,
+    store_content,
+)
+
+
+def create_bill_text_schema(neo4j_client: Neo4jClient, content_storage: Optional[str] = None) -> None:
     """
     Create Neo4j schema for bill texts.
 
@@ -51,10 +65,15 @@ def create_bill_text_schema(neo4j_client: Neo4jClient) -> None:
         - Full-text index on text_fr
         - Full-text index on summary_en
 
+    In "nodes" mode the text indexes are on BillTextContent instead (with a
+    unique constraint on its id); in "blob" mode only summary_en is indexed.
+
     Args:
         neo4j_client: Neo4j client instance
+        content_storage: "inline", "nodes" or "blob" (default: PIPELINE_CONTENT_STORAGE)
     """
     logger.info("Creating bill text schema...")
+    content_storage = content_storage_mode(content_storage)
 
     # Create unique constraint on id
     neo4j_client.run_query("""
@@ -68,22 +87,19 @@ def create_bill_text_schema(neo4j_client: Neo4jClient) -> None:
         FOR (bt:BillText) ON (bt.docid)
     """)
 
-    # Create full-text indexes
-    try:
-        neo4j_client.run_query("""
-            CREATE FULLTEXT INDEX bill_text_en IF NOT EXISTS
-            FOR (bt:BillText) ON EACH [bt.text_en]
-        """)
-    except Exception as e:
-        logger.warning(f"Full-text index bill_text_en may already exist: {e}")
-
-    try:
-        neo4j_client.run_query("""
-            CREATE FULLTEXT INDEX bill_text_fr IF NOT EXISTS
-            FOR (bt:BillText) ON EACH [bt.text_fr]
-        """)
-    except Exception as e:
-        logger.warning(f"Full-text index bill_text_fr may already exist: {e}")
+    # Create full-text indexes on wherever the text lives
+    if content_storage != "blob":
+        text_label = CONTENT_LABELS["BillText"] if content_storage == "nodes" else "BillText"
+        if content_storage == "nodes":
+            create_content_constraints(neo4j_client, "BillText")
+        for language in ("en", "fr"):
+            try:
+                neo4j_client.run_query(f"""
+                    CREATE FULLTEXT INDEX bill_text_{language} IF NOT EXISTS
+                    FOR (bt:{text_label}) ON EACH [bt.text_{language}]
+                """)
+            except Exception as e:
+                logger.warning(f"Full-text index bill_text_{language} may already exist: {e}")
 
     try:
         neo4j_client.run_query("""
@@ -100,7 +116,9 @@ def ingest_bill_texts(
     neo4j_client: Neo4jClient,
     postgres_client: PostgresClient,
     batch_size: int = 1000,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    incremental: bool = False,
+    content_storage: Optional[str] = None,
 ) -> int:
     """
     Ingest bill texts from PostgreSQL to Neo4j.
@@ -114,16 +132,23 @@ def ingest_bill_texts(
         - summary_en: Summary in English
         - created: Timestamp when text was created
 
+    Unless ``content_storage`` is "inline", text_en/text_fr go to a linked
+    BillTextContent node or the blob store and the node keeps
+    text_en_preview/text_fr_preview (see utils/content_store.py).
+
     Args:
         neo4j_client: Neo4j client instance
         postgres_client: PostgreSQL client instance
         batch_size: Number of records to process per batch (default: 1000)
         limit: Optional limit on total records to import
+        incremental: Only import texts with ids past the stored watermark
+        content_storage: "inline", "nodes" or "blob" (default: PIPELINE_CONTENT_STORAGE)
 
     Returns:
         Number of BillText nodes created
     """
     logger.info("Ingesting bill texts from PostgreSQL...")
+    content_storage = content_storage_mode(content_storage)
 
     # Fetch bill texts
     query = """
@@ -136,13 +161,21 @@ def ingest_bill_texts(
             text_fr,
             summary_en
         FROM bills_billtext
-        ORDER BY id
     """
+    params = None
 
+    watermarks = WatermarkRegistry(neo4j_client)
+    if incremental:
+        last_id = watermarks.get("bills_billtext").get("id", 0)
+        query += " WHERE id > %s"
+        params = (last_id,)
+        logger.info(f"Incremental: bill texts after id {last_id:,}")
+
+    query += " ORDER BY id"
     if limit:
         query += f" LIMIT {limit}"
 
-    bill_texts = postgres_client.execute_query(query)
+    bill_texts = postgres_client.copy_query(query, params)
     logger.info(f"Fetched {len(bill_texts):,} bill texts from PostgreSQL")
 
     if not bill_texts:
@@ -157,6 +190,8 @@ def ingest_bill_texts(
     )
 
     total_created = 0
+    blob_store = ContentBlobStore() if content_storage == "blob" else None
+    log_content_storage("BillText", content_storage, blob_store)
 
     for i in range(0, len(bill_texts), batch_size):
         batch = bill_texts[i:i + batch_size]
@@ -165,8 +200,9 @@ def ingest_bill_texts(
         for text in batch:
             if text.get("created"):
                 text["created"] = text["created"].isoformat()
+        bodies = split_content("BillText", batch) if content_storage != "inline" else None
 
-        # Create BillText nodes
+        # Create BillText nodes (previews are null inline; text is null otherwise)
         cypher = """
         UNWIND $bill_texts AS bt
         MERGE (text:BillText {id: bt.id})
@@ -175,25 +211,35 @@ def ingest_bill_texts(
             text.created = datetime(bt.created),
             text.text_en = bt.text_en,
             text.text_fr = bt.text_fr,
+            text.text_en_preview = bt.text_en_preview,
+            text.text_fr_preview = bt.text_fr_preview,
             text.summary_en = bt.summary_en
         RETURN count(text) as created
         """
 
-        result = neo4j_client.run_query(cypher, {"bill_texts": batch})
+        result = neo4j_client.run_query(cypher, {"bill_texts": batch}, rows=len(batch))
         created = result[0]["created"] if result else 0
         total_created += created
+        if bodies:
+            store_content(neo4j_client, "BillText", bodies, content_storage, blob_store)
 
         progress.update(len(batch))
 
     progress.close()
+    if blob_store:
+        blob_store.close()
     logger.info(f"✅ Created {total_created:,} BillText nodes")
 
+    if not limit:
+        watermarks.advance("bills_billtext", id=bill_texts[-1]["id"])
+
     return total_created
 
 
 def link_texts_to_bills(
     neo4j_client: Neo4jClient,
-    batch_size: int = 5000
+    batch_size: int = 5000,
+    since_id: Optional[int] = None
 ) -> int:
     """
     Create HAS_TEXT relationships between Bills and BillTexts.
@@ -203,59 +249,23 @@ def link_texts_to_bills(
     Args:
         neo4j_client: Neo4j client instance
         batch_size: Number of relationships to create per batch
+        since_id: Only link texts with ids above this (incremental runs)
 
     Returns:
         Number of HAS_TEXT relationships created
     """
     logger.info("Creating HAS_TEXT relationships...")
 
-    # Get count of bill texts
-    count_result = neo4j_client.run_query("""
-        MATCH (bt:BillText)
-        RETURN count(bt) as total
-    """)
-    total = count_result[0]["total"] if count_result else 0
-
-    if total == 0:
-        logger.warning("No BillText nodes found")
-        return 0
-
-    logger.info(f"Found {total:,} BillText nodes to link")
-
-    # Create relationships in batches
-    cypher = """
-    MATCH (bt:BillText)
-    WHERE bt.bill_id IS NOT NULL
-    WITH bt LIMIT $batch_size
-
-    MATCH (b:Bill)
-    WHERE b.postgres_id = bt.bill_id
-
-    MERGE (b)-[r:HAS_TEXT]->(bt)
-    RETURN count(r) as created
-    """
-
-    progress = ProgressTracker(
-        total=total,
-        desc="Creating HAS_TEXT relationships",
-        unit="links"
+    total_created = neo4j_client.link_by_keyset(
+        "HAS_TEXT",
+        source_label="BillText",
+        source_prop="bill_id",
+        target_label="Bill",
+        target_prop="postgres_id",
+        reverse=True,
+        batch_size=batch_size,
+        start_after=since_id,
     )
-
-    total_created = 0
-    processed = 0
-
-    while processed < total:
-        result = neo4j_client.run_query(cypher, {"batch_size": batch_size})
-        created = result[0]["created"] if result else 0
-
-        if created == 0:
-            break  # No more relationships to create
-
-        total_created += created
-        processed += created
-        progress.update(created)
-
-    progress.close()
     logger.info(f"✅ Created {total_created:,} HAS_TEXT relationships")
 
     return total_created
@@ -40,6 +40,7 @@ from typing import Optional, Dict, Any, List
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.postgres_client import PostgresClient
 from ..utils.progress import ProgressTracker, logger
+from ..utils.watermarks import WatermarkRegistry
 
 
 def create_candidacy_schema(neo4j_client: Neo4jClient) -> None:
@@ -88,7 +89,8 @@ def ingest_election_candidacies(
     neo4j_client: Neo4jClient,
     postgres_client: PostgresClient,
     batch_size: int = 1000,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    incremental: bool = False
 ) -> int:
     """
     Ingest election candidacies from PostgreSQL to Neo4j.
@@ -108,6 +110,9 @@ def ingest_election_candidacies(
         postgres_client: PostgreSQL client instance
         batch_size: Number of records to process per batch (default: 1000)
         limit: Optional limit on total records to import
+        incremental: Only import candidacies with ids past the stored watermark,
+            plus every candidacy of the latest ingested election (whose results
+            are revised after election night)
 
     Returns:
         Number of Candidacy nodes created
@@ -126,13 +131,23 @@ def ingest_election_candidacies(
             elected,
             votepercent
         FROM elections_candidacy
-        ORDER BY election_id DESC, riding_id
     """
-
+    params = None
+
+    watermarks = WatermarkRegistry(neo4j_client)
+    if incremental:
+        watermark = watermarks.get("elections_candidacy")
+        last_id = watermark.get("id", 0)
+        last_election = watermark.get("election_id", 0)
+        query += " WHERE id > %s OR election_id >= %s"
+        params = (last_id, last_election)
+        logger.info(f"Incremental: candidacies after id {last_id:,} or from election {last_election}")
+
+    query += " ORDER BY election_id DESC, riding_id"
     if limit:
         query += f" LIMIT {limit}"
 
-    candidacies = postgres_client.execute_query(query)
+    candidacies = postgres_client.copy_query(query, params)
     logger.info(f"Fetched {len(candidacies):,} candidacies from PostgreSQL")
 
     if not candidacies:
@@ -172,7 +187,7 @@ def ingest_election_candidacies(
         RETURN count(c) as created
         """
 
-        result = neo4j_client.run_query(cypher, {"candidacies": batch})
+        result = neo4j_client.run_query(cypher, {"candidacies": batch}, rows=len(batch))
         created = result[0]["created"] if result else 0
         total_created += created
 
@@ -181,12 +196,20 @@ def ingest_election_candidacies(
     progress.close()
     logger.info(f"✅ Created {total_created:,} Candidacy nodes")
 
+    if not limit:
+        watermarks.advance(
+            "elections_candidacy",
+            id=max(c["id"] for c in candidacies),
+            election_id=max(c["election_id"] for c in candidacies),
+        )
+
     return total_created
 
 
 def link_candidacies_to_politicians(
     neo4j_client: Neo4jClient,
-    batch_size: int = 5000
+    batch_size: int = 5000,
+    since_id: Optional[int] = None
 ) -> int:
     """
     Create RAN_IN relationships between Politicians and Candidacies.
@@ -196,59 +219,23 @@ def link_candidacies_to_politicians(
     Args:
         neo4j_client: Neo4j client instance
         batch_size: Number of relationships to create per batch
+        since_id: Only link candidacies with ids above this (incremental runs)
 
     Returns:
         Number of RAN_IN relationships created
     """
     logger.info("Creating RAN_IN relationships...")
 
-    # Get count of candidacies
-    count_result = neo4j_client.run_query("""
-        MATCH (c:Candidacy)
-        RETURN count(c) as total
-    """)
-    total = count_result[0]["total"] if count_result else 0
-
-    if total == 0:
-        logger.warning("No Candidacy nodes found")
-        return 0
-
-    logger.info(f"Found {total:,} Candidacy nodes to link")
-
-    # Create relationships in batches
-    cypher = """
-    MATCH (c:Candidacy)
-    WHERE c.candidate_id IS NOT NULL
-    WITH c LIMIT $batch_size
-
-    MATCH (p:Politician)
-    WHERE p.postgres_id = c.candidate_id
-
-    MERGE (p)-[r:RAN_IN]->(c)
-    RETURN count(r) as created
-    """
-
-    progress = ProgressTracker(
-        total=total,
-        desc="Creating RAN_IN relationships",
-        unit="links"
+    total_created = neo4j_client.link_by_keyset(
+        "RAN_IN",
+        source_label="Candidacy",
+        source_prop="candidate_id",
+        target_label="Politician",
+        target_prop="postgres_id",
+        reverse=True,
+        batch_size=batch_size,
+        start_after=since_id,
     )
-
-    total_created = 0
-    processed = 0
-
-    while processed < total:
-        result = neo4j_client.run_query(cypher, {"batch_size": batch_size})
-        created = result[0]["created"] if result else 0
-
-        if created == 0:
-            break  # No more relationships to create
-
-        total_created += created
-        processed += created
-        progress.update(created)
-
-    progress.close()
     logger.info(f"✅ Created {total_created:,} RAN_IN relationships")
 
     return total_created
@@ -293,7 +280,7 @@ def enrich_candidacy_metadata(
         ORDER BY c.id
     """
 
-    candidacies = postgres_client.execute_query(query)
+    candidacies = postgres_client.copy_query(query)
     logger.info(f"Fetched {len(candidacies):,} candidacies with metadata")
 
     if not candidacies:
@@ -329,7 +316,7 @@ def enrich_candidacy_metadata(
         RETURN count(c) as enriched
         """
 
-        result = neo4j_client.run_query(cypher, {"candidacies": batch})
+        result = neo4j_client.run_query(cypher, {"candidacies": batch}, rows=len(batch))
         enriched = result[0]["enriched"] if result else 0
         total_enriched += enriched
 
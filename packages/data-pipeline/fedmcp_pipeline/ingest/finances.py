@@ -1,101 +1,41 @@
 """Financial data ingestion: MP expenses, contracts, grants, donations."""
 
 import sys
-import unicodedata
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set
 
 # Add fedmcp package to path
 FEDMCP_PATH = Path(__file__).parent.parent.parent.parent / "fedmcp" / "src"
 sys.path.insert(0, str(FEDMCP_PATH))
 
 from fedmcp.clients.expenditure import MPExpenditureClient
+from fedmcp.clients.federal_contracts import FederalContractsClient
+from fedmcp.clients.grants_contributions import GrantsContributionsClient
+from fedmcp.clients.political_contributions import PoliticalContributionsClient
 
-from ..utils.neo4j_client import Neo4jClient
+from ..utils.name_matching import MPNameResolver, normalize_name
+from ..utils.neo4j_client import Neo4jClient, stable_id
 from ..utils.progress import logger
+from ..utils.run_report import record_extracted
 
 
-# Common nickname mappings for Canadian MPs
-NICKNAME_MAPPING = {
-    'bobby': 'robert',
-    'rob': 'robert',
-    'bob': 'robert',
-    'bill': 'william',
-    'dick': 'richard',
-    'jim': 'james',
-    'joe': 'joseph',
-    'mike': 'michael',
-    'tony': 'anthony',
-    'shuv': 'shuvaloy',
-}
-
-
-def normalize_name(name: str) -> str:
-    """
-    Normalize a name for fuzzy matching by:
-    - Removing accents/diacritics
-    - Converting to lowercase
-    - Removing extra whitespace
-    - Removing punctuation like periods
-
-    Args:
-        name: Name to normalize
-
-    Returns:
-        Normalized name string
-    """
-    if not name:
-        return ""
-
-    # Remove accents: é → e, è → e, ñ → n, etc.
-    # NFD decomposes characters into base + combining characters
-    # Then filter out combining characters
-    name = ''.join(
-        char for char in unicodedata.normalize('NFD', name)
-        if unicodedata.category(char) != 'Mn'
-    )
-
-    # Remove periods (for middle initials like "S." or "A.")
-    name = name.replace('.', '')
-
-    # Convert to lowercase and strip whitespace
-    name = name.lower().strip()
-
-    # Normalize whitespace
-    name = ' '.join(name.split())
-
-    return name
-
-
-def extract_core_name(given_name: str, family_name: str) -> str:
-    """
-    Extract core first and last name, removing middle names/initials.
-
-    Args:
-        given_name: Given/first name (may include middle names/initials)
-        family_name: Family/last name
-
-    Returns:
-        "FirstName LastName" with middle names removed
-    """
-    # Get first word from given name (removes middle names/initials)
-    first_only = given_name.split()[0] if given_name else ""
-
-    # Get first word from family name (handles hyphenated surnames)
-    # e.g., "Fancy-Landry" → "Fancy"
-    last_first = family_name.split()[0].split('-')[0] if family_name else ""
-
-    return f"{first_only} {last_first}".strip()
-
-
-def ingest_financial_data(neo4j_client: Neo4jClient, batch_size: int = 10000) -> Dict[str, int]:
+def ingest_financial_data(
+    neo4j_client: Neo4jClient,
+    batch_size: int = 10000,
+    since_year: Optional[int] = None,
+) -> Dict[str, int]:
     """
     Ingest financial data: MP expenses, contracts, grants, donations.
 
+    Flow relationships (INCURRED, RECEIVED, DONATED) are written alongside
+    the nodes, keyed by the ids resolved here, so no graph-wide join is needed.
+
     Args:
         neo4j_client: Neo4j client
         batch_size: Batch size for operations
+        since_year: Only load contracts, grants and contributions from this year on (None = all)
 
     Returns:
         Dict with counts of created entities
@@ -106,203 +46,392 @@ def ingest_financial_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
 
     stats = {}
 
-    # Build MP name -> ID mapping from database
-    logger.info("Building MP name -> ID mapping...")
-    mp_mapping = {}
-    mp_list = []  # Store all MP records for fuzzy matching
-    mp_query_result = neo4j_client.run_query("""
-        MATCH (m:MP)
-        RETURN m.id AS id, m.name AS name, m.given_name AS given_name, m.family_name AS family_name
-    """)
-    for record in mp_query_result:
-        mp_id = record.get("id")
-        name = record.get("name")
-        given = record.get("given_name", "")
-        family = record.get("family_name", "")
-
-        # Store for fuzzy matching
-        mp_list.append({
-            "id": mp_id,
-            "name": name,
-            "given_name": given,
-            "family_name": family
-        })
-
-        # Store by full name (normalized)
-        if name:
-            mp_mapping[normalize_name(name)] = mp_id
-
-        # Store by "FirstName LastName" format (normalized)
-        if given and family:
-            normalized_full = normalize_name(f"{given} {family}")
-            mp_mapping[normalized_full] = mp_id
-
-            # Also store core name without middle names/initials
-            # e.g., "Amanpreet S. Gill" -> "amanpreet gill"
-            core_name = normalize_name(extract_core_name(given, family))
-            if core_name:
-                mp_mapping[core_name] = mp_id
-
-            # Store with nickname variations
-            first_name = given.split()[0] if given else ""
-            first_normalized = normalize_name(first_name)
-            if first_normalized in NICKNAME_MAPPING:
-                # e.g., "Bobby Morrissey" also maps as "Robert Morrissey"
-                formal_name = normalize_name(f"{NICKNAME_MAPPING[first_normalized]} {family}")
-                mp_mapping[formal_name] = mp_id
-
-                # Also store core version with formal name
-                formal_core = normalize_name(f"{NICKNAME_MAPPING[first_normalized]} {family.split()[0].split('-')[0]}")
-                mp_mapping[formal_core] = mp_id
-
-        # For compound last names, also store with just the first part
-        # e.g., "Michelle Rempel Garner" -> "Michelle Rempel"
-        if given and family and " " in family:
-            first_family = family.split()[0]
-            mp_mapping[normalize_name(f"{given} {first_family}")] = mp_id
-
-        # For hyphenated last names, also store first part only
-        # e.g., "Jessica Fancy-Landry" -> "Jessica Fancy"
-        if given and family and "-" in family:
-            first_part = family.split('-')[0]
-            mp_mapping[normalize_name(f"{given} {first_part}")] = mp_id
-            # Also core version
-            mp_mapping[normalize_name(f"{given.split()[0]} {first_part}")] = mp_id
-
-    logger.info(f"Mapped {len(mp_mapping):,} MP name variations to IDs")
+    # Resolve expense-report names to MP ids in memory
+    resolver = MPNameResolver.from_neo4j(neo4j_client)
 
     # 1. MP Expenses
     logger.info("Fetching MP expenses...")
     expense_client = MPExpenditureClient()
 
-    # Get expenses for recent quarters (2024-2025)
+    # Get expenses for recent quarters (2024-2025). Quarters are fetched
+    # concurrently into the local expenditure archive; closed quarters that are
+    # already archived are read from disk instead of re-downloaded.
+    quarters = [(fiscal_year, quarter) for fiscal_year in [2024, 2025, 2026] for quarter in [1, 2, 3, 4]]
+    backfill_errors = expense_client.backfill(quarters)
+
+    summaries = {}
+    for fiscal_year, quarter in quarters:
+        try:
+            if backfill_errors[(fiscal_year, quarter)]:
+                raise ValueError(backfill_errors[(fiscal_year, quarter)])
+            summaries[(fiscal_year, quarter)] = expense_client.get_quarterly_summary(fiscal_year, quarter)
+            record_extracted(len(summaries[(fiscal_year, quarter)]))
+        except Exception as e:
+            logger.warning(f"Could not fetch FY {fiscal_year} Q{quarter}: {e}")
+
+    # Names are reported "LastName, FirstName" with honorifics ("Sgro, Hon. Judy A.");
+    # the resolver handles both, and each distinct name is resolved once
+    matches = resolver.resolve_many(
+        (mp_expenses.name for summary in summaries.values() for mp_expenses in summary
+         if mp_expenses.name != "Vacant"),
+        label="expense names",
+    )
+
     expenses_data = []
     skipped_count = 0
-    for fiscal_year in [2024, 2025, 2026]:
-        for quarter in [1, 2, 3, 4]:
-            try:
-                logger.debug(f"Fetching FY {fiscal_year} Q{quarter}...")
-                summary = expense_client.get_quarterly_summary(fiscal_year, quarter)
-
-                for mp_expenses in summary:
-                    # Skip vacant seats
-                    if mp_expenses.name == "Vacant":
-                        continue
-
-                    # Parse name from "LastName, FirstName" format to "FirstName LastName"
-                    # Example: "Aboultaif,  Ziad" -> "Ziad Aboultaif"
-                    # Example: "Sgro, Hon. Judy A." -> "Hon. Judy A. Sgro"
-                    if "," in mp_expenses.name:
-                        parts = mp_expenses.name.split(",", 1)  # Split only on first comma
-                        if len(parts) == 2:
-                            last_name = parts[0].strip()
-                            first_name = parts[1].strip()
-                            full_name = f"{first_name} {last_name}"
-                        else:
-                            full_name = mp_expenses.name.strip()
-                    else:
-                        full_name = mp_expenses.name.strip()
-
-                    # Strip honorifics/titles from the name
-                    # Common titles: "Hon.", "Rt. Hon.", "Right Hon.", "Dr.", "Rev.", "Prof."
-                    honorifics = ["Right Hon.", "Rt. Hon.", "Hon.", "Dr.", "Rev.", "Prof.", "Mr.", "Mrs.", "Ms.", "Miss"]
-                    for honorific in honorifics:
-                        full_name = full_name.replace(honorific, "").strip()
-
-                    # Normalize the name (remove accents, lowercase, clean whitespace)
-                    normalized_name = normalize_name(full_name)
-
-                    # Look up MP ID from normalized name
-                    mp_id = mp_mapping.get(normalized_name)
-
-                    # If not found, try variations
-                    if not mp_id and " " in normalized_name:
-                        parts = normalized_name.split()
-
-                        # Try: first name + first word of last name
-                        # Handles: "Fancy Jessica" when DB has "Jessica Fancy-Landry"
-                        if len(parts) >= 2:
-                            first_last = f"{parts[0]} {parts[1]}"
-                            mp_id = mp_mapping.get(first_last)
-
-                        # Try: extracting just first + last (no middle names)
-                        # Handles: "Rhéal Éloi Fortin" -> "rheal fortin"
-                        if not mp_id and len(parts) >= 2:
-                            core_name = f"{parts[0]} {parts[-1]}"
-                            mp_id = mp_mapping.get(core_name)
-
-                        # Try: check if first name is a nickname, try formal version
-                        # Handles: "Robert Morrissey" when DB has "Bobby Morrissey"
-                        if not mp_id and len(parts) >= 2:
-                            first_name_norm = parts[0]
-                            # Check reverse mapping (formal -> nickname)
-                            for nickname, formal in NICKNAME_MAPPING.items():
-                                if first_name_norm == formal:
-                                    nickname_version = f"{nickname} {parts[-1]}"
-                                    mp_id = mp_mapping.get(nickname_version)
-                                    if mp_id:
-                                        break
-
-                    if not mp_id:
-                        logger.debug(f"Could not find MP ID for: {mp_expenses.name} (normalized: {normalized_name})")
-                        skipped_count += 1
-                        continue
-
-                    # Create separate expense records for each category
-                    categories = [
-                        ("salaries", mp_expenses.salaries, "Staff salaries and benefits"),
-                        ("travel", mp_expenses.travel, "Travel expenses"),
-                        ("hospitality", mp_expenses.hospitality, "Hospitality and events"),
-                        ("contracts", mp_expenses.contracts, "Contract services"),
-                    ]
-
-                    for category, amount, description in categories:
-                        if amount > 0:  # Only create records for non-zero expenses
-                            expense_props = {
-                                "id": f"exp-{mp_id}-{fiscal_year}-q{quarter}-{category}",
-                                "mp_id": mp_id,
-                                "fiscal_year": fiscal_year,
-                                "quarter": quarter,
-                                "category": category,
-                                "amount": amount,
-                                "description": description,
-                                "updated_at": datetime.utcnow().isoformat(),
-                            }
-                            expenses_data.append(expense_props)
-
-            except Exception as e:
-                logger.warning(f"Could not fetch FY {fiscal_year} Q{quarter}: {e}")
+    for (fiscal_year, quarter), summary in summaries.items():
+        for mp_expenses in summary:
+            # Skip vacant seats
+            if mp_expenses.name == "Vacant":
+                continue
+
+            match = matches.get(mp_expenses.name)
+            mp_id = match.mp_id if match else None
+
+            if not mp_id:
+                logger.debug(f"Could not find MP ID for: {mp_expenses.name}")
+                skipped_count += 1
                 continue
 
+            # Create separate expense records for each category
+            categories = [
+                ("salaries", mp_expenses.salaries, "Staff salaries and benefits"),
+                ("travel", mp_expenses.travel, "Travel expenses"),
+                ("hospitality", mp_expenses.hospitality, "Hospitality and events"),
+                ("contracts", mp_expenses.contracts, "Contract services"),
+            ]
+
+            for category, amount, description in categories:
+                if amount > 0:  # Only create records for non-zero expenses
+                    expense_props = {
+                        "id": f"exp-{mp_id}-{fiscal_year}-q{quarter}-{category}",
+                        "mp_id": mp_id,
+                        "fiscal_year": fiscal_year,
+                        "quarter": quarter,
+                        "category": category,
+                        "amount": amount,
+                        "description": description,
+                        "updated_at": datetime.utcnow().isoformat(),
+                    }
+                    expenses_data.append(expense_props)
+
     logger.info(f"Found {len(expenses_data):,} expense records ({skipped_count} MPs skipped due to name mismatch)")
 
     if expenses_data:
-        stats["expenses"] = neo4j_client.batch_merge_nodes("Expense", expenses_data, merge_keys=["id"], batch_size=batch_size)
-        logger.info(f"Created/updated {stats['expenses']:,} expense nodes")
+        neo4j_client.ensure_index("Expense", "id")
+        result = neo4j_client.batch_upsert_nodes("Expense", expenses_data, batch_size=batch_size)
+        stats["expenses"] = result.total
+        logger.info(f"Expense nodes: {result}")
 
-        # Create INCURRED relationships between MPs and Expenses
+        # INCURRED edges come straight from the resolved mp_id of each record
         logger.info("Creating INCURRED relationships...")
-        rel_query = """
-        MATCH (e:Expense)
-        MATCH (m:MP {id: e.mp_id})
-        MERGE (m)-[:INCURRED]->(e)
-        """
-        neo4j_client.run_query(rel_query)
-        logger.info("✅ Created INCURRED relationships")
+        stats["incurred"] = neo4j_client.batch_merge_relationships(
+            "INCURRED",
+            [{"from_id": expense["mp_id"], "to_id": expense["id"]} for expense in expenses_data],
+            from_label="MP",
+            to_label="Expense",
+            batch_size=batch_size,
+        )
     else:
         stats["expenses"] = 0
-
-    # TODO: Contracts, grants, donations (requires additional data sources)
-    stats["contracts"] = 0
-    stats["grants"] = 0
-    stats["donations"] = 0
+        stats["incurred"] = 0
+
+    # 2-4. Contracts, grants and political contributions
+    # (a download failure skips that source rather than the whole stage)
+    for key in ("contracts", "contracts_received", "grants", "grants_received",
+                "donations", "donations_received", "donated"):
+        stats[key] = 0
+    vendors: Set[str] = set()
+    recipients: Set[str] = set()
+    try:
+        vendors = ingest_contracts(neo4j_client, batch_size, stats, since_year=since_year)
+    except Exception as e:
+        logger.warning(f"Could not load federal contracts: {e}")
+    try:
+        recipients = ingest_grants(neo4j_client, batch_size, stats, since_year=since_year)
+    except Exception as e:
+        logger.warning(f"Could not load grants and contributions: {e}")
+    try:
+        ingest_donations(neo4j_client, batch_size, stats, since_year=since_year, organizations=vendors | recipients)
+    except Exception as e:
+        logger.warning(f"Could not load political contributions: {e}")
 
     logger.info("=" * 60)
     logger.success("✅ FINANCIAL DATA INGESTION COMPLETE")
-    logger.info(f"Expenses: {stats['expenses']:,}")
-    logger.info(f"Contracts: {stats['contracts']:,} (TODO)")
-    logger.info(f"Grants: {stats['grants']:,} (TODO)")
-    logger.info(f"Donations: {stats['donations']:,} (TODO)")
+    logger.info(f"Expenses: {stats['expenses']:,} ({stats['incurred']:,} INCURRED)")
+    logger.info(f"Contracts: {stats['contracts']:,} ({stats['contracts_received']:,} RECEIVED)")
+    logger.info(f"Grants: {stats['grants']:,} ({stats['grants_received']:,} RECEIVED)")
+    logger.info(f"Donations: {stats['donations']:,} ({stats['donations_received']:,} RECEIVED, "
+                f"{stats['donated']:,} DONATED)")
     logger.info("=" * 60)
 
     return stats
+
+
+def _merge_organizations(neo4j_client: Neo4jClient, names: Iterable[str], batch_size: int) -> int:
+    """MERGE Organization nodes by name (ids are only assigned to new nodes)."""
+    neo4j_client.ensure_index("Organization", "name")
+    rows = [{"name": name, "id": stable_id("org", normalize_name(name))} for name in sorted(names)]
+    return neo4j_client.batch_write(
+        """
+        UNWIND $orgs AS org
+        MERGE (o:Organization {name: org.name})
+        ON CREATE SET o.id = org.id
+        """,
+        rows,
+        param="orgs",
+        batch_size=batch_size,
+    ) if rows else 0
+
+
+def _link_received(
+    neo4j_client: Neo4jClient,
+    label: str,
+    records: List[Dict[str, Any]],
+    name_key: str,
+    batch_size: int,
+) -> int:
+    """(Organization {name})-[:RECEIVED]->(label {id}) for each record, by key."""
+    return neo4j_client.batch_merge_relationships(
+        "RECEIVED",
+        [{"from_id": record[name_key], "to_id": record["id"]} for record in records],
+        from_label="Organization",
+        to_label=label,
+        from_key="name",
+        batch_size=batch_size,
+    ) if records else 0
+
+
+def ingest_contracts(
+    neo4j_client: Neo4jClient,
+    batch_size: int,
+    stats: Dict[str, int],
+    since_year: Optional[int] = None,
+) -> Set[str]:
+    """
+    Ingest federal contracts as (Organization)-[:RECEIVED]->(Contract).
+
+    Args:
+        neo4j_client: Neo4j client
+        batch_size: Batch size for operations
+        stats: Receives "contracts" and "contracts_received" counts
+        since_year: Only contracts dated in or after this year (None = all)
+
+    Returns:
+        Vendor names (Organization nodes) seen
+    """
+    logger.info("Loading federal contracts...")
+    contracts_data = []
+    contracts = FederalContractsClient().search_contracts()
+    record_extracted(len(contracts))
+    for contract in contracts:
+        if not contract.vendor_name or (since_year and (contract.contract_year or 0) < since_year):
+            continue
+        contract_props = {
+            "id": contract.reference_number or stable_id(
+                "contract", contract.owner_org, contract.vendor_name, contract.contract_date, contract.contract_value,
+            ),
+            "vendor": contract.vendor_name.strip(),
+            "amount": contract.contract_value,
+            "department": contract.owner_org_title,
+            "date": contract.contract_date or None,
+            "delivery_date": contract.delivery_date or None,
+            "description": contract.comments or "",
+            "owner_org": contract.owner_org,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        contracts_data.append({k: v for k, v in contract_props.items() if v is not None})
+
+    # Amended contracts repeat a reference number; keep the latest row
+    contracts_data = list({contract["id"]: contract for contract in contracts_data}.values())
+    vendors = {contract["vendor"] for contract in contracts_data}
+    logger.info(f"Found {len(contracts_data):,} contracts from {len(vendors):,} vendors")
+
+    neo4j_client.ensure_index("Contract", "id")
+    stats["contracts"] = neo4j_client.batch_upsert_nodes("Contract", contracts_data, batch_size=batch_size).total
+    _merge_organizations(neo4j_client, vendors, batch_size)
+    stats["contracts_received"] = _link_received(neo4j_client, "Contract", contracts_data, "vendor", batch_size)
+    return vendors
+
+
+def ingest_grants(
+    neo4j_client: Neo4jClient,
+    batch_size: int,
+    stats: Dict[str, int],
+    since_year: Optional[int] = None,
+) -> Set[str]:
+    """
+    Ingest federal grants and contributions as (Organization)-[:RECEIVED]->(Grant).
+
+    Args:
+        neo4j_client: Neo4j client
+        batch_size: Batch size for operations
+        stats: Receives "grants" and "grants_received" counts
+        since_year: Only agreements dated in or after this year (None = all)
+
+    Returns:
+        Recipient names (Organization nodes) seen
+    """
+    logger.info("Loading federal grants and contributions...")
+    grants_data = []
+    occurrences: Counter = Counter()
+    grants = GrantsContributionsClient().search_grants()
+    record_extracted(len(grants))
+    for grant in grants:
+        if not grant.recipient_name or (since_year and (grant.agreement_year or 0) < since_year):
+            continue
+        key = (grant.owner_org, grant.recipient_name, grant.agreement_date, grant.agreement_value, grant.program_name)
+        occurrences[key] += 1
+        grant_props = {
+            "id": stable_id("grant", *key, occurrences[key]),
+            "recipient": grant.recipient_name.strip(),
+            "amount": grant.agreement_value,
+            "program_name": grant.program_name,
+            "program_purpose": grant.program_purpose or None,
+            "agreement_date": grant.agreement_date or None,
+            "agreement_year": grant.agreement_year,
+            "start_date": grant.start_date or None,
+            "end_date": grant.end_date or None,
+            "owner_org": grant.owner_org,
+            "recipient_city": grant.recipient_city or None,
+            "recipient_province": grant.recipient_province or None,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        grants_data.append({k: v for k, v in grant_props.items() if v is not None})
+
+    recipients = {grant["recipient"] for grant in grants_data}
+    logger.info(f"Found {len(grants_data):,} grants to {len(recipients):,} recipients")
+
+    neo4j_client.ensure_index("Grant", "id")
+    stats["grants"] = neo4j_client.batch_upsert_nodes("Grant", grants_data, batch_size=batch_size).total
+    _merge_organizations(neo4j_client, recipients, batch_size)
+    stats["grants_received"] = _link_received(neo4j_client, "Grant", grants_data, "recipient", batch_size)
+    return recipients
+
+
+def ingest_donations(
+    neo4j_client: Neo4jClient,
+    batch_size: int,
+    stats: Dict[str, int],
+    since_year: Optional[int] = None,
+    organizations: Iterable[str] = (),
+) -> None:
+    """
+    Ingest Elections Canada contributions as (Party)-[:RECEIVED]->(Donation).
+
+    Contributors whose name is also an Organization (a vendor, grant recipient
+    or lobbying client) additionally get (Organization)-[:DONATED]->(Party)
+    with the total amount. Parties and organizations are matched in memory.
+    On a ``since_year`` run the totals are recomputed from every stored
+    Donation of the pair, so earlier years are not overwritten.
+
+    Args:
+        neo4j_client: Neo4j client
+        batch_size: Batch size for operations
+        stats: Receives "donations", "donations_received" and "donated" counts
+        since_year: Only contributions in or after this year (None = all)
+        organizations: Organization names already known from this run
+    """
+    parties = neo4j_client.run_query("MATCH (p:Party) RETURN p.code AS code, p.name AS name, p.short_name AS short_name")
+    party_codes = {}
+    for party in parties:
+        for name in (party["name"], party["short_name"]):
+            if name:
+                party_codes[normalize_name(name)] = party["code"]
+
+    org_names = {normalize_name(name): name for name in organizations}
+    for record in neo4j_client.run_query("MATCH (o:Organization) RETURN o.name AS name"):
+        if record["name"]:
+            org_names.setdefault(normalize_name(record["name"]), record["name"])
+
+    logger.info("Loading political contributions...")
+    donations_data = []
+    donated: Dict[tuple, Dict[str, Any]] = {}
+    donors: Dict[tuple, Set[str]] = {}
+    occurrences: Counter = Counter()
+    contributions = PoliticalContributionsClient().search_contributions()
+    record_extracted(len(contributions))
+    for contribution in contributions:
+        year = contribution.contribution_year
+        if not contribution.contributor_name or (since_year and (year or 0) < since_year):
+            continue
+        party_code = party_codes.get(normalize_name(contribution.political_party))
+        key = (contribution.contributor_name, contribution.contribution_date, contribution.contribution_amount,
+               contribution.recipient_name, contribution.political_party)
+        occurrences[key] += 1
+        donation_props = {
+            "id": stable_id("donation", *key, occurrences[key]),
+            "donor_name": contribution.contributor_name,
+            "amount": contribution.contribution_amount,
+            "date": contribution.contribution_date or None,
+            "contribution_year": year,
+            "political_party": contribution.political_party,
+            "party_code": party_code,
+            "recipient_type": contribution.recipient_type,
+            "recipient_name": contribution.recipient_name,
+            "electoral_district": contribution.electoral_district or None,
+            "donor_city": contribution.contributor_city or None,
+            "donor_province": contribution.contributor_province or None,
+        }
+        donations_data.append({k: v for k, v in donation_props.items() if v is not None})
+
+        org_name = org_names.get(normalize_name(contribution.contributor_name))
+        if org_name and party_code:
+            flow = donated.setdefault((org_name, party_code), {"total_amount": 0.0, "donation_count": 0})
+            flow["total_amount"] += contribution.contribution_amount
+            flow["donation_count"] += 1
+            donors.setdefault((org_name, party_code), set()).add(contribution.contributor_name)
+
+    logger.info(f"Found {len(donations_data):,} contributions ({len(donated):,} organization → party flows)")
+
+    neo4j_client.ensure_index("Donation", "id")
+    stats["donations"] = neo4j_client.batch_upsert_nodes("Donation", donations_data, batch_size=batch_size).total
+    received = [
+        {"from_id": donation["party_code"], "to_id": donation["id"]}
+        for donation in donations_data if "party_code" in donation
+    ]
+    stats["donations_received"] = neo4j_client.batch_merge_relationships(
+        "RECEIVED", received, from_label="Party", to_label="Donation", from_key="code", batch_size=batch_size,
+    ) if received else 0
+    if since_year and donated:
+        donated = stored_donation_totals(neo4j_client, donors)
+    flows = [
+        {"from_id": org_name, "to_id": party_code, "properties": {"via": "corporate", **totals}}
+        for (org_name, party_code), totals in donated.items()
+    ]
+    stats["donated"] = neo4j_client.batch_merge_relationships(
+        "DONATED", flows, from_label="Organization", to_label="Party", from_key="name", to_key="code",
+        batch_size=batch_size,
+    ) if flows else 0
+
+
+def stored_donation_totals(neo4j_client: Neo4jClient, donors: Dict[tuple, Set[str]]) -> Dict[tuple, Dict[str, Any]]:
+    """
+    Total every stored Donation of each organization -> party pair.
+
+    Args:
+        neo4j_client: Neo4j client
+        donors: (organization name, party code) -> contributor names seen for it
+
+    Returns:
+        Dict of (organization name, party code) -> total_amount/donation_count
+    """
+    neo4j_client.ensure_index("Donation", "donor_name")
+    pairs = [
+        {"org_name": org_name, "party_code": party_code, "donors": sorted(names)}
+        for (org_name, party_code), names in donors.items()
+    ]
+    result = neo4j_client.run_query("""
+        UNWIND $pairs AS pair
+        MATCH (d:Donation)
+        WHERE d.donor_name IN pair.donors AND d.party_code = pair.party_code
+        RETURN pair.org_name AS org_name, pair.party_code AS party_code,
+               sum(d.amount) AS total_amount, count(d) AS donation_count
+    """, {"pairs": pairs})
+    return {
+        (record["org_name"], record["party_code"]): {
+            "total_amount": record["total_amount"],
+            "donation_count": record["donation_count"],
+        }
+        for record in result
+    }
@@ -1,14 +1,29 @@
 """Hansard statements and documents ingestion from OpenParliament PostgreSQL."""
 
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import re
 
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.postgres_client import PostgresClient
 from ..utils.progress import logger, ProgressTracker
 from ..utils.keyword_extraction import extract_document_keywords
+from ..utils.admin_import import AdminImportWriter
+from ..utils.watermarks import WatermarkRegistry
+from ..utils.checkpoints import Checkpoint, DeadLetterQueue, write_or_dead_letter
+from ..utils.content_store import (
+    CONTENT_LABELS,
+    ContentBlobStore,
+    content_node_query,
+    content_storage_mode,
+    create_content_constraints,
+    log_content_storage,
+    split_content,
+)
+
+if TYPE_CHECKING:
+    from ..search import HansardIndex
 
 
 # Data Quality Utilities
@@ -112,11 +127,154 @@ def sanitize_statement_content(statement_data: Dict[str, Any]) -> Dict[str, Any]
     return statement_data
 
 
+# Extract queries shared by the online ingest and the offline export.
+# No WHERE/ORDER BY here: callers append their own filters and ordering.
+DOCUMENTS_QUERY = """
+    SELECT
+        id,
+        date,
+        number,
+        session_id,
+        document_type,
+        source_id,
+        downloaded,
+        public,
+        xml_source_url
+    FROM hansards_document
+"""
+
+STATEMENTS_QUERY = """
+    SELECT
+        id,
+        document_id,
+        time,
+        politician_id,
+        member_id,
+        who_en,
+        who_fr,
+        content_en,
+        content_fr,
+        h1_en,
+        h1_fr,
+        h2_en,
+        h2_fr,
+        h3_en,
+        h3_fr,
+        statement_type,
+        wordcount,
+        procedural,
+        bill_debated_id,
+        bill_debate_stage,
+        slug
+    FROM hansards_statement
+"""
+
+# Incremental statement extracts: past the id watermark, or in a recent document.
+# hansards_statement has no modification time, so corrections are picked up by
+# re-reading the statements of documents dated within the lookback window.
+CHANGED_STATEMENTS_FILTER = """
+    (id > %s OR document_id IN (SELECT id FROM hansards_document WHERE date >= %s))
+"""
+
+
+def lookback_date(lookback_days: int):
+    """First document date re-read by incremental runs."""
+    return (datetime.now() - timedelta(days=lookback_days)).date()
+
+
+# Statements for the local search index, with the party the speaker sat for at the time
+# (same changed rows as CHANGED_STATEMENTS_FILTER; columns are qualified for the joins)
+SEARCH_STATEMENTS_QUERY = """
+    SELECT
+        s.id,
+        s.document_id,
+        s.time,
+        s.politician_id,
+        s.member_id,
+        s.who_en,
+        s.who_fr,
+        s.content_en,
+        s.content_fr,
+        s.h1_en,
+        s.h1_fr,
+        s.h2_en,
+        s.h2_fr,
+        s.h3_en,
+        s.h3_fr,
+        s.statement_type,
+        s.wordcount,
+        s.procedural,
+        s.bill_debated_id,
+        s.bill_debate_stage,
+        s.slug,
+        party.short_name_en AS party
+    FROM hansards_statement s
+    LEFT JOIN core_electedmember em ON em.id = s.member_id
+    LEFT JOIN core_party party ON party.id = em.party_id
+    WHERE s.id > %s OR s.document_id IN (SELECT id FROM hansards_document WHERE date >= %s)
+    ORDER BY s.id
+"""
+
+
+def document_row(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Document node properties from a hansards_document row."""
+    return {
+        "id": doc["id"],
+        "date": doc["date"].isoformat() if doc["date"] else None,
+        "number": doc["number"],
+        "session_id": doc["session_id"],
+        "document_type": doc["document_type"],  # D=debates, E=evidence
+        "source_id": doc["source_id"],
+        "downloaded": doc["downloaded"],
+        "public": doc["public"],
+        "xml_source_url": doc["xml_source_url"],
+    }
+
+
+def statement_row(stmt: Dict[str, Any]) -> Dict[str, Any]:
+    """Sanitized Statement node properties from a hansards_statement row."""
+    # Build raw statement data
+    statement_data = {
+        "id": stmt["id"],
+        "document_id": stmt["document_id"],
+        "time": stmt["time"],  # Don't convert yet, sanitize_statement_content handles it
+        "politician_id": stmt["politician_id"],
+        "member_id": stmt["member_id"],
+        "who_en": stmt["who_en"],
+        "who_fr": stmt["who_fr"],
+        "content_en": stmt["content_en"] or "",
+        "content_fr": stmt["content_fr"] or "",
+        "h1_en": stmt["h1_en"],
+        "h1_fr": stmt["h1_fr"],
+        "h2_en": stmt["h2_en"],
+        "h2_fr": stmt["h2_fr"],
+        "h3_en": stmt["h3_en"],
+        "h3_fr": stmt["h3_fr"],
+        "statement_type": stmt["statement_type"],
+        "wordcount": stmt["wordcount"],
+        "procedural": stmt["procedural"],
+        "bill_debated_id": stmt["bill_debated_id"],
+        "bill_debate_stage": stmt["bill_debate_stage"],
+        "slug": stmt["slug"],
+    }
+
+    # Sanitize content (strip HTML, validate dates)
+    statement_data = sanitize_statement_content(statement_data)
+
+    # Convert time to ISO format after sanitization
+    if statement_data["time"]:
+        statement_data["time"] = statement_data["time"].isoformat()
+
+    return statement_data
+
+
 def ingest_hansard_documents(
     neo4j_client: Neo4jClient,
     postgres_client: PostgresClient,
     batch_size: int = 1000,
     limit: Optional[int] = None,
+    incremental: bool = False,
+    lookback_days: int = 7,
 ) -> int:
     """
     Ingest Hansard documents from PostgreSQL to Neo4j.
@@ -128,33 +286,32 @@ def ingest_hansard_documents(
         postgres_client: PostgreSQL client instance
         batch_size: Batch size for Neo4j operations
         limit: Optional limit for sample imports (None = all documents)
+        incremental: Only extract documents past the stored watermark, plus
+            those dated within ``lookback_days`` (their flags can still change)
+        lookback_days: Window of recent documents re-read in incremental mode
 
     Returns:
         Number of documents created
     """
     logger.info("Ingesting Hansard documents from PostgreSQL...")
 
-    # Build query
-    query = """
-        SELECT
-            id,
-            date,
-            number,
-            session_id,
-            document_type,
-            source_id,
-            downloaded,
-            public,
-            xml_source_url
-        FROM hansards_document
-        ORDER BY date DESC
-    """
+    watermarks = WatermarkRegistry(neo4j_client)
+    query = DOCUMENTS_QUERY
+    params = None
+
+    if incremental:
+        last_id = watermarks.get("hansards_document").get("id", 0)
+        since = lookback_date(lookback_days)
+        query += " WHERE id > %s OR date >= %s"
+        params = (last_id, since)
+        logger.info(f"Incremental: documents after id {last_id:,} or dated since {since}")
 
+    query += " ORDER BY date DESC"
     if limit:
         query += f" LIMIT {limit}"
 
     # Fetch documents
-    documents = postgres_client.execute_query(query)
+    documents = postgres_client.copy_query(query, params)
     logger.info(f"Fetched {len(documents):,} Hansard documents from PostgreSQL")
 
     if not documents:
@@ -162,19 +319,7 @@ def ingest_hansard_documents(
         return 0
 
     # Prepare data for batch insert
-    documents_data = []
-    for doc in documents:
-        documents_data.append({
-            "id": doc["id"],
-            "date": doc["date"].isoformat() if doc["date"] else None,
-            "number": doc["number"],
-            "session_id": doc["session_id"],
-            "document_type": doc["document_type"],  # D=debates, E=evidence
-            "source_id": doc["source_id"],
-            "downloaded": doc["downloaded"],
-            "public": doc["public"],
-            "xml_source_url": doc["xml_source_url"],
-        })
+    documents_data = [document_row(doc) for doc in documents]
 
     # Create nodes in Neo4j
     tracker = ProgressTracker(total=len(documents_data), desc="Creating Document nodes")
@@ -199,7 +344,7 @@ def ingest_hansard_documents(
     created_total = 0
     for i in range(0, len(documents_data), batch_size):
         batch = documents_data[i:i + batch_size]
-        result = neo4j_client.run_query(cypher, {"documents": batch})
+        result = neo4j_client.run_query(cypher, {"documents": batch}, rows=len(batch))
         created = result[0]["created"] if result else 0
         created_total += created
         tracker.update(len(batch))
@@ -207,6 +352,9 @@ def ingest_hansard_documents(
     tracker.close()
     logger.info(f"Created {created_total:,} Document nodes in Neo4j")
 
+    if not limit:
+        watermarks.advance("hansards_document", id=max(doc["id"] for doc in documents_data))
+
     return created_total
 
 
@@ -215,104 +363,87 @@ def ingest_hansard_statements(
     postgres_client: PostgresClient,
     batch_size: int = 5000,
     limit: Optional[int] = None,
+    incremental: bool = False,
+    lookback_days: int = 7,
+    content_storage: Optional[str] = None,
 ) -> int:
     """
     Ingest Hansard statements from PostgreSQL to Neo4j.
 
     Statements are individual speeches/interventions by MPs in debates or committees.
+    Unless ``content_storage`` is "inline", the speech text is written to a linked
+    StatementContent node or the blob store and the Statement keeps a preview
+    (see utils/content_store.py).
 
     Args:
         neo4j_client: Neo4j client instance
         postgres_client: PostgreSQL client instance
-        batch_size: Batch size for Neo4j operations (larger for statements)
+        batch_size: Rows per PostgreSQL batch (and starting Neo4j batch size; adapted at runtime)
         limit: Optional limit for sample imports (None = all statements)
+        incremental: Only extract statements with ids past the stored watermark,
+            plus those of documents dated within ``lookback_days`` (they can
+            still be corrected). The watermark advances after every batch, so an
+            interrupted run resumes.
+        lookback_days: Window of recent documents whose statements are re-read in incremental mode
+        content_storage: "inline", "nodes" or "blob" (default: PIPELINE_CONTENT_STORAGE)
 
     Returns:
         Number of statements created
     """
     logger.info("Ingesting Hansard statements from PostgreSQL...")
 
-    # Build query - get most recent statements first
-    query = """
-        SELECT
-            id,
-            document_id,
-            time,
-            politician_id,
-            member_id,
-            who_en,
-            who_fr,
-            content_en,
-            content_fr,
-            h1_en,
-            h1_fr,
-            h2_en,
-            h2_fr,
-            h3_en,
-            h3_fr,
-            statement_type,
-            wordcount,
-            procedural,
-            bill_debated_id,
-            bill_debate_stage,
-            slug
-        FROM hansards_statement
-        ORDER BY time DESC
-    """
+    content_storage = content_storage_mode(content_storage)
+    blob_store = ContentBlobStore() if content_storage == "blob" else None
+    log_content_storage("Statement", content_storage, blob_store)
+
+    watermarks = WatermarkRegistry(neo4j_client)
+    checkpoint = Checkpoint("hansard_statements")
+    dead_letters = DeadLetterQueue("hansard_statements")
+    query = STATEMENTS_QUERY
+    params = None
+    # Full imports walk ids in order so an interrupted run resumes from its checkpoint
+    resumable = not incremental and not limit
+
+    if incremental:
+        last_id = watermarks.get("hansards_statement").get("id", 0)
+        since = lookback_date(lookback_days)
+        query += f" WHERE {CHANGED_STATEMENTS_FILTER} ORDER BY id"
+        params = (last_id, since)
+        count = postgres_client.execute_query(
+            f"SELECT count(*) AS count FROM hansards_statement WHERE {CHANGED_STATEMENTS_FILTER}", params
+        )
+        total = count[0]["count"] if count else 0
+        logger.info(f"{total:,} statements after id {last_id:,} or in documents dated since {since}")
+    elif resumable:
+        last_id = checkpoint.load().get("last_id", 0)
+        query += " WHERE id > %s ORDER BY id"
+        params = (last_id,)
+        count = postgres_client.execute_query(
+            "SELECT count(*) AS count FROM hansards_statement WHERE id > %s", params
+        )
+        total = count[0]["count"] if count else 0
+        logger.info(f"{total:,} statements after id {last_id:,}")
+    else:
+        # Most recent statements first
+        query += " ORDER BY time DESC"
+        total = limit
 
     if limit:
         query += f" LIMIT {limit}"
 
-    # Fetch statements
-    logger.info("Fetching statements from PostgreSQL...")
-    statements = postgres_client.execute_query(query)
-    logger.info(f"Fetched {len(statements):,} Hansard statements from PostgreSQL")
-
-    if not statements:
-        logger.warning("No Hansard statements found")
+    if not total:
+        if resumable and last_id:
+            # Nothing after the checkpoint: the previous run wrote its last batch
+            # but stopped before clearing it, so this run is complete too
+            logger.info(f"No statements after checkpoint id {last_id:,}; import already complete")
+            checkpoint.clear()
+        else:
+            logger.warning("No Hansard statements found")
         return 0
 
-    # Prepare data for batch insert
-    statements_data = []
-    for stmt in statements:
-        # Build raw statement data
-        statement_data = {
-            "id": stmt["id"],
-            "document_id": stmt["document_id"],
-            "time": stmt["time"],  # Don't convert yet, sanitize_statement_content handles it
-            "politician_id": stmt["politician_id"],
-            "member_id": stmt["member_id"],
-            "who_en": stmt["who_en"],
-            "who_fr": stmt["who_fr"],
-            "content_en": stmt["content_en"] or "",
-            "content_fr": stmt["content_fr"] or "",
-            "h1_en": stmt["h1_en"],
-            "h1_fr": stmt["h1_fr"],
-            "h2_en": stmt["h2_en"],
-            "h2_fr": stmt["h2_fr"],
-            "h3_en": stmt["h3_en"],
-            "h3_fr": stmt["h3_fr"],
-            "statement_type": stmt["statement_type"],
-            "wordcount": stmt["wordcount"],
-            "procedural": stmt["procedural"],
-            "bill_debated_id": stmt["bill_debated_id"],
-            "bill_debate_stage": stmt["bill_debate_stage"],
-            "slug": stmt["slug"],
-        }
-
-        # Sanitize content (strip HTML, validate dates)
-        statement_data = sanitize_statement_content(statement_data)
-
-        # Convert time to ISO format after sanitization
-        if statement_data["time"]:
-            statement_data["time"] = statement_data["time"].isoformat()
-
-        statements_data.append(statement_data)
-
-    # Create nodes in Neo4j
-    tracker = ProgressTracker(total=len(statements_data), desc="Creating Statement nodes")
-
-    # Use UNWIND for efficient batch insert
+    # Use UNWIND for efficient batch insert. In "inline" mode the previews are
+    # null (and so removed); otherwise the bodies are, so switching modes
+    # rewrites whichever layout the node had before.
     cypher = """
         UNWIND $statements AS stmt
         MERGE (s:Statement {id: stmt.id})
@@ -324,6 +455,8 @@ def ingest_hansard_statements(
             s.who_fr = stmt.who_fr,
             s.content_en = stmt.content_en,
             s.content_fr = stmt.content_fr,
+            s.content_en_preview = stmt.content_en_preview,
+            s.content_fr_preview = stmt.content_fr_preview,
             s.h1_en = stmt.h1_en,
             s.h1_fr = stmt.h1_fr,
             s.h2_en = stmt.h2_en,
@@ -340,24 +473,68 @@ def ingest_hansard_statements(
         RETURN count(s) as created
     """
 
-    # Process in batches
+    # Stream statements from PostgreSQL via COPY, one Neo4j write per batch
+    logger.info(f"Streaming {total:,} statements from PostgreSQL...")
+    tracker = ProgressTracker(total=total, desc="Creating Statement nodes")
+
     created_total = 0
-    for i in range(0, len(statements_data), batch_size):
-        batch = statements_data[i:i + batch_size]
-        result = neo4j_client.run_query(cypher, {"statements": batch})
-        created = result[0]["created"] if result else 0
-        created_total += created
-        tracker.update(len(batch))
+    max_id = None
+    for batch in postgres_client.copy_batches(query, params, batch_size=batch_size):
+        statements_data = [statement_row(stmt) for stmt in batch.dicts()]
+        bodies = split_content("Statement", statements_data) if content_storage != "inline" else None
+
+        # Sub-batched adaptively to stay under transaction memory limits; a failed
+        # write is queued for --replay-dead-letters instead of aborting the run
+        created = write_or_dead_letter(
+            neo4j_client, dead_letters, "batch_write",
+            query=cypher, rows=statements_data, param="statements",
+        )
+        created_total += created or 0
+        if content_storage == "nodes" and created is None:
+            # The MERGE would create bare Statements for the failed batch; queue the
+            # bodies behind it so --replay-dead-letters writes them after the nodes
+            dead_letters.push(
+                "batch_write",
+                {"query": content_node_query("Statement"), "rows": bodies, "param": "bodies"},
+                RuntimeError("Statement batch was dead-lettered"),
+            )
+        elif content_storage == "nodes":
+            write_or_dead_letter(
+                neo4j_client, dead_letters, "batch_write",
+                query=content_node_query("Statement"), rows=bodies, param="bodies",
+            )
+        elif content_storage == "blob":
+            blob_store.put_many("Statement", bodies)
+        tracker.update(len(statements_data))
+
+        batch_max = max(stmt["id"] for stmt in statements_data)
+        max_id = batch_max if max_id is None else max(max_id, batch_max)
+        # Rows arrive in id order, so everything up to here is written or queued.
+        # Re-read statements sit below the watermark, which never moves back.
+        if incremental:
+            watermarks.advance("hansards_statement", id=max_id)
+        elif resumable:
+            checkpoint.save(last_id=max_id)
 
     tracker.close()
+    if blob_store:
+        blob_store.close()
     logger.info(f"Created {created_total:,} Statement nodes in Neo4j")
 
+    if not limit:
+        watermarks.advance("hansards_statement", id=max_id)
+    if resumable:
+        checkpoint.clear()
+    if dead_letters.path.exists():
+        logger.warning(f"{len(dead_letters):,} failed statement batches queued in {dead_letters.path}")
+
     return created_total
 
 
 def link_statements_to_mps(
     neo4j_client: Neo4jClient,
     batch_size: int = 10000,
+    since_id: Optional[int] = None,
 ) -> int:
     """
     Create MADE_BY relationships between Statements and MPs.
@@ -368,43 +545,28 @@ def link_statements_to_mps(
     Args:
         neo4j_client: Neo4j client instance
         batch_size: Batch size for relationship creation
+        since_id: Only link statements with ids above this (incremental runs)
 
     Returns:
         Number of relationships created
     """
     logger.info("Linking statements to MPs...")
 
-    cypher = """
-        MATCH (s:Statement)
-        WHERE s.politician_id IS NOT NULL
-          AND NOT exists((s)-[:MADE_BY]->())
-        WITH s LIMIT $batch_size
-
-        MATCH (mp:MP)
-        WHERE mp.openparliament_politician_id = s.politician_id
-
-        MERGE (s)-[:MADE_BY]->(mp)
-        RETURN count(*) as created
-    """
-
-    total_created = 0
-    while True:
-        result = neo4j_client.run_query(cypher, {"batch_size": batch_size})
-        created = result[0]["created"] if result else 0
-
-        if created == 0:
-            break
-
-        total_created += created
-        logger.info(f"Progress: {total_created:,} MADE_BY relationships created")
-
-    logger.info(f"Created {total_created:,} MADE_BY relationships")
-    return total_created
+    return neo4j_client.link_by_keyset(
+        "MADE_BY",
+        source_label="Statement",
+        source_prop="politician_id",
+        target_label="MP",
+        target_prop="openparliament_politician_id",
+        batch_size=batch_size,
+        start_after=since_id,
+    )
 
 
 def link_statements_to_documents(
     neo4j_client: Neo4jClient,
     batch_size: int = 10000,
+    since_id: Optional[int] = None,
 ) -> int:
     """
     Create PART_OF relationships between Statements and Documents.
@@ -412,42 +574,28 @@ def link_statements_to_documents(
     Args:
         neo4j_client: Neo4j client instance
         batch_size: Batch size for relationship creation
+        since_id: Only link statements with ids above this (incremental runs)
 
     Returns:
         Number of relationships created
     """
     logger.info("Linking statements to documents...")
 
-    cypher = """
-        MATCH (s:Statement)
-        WHERE s.document_id IS NOT NULL
-          AND NOT exists((s)-[:PART_OF]->())
-        WITH s LIMIT $batch_size
-
-        MATCH (d:Document {id: s.document_id})
-
-        MERGE (s)-[:PART_OF]->(d)
-        RETURN count(*) as created
-    """
-
-    total_created = 0
-    while True:
-        result = neo4j_client.run_query(cypher, {"batch_size": batch_size})
-        created = result[0]["created"] if result else 0
-
-        if created == 0:
-            break
-
-        total_created += created
-        logger.info(f"Progress: {total_created:,} PART_OF relationships created")
-
-    logger.info(f"Created {total_created:,} PART_OF relationships")
-    return total_created
+    return neo4j_client.link_by_keyset(
+        "PART_OF",
+        source_label="Statement",
+        source_prop="document_id",
+        target_label="Document",
+        target_prop="id",
+        batch_size=batch_size,
+        start_after=since_id,
+    )
 
 
 def link_statements_to_bills(
     neo4j_client: Neo4jClient,
     batch_size: int = 10000,
+    since_id: Optional[int] = None,
 ) -> int:
     """
     Create MENTIONS relationships between Statements and Bills.
@@ -458,76 +606,78 @@ def link_statements_to_bills(
     Args:
         neo4j_client: Neo4j client instance
         batch_size: Batch size for relationship creation
+        since_id: Only link statements with ids above this (incremental runs)
 
     Returns:
         Number of relationships created
     """
     logger.info("Linking statements to bills...")
 
-    cypher = """
-        MATCH (s:Statement)
-        WHERE s.bill_debated_id IS NOT NULL
-          AND NOT exists((s)-[:MENTIONS]->())
-        WITH s LIMIT $batch_size
-
-        MATCH (b:Bill)
-        WHERE b.openparliament_bill_id = s.bill_debated_id
-
-        MERGE (s)-[r:MENTIONS]->(b)
-        SET r.debate_stage = s.bill_debate_stage
-        RETURN count(*) as created
-    """
-
-    total_created = 0
-    while True:
-        result = neo4j_client.run_query(cypher, {"batch_size": batch_size})
-        created = result[0]["created"] if result else 0
-
-        if created == 0:
-            break
-
-        total_created += created
-        logger.info(f"Progress: {total_created:,} MENTIONS relationships created")
-
-    logger.info(f"Created {total_created:,} MENTIONS relationships")
-    return total_created
+    return neo4j_client.link_by_keyset(
+        "MENTIONS",
+        source_label="Statement",
+        source_prop="bill_debated_id",
+        target_label="Bill",
+        target_prop="openparliament_bill_id",
+        rel_properties={"debate_stage": "bill_debate_stage"},
+        batch_size=batch_size,
+        start_after=since_id,
+    )
 
 
-def create_hansard_indexes(neo4j_client: Neo4jClient) -> None:
+def create_hansard_indexes(neo4j_client: Neo4jClient, content_storage: Optional[str] = None) -> None:
     """
     Create indexes for efficient Hansard queries.
 
     Creates:
     - Full-text indexes on Statement.content_en and Statement.content_fr
+      (StatementContent.content_en/fr as statement_body_en/fr in "nodes" mode;
+      none in "blob" mode, which is searched with the local search index)
     - Regular indexes on Statement(document_id, time)
     - Index on Document.date
 
     Args:
         neo4j_client: Neo4j client instance
+        content_storage: "inline", "nodes" or "blob" (default: PIPELINE_CONTENT_STORAGE)
     """
     logger.info("Creating Hansard indexes...")
-
-    # Full-text index on English content
-    try:
-        neo4j_client.run_query("""
-            CREATE FULLTEXT INDEX statement_content_en IF NOT EXISTS
-            FOR (s:Statement)
-            ON EACH [s.content_en]
-        """)
-        logger.info("Created full-text index on Statement.content_en")
-    except Exception as e:
-        logger.warning(f"Could not create statement_content_en index: {e}")
-
-    # Full-text index on French content
-    try:
-        neo4j_client.run_query("""
-            CREATE FULLTEXT INDEX statement_content_fr IF NOT EXISTS
-            FOR (s:Statement)
-            ON EACH [s.content_fr]
-        """)
-        logger.info("Created full-text index on Statement.content_fr")
-    except Exception as e:
-        logger.warning(f"Could not create statement_content_fr index: {e}")
+    content_storage = content_storage_mode(content_storage)
+
+    if content_storage == "nodes":
+        create_content_constraints(neo4j_client, "Statement")
+        for language in ("en", "fr"):
+            try:
+                neo4j_client.run_query(f"""
+                    CREATE FULLTEXT INDEX statement_body_{language} IF NOT EXISTS
+                    FOR (c:{CONTENT_LABELS["Statement"]})
+                    ON EACH [c.content_{language}]
+                """)
+                logger.info(f"Created full-text index on StatementContent.content_{language}")
+            except Exception as e:
+                logger.warning(f"Could not create statement_body_{language} index: {e}")
+
+    elif content_storage == "inline":
+        # Full-text index on English content
+        try:
+            neo4j_client.run_query("""
+                CREATE FULLTEXT INDEX statement_content_en IF NOT EXISTS
+                FOR (s:Statement)
+                ON EACH [s.content_en]
+            """)
+            logger.info("Created full-text index on Statement.content_en")
+        except Exception as e:
+            logger.warning(f"Could not create statement_content_en index: {e}")
+
+        # Full-text index on French content
+        try:
+            neo4j_client.run_query("""
+                CREATE FULLTEXT INDEX statement_content_fr IF NOT EXISTS
+                FOR (s:Statement)
+                ON EACH [s.content_fr]
+            """)
+            logger.info("Created full-text index on Statement.content_fr")
+        except Exception as e:
+            logger.warning(f"Could not create statement_content_fr index: {e}")
 
     # Composite index for statement lookups by document and time
     try:
@@ -558,7 +708,8 @@ def extract_hansard_keywords(
     neo4j_client: Neo4jClient,
     session_id: Optional[str] = None,
     limit: Optional[int] = None,
-    top_n: int = 20
+    top_n: int = 20,
+    content_storage: Optional[str] = None,
 ) -> int:
     """
     Extract and populate keywords for Hansard documents using TF-IDF.
@@ -570,11 +721,13 @@ def extract_hansard_keywords(
         session_id: Optional specific session to process (e.g., "45-1")
         limit: Optional limit for number of documents to process
         top_n: Number of keywords to extract per document
+        content_storage: "inline", "nodes" or "blob" (default: PIPELINE_CONTENT_STORAGE)
 
     Returns:
         Number of documents updated with keywords
     """
     logger.info("Extracting keywords for Hansard documents...")
+    blob_store = ContentBlobStore() if content_storage_mode(content_storage) == "blob" else None
 
     # Get sessions to process
     if session_id:
@@ -617,17 +770,25 @@ def extract_hansard_keywords(
         doc_ids = [doc['doc_id'] for doc in documents]
         logger.info(f"  Processing {len(doc_ids)} documents in session {session}")
 
-        # Get all statement text for corpus
+        # Get all statement text for corpus (inline, or on linked content nodes)
         corpus_query = """
             MATCH (d:Document)<-[:PART_OF]-(s:Statement)
             WHERE d.id IN $doc_ids
               AND s.procedural = false
+            OPTIONAL MATCH (s)-[:HAS_CONTENT]->(c:StatementContent)
             RETURN d.id as doc_id,
-                   collect(COALESCE(s.content_en, '')) as contents_en,
-                   collect(COALESCE(s.content_fr, '')) as contents_fr
+                   collect(s.id) as statement_ids,
+                   collect(COALESCE(c.content_en, s.content_en, '')) as contents_en,
+                   collect(COALESCE(c.content_fr, s.content_fr, '')) as contents_fr
         """
         result = neo4j_client.run_query(corpus_query, {"doc_ids": doc_ids})
 
+        if blob_store:
+            for row in result:
+                bodies = blob_store.get_many("Statement", row['statement_ids'])
+                row['contents_en'] = [bodies.get(i, {}).get('content_en') or '' for i in row['statement_ids']]
+                row['contents_fr'] = [bodies.get(i, {}).get('content_fr') or '' for i in row['statement_ids']]
+
         # Build document texts and corpus
         doc_texts = {}
         corpus_en = []
@@ -682,6 +843,8 @@ def extract_hansard_keywords(
 
         tracker.close()
 
+    if blob_store:
+        blob_store.close()
     logger.success(f"✅ Extracted keywords for {total_updated} documents")
     return total_updated
 
@@ -716,7 +879,7 @@ def ingest_hansard_sample(
         ORDER BY time DESC
         LIMIT {statement_limit}
     """
-    statements = postgres_client.execute_query(query)
+    statements = postgres_client.copy_query(query)
     # Extract unique document IDs
     document_ids = list(set(row["document_id"] for row in statements))
 
@@ -730,7 +893,7 @@ def ingest_hansard_sample(
         FROM hansards_document
         WHERE id IN ({','.join(map(str, document_ids))})
     """
-    documents = postgres_client.execute_query(doc_query)
+    documents = postgres_client.copy_query(doc_query)
 
     # Create documents
     results["documents"] = ingest_hansard_documents(
@@ -821,3 +984,220 @@ def ingest_hansard_full(
     logger.info(f"=" * 80)
 
     return results
+
+
+def ingest_hansard_incremental(
+    neo4j_client: Neo4jClient,
+    postgres_client: PostgresClient,
+    lookback_days: int = 7,
+    content_storage: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Import Hansard rows added since the last run, using the stored watermarks.
+
+    Work is proportional to the new rows rather than the 3.67M-statement table:
+    only new statements are extracted and linked, and documents (with their
+    statements, to pick up corrections) are re-read only for the last
+    ``lookback_days``.
+
+    Args:
+        neo4j_client: Neo4j client instance
+        postgres_client: PostgreSQL client instance
+        lookback_days: Window of recent documents re-read to pick up changes
+        content_storage: "inline", "nodes" or "blob" (default: PIPELINE_CONTENT_STORAGE)
+
+    Returns:
+        Dictionary with counts of created nodes and relationships
+    """
+    logger.info(f"=" * 80)
+    logger.info(f"HANSARD INCREMENTAL IMPORT")
+    logger.info(f"=" * 80)
+
+    since_id = WatermarkRegistry(neo4j_client).get("hansards_statement").get("id")
+    if since_id is not None:
+        # Re-read statements are relinked too, in case a correction changed their speaker or bill
+        recent = postgres_client.execute_query(
+            "SELECT min(id) AS min_id FROM hansards_statement "
+            "WHERE document_id IN (SELECT id FROM hansards_document WHERE date >= %s)",
+            (lookback_date(lookback_days),),
+        )
+        if recent and recent[0]["min_id"] is not None:
+            since_id = min(since_id, recent[0]["min_id"] - 1)
+
+    results = {}
+    results["documents"] = ingest_hansard_documents(
+        neo4j_client,
+        postgres_client,
+        incremental=True,
+        lookback_days=lookback_days,
+    )
+    results["statements"] = ingest_hansard_statements(
+        neo4j_client,
+        postgres_client,
+        incremental=True,
+        lookback_days=lookback_days,
+        content_storage=content_storage,
+    )
+
+    # Only the statements written above need relationships
+    results["made_by_links"] = link_statements_to_mps(neo4j_client, since_id=since_id)
+    results["part_of_links"] = link_statements_to_documents(neo4j_client, since_id=since_id)
+    results["mentions_links"] = link_statements_to_bills(neo4j_client, since_id=since_id)
+
+    logger.info(f"=" * 80)
+    logger.info(f"HANSARD INCREMENTAL IMPORT COMPLETE")
+    logger.info(f"Documents: {results['documents']:,}")
+    logger.info(f"Statements: {results['statements']:,}")
+    logger.info(f"MP links: {results['made_by_links']:,}")
+    logger.info(f"Document links: {results['part_of_links']:,}")
+    logger.info(f"Bill mentions: {results['mentions_links']:,}")
+    logger.info(f"=" * 80)
+
+    return results
+
+
+def index_hansard_statements(
+    postgres_client: PostgresClient,
+    index: Optional["HansardIndex"] = None,
+    rebuild: bool = False,
+    batch_size: int = 20000,
+    lookback_days: int = 7,
+) -> int:
+    """
+    Add new and changed Hansard statements to the local full-text search index.
+
+    Reads the same changed rows as ingest_hansard_incremental: statements past
+    the index's highest statement id, plus those of documents dated within
+    ``lookback_days`` (re-indexed statements replace their old copies). Rows are
+    read in id order and written as new segments; the index merges segments as
+    they accumulate (see search/index.py). A rebuild re-reads the whole table
+    into an empty index.
+
+    Args:
+        postgres_client: PostgreSQL client instance
+        index: Index to update (default: HansardIndex() at ~/.cache/fedmcp/hansard_index)
+        rebuild: Drop every segment first and index all statements
+        batch_size: Rows per COPY batch
+        lookback_days: Window of recent documents whose statements are re-indexed
+
+    Returns:
+        Number of statements indexed
+    """
+    from ..search import HansardIndex
+
+    index = index or HansardIndex()
+    if rebuild:
+        index.clear()
+
+    last_id = index.max_statement_id
+    since = lookback_date(lookback_days)
+    params = (last_id, since)
+    count = postgres_client.execute_query(
+        f"SELECT count(*) AS count FROM hansards_statement WHERE {CHANGED_STATEMENTS_FILTER}", params
+    )
+    total = count[0]["count"] if count else 0
+    if not total:
+        logger.info(f"Search index is up to date (statement id {last_id:,})")
+        return 0
+
+    logger.info(
+        f"Indexing {total:,} statements after id {last_id:,} or in documents since {since} "
+        f"in {index.directory}"
+    )
+    tracker = ProgressTracker(total=total, desc="Indexing statements")
+    indexed = 0
+    for batch in postgres_client.copy_batches(SEARCH_STATEMENTS_QUERY, params, batch_size=batch_size):
+        rows = batch.dicts()
+        indexed += index.add_statements({**statement_row(row), "party": row["party"]} for row in rows)
+        tracker.update(len(rows))
+    tracker.close()
+
+    index.commit()
+    stats = index.stats()
+    logger.info(
+        f"Indexed {indexed:,} statements; index holds {stats['docs']:,} statements "
+        f"in {stats['segments']} segments ({stats['size_mb']:,} MB)"
+    )
+    return indexed
+
+
+def export_hansard_full(
+    writer: AdminImportWriter,
+    postgres_client: PostgresClient,
+    batch_size: int = 50000,
+    content_storage: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Write ALL Hansard data as neo4j-admin import files (offline full load).
+
+    Produces the same Document/Statement properties and MADE_BY/PART_OF/MENTIONS
+    relationships as ingest_hansard_full, for loading into an empty database
+    with run_admin_import. Statement bodies follow ``content_storage`` as in
+    ingest_hansard_statements (StatementContent nodes and HAS_CONTENT
+    relationships, or the blob store). MADE_BY and MENTIONS are resolved
+    through ``openparliament_politician_id``/``openparliament_bill_id``, so the
+    same writer must also receive OpenParliamentBulkImporter.import_mps and
+    import_bills; statements whose MP or bill was not written lose the edge.
+
+    Args:
+        writer: AdminImportWriter collecting the import files
+        postgres_client: PostgreSQL client instance
+        batch_size: Rows per COPY batch
+        content_storage: "inline", "nodes" or "blob" (default: PIPELINE_CONTENT_STORAGE)
+
+    Returns:
+        Dictionary with counts of exported nodes and relationships
+    """
+    logger.info("Exporting Hansard for offline import...")
+    results = {"documents": 0, "statements": 0, "made_by_links": 0, "part_of_links": 0, "mentions_links": 0}
+    loaded_at = datetime.now(timezone.utc)
+    content_storage = content_storage_mode(content_storage)
+    blob_store = ContentBlobStore() if content_storage == "blob" else None
+    log_content_storage("Statement", content_storage, blob_store)
+
+    for batch in postgres_client.copy_batches(DOCUMENTS_QUERY, batch_size=batch_size):
+        documents_data = [{**document_row(doc), "updated_at": loaded_at} for doc in batch.dicts()]
+        results["documents"] += writer.batch_create_nodes("Document", documents_data)
+
+    total = postgres_client.get_table_row_count("hansards_statement")
+    tracker = ProgressTracker(total=total, desc="Exporting Statement nodes")
+    for batch in postgres_client.copy_batches(STATEMENTS_QUERY, batch_size=batch_size):
+        statements_data = [{**statement_row(stmt), "updated_at": loaded_at} for stmt in batch.dicts()]
+        bodies = split_content("Statement", statements_data) if content_storage != "inline" else None
+        results["statements"] += writer.batch_create_nodes("Statement", statements_data)
+
+        if content_storage == "nodes":
+            writer.batch_create_nodes("StatementContent", bodies)
+            writer.batch_create_relationships(
+                "HAS_CONTENT",
+                [{"from_id": body["id"], "to_id": body["id"]} for body in bodies],
+                from_label="Statement", to_label="StatementContent",
+            )
+        elif content_storage == "blob":
+            blob_store.put_many("Statement", bodies)
+
+        results["made_by_links"] += writer.batch_create_relationships(
+            "MADE_BY",
+            [{"from_id": s["id"], "to_id": s["politician_id"]} for s in statements_data if s["politician_id"] is not None],
+            from_label="Statement", to_label="MP", to_key="openparliament_politician_id",
+        )
+        results["part_of_links"] += writer.batch_create_relationships(
+            "PART_OF",
+            [{"from_id": s["id"], "to_id": s["document_id"]} for s in statements_data if s["document_id"] is not None],
+            from_label="Statement", to_label="Document",
+        )
+        results["mentions_links"] += writer.batch_create_relationships(
+            "MENTIONS",
+            [
+                {"from_id": s["id"], "to_id": s["bill_debated_id"], "properties": {"debate_stage": s["bill_debate_stage"]}}
+                for s in statements_data if s["bill_debated_id"] is not None
+            ],
+            from_label="Statement", to_label="Bill", to_key="openparliament_bill_id",
+        )
+        tracker.update(len(statements_data))
+
+    tracker.close()
+    if blob_store:
+        blob_store.close()
+    logger.info(f"Exported {results['documents']:,} documents and {results['statements']:,} statements")
+    return results
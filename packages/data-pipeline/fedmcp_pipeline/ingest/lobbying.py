@@ -11,8 +11,10 @@ sys.path.insert(0, str(FEDMCP_PATH))
 
 from fedmcp.clients.lobbying import LobbyingRegistryClient
 
-from ..utils.neo4j_client import Neo4jClient
+from ..utils.name_matching import normalize_name
+from ..utils.neo4j_client import Neo4jClient, stable_id
 from ..utils.progress import logger
+from ..utils.run_report import record_extracted
 
 
 def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) -> Dict[str, int]:
@@ -45,6 +47,7 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
     logger.info("Fetching lobby registrations (may download 90MB on first run)...")
     registrations = lobby_client.search_registrations(active_only=False, limit=None)
     logger.info(f"Found {len(registrations):,} registrations")
+    record_extracted(len(registrations))
 
     # Transform to Neo4j format with ALL fields
     reg_data = []
@@ -53,7 +56,7 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
         org_name = reg.client_org_name
         if org_name and org_name not in unique_organizations:
             unique_organizations[org_name] = {
-                "id": f"org-{len(unique_organizations)}",
+                "id": stable_id("org", normalize_name(org_name)),
                 "name": org_name,
             }
 
@@ -61,7 +64,7 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
         lobbyist_name = reg.registrant_name
         if lobbyist_name and lobbyist_name not in unique_lobbyists:
             unique_lobbyists[lobbyist_name] = {
-                "id": f"lobbyist-{len(unique_lobbyists)}",
+                "id": stable_id("lobbyist", normalize_name(lobbyist_name)),
                 "name": lobbyist_name,
             }
 
@@ -84,12 +87,14 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
         if (i + 1) % 10000 == 0:
             logger.info(f"Processed {i + 1:,} registrations...")
 
-    stats["lobby_registrations"] = neo4j_client.batch_create_nodes("LobbyRegistration", reg_data, batch_size)
+    # Upserts write only new or changed rows, so a rerun leaves unchanged nodes (and their updated_at) alone
+    stats["lobby_registrations"] = neo4j_client.batch_upsert_nodes("LobbyRegistration", reg_data, batch_size=batch_size).total
 
     # 2. Lobby Communications
     logger.info("Fetching lobby communications...")
     communications = lobby_client.search_communications(limit=None)  # Process ALL
     logger.info(f"Found {len(communications):,} communications")
+    record_extracted(len(communications))
 
     comm_data = []
     for i, comm in enumerate(communications):
@@ -97,7 +102,7 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
         org_name = comm.client_org_name
         if org_name and org_name not in unique_organizations:
             unique_organizations[org_name] = {
-                "id": f"org-{len(unique_organizations)}",
+                "id": stable_id("org", normalize_name(org_name)),
                 "name": org_name,
             }
 
@@ -105,7 +110,7 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
         lobbyist_name = comm.registrant_name
         if lobbyist_name and lobbyist_name not in unique_lobbyists:
             unique_lobbyists[lobbyist_name] = {
-                "id": f"lobbyist-{len(unique_lobbyists)}",
+                "id": stable_id("lobbyist", normalize_name(lobbyist_name)),
                 "name": lobbyist_name,
             }
 
@@ -127,17 +132,21 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
         if (i + 1) % 10000 == 0:
             logger.info(f"Processed {i + 1:,} communications...")
 
-    stats["lobby_communications"] = neo4j_client.batch_create_nodes("LobbyCommunication", comm_data, batch_size)
+    stats["lobby_communications"] = neo4j_client.batch_upsert_nodes("LobbyCommunication", comm_data, batch_size=batch_size).total
 
     # 3. Create Organizations
     logger.info(f"Creating {len(unique_organizations):,} unique organizations...")
     org_data = list(unique_organizations.values())
-    stats["organizations"] = neo4j_client.batch_create_nodes("Organization", org_data, batch_size)
+    stats["organizations"] = neo4j_client.batch_upsert_nodes(
+        "Organization", org_data, merge_keys=["name"], batch_size=batch_size
+    ).total
 
     # 4. Create Lobbyists
     logger.info(f"Creating {len(unique_lobbyists):,} unique lobbyists...")
     lobbyist_data = list(unique_lobbyists.values())
-    stats["lobbyists"] = neo4j_client.batch_create_nodes("Lobbyist", lobbyist_data, batch_size)
+    stats["lobbyists"] = neo4j_client.batch_upsert_nodes(
+        "Lobbyist", lobbyist_data, merge_keys=["name"], batch_size=batch_size
+    ).total
 
     logger.info("=" * 60)
     logger.success("✅ LOBBYING DATA INGESTION COMPLETE")
@@ -14,8 +14,11 @@ sys.path.insert(0, str(FEDMCP_PATH))
 from fedmcp.clients.openparliament import OpenParliamentClient
 from fedmcp.clients.legisinfo import LegisInfoClient
 
+from ..utils.name_matching import MPNameResolver
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger, ProgressTracker, batch_iterator
+from ..utils.run_report import record_extracted
+from ..utils.stages import Stage, StageRunner
 
 
 def detect_province(riding_name: str) -> Optional[str]:
@@ -84,6 +87,7 @@ def ingest_mps(neo4j_client: Neo4jClient, batch_size: int = 10000) -> int:
     # Fetch all MPs (current + historical) - list endpoint for URLs
     mps_list = list(op_client.list_mps())
     logger.info(f"Found {len(mps_list):,} MPs, fetching detailed information...")
+    record_extracted(len(mps_list))
 
     # Fetch detailed data for each MP
     mps_data = []
@@ -184,10 +188,10 @@ def ingest_mps(neo4j_client: Neo4jClient, batch_size: int = 10000) -> int:
             mp_props = {k: v for k, v in mp_props.items() if v is not None}
             mps_data.append(mp_props)
 
-    # Batch create MPs
-    created = neo4j_client.batch_create_nodes("MP", mps_data, batch_size=batch_size)
-    logger.success(f"✅ Created {created:,} MPs with full details")
-    return created
+    # Upsert MPs (only new or changed rows are written)
+    result = neo4j_client.batch_upsert_nodes("MP", mps_data, batch_size=batch_size)
+    logger.success(f"✅ MPs with full details: {result}")
+    return result.total
 
 
 def ingest_parties(neo4j_client: Neo4jClient) -> int:
@@ -343,6 +347,7 @@ def ingest_bills(neo4j_client: Neo4jClient, batch_size: int = 10000, limit: Opti
             break
 
     logger.info(f"Found {len(bills_raw):,} bills")
+    record_extracted(len(bills_raw))
 
     # Fetch detailed bill information if requested
     if fetch_details:
@@ -383,10 +388,10 @@ def ingest_bills(neo4j_client: Neo4jClient, batch_size: int = 10000, limit: Opti
         bill_props = {k: v for k, v in bill_props.items() if v is not None}
         bills_data.append(bill_props)
 
-    # Batch merge bills (handle duplicates with composite key: number + session)
-    created = neo4j_client.batch_merge_nodes("Bill", bills_data, merge_keys=["number", "session"], batch_size=batch_size)
-    logger.success(f"✅ Merged {created:,} bills")
-    return created
+    # Upsert bills by composite key (number + session); only new or changed rows are written
+    result = neo4j_client.batch_upsert_nodes("Bill", bills_data, merge_keys=["number", "session"], batch_size=batch_size)
+    logger.success(f"✅ Bills: {result}")
+    return result.total
 
 
 def link_bill_sponsors(neo4j_client: Neo4jClient) -> int:
@@ -440,6 +445,7 @@ def ingest_bills_from_legisinfo_json(neo4j_client: Neo4jClient, batch_size: int
     bills_json = response.json()
 
     logger.info(f"Downloaded {len(bills_json):,} bills from LEGISinfo")
+    record_extracted(len(bills_json))
 
     # Transform to Neo4j format
     bills_data = []
@@ -496,9 +502,12 @@ def ingest_bills_from_legisinfo_json(neo4j_client: Neo4jClient, batch_size: int
         if sponsor_name and bill_number and session:
             sponsor_mapping[f"{bill_number}-{session}"] = sponsor_name
 
-    # Batch merge bills
-    created = neo4j_client.batch_merge_nodes("Bill", bills_data, merge_keys=["number", "session"], batch_size=batch_size)
-    logger.success(f"✅ Merged {created:,} bills from LEGISinfo JSON")
+    # Upsert bills; LEGISinfo keeps its own hash so it never clears properties set by the API ingest
+    result = neo4j_client.batch_upsert_nodes(
+        "Bill", bills_data, merge_keys=["number", "session"], batch_size=batch_size, hash_property="legisinfo_hash"
+    )
+    created = result.total
+    logger.success(f"✅ Bills from LEGISinfo JSON: {result}")
 
     # Create SPONSORED relationships using sponsor names
     logger.info("Creating SPONSORED relationships from sponsor names...")
@@ -508,16 +517,21 @@ def ingest_bills_from_legisinfo_json(neo4j_client: Neo4jClient, batch_size: int
     return created
 
 
-def link_bill_sponsors_by_name(neo4j_client: Neo4jClient, sponsor_mapping: Dict[str, str]) -> int:
+def link_bill_sponsors_by_name(
+    neo4j_client: Neo4jClient,
+    sponsor_mapping: Dict[str, str],
+    resolver: Optional[MPNameResolver] = None,
+) -> int:
     """
     Create SPONSORED relationships using sponsor names from LEGISinfo.
 
     LEGISinfo provides sponsor names (e.g., "Hon. Mark Carney") rather than URLs,
-    so we need to match against MP names in the database.
+    so they are resolved to MP ids in memory and linked in one batch.
 
     Args:
         neo4j_client: Neo4j client
         sponsor_mapping: Dict mapping "bill_number-session" to sponsor name
+        resolver: Name resolver to reuse (built from the MP nodes if omitted)
 
     Returns:
         Number of relationships created
@@ -525,50 +539,30 @@ def link_bill_sponsors_by_name(neo4j_client: Neo4jClient, sponsor_mapping: Dict[
     if not sponsor_mapping:
         return 0
 
-    # Strategy: Try exact name match, then fuzzy match on family name
-    query = """
-    UNWIND $bill_sponsors AS bs
-    MATCH (b:Bill {number: bs.bill_number, session: bs.session})
+    resolver = resolver or MPNameResolver.from_neo4j(neo4j_client)
+    matches = resolver.resolve_many(sponsor_mapping.values(), label="bill sponsors")
 
-    // Try exact match first
-    OPTIONAL MATCH (m1:MP)
-    WHERE m1.name = bs.sponsor_name
-       OR m1.name CONTAINS bs.sponsor_name
-       OR bs.sponsor_name CONTAINS m1.name
-
-    // If no exact match, try matching on family name
-    OPTIONAL MATCH (m2:MP)
-    WHERE bs.sponsor_name CONTAINS m2.family_name
-      AND m2.family_name IS NOT NULL
-      AND size(m2.family_name) > 3
-
-    WITH b, COALESCE(m1, m2) AS mp
-    WHERE mp IS NOT NULL
-    MERGE (mp)-[:SPONSORED]->(b)
-    RETURN count(*) as relationships_created
-    """
-
-    # Prepare data
     bill_sponsors = []
     for bill_key, sponsor_name in sponsor_mapping.items():
         parts = bill_key.rsplit("-", 1)
-        if len(parts) == 2:
+        match = matches.get(sponsor_name)
+        if len(parts) == 2 and match:
             bill_number, session = parts
-            # Clean sponsor name - remove titles
-            clean_name = sponsor_name
-            for title in ["Hon. ", "Sen. ", "Mr. ", "Mrs. ", "Ms. ", "Dr. "]:
-                clean_name = clean_name.replace(title, "")
-            clean_name = clean_name.strip()
-
             bill_sponsors.append({
                 "bill_number": bill_number,
                 "session": session,
-                "sponsor_name": clean_name
+                "mp_id": match.mp_id,
+                "confidence": match.confidence,
             })
 
-    result = neo4j_client.run_query(query, {"bill_sponsors": bill_sponsors})
-    count = result[0]["relationships_created"] if result else 0
-    return count
+    query = """
+    UNWIND $bill_sponsors AS bs
+    MATCH (b:Bill {number: bs.bill_number, session: bs.session})
+    MATCH (m:MP {id: bs.mp_id})
+    MERGE (m)-[r:SPONSORED]->(b)
+    SET r.match_confidence = bs.confidence
+    """
+    return neo4j_client.batch_write(query, bill_sponsors, param="bill_sponsors") if bill_sponsors else 0
 
 
 def ingest_votes(neo4j_client: Neo4jClient, batch_size: int = 10000, limit: Optional[int] = None) -> int:
@@ -583,6 +577,7 @@ def ingest_votes(neo4j_client: Neo4jClient, batch_size: int = 10000, limit: Opti
             break
 
     logger.info(f"Found {len(votes_raw):,} votes")
+    record_extracted(len(votes_raw))
 
     # Transform to Neo4j format
     votes_data = []
@@ -604,10 +599,10 @@ def ingest_votes(neo4j_client: Neo4jClient, batch_size: int = 10000, limit: Opti
         vote_props = {k: v for k, v in vote_props.items() if v is not None}
         votes_data.append(vote_props)
 
-    # Batch create votes
-    created = neo4j_client.batch_create_nodes("Vote", votes_data, batch_size=batch_size)
-    logger.success(f"✅ Created {created:,} votes")
-    return created
+    # Upsert votes (only new or changed rows are written)
+    result = neo4j_client.batch_upsert_nodes("Vote", votes_data, batch_size=batch_size)
+    logger.success(f"✅ Votes: {result}")
+    return result.total
 
 
 def ingest_committees(neo4j_client: Neo4jClient) -> int:
@@ -617,6 +612,7 @@ def ingest_committees(neo4j_client: Neo4jClient) -> int:
 
     committees_raw = list(op_client.list_committees())
     logger.info(f"Found {len(committees_raw)} committees")
+    record_extracted(len(committees_raw))
 
     # Transform to Neo4j format
     committees_data = []
@@ -676,6 +672,7 @@ def ingest_government_roles(neo4j_client: Neo4jClient, batch_size: int = 10000)
     logger.info("Fetching Cabinet ministers...")
     ministers = roles_client.get_ministers()
     logger.info(f"Found {len(ministers)} ministers")
+    record_extracted(len(ministers))
 
     for minister in ministers:
         role_props = {
@@ -696,6 +693,7 @@ def ingest_government_roles(neo4j_client: Neo4jClient, batch_size: int = 10000)
     logger.info("Fetching Parliamentary Secretaries...")
     secretaries = roles_client.get_parliamentary_secretaries()
     logger.info(f"Found {len(secretaries)} Parliamentary Secretaries")
+    record_extracted(len(secretaries))
 
     for ps in secretaries:
         role_props = {
@@ -708,10 +706,10 @@ def ingest_government_roles(neo4j_client: Neo4jClient, batch_size: int = 10000)
         }
         roles_data.append({k: v for k, v in role_props.items() if v is not None})
 
-    # Batch create roles
-    created = neo4j_client.batch_create_nodes("Role", roles_data, batch_size=batch_size)
-    logger.success(f"✅ Created {created} government roles")
-    return created
+    # Upsert roles (only new or changed rows are written)
+    result = neo4j_client.batch_upsert_nodes("Role", roles_data, batch_size=batch_size)
+    logger.success(f"✅ Government roles: {result}")
+    return result.total
 
 
 def link_government_roles(neo4j_client: Neo4jClient) -> int:
@@ -746,15 +744,17 @@ def link_government_roles(neo4j_client: Neo4jClient) -> int:
     return count
 
 
-def ingest_committee_memberships(neo4j_client: Neo4jClient) -> int:
+def ingest_committee_memberships(neo4j_client: Neo4jClient, max_workers: int = 4) -> int:
     """
     Scrape committee membership from House of Commons website and create MEMBER_OF relationships.
 
-    This scrapes the current membership from committee pages at ourcommons.ca
-    and creates relationships between MPs and Committees with role information.
+    Committee pages at ourcommons.ca are fetched concurrently, members are
+    resolved to MP ids in memory, and every MEMBER_OF relationship (with role
+    information) is written in one batch.
 
     Args:
         neo4j_client: Neo4j client instance
+        max_workers: Maximum concurrent requests to ourcommons.ca
 
     Returns:
         Number of relationships created
@@ -772,76 +772,101 @@ def ingest_committee_memberships(neo4j_client: Neo4jClient) -> int:
         return 0
 
     membership_client = CommitteeMembershipClient()
-    relationships_created = 0
-    failed_committees = []
+    members_by_code, errors = membership_client.get_members_for_committees(
+        (committee["code"] for committee in committees), max_workers=max_workers,
+    )
+    for code, error in errors.items():
+        logger.error(f"Failed to fetch members for {code}: {error}")
+    logger.info(
+        f"Fetched {sum(len(members) for members in members_by_code.values()):,} members "
+        f"of {len(members_by_code)} committees"
+    )
 
-    for committee in committees:
-        code = committee["code"]
-        name = committee["name"]
+    # Resolve member names to MP ids in memory
+    resolver = MPNameResolver.from_neo4j(neo4j_client)
+    matches = resolver.resolve_many(
+        (member.name for members in members_by_code.values() for member in members),
+        label="committee members",
+    )
 
-        try:
-            logger.info(f"Fetching members for {code} ({name})...")
-            members = membership_client.get_committee_members(code)
-            logger.info(f"Found {len(members)} members for {code}")
-
-            # Create relationships for each member
-            for member in members:
-                # Try to match MP by name
-                # Use case-insensitive matching and handle various name formats
-                match_query = """
-                MATCH (m:MP)
-                WHERE toLower(m.name) = toLower($member_name)
-                   OR toLower(m.name) CONTAINS toLower($member_name)
-                   OR toLower($member_name) CONTAINS toLower(m.name)
-                MATCH (c:Committee {code: $committee_code})
-                MERGE (m)-[r:MEMBER_OF]->(c)
-                SET r.role = $role,
-                    r.updated_at = $updated_at
-                RETURN count(*) as created
-                """
-
-                result = neo4j_client.run_query(
-                    match_query,
-                    {
-                        "member_name": member.name,
-                        "committee_code": code,
-                        "role": member.role,
-                        "updated_at": datetime.utcnow().isoformat(),
-                    }
-                )
-
-                if result and result[0]["created"] > 0:
-                    relationships_created += result[0]["created"]
-                    logger.debug(f"  ✓ Linked {member.name} as {member.role}")
-                else:
-                    logger.warning(f"  ✗ Could not find MP: {member.name}")
+    updated_at = datetime.utcnow().isoformat()
+    memberships = []
+    for code, members in members_by_code.items():
+        for member in members:
+            match = matches.get(member.name)
+            if not match:
+                logger.warning(f"  ✗ Could not find MP: {member.name} ({code})")
+                continue
+            memberships.append({
+                "from_id": match.mp_id,
+                "to_id": code,
+                "properties": {"role": member.role, "updated_at": updated_at},
+            })
 
-        except Exception as e:
-            logger.error(f"Failed to fetch members for {code}: {e}")
-            failed_committees.append(code)
-            continue
+    relationships_created = neo4j_client.batch_merge_relationships(
+        "MEMBER_OF", memberships, from_label="MP", to_label="Committee", to_key="code",
+    ) if memberships else 0
 
     logger.success(f"✅ Created {relationships_created} committee membership relationships")
-    if failed_committees:
-        logger.warning(f"Failed to fetch membership for {len(failed_committees)} committees: {', '.join(failed_committees)}")
+    if errors:
+        logger.warning(f"Failed to fetch membership for {len(errors)} committees: {', '.join(sorted(errors))}")
 
     return relationships_created
 
 
+def parliament_stages(
+    neo4j_client: Neo4jClient,
+    batch_size: int = 10000,
+    limit_votes: Optional[int] = None,
+) -> List[Stage]:
+    """
+    Parliament ingestion as schedulable stages.
+
+    Parties and ridings are derived from MP nodes and bill sponsors are matched
+    to MPs by name, so those wait for MPs; votes, committees and roles only need
+    their source APIs and run alongside them.
+
+    Args:
+        neo4j_client: Neo4j client
+        batch_size: Batch size for operations
+        limit_votes: Limit number of votes (for testing)
+
+    Returns:
+        Stages for StageRunner
+    """
+    # Bills use the LEGISinfo JSON bulk export, which also creates SPONSORED relationships
+    return [
+        Stage("mps", lambda: ingest_mps(neo4j_client, batch_size), resources=("http", "neo4j")),
+        Stage("parties", lambda: ingest_parties(neo4j_client), depends_on=["mps"]),
+        Stage("ridings", lambda: ingest_ridings(neo4j_client), depends_on=["mps"]),
+        Stage("bills", lambda: ingest_bills_from_legisinfo_json(neo4j_client, batch_size),
+              depends_on=["mps"], resources=("http", "neo4j")),
+        Stage("votes", lambda: ingest_votes(neo4j_client, batch_size, limit=limit_votes),
+              resources=("http", "neo4j")),
+        Stage("committees", lambda: ingest_committees(neo4j_client), resources=("http", "neo4j")),
+        Stage("roles", lambda: ingest_government_roles(neo4j_client, batch_size), resources=("http", "neo4j")),
+        Stage("role_relationships", lambda: link_government_roles(neo4j_client), depends_on=["mps", "roles"]),
+    ]
+
+
 def ingest_parliament_data(
     neo4j_client: Neo4jClient,
     batch_size: int = 10000,
     limit_bills: Optional[int] = None,
     limit_votes: Optional[int] = None,
+    limits: Optional[Dict[str, int]] = None,
 ) -> Dict[str, int]:
     """
     Run full parliament data ingestion pipeline.
 
+    Independent stages (see parliament_stages) run concurrently.
+
     Args:
         neo4j_client: Neo4j client
         batch_size: Batch size for operations
         limit_bills: Limit number of bills (for testing)
         limit_votes: Limit number of votes (for testing)
+        limits: Concurrent stages per resource tag (default: 4 HTTP, 2 Neo4j)
 
     Returns:
         Dict with counts of created entities
@@ -850,33 +875,14 @@ def ingest_parliament_data(
     logger.info("PARLIAMENT DATA INGESTION")
     logger.info("=" * 60)
 
-    stats = {}
-
-    # 1. MPs
-    stats["mps"] = ingest_mps(neo4j_client, batch_size)
-
-    # 2. Parties (derived from MPs)
-    stats["parties"] = ingest_parties(neo4j_client)
-
-    # 3. Ridings (derived from MPs)
-    stats["ridings"] = ingest_ridings(neo4j_client)
-
-    # 4. Bills (using LEGISinfo JSON bulk export - fast!)
-    # Note: This also creates SPONSORED relationships internally
-    stats["bills"] = ingest_bills_from_legisinfo_json(neo4j_client, batch_size)
-    stats["bill_sponsors"] = "included"  # Handled by ingest_bills_from_legisinfo_json
-
-    # 5. Votes
-    stats["votes"] = ingest_votes(neo4j_client, batch_size, limit=limit_votes)
-
-    # 6. Committees
-    stats["committees"] = ingest_committees(neo4j_client)
-
-    # 7. Government roles (Cabinet ministers and Parliamentary Secretaries)
-    stats["roles"] = ingest_government_roles(neo4j_client, batch_size)
+    stages = parliament_stages(neo4j_client, batch_size, limit_votes=limit_votes)
+    runner = StageRunner(stages, limits=limits or {"http": 4, "neo4j": 2})
+    run = runner.run()
+    run.log_report(runner.stages)
+    if run.failed:
+        raise RuntimeError(f"Parliament ingestion failed: {', '.join(run.failed)}")
 
-    # 8. Link government roles to MPs
-    stats["role_relationships"] = link_government_roles(neo4j_client)
+    stats = {name: result.result for name, result in run.results.items()}
 
     logger.info("=" * 60)
     logger.success("✅ PARLIAMENT DATA INGESTION COMPLETE")
@@ -884,7 +890,6 @@ def ingest_parliament_data(
     logger.info(f"Parties: {stats['parties']}")
     logger.info(f"Ridings: {stats['ridings']}")
     logger.info(f"Bills: {stats['bills']:,}")
-    logger.info(f"Bill Sponsors: {stats['bill_sponsors']:,}")
     logger.info(f"Votes: {stats['votes']:,}")
     logger.info(f"Committees: {stats['committees']}")
     logger.info(f"Government Roles: {stats['roles']}")
@@ -121,7 +121,7 @@ def enrich_politician_info(
         RETURN count(p) as enriched
         """
 
-        result = neo4j_client.run_query(cypher, {"politicians": batch})
+        result = neo4j_client.run_query(cypher, {"politicians": batch}, rows=len(batch))
         enriched = result[0]["enriched"] if result else 0
         total_enriched += enriched
 
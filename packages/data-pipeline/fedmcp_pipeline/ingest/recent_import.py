@@ -139,7 +139,7 @@ class RecentDataImporter:
             MATCH (d:Debate {id: rel.debate_id})
             MERGE (s)-[:IN_DEBATE]->(d)
             """
-            self.neo4j.run_query(rel_query, {"rels": relationships})
+            self.neo4j.run_query(rel_query, {"rels": relationships}, rows=len(relationships))
             logger.success(f"✅ Created {len(relationships)} relationships")
 
         return stats
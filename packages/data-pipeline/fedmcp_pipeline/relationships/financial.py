@@ -1,19 +1,77 @@
-"""Financial flow relationships: INCURRED, RECEIVED, DONATED."""
+"""Financial flow relationships: INCURRED, RECEIVED, DONATED.
+
+``ingest_financial_data`` writes these edges at ingest time from the MP ids,
+vendor/recipient names and party codes it has already resolved in memory.
+``build_financial_flows`` is the repair pass: it links financial nodes that
+are still missing their edge (e.g. an Expense loaded before its MP existed)
+using the same stored keys, so every lookup is an indexed MATCH.
+"""
 
 from typing import Dict, Any
 
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger
 
+# label -> (relationship, source label, source key, property on the node holding that key)
+FLOW_KEYS = {
+    "Expense": ("INCURRED", "MP", "id", "mp_id"),
+    "Contract": ("RECEIVED", "Organization", "name", "vendor"),
+    "Grant": ("RECEIVED", "Organization", "name", "recipient"),
+    "Donation": ("RECEIVED", "Party", "code", "party_code"),
+}
+
+
+def link_unlinked_flows(
+    neo4j_client: Neo4jClient,
+    label: str,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Create the flow edge for ``label`` nodes that do not have one yet.
+
+    Args:
+        neo4j_client: Neo4j client
+        label: Expense, Contract, Grant or Donation
+        batch_size: Batch size for operations
+
+    Returns:
+        Number of relationships merged
+    """
+    rel_type, source_label, source_key, node_key = FLOW_KEYS[label]
+    result = neo4j_client.run_query(
+        f"""
+        MATCH (n:{label})
+        WHERE n.{node_key} IS NOT NULL AND NOT (n)<-[:{rel_type}]-(:{source_label})
+        RETURN n.id AS id, n.{node_key} AS source
+        """
+    )
+    rels = [{"from_id": record["source"], "to_id": record["id"]} for record in result]
+    if not rels:
+        return 0
+
+    neo4j_client.ensure_index(source_label, source_key)
+    return neo4j_client.batch_merge_relationships(
+        rel_type,
+        rels,
+        from_label=source_label,
+        to_label=label,
+        from_key=source_key,
+        batch_size=batch_size,
+    )
+
 
 def build_financial_flows(neo4j_client: Neo4jClient, batch_size: int = 10000) -> Dict[str, int]:
     """
     Build financial flow relationships.
 
-    Creates:
+    Creates (for nodes the ingest could not link yet):
     - (MP)-[:INCURRED]->(Expense)
     - (Organization)-[:RECEIVED]->(Contract)
-    - (Organization)-[:DONATED]->(Party)
+    - (Organization)-[:RECEIVED]->(Grant)
+    - (Party)-[:RECEIVED]->(Donation)
+
+    (Organization)-[:DONATED]->(Party) is aggregated from contributions during
+    ingest_financial_data.
 
     Args:
         neo4j_client: Neo4j client
@@ -27,44 +85,15 @@ def build_financial_flows(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
     logger.info("=" * 60)
 
     stats = {}
-
-    # 1. MP INCURRED Expense
-    logger.info("Creating (MP)-[:INCURRED]->(Expense) relationships...")
-
-    result = neo4j_client.run_query(
-        """
-        MATCH (m:MP), (e:Expense)
-        WHERE e.mp_id = m.id
-        RETURN m.id AS mp_id, e.id AS expense_id
-        LIMIT 10000
-        """
-    )
-
-    incurred_rels = [
-        {"from_id": record["mp_id"], "to_id": record["expense_id"]}
-        for record in result
-    ]
-
-    if incurred_rels:
-        stats["incurred"] = neo4j_client.batch_create_relationships(
-            "INCURRED",
-            incurred_rels,
-            from_label="MP",
-            to_label="Expense",
-            batch_size=batch_size,
-        )
-    else:
-        stats["incurred"] = 0
-
-    # TODO: RECEIVED (contracts/grants), DONATED relationships
-    stats["received"] = 0
-    stats["donated"] = 0
+    for label in FLOW_KEYS:
+        stats[label.lower()] = link_unlinked_flows(neo4j_client, label, batch_size)
 
     logger.info("=" * 60)
     logger.success("✅ FINANCIAL FLOWS COMPLETE")
-    logger.info(f"INCURRED: {stats['incurred']:,}")
-    logger.info(f"RECEIVED: {stats['received']:,} (TODO)")
-    logger.info(f"DONATED: {stats['donated']:,} (TODO)")
+    logger.info(f"INCURRED (Expense): {stats['expense']:,}")
+    logger.info(f"RECEIVED (Contract): {stats['contract']:,}")
+    logger.info(f"RECEIVED (Grant): {stats['grant']:,}")
+    logger.info(f"RECEIVED (Donation): {stats['donation']:,}")
     logger.info("=" * 60)
 
     return stats
@@ -2,9 +2,13 @@
 
 from typing import Dict, Any
 
+from ..utils.name_matching import MPNameResolver
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger
 
+# DPOH lists mix MPs with public servants; don't link on fuzzy surname matches
+DPOH_MIN_CONFIDENCE = 0.9
+
 
 def build_lobbying_network(neo4j_client: Neo4jClient, batch_size: int = 10000) -> Dict[str, int]:
     """
@@ -96,16 +100,29 @@ def build_lobbying_network(neo4j_client: Neo4jClient, batch_size: int = 10000) -
     logger.info(f"Created {stats['conducted_by']:,} CONDUCTED_BY relationships")
 
     # 6. Link LobbyCommunications to MPs (CONTACTED)
-    # Match DPOH names to MP names - this is fuzzy matching
+    # DPOH names are resolved to MP ids in memory; most DPOHs are public
+    # servants, so only high-confidence matches are linked
     logger.info("Creating CONTACTED relationships (LobbyCommunication -> MP)...")
-    contacted_query = """
-    MATCH (c:LobbyCommunication), (mp:MP)
-    WHERE any(dpoh IN c.dpoh_names WHERE mp.name CONTAINS dpoh OR dpoh CONTAINS mp.name)
-    MERGE (c)-[:CONTACTED]->(mp)
-    RETURN count(*) as count
-    """
-    result = neo4j_client.run_query(contacted_query)
-    stats["contacted"] = result[0]["count"] if result else 0
+    communications = neo4j_client.run_query("""
+    MATCH (c:LobbyCommunication)
+    WHERE size(c.dpoh_names) > 0
+    RETURN c.id AS id, c.dpoh_names AS dpoh_names
+    """)
+    resolver = MPNameResolver.from_neo4j(neo4j_client)
+    matches = resolver.resolve_many(
+        (dpoh for comm in communications for dpoh in comm["dpoh_names"]),
+        min_confidence=DPOH_MIN_CONFIDENCE,
+        label="DPOH names",
+    )
+    contacted = []
+    for comm in communications:
+        mp_ids = {matches[dpoh].mp_id for dpoh in comm["dpoh_names"] if matches.get(dpoh)}
+        contacted.extend({"from_id": comm["id"], "to_id": mp_id} for mp_id in mp_ids)
+
+    neo4j_client.ensure_index("LobbyCommunication", "id")
+    stats["contacted"] = neo4j_client.batch_merge_relationships(
+        "CONTACTED", contacted, from_label="LobbyCommunication", to_label="MP", batch_size=batch_size,
+    ) if contacted else 0
     logger.info(f"Created {stats['contacted']:,} CONTACTED relationships")
 
     # 7. Link Lobbyists to MPs (MET_WITH) with date properties from communications
@@ -0,0 +1,6 @@
+"""Local full-text search over Hansard statements (BM25, English and French)."""
+
+from .analysis import analyze
+from .index import HansardIndex, SearchHit
+
+__all__ = ["HansardIndex", "SearchHit", "analyze"]
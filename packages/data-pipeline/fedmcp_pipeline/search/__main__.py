@@ -0,0 +1,73 @@
+"""Query the local Hansard search index.
+
+Usage:
+    python -m fedmcp_pipeline.search '"carbon tax" rebate' --party Liberal --from 2019-01-01
+    python -m fedmcp_pipeline.search --stats
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from .index import HansardIndex
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Search Hansard statements in the local index")
+    parser.add_argument("query", nargs="?", help='Words and "quoted phrases"')
+    parser.add_argument("--lang", choices=("en", "fr"), default="en", help="Query and content language")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum results (default: 10)")
+    parser.add_argument("--from", dest="date_from", help="Earliest date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="Latest date (YYYY-MM-DD)")
+    parser.add_argument("--speaker", help="Politician id or part of the speaker's name")
+    parser.add_argument("--party", help="Party short name (e.g. Liberal, NDP)")
+    parser.add_argument("--document", type=int, help="Hansard document id")
+    parser.add_argument("--any", action="store_true", help="Match any word instead of all")
+    parser.add_argument("--index-dir", type=Path, help="Index directory (default: ~/.cache/fedmcp/hansard_index)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--stats", action="store_true", help="Show index statistics")
+    args = parser.parse_args()
+
+    index = HansardIndex(args.index_dir)
+    if not index.exists():
+        print(f"No index at {index.directory}; build one with: canadagpt-ingest --search-index", file=sys.stderr)
+        return 1
+    if args.stats:
+        print(json.dumps(index.stats(), indent=2))
+        return 0
+    if not args.query:
+        parser.error("a query is required (or --stats)")
+
+    started = time.perf_counter()
+    hits = index.search(
+        args.query,
+        language=args.lang,
+        limit=args.limit,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        speaker=args.speaker,
+        party=args.party,
+        document_id=args.document,
+        match_all=not args.any,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps([hit.to_dict() for hit in hits], ensure_ascii=False, indent=2))
+        return 0
+    for hit in hits:
+        date = (hit.time or "")[:10]
+        party = f" ({hit.party})" if hit.party else ""
+        print(f"{hit.score:7.2f}  {date}  {hit.speaker or 'Unknown'}{party}  [statement {hit.statement_id}]")
+        if hit.heading:
+            print(f"         {hit.heading}")
+        print(f"         {hit.preview[:200]}")
+        print()
+    print(f"{len(hits)} results in {elapsed_ms:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
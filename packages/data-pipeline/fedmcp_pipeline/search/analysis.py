@@ -0,0 +1,127 @@
+"""English and French analyzers for the Hansard search index.
+
+Text is lowercased, split into word tokens (French elisions such as ``l'`` and
+``qu'`` are dropped), filtered against the parliamentary stop words used for
+keyword extraction, lightly stemmed and folded to ASCII so that "économie"
+matches "economie". Each kept token carries its position in the original
+token stream; removed stop words still advance the position, so the phrase
+"minister of finance" matches only where the two words are two tokens apart.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+from ..utils.keyword_extraction import PARLIAMENTARY_STOPWORDS
+
+LANGUAGES = ("en", "fr")
+
+# Stop words for keyword extraction that people do search for (parties, roles, procedure)
+SEARCHABLE_TERMS = {
+    'liberal', 'conservative', 'ndp', 'bloc', 'green', 'party',
+    'minister', 'prime', 'opposition', 'speaker', 'chair', 'member', 'members',
+    'committee', 'house', 'commons', 'parliament', 'parliamentary', 'riding', 'constituency',
+    'motion', 'question', 'answer', 'vote', 'voted', 'voting',
+    'ministre', 'président', 'présidente', 'député', 'députée', 'députés', 'comité', 'chambre',
+}
+
+SEARCH_STOPWORDS = frozenset(PARLIAMENTARY_STOPWORDS - SEARCHABLE_TERMS)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_POSSESSIVE = re.compile(r"['’]s\b")
+_ELISION = re.compile(r"\b(?:l|d|j|m|n|s|t|c|qu|jusqu|lorsqu|puisqu|quoiqu)['’]", re.UNICODE)
+
+
+def fold(token: str) -> str:
+    """Strip accents ("été" -> "ete")."""
+    if token.isascii():
+        return token
+    decomposed = unicodedata.normalize("NFKD", token)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def stem_en(word: str) -> str:
+    """
+    Light English stemmer: plural, -ed and -ing suffixes and a trailing e.
+
+    Deliberately conservative (taxes/taxing -> tax, housing/house -> hous);
+    aggressive stemmers conflate too many policy terms.
+    """
+    if len(word) <= 3 or not word.isalpha():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith(("xes", "ches", "shes", "zes")):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+
+    for suffix in ("ing", "ed"):
+        if word.endswith(suffix) and not word.endswith("eed"):
+            stem = word[: -len(suffix)]
+            if len(stem) >= 3 and any(ch in "aeiouy" for ch in stem):
+                word = stem
+                if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "lsz":
+                    word = word[:-1]
+            break
+
+    if len(word) > 4 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def stem_fr(word: str) -> str:
+    """Light French stemmer (plural and feminine endings; Savoy's minimal stemmer)."""
+    if len(word) < 6:
+        return word
+    if word.endswith("x"):
+        return word[:-2] + "l" if word.endswith("aux") else word[:-1]
+    for ending in ("s", "r", "e", "é"):
+        if word.endswith(ending):
+            word = word[:-1]
+    if len(word) > 1 and word[-1] == word[-2] and word[-1].isalpha():
+        word = word[:-1]
+    return word
+
+
+_STEMMERS = {"en": stem_en, "fr": stem_fr}
+
+
+@lru_cache(maxsize=200_000)
+def normalize(token: str, language: str) -> str:
+    """Index term for an already lowercased, non-stop-word token."""
+    return fold(_STEMMERS[language](token))
+
+
+def analyze(text: str, language: str) -> Iterator[Tuple[str, int]]:
+    """
+    Index terms of ``text`` with their token positions.
+
+    Args:
+        text: Raw text
+        language: "en" or "fr"
+
+    Yields:
+        (term, position) pairs in text order
+    """
+    if not text:
+        return
+    text = text.lower()
+    text = _ELISION.sub(" ", text) if language == "fr" else _POSSESSIVE.sub("", text)
+    for position, match in enumerate(_TOKEN.finditer(text)):
+        token = match.group()
+        if len(token) < 2 or token in SEARCH_STOPWORDS or (token.isdigit() and len(token) > 4):
+            continue
+        yield normalize(token, language), position
+
+
+def query_terms(text: str, language: str) -> List[Tuple[str, int]]:
+    """Analyzed terms of a query phrase with positions relative to its first term."""
+    terms = list(analyze(text, language))
+    if not terms:
+        return []
+    first = terms[0][1]
+    return [(term, position - first) for term, position in terms]
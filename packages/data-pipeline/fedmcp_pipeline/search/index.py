@@ -0,0 +1,594 @@
+"""Segmented BM25 index over Hansard statements.
+
+The index is a directory of immutable segments (see ``segment.py``) listed in
+``segments.json``. New statements are buffered and written as a new segment on
+``commit``; statements indexed again (e.g. corrected transcripts) mask their
+old copy through a per-segment deletion file. Small segments are merged in
+tiers of ``merge_factor``, so a daily update writes one small segment and only
+occasionally rewrites larger ones.
+
+Readers open segments through ``mmap`` and never see partial writes: segments
+and deletion files are written under new names and the manifest is replaced
+atomically. Only one process should write to an index at a time.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import time
+from array import array
+from dataclasses import dataclass, asdict
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from .analysis import LANGUAGES, query_terms
+from .segment import Segment, SegmentWriter, date_ordinal, merge_segments
+from ..utils.progress import logger
+
+INDEX_DIR = Path(os.getenv("HANSARD_INDEX_DIR", Path.home() / ".cache" / "fedmcp" / "hansard_index")).expanduser()
+MANIFEST = "segments.json"
+
+# BM25 parameters (Robertson/Lucene defaults)
+K1 = 1.2
+B = 0.75
+
+_PHRASE = re.compile(r'"([^"]+)"')
+
+DateLike = Union[str, date, None]
+
+
+@dataclass
+class SearchHit:
+    """One ranked statement."""
+    statement_id: int
+    score: float
+    time: Optional[str]
+    politician_id: Optional[int]
+    speaker: Optional[str]
+    party: Optional[str]
+    document_id: Optional[int]
+    heading: Optional[str]
+    preview: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Clause:
+    """A query term or phrase: analyzed terms with positions relative to the first."""
+    text: str
+    terms: List[Tuple[str, int]]
+    idf: float = 0.0
+
+    @property
+    def is_phrase(self) -> bool:
+        return len(self.terms) > 1
+
+
+class HansardIndex:
+    """
+    Local full-text index of Hansard statements.
+
+    Example:
+        >>> index = HansardIndex()
+        >>> index.add_statements(statements)
+        >>> index.commit()
+        >>> for hit in index.search('"carbon tax" rebate', party="Liberal", date_from="2019-01-01"):
+        ...     print(hit.score, hit.speaker, hit.preview[:80])
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        merge_factor: int = 10,
+        max_buffered_docs: int = 50_000,
+    ):
+        """
+        Args:
+            directory: Index directory (default: ~/.cache/fedmcp/hansard_index,
+                or HANSARD_INDEX_DIR)
+            merge_factor: Segments of a similar size merged together
+            max_buffered_docs: Statements held in memory before a segment is written
+        """
+        self.directory = Path(directory) if directory else INDEX_DIR
+        self.merge_factor = merge_factor
+        self.max_buffered_docs = max_buffered_docs
+        self._manifest: Dict[str, Any] = {"generation": 0, "segments": [], "max_statement_id": 0}
+        self._segments: Dict[str, Segment] = {}
+        self._norms: Dict[Tuple[str, str], Tuple[float, array]] = {}
+        self._writer: Optional[SegmentWriter] = None
+        self._buffered_ids: Set[int] = set()
+        self._pending_deletes: Dict[str, Set[int]] = {}
+        self._manifest_mtime = None
+        self._load_manifest()
+
+    # Manifest and segments
+    # ---------------------
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / MANIFEST
+
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    def _load_manifest(self) -> None:
+        if not self.manifest_path.exists():
+            return
+        mtime = self.manifest_path.stat().st_mtime_ns
+        if mtime == self._manifest_mtime:
+            return
+        with open(self.manifest_path) as f:
+            self._manifest = json.load(f)
+        self._manifest_mtime = mtime
+
+        # Keep already-open segments whose deletions did not change
+        wanted = {entry["name"]: entry.get("deleted") for entry in self._manifest["segments"]}
+        for name in list(self._segments):
+            segment = self._segments[name]
+            if name not in wanted or segment.deleted_file != wanted[name]:
+                segment.close()
+                del self._segments[name]
+                self._norms = {key: value for key, value in self._norms.items() if key[0] != name}
+        for name, deleted in wanted.items():
+            if name not in self._segments:
+                self._segments[name] = Segment(self.directory / name, self.directory / deleted if deleted else None)
+
+    def _write_manifest(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._manifest["generation"] += 1
+        self._manifest["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        tmp = self.manifest_path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f, indent=2)
+        os.replace(tmp, self.manifest_path)
+        self._manifest_mtime = None
+        self._load_manifest()
+        self._remove_unreferenced()
+
+    def _remove_unreferenced(self) -> None:
+        """Delete segments and deletion files no longer in the manifest."""
+        referenced = {MANIFEST}
+        for entry in self._manifest["segments"]:
+            referenced.add(entry["name"])
+            if entry.get("deleted"):
+                referenced.add(entry["deleted"])
+        for path in self.directory.iterdir():
+            if path.name in referenced:
+                continue
+            if path.is_dir() and path.name.startswith("seg-"):
+                for child in path.iterdir():
+                    child.unlink()
+                path.rmdir()
+            elif path.name.startswith("seg-") and path.suffix == ".del":
+                path.unlink()
+
+    @property
+    def segments(self) -> List[Segment]:
+        return [self._segments[entry["name"]] for entry in self._manifest["segments"]]
+
+    @property
+    def max_statement_id(self) -> int:
+        """Highest statement id indexed (for incremental updates)."""
+        return self._manifest.get("max_statement_id", 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Document, segment and size counts."""
+        segments = self.segments
+        size = sum(path.stat().st_size for path in self.directory.rglob("*") if path.is_file()) if self.exists() else 0
+        return {
+            "directory": str(self.directory),
+            "segments": len(segments),
+            "docs": sum(segment.live_docs for segment in segments),
+            "deleted": sum(len(segment.deleted) for segment in segments),
+            "terms": sum(segment.terms_count for segment in segments),
+            "max_statement_id": self.max_statement_id,
+            "size_mb": round(size / 2**20, 1),
+            "updated_at": self._manifest.get("updated_at"),
+        }
+
+    # Writing
+    # -------
+
+    def add_statements(self, statements: Iterable[Dict[str, Any]]) -> int:
+        """
+        Buffer statements for the next commit.
+
+        Statements already in the index are replaced. A segment is written each
+        time ``max_buffered_docs`` statements are buffered.
+
+        Args:
+            statements: Statement dicts (``statement_row`` properties plus ``party``)
+
+        Returns:
+            Number of statements added
+        """
+        added = 0
+        for statement in statements:
+            statement_id = int(statement["id"])
+            if statement_id in self._buffered_ids:
+                self._flush()
+            self._delete_existing(statement_id)
+            if self._writer is None:
+                self._writer = SegmentWriter()
+            self._writer.add(statement)
+            self._buffered_ids.add(statement_id)
+            added += 1
+            if len(self._writer) >= self.max_buffered_docs:
+                self._flush()
+        return added
+
+    def _delete_existing(self, statement_id: int) -> None:
+        if statement_id > self.max_statement_id:
+            # Ids grow over time, so new statements can't be in the index yet
+            return
+        for segment in self.segments:
+            doc = segment.local_doc(statement_id)
+            if doc is not None and doc not in segment.deleted:
+                self._pending_deletes.setdefault(segment.name, set()).add(doc)
+
+    def _flush(self) -> None:
+        """Write buffered statements as a new segment (listed on the next manifest write)."""
+        if not self._writer or not len(self._writer):
+            return
+        name = f"seg-{self._next_segment_id():06d}"
+        started = time.perf_counter()
+        meta = self._writer.write(self.directory / name)
+        logger.info(
+            f"Wrote search segment {name}: {meta['docs']:,} statements, "
+            f"{meta['terms']:,} terms in {time.perf_counter() - started:.1f}s"
+        )
+        self._add_segment(name, meta)
+        self._writer = None
+        self._buffered_ids = set()
+
+    def _next_segment_id(self) -> int:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._manifest["next_segment"] = self._manifest.get("next_segment", 0) + 1
+        return self._manifest["next_segment"]
+
+    def _add_segment(self, name: str, meta: Dict[str, Any]) -> None:
+        self._apply_deletes()
+        self._manifest["segments"].append({"name": name, "docs": meta["docs"], "deleted": None})
+        self._manifest["max_statement_id"] = max(self.max_statement_id, meta["max_statement_id"])
+        self._write_manifest()
+
+    def _apply_deletes(self) -> None:
+        """Write pending deletions as new deletion files (old ones stay valid for open readers)."""
+        if not self._pending_deletes:
+            return
+        generation = self._manifest["generation"] + 1
+        for entry in self._manifest["segments"]:
+            docs = self._pending_deletes.get(entry["name"])
+            if not docs:
+                continue
+            deleted = sorted(self._segments[entry["name"]].deleted | docs)
+            entry["deleted"] = f"{entry['name']}.{generation}.del"
+            (self.directory / entry["deleted"]).write_bytes(array("I", deleted).tobytes())
+        self._pending_deletes = {}
+
+    def commit(self, merge: bool = True) -> None:
+        """
+        Write buffered statements and deletions, then merge segments per the merge policy.
+
+        Args:
+            merge: Run the tiered merge policy after writing
+        """
+        self._flush()
+        if self._pending_deletes:
+            self._apply_deletes()
+            self._write_manifest()
+        if merge:
+            self.maybe_merge()
+
+    def maybe_merge(self) -> int:
+        """
+        Merge segments of similar size, ``merge_factor`` at a time.
+
+        Segments are grouped into tiers by live doc count (powers of
+        ``merge_factor``). Whenever a tier holds ``merge_factor`` segments they are
+        merged into one, which lands in the next tier, so every statement is
+        rewritten about log(N) times over the life of the index.
+
+        Returns:
+            Number of merges performed
+        """
+        merges = 0
+        while True:
+            tiers: Dict[int, List[Segment]] = {}
+            for segment in self.segments:
+                tier = int(math.log(max(segment.live_docs, 1), self.merge_factor))
+                tiers.setdefault(tier, []).append(segment)
+            full = [group for _, group in sorted(tiers.items()) if len(group) >= self.merge_factor]
+            if not full:
+                return merges
+            self.merge(full[0][:self.merge_factor])
+            merges += 1
+
+    def optimize(self) -> None:
+        """Merge all segments into one (drops every deleted statement)."""
+        self.commit(merge=False)
+        if len(self.segments) > 1 or any(segment.deleted for segment in self.segments):
+            self.merge(self.segments)
+
+    def merge(self, segments: Sequence[Segment]) -> str:
+        """Replace ``segments`` with one merged segment; returns its name."""
+        names = [segment.name for segment in segments]
+        name = f"seg-{self._next_segment_id():06d}"
+        started = time.perf_counter()
+        meta = merge_segments(list(segments), self.directory / name)
+        logger.info(
+            f"Merged {len(names)} search segments into {name}: "
+            f"{meta['docs']:,} statements in {time.perf_counter() - started:.1f}s"
+        )
+        # The merged segment takes the place of the first, keeping docs in id order
+        entries = self._manifest["segments"]
+        position = next(i for i, entry in enumerate(entries) if entry["name"] == names[0])
+        merged = {"name": name, "docs": meta["docs"], "deleted": None}
+        self._manifest["segments"] = (
+            [entry for entry in entries[:position] if entry["name"] not in names]
+            + [merged]
+            + [entry for entry in entries[position:] if entry["name"] not in names]
+        )
+        self._write_manifest()
+        return name
+
+    def clear(self) -> None:
+        """Remove every segment (for a full rebuild)."""
+        self._writer = None
+        self._buffered_ids = set()
+        self._pending_deletes = {}
+        self._manifest["segments"] = []
+        self._manifest["max_statement_id"] = 0
+        self._write_manifest()
+
+    def close(self) -> None:
+        for segment in self._segments.values():
+            segment.close()
+        self._segments = {}
+        self._norms = {}
+        self._manifest_mtime = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Searching
+    # ---------
+
+    def refresh(self) -> None:
+        """Pick up segments committed by another process."""
+        self._load_manifest()
+
+    def search(
+        self,
+        query: str,
+        language: str = "en",
+        limit: int = 10,
+        date_from: DateLike = None,
+        date_to: DateLike = None,
+        speaker: Union[int, str, None] = None,
+        party: Optional[str] = None,
+        document_id: Optional[int] = None,
+        match_all: bool = True,
+    ) -> List[SearchHit]:
+        """
+        Rank statements against a query with BM25.
+
+        Args:
+            query: Words and "quoted phrases"
+            language: Analyzer and content language ("en" or "fr")
+            limit: Maximum hits
+            date_from: Earliest statement date (inclusive, ISO string or date)
+            date_to: Latest statement date (inclusive)
+            speaker: OpenParliament politician id, or part of a speaker name
+            party: Party short name (e.g. "Liberal", "NDP"; case-insensitive)
+            document_id: Hansard document id
+            match_all: Require every word and phrase (False: any of them)
+
+        Returns:
+            Hits ordered by descending score
+        """
+        if language not in LANGUAGES:
+            raise ValueError(f"Unsupported language {language!r} (expected one of {LANGUAGES})")
+        clauses = self._parse_query(query, language)
+        if not clauses:
+            return []
+
+        segments = self.segments
+        live_docs = sum(segment.live_docs for segment in segments)
+        if not live_docs:
+            return []
+        # Collection statistics include deleted docs (as document frequencies do)
+        all_docs = sum(segment.docs_count for segment in segments)
+        average_length = sum(segment.meta["total_length"][language] for segment in segments) / all_docs
+
+        # Global idf so scores are comparable across segments; a phrase weighs the sum of its terms
+        for clause in clauses:
+            clause.idf = 0.0
+            for term, _ in clause.terms:
+                df = sum(segment.doc_frequency(term) for segment in segments)
+                clause.idf += math.log(1 + (all_docs - df + 0.5) / (df + 0.5))
+
+        filters = {
+            "date_from": date_ordinal(date_from),
+            "date_to": date_ordinal(date_to),
+            "speaker": speaker,
+            "party": party,
+            "document_id": document_id,
+        }
+        hits: List[Tuple[float, int, int]] = []
+        for position, segment in enumerate(segments):
+            for score, doc in self._search_segment(segment, clauses, language, average_length, filters, match_all):
+                hits.append((score, position, doc))
+
+        return [
+            self._hit(segments[position], doc, score, language)
+            for score, position, doc in heapq.nlargest(limit, hits)
+        ]
+
+    def _parse_query(self, query: str, language: str) -> List[_Clause]:
+        clauses = []
+        for phrase in _PHRASE.findall(query):
+            terms = query_terms(phrase, language)
+            if terms:
+                clauses.append(_Clause(phrase, [(f"{language}|{term}", offset) for term, offset in terms]))
+        seen = set()
+        for term, _ in query_terms(_PHRASE.sub(" ", query), language):
+            if term not in seen:
+                seen.add(term)
+                clauses.append(_Clause(term, [(f"{language}|{term}", 0)]))
+        return clauses
+
+    def _norm(self, segment: Segment, language: str, average_length: float) -> array:
+        """Per-doc BM25 length normalization K1 * (1 - B + B * dl / avgdl), cached per segment."""
+        key = (segment.name, language)
+        cached = self._norms.get(key)
+        if cached is None or cached[0] != average_length:
+            offset = LANGUAGES.index(language)
+            lengths = segment.lengths[offset::len(LANGUAGES)] if len(segment.lengths) else []
+            norm = array("d", (K1 * (1 - B + B * length / average_length) for length in lengths))
+            self._norms[key] = cached = (average_length, norm)
+        return cached[1]
+
+    def _doc_filter(self, segment: Segment, filters: Dict[str, Any]):
+        """Predicate over local docs for the given filters (None if unfiltered)."""
+        checks = []
+        if filters["date_from"]:
+            dates, low = segment.dates, filters["date_from"]
+            checks.append(lambda doc: dates[doc] >= low)
+        if filters["date_to"]:
+            dates, high = segment.dates, filters["date_to"]
+            checks.append(lambda doc: 0 < dates[doc] <= high)
+        if filters["document_id"] is not None:
+            documents, wanted_document = segment.documents, int(filters["document_id"])
+            checks.append(lambda doc: documents[doc] == wanted_document)
+        if filters["speaker"] is not None:
+            speakers = segment.speakers
+            speaker_ids = _speaker_ids(segment, filters["speaker"])
+            checks.append(lambda doc: speakers[doc] in speaker_ids)
+        if filters["party"]:
+            parties = segment.parties
+            wanted = filters["party"].casefold()
+            party_ids = {i for i, name in enumerate(segment.parties_table) if name and name.casefold() == wanted}
+            checks.append(lambda doc: parties[doc] in party_ids)
+        deleted = segment.deleted
+        if deleted:
+            checks.append(lambda doc: doc not in deleted)
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda doc: all(check(doc) for check in checks)
+
+    def _search_segment(
+        self,
+        segment: Segment,
+        clauses: List[_Clause],
+        language: str,
+        average_length: float,
+        filters: Dict[str, Any],
+        match_all: bool,
+    ) -> Iterator[Tuple[float, int]]:
+        """Yield (score, local doc) for matching docs of one segment."""
+        # Term frequency per doc for each clause. Postings are decoded into dicts
+        # in bulk (C loops) so intersections and lookups avoid per-doc bisects.
+        clause_tfs: List[Tuple[_Clause, Dict[int, int]]] = []
+        for clause in sorted(clauses, key=lambda c: min(segment.doc_frequency(t) for t, _ in c.terms)):
+            postings = [segment.postings(term) for term, _ in clause.terms]
+            if any(p is None for p in postings):
+                if match_all:
+                    return
+                continue
+            # Each clause is limited to the running intersection: the previous
+            # clause's postings were already restricted to every earlier clause
+            restrict = clause_tfs[-1][1] if match_all and clause_tfs else None
+            if clause.is_phrase:
+                tfs = self._phrase_tfs(segment, clause, postings, restrict)
+            else:
+                docs, term_tfs, _ = postings[0]
+                tfs = dict(zip(docs.tolist(), term_tfs.tolist()))
+                if restrict is not None:
+                    tfs = {doc: tfs[doc] for doc in restrict.keys() & tfs.keys()}
+            if not tfs and match_all:
+                return
+            clause_tfs.append((clause, tfs))
+        if not clause_tfs:
+            return
+
+        if match_all:
+            candidates = clause_tfs[-1][1].keys()
+        else:
+            candidates = set().union(*(tfs.keys() for _, tfs in clause_tfs))
+        accept = self._doc_filter(segment, filters)
+        if accept is not None:
+            candidates = [doc for doc in candidates if accept(doc)]
+
+        norm = self._norm(segment, language, average_length)
+        weights = [(clause.idf * (K1 + 1), tfs) for clause, tfs in clause_tfs]
+        for doc in candidates:
+            total = 0.0
+            doc_norm = norm[doc]
+            for weight, tfs in weights:
+                tf = tfs.get(doc)
+                if tf:
+                    total += weight * tf / (tf + doc_norm)
+            yield total, doc
+
+    @staticmethod
+    def _phrase_tfs(
+        segment: Segment,
+        clause: _Clause,
+        postings: List[Tuple[Any, Any, Any]],
+        restrict: Optional[Dict[int, int]],
+    ) -> Dict[int, int]:
+        """Phrase frequency per doc: positions where every term follows at its offset."""
+        indexes = [dict(zip(docs.tolist(), range(len(docs)))) for docs, _, _ in postings]
+        common = set(min(indexes, key=len))
+        for index in indexes:
+            common &= index.keys()
+        if restrict is not None:
+            common &= restrict.keys()
+        tfs = {}
+        for doc in common:
+            candidates = None
+            for (_, offset), (_, term_tfs, position_offsets), index in zip(clause.terms, postings, indexes):
+                i = index[doc]
+                positions = segment.term_positions(position_offsets[i], term_tfs[i]).tolist()
+                shifted = {position - offset for position in positions}
+                candidates = shifted if candidates is None else candidates & shifted
+                if not candidates:
+                    break
+            if candidates:
+                tfs[doc] = len(candidates)
+        return tfs
+
+    def _hit(self, segment: Segment, doc: int, score: float, language: str) -> SearchHit:
+        stored = segment.stored_record(doc)
+        speaker = segment.speakers[doc]
+        document = segment.documents[doc]
+        return SearchHit(
+            statement_id=segment.ids[doc],
+            score=round(score, 4),
+            time=stored.get("time"),
+            politician_id=speaker if speaker >= 0 else None,
+            speaker=stored.get(f"who_{language}") or stored.get("who_en"),
+            party=segment.parties_table[segment.parties[doc]] or None,
+            document_id=document or None,
+            heading=stored.get(f"heading_{language}"),
+            preview=stored.get(f"preview_{language}") or "",
+        )
+
+
+def _speaker_ids(segment: Segment, speaker: Union[int, str]) -> Set[int]:
+    """Politician ids matching a speaker filter (an id, or a case-insensitive name fragment)."""
+    if isinstance(speaker, int) or str(speaker).isdigit():
+        return {int(speaker)}
+    wanted = str(speaker).casefold()
+    return {int(pid) for pid, name in segment.meta["speakers"].items() if wanted in name.casefold()}
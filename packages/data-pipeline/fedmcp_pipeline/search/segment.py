@@ -0,0 +1,460 @@
+"""Immutable on-disk segments of the Hansard search index.
+
+A segment is a directory of flat arrays, memory-mapped when read, so opening
+an index costs a few page faults rather than loading postings into memory:
+
+    terms.dat       sorted terms ("en|tax", "fr|impot", ...), UTF-8, concatenated
+    terms.off       uint64[terms + 1]  term byte offsets into terms.dat
+    postings.off    uint64[terms + 1]  offset of each term's postings in docs/tfs/posoff
+    docs.u32        local doc ids, ascending per term
+    tfs.u32         term frequency per posting
+    posoff.u64      offset of each posting's positions in positions.u32
+    positions.u32   token positions, ascending per posting
+    ids.u64         statement id per local doc
+    ids_sorted.u64  statement ids ascending, with ids_order.u32 the matching local doc
+    dates.i32       date ordinal per doc (0 = unknown)
+    speakers.i32    OpenParliament politician id per doc (-1 = unknown)
+    parties.u16     index into meta["parties"] per doc (0 = unknown)
+    documents.u32   Hansard document id per doc (0 = unknown)
+    lengths.u32     indexed tokens per doc, [en, fr] pairs
+    stored.dat      zlib-compressed JSON per doc (speaker name, heading, preview)
+    stored.off      uint64[docs + 1]
+    meta.json       counts, total lengths, party and speaker tables, date range
+
+Segments never change once written. Statements re-indexed later are masked
+through a separate deletion file (a sorted uint32 list of local docs), and
+``merge_segments`` drops them when segments are combined.
+"""
+
+import heapq
+import json
+import mmap
+import os
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .analysis import LANGUAGES, analyze
+
+# Position gap between fields so phrases never match across content and headings
+FIELD_POSITION_GAP = 100
+PREVIEW_CHARS = 300
+
+# File name -> (attribute, array typecode)
+ARRAYS = {
+    "terms.off": ("term_offsets", "Q"),
+    "postings.off": ("posting_offsets", "Q"),
+    "docs.u32": ("docs", "I"),
+    "tfs.u32": ("tfs", "I"),
+    "posoff.u64": ("position_offsets", "Q"),
+    "positions.u32": ("positions", "I"),
+    "ids.u64": ("ids", "Q"),
+    "ids_sorted.u64": ("ids_sorted", "Q"),
+    "ids_order.u32": ("ids_order", "I"),
+    "dates.i32": ("dates", "i"),
+    "speakers.i32": ("speakers", "i"),
+    "parties.u16": ("parties", "H"),
+    "documents.u32": ("documents", "I"),
+    "lengths.u32": ("lengths", "I"),
+    "stored.off": ("stored_offsets", "Q"),
+}
+
+
+def date_ordinal(value: Any) -> int:
+    """Ordinal of an ISO date/datetime string or date (0 if missing or unparseable)."""
+    if not value:
+        return 0
+    if isinstance(value, date):
+        return value.toordinal()
+    try:
+        return date.fromisoformat(str(value)[:10]).toordinal()
+    except ValueError:
+        return 0
+
+
+def statement_fields(statement: Dict[str, Any], language: str) -> List[str]:
+    """Indexed text fields of a statement, matching the statement_content_* Neo4j full-text indexes."""
+    return [statement.get(f"{name}_{language}") or "" for name in ("content", "who", "h1", "h2", "h3")]
+
+
+class SegmentWriter:
+    """
+    Accumulate statements in memory and write them as one segment.
+
+    Example:
+        >>> writer = SegmentWriter()
+        >>> for statement in statements:
+        ...     writer.add(statement)
+        >>> meta = writer.write(index_dir / "seg-000001")
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Tuple[array, array, array]] = {}
+        self.ids = array("Q")
+        self.dates = array("i")
+        self.speakers = array("i")
+        self.parties = array("H")
+        self.documents = array("I")
+        self.lengths = array("I")
+        self.stored: List[bytes] = []
+        self.party_table: Dict[str, int] = {"": 0}
+        self.speaker_names: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, statement: Dict[str, Any]) -> int:
+        """
+        Index one statement.
+
+        Args:
+            statement: Statement properties as exported by the pipeline (``statement_row``)
+                plus an optional ``party`` short name
+
+        Returns:
+            Local doc id within the segment
+        """
+        doc = len(self.ids)
+        self.ids.append(int(statement["id"]))
+        self.dates.append(date_ordinal(statement.get("time")))
+        politician_id = statement.get("politician_id")
+        self.speakers.append(int(politician_id) if politician_id is not None else -1)
+        party = statement.get("party") or ""
+        self.parties.append(self.party_table.setdefault(party, len(self.party_table)))
+        self.documents.append(int(statement.get("document_id") or 0))
+        if politician_id is not None and statement.get("who_en"):
+            self.speaker_names[int(politician_id)] = statement["who_en"]
+
+        for language in LANGUAGES:
+            positions: Dict[str, array] = {}
+            base = 0
+            length = 0
+            for text in statement_fields(statement, language):
+                last = -1
+                for term, position in analyze(text, language):
+                    key = f"{language}|{term}"
+                    if key not in positions:
+                        positions[key] = array("I")
+                    positions[key].append(base + position)
+                    last = position
+                    length += 1
+                base += last + 1 + FIELD_POSITION_GAP
+            self.lengths.append(length)
+            for key, term_positions in positions.items():
+                entry = self.postings.get(key)
+                if entry is None:
+                    entry = self.postings[key] = (array("I"), array("I"), array("I"))
+                entry[0].append(doc)
+                entry[1].append(len(term_positions))
+                entry[2].extend(term_positions)
+
+        self.stored.append(_stored_record(statement))
+        return doc
+
+    def write(self, directory: Path) -> Dict[str, Any]:
+        """Write the segment to ``directory`` and return its meta."""
+        def terms() -> Iterator[Tuple[str, array, array, array]]:
+            for key in sorted(self.postings):
+                docs, tfs, positions = self.postings[key]
+                yield key, docs, tfs, positions
+
+        parties = [name for name, _ in sorted(self.party_table.items(), key=lambda item: item[1])]
+        return write_segment(
+            directory,
+            terms(),
+            columns={
+                "ids": self.ids,
+                "dates": self.dates,
+                "speakers": self.speakers,
+                "parties": self.parties,
+                "documents": self.documents,
+                "lengths": self.lengths,
+            },
+            stored=self.stored,
+            parties=parties,
+            speaker_names=self.speaker_names,
+        )
+
+
+def _stored_record(statement: Dict[str, Any]) -> bytes:
+    record = {
+        "who_en": statement.get("who_en"),
+        "who_fr": statement.get("who_fr"),
+        "heading_en": statement.get("h3_en") or statement.get("h2_en"),
+        "heading_fr": statement.get("h3_fr") or statement.get("h2_fr"),
+        "preview_en": (statement.get("content_en") or "")[:PREVIEW_CHARS],
+        "preview_fr": (statement.get("content_fr") or "")[:PREVIEW_CHARS],
+        "time": statement.get("time"),
+    }
+    return zlib.compress(json.dumps(record, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def write_segment(
+    directory: Path,
+    terms: Iterable[Tuple[str, Sequence[int], Sequence[int], Sequence[int]]],
+    columns: Dict[str, array],
+    stored: Iterable[bytes],
+    parties: List[str],
+    speaker_names: Dict[int, str],
+) -> Dict[str, Any]:
+    """
+    Write a segment directory.
+
+    Args:
+        directory: New segment directory (must not exist)
+        terms: (term, docs, tfs, positions) in ascending term order; positions are
+            the concatenated positions of each posting, in posting order
+        columns: Per-doc arrays: ids, dates, speakers, parties, documents, lengths
+        stored: Compressed stored record per doc
+        parties: Party table (index 0 = unknown)
+        speaker_names: Politician id -> speaker name
+
+    Returns:
+        Segment meta (also written to meta.json)
+    """
+    tmp = directory.with_name(directory.name + ".tmp")
+    tmp.mkdir(parents=True)
+
+    term_offsets = array("Q", [0])
+    posting_offsets = array("Q", [0])
+    position_count = 0
+    with open(tmp / "terms.dat", "wb") as terms_out, open(tmp / "docs.u32", "wb") as docs_out, \
+            open(tmp / "tfs.u32", "wb") as tfs_out, open(tmp / "posoff.u64", "wb") as posoff_out, \
+            open(tmp / "positions.u32", "wb") as positions_out:
+        for term, docs, tfs, positions in terms:
+            encoded = term.encode("utf-8")
+            terms_out.write(encoded)
+            term_offsets.append(term_offsets[-1] + len(encoded))
+            posting_offsets.append(posting_offsets[-1] + len(docs))
+            _as_array("I", docs).tofile(docs_out)
+            _as_array("I", tfs).tofile(tfs_out)
+            offsets = array("Q")
+            for tf in tfs:
+                offsets.append(position_count)
+                position_count += tf
+            offsets.tofile(posoff_out)
+            _as_array("I", positions).tofile(positions_out)
+
+    ids = columns["ids"]
+    order = sorted(range(len(ids)), key=ids.__getitem__)
+    arrays = {
+        "terms.off": term_offsets,
+        "postings.off": posting_offsets,
+        "ids.u64": ids,
+        "ids_sorted.u64": array("Q", (ids[i] for i in order)),
+        "ids_order.u32": array("I", order),
+        "dates.i32": columns["dates"],
+        "speakers.i32": columns["speakers"],
+        "parties.u16": columns["parties"],
+        "documents.u32": columns["documents"],
+        "lengths.u32": columns["lengths"],
+    }
+    for name, values in arrays.items():
+        with open(tmp / name, "wb") as f:
+            values.tofile(f)
+
+    stored_offsets = array("Q", [0])
+    with open(tmp / "stored.dat", "wb") as f:
+        for record in stored:
+            f.write(record)
+            stored_offsets.append(stored_offsets[-1] + len(record))
+    with open(tmp / "stored.off", "wb") as f:
+        stored_offsets.tofile(f)
+
+    lengths = columns["lengths"]
+    dates = [d for d in columns["dates"] if d]
+    meta = {
+        "docs": len(ids),
+        "terms": len(term_offsets) - 1,
+        "total_length": {language: sum(lengths[i::len(LANGUAGES)]) for i, language in enumerate(LANGUAGES)},
+        "max_statement_id": max(ids) if ids else 0,
+        "min_date": min(dates) if dates else 0,
+        "max_date": max(dates) if dates else 0,
+        "parties": parties,
+        "speakers": {str(pid): name for pid, name in speaker_names.items()},
+        "byteorder": sys.byteorder,
+    }
+    with open(tmp / "meta.json", "w") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp, directory)
+    return meta
+
+
+def _as_array(typecode: str, values: Sequence[int]) -> array:
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+
+class Segment:
+    """Read-only, memory-mapped view of one segment."""
+
+    def __init__(self, directory: Path, deleted: Optional[Path] = None):
+        """
+        Args:
+            directory: Segment directory
+            deleted: File of deleted local docs (sorted uint32), if any
+        """
+        self.directory = directory
+        self.name = directory.name
+        with open(directory / "meta.json") as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        if self.meta.get("byteorder", sys.byteorder) != sys.byteorder:
+            raise ValueError(f"Segment {self.name} was written on a {self.meta['byteorder']}-endian machine")
+
+        self._maps: List[mmap.mmap] = []
+        self.terms_data = self._map("terms.dat", None)
+        self.stored_data = self._map("stored.dat", None)
+        for name, (attribute, typecode) in ARRAYS.items():
+            setattr(self, attribute, self._map(name, typecode))
+
+        self.docs_count = self.meta["docs"]
+        self.terms_count = self.meta["terms"]
+        self.parties_table: List[str] = self.meta["parties"]
+        self.deleted: Set[int] = set()
+        self.deleted_file = deleted.name if deleted is not None else None
+        if deleted is not None and deleted.exists():
+            self.deleted = set(array("I", deleted.read_bytes()))
+
+    def _map(self, name: str, typecode: Optional[str]) -> memoryview:
+        path = self.directory / name
+        if path.stat().st_size == 0:
+            view = memoryview(b"")
+        else:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            view = memoryview(mapped)
+        return view.cast(typecode) if typecode else view
+
+    @property
+    def live_docs(self) -> int:
+        return self.docs_count - len(self.deleted)
+
+    def term_at(self, index: int) -> bytes:
+        return bytes(self.terms_data[self.term_offsets[index]:self.term_offsets[index + 1]])
+
+    def find_term(self, term: str) -> int:
+        """Index of ``term`` in the term dictionary (-1 if absent)."""
+        key = term.encode("utf-8")
+        low, high = 0, self.terms_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.term_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self.terms_count and self.term_at(low) == key else -1
+
+    def postings(self, term: str) -> Optional[Tuple[memoryview, memoryview, memoryview]]:
+        """(docs, tfs, position offsets) of ``term``, zero-copy; None if absent."""
+        index = self.find_term(term)
+        if index < 0:
+            return None
+        start, end = self.posting_offsets[index], self.posting_offsets[index + 1]
+        return self.docs[start:end], self.tfs[start:end], self.position_offsets[start:end]
+
+    def doc_frequency(self, term: str) -> int:
+        """Docs containing ``term``, deleted docs included."""
+        index = self.find_term(term)
+        return self.posting_offsets[index + 1] - self.posting_offsets[index] if index >= 0 else 0
+
+    def term_positions(self, offset: int, tf: int) -> memoryview:
+        return self.positions[offset:offset + tf]
+
+    def iter_terms(self) -> Iterator[Tuple[str, int]]:
+        """(term, term index) in ascending order."""
+        for index in range(self.terms_count):
+            yield self.term_at(index).decode("utf-8"), index
+
+    def local_doc(self, statement_id: int) -> Optional[int]:
+        """Local doc of a statement id (None if not in this segment)."""
+        position = bisect_left(self.ids_sorted, statement_id)
+        if position < self.docs_count and self.ids_sorted[position] == statement_id:
+            return self.ids_order[position]
+        return None
+
+    def stored_record(self, doc: int) -> Dict[str, Any]:
+        start, end = self.stored_offsets[doc], self.stored_offsets[doc + 1]
+        return json.loads(zlib.decompress(self.stored_data[start:end]))
+
+    def close(self) -> None:
+        for name in ("terms_data", "stored_data", *(attribute for attribute, _ in ARRAYS.values())):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                # A caller still holds a postings slice; the map is released with it
+                pass
+        self._maps = []
+
+
+def merge_segments(segments: List[Segment], directory: Path) -> Dict[str, Any]:
+    """
+    Combine segments into one, dropping deleted docs.
+
+    Docs keep their relative order (segment by segment), so each term's merged
+    postings are the concatenation of its remapped postings.
+    """
+    remaps: List[array] = []
+    columns = {name: array(code) for name, code in
+               (("ids", "Q"), ("dates", "i"), ("speakers", "i"), ("parties", "H"), ("documents", "I"), ("lengths", "I"))}
+    party_table: Dict[str, int] = {"": 0}
+    speaker_names: Dict[int, str] = {}
+    stored: List[bytes] = []
+
+    for segment in segments:
+        party_map = [party_table.setdefault(name, len(party_table)) for name in segment.parties_table]
+        remap = array("i", [-1]) * segment.docs_count
+        for doc in range(segment.docs_count):
+            if doc in segment.deleted:
+                continue
+            remap[doc] = len(columns["ids"])
+            columns["ids"].append(segment.ids[doc])
+            columns["dates"].append(segment.dates[doc])
+            columns["speakers"].append(segment.speakers[doc])
+            columns["parties"].append(party_map[segment.parties[doc]])
+            columns["documents"].append(segment.documents[doc])
+            columns["lengths"].extend(segment.lengths[doc * len(LANGUAGES):(doc + 1) * len(LANGUAGES)])
+            stored.append(bytes(segment.stored_data[segment.stored_offsets[doc]:segment.stored_offsets[doc + 1]]))
+        remaps.append(remap)
+        speaker_names.update({int(pid): name for pid, name in segment.meta["speakers"].items()})
+
+    def terms() -> Iterator[Tuple[str, array, array, array]]:
+        def stream(position: int, segment: Segment) -> Iterator[Tuple[str, int, int]]:
+            for term, index in segment.iter_terms():
+                yield term, position, index
+
+        streams = [stream(position, segment) for position, segment in enumerate(segments)]
+        current: Optional[str] = None
+        docs, tfs, positions = array("I"), array("I"), array("I")
+        for term, position, index in heapq.merge(*streams):
+            if term != current:
+                if current is not None and docs:
+                    yield current, docs, tfs, positions
+                current = term
+                docs, tfs, positions = array("I"), array("I"), array("I")
+            segment, remap = segments[position], remaps[position]
+            start, end = segment.posting_offsets[index], segment.posting_offsets[index + 1]
+            docs_slice = segment.docs[start:end].tolist()
+            tfs_slice = segment.tfs[start:end].tolist()
+            offsets_slice = segment.position_offsets[start:end].tolist()
+            for doc, tf, offset in zip(docs_slice, tfs_slice, offsets_slice):
+                new_doc = remap[doc]
+                if new_doc < 0:
+                    continue
+                docs.append(new_doc)
+                tfs.append(tf)
+                positions.extend(segment.positions[offset:offset + tf])
+        if current is not None and docs:
+            yield current, docs, tfs, positions
+
+    parties = [name for name, _ in sorted(party_table.items(), key=lambda item: item[1])]
+    return write_segment(directory, terms(), columns, stored, parties, speaker_names)
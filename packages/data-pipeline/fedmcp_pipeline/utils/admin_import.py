@@ -0,0 +1,548 @@
+"""Offline bulk load: write neo4j-admin import CSVs and drive ``neo4j-admin database import``.
+
+Transactional UNWIND batches are the slowest way to fill an empty database with
+tens of millions of nodes. For initial full loads, :class:`AdminImportWriter`
+stands in for :class:`~fedmcp_pipeline.utils.neo4j_client.Neo4jClient`: it
+exposes the same ``batch_create_nodes`` / ``batch_merge_nodes`` /
+``batch_create_relationships`` / ``batch_merge_relationships`` calls, so the
+ingest modules produce exactly the properties they would write online, but rows
+go to gzipped CSV files in the neo4j-admin import format instead. The files are
+then loaded with :func:`run_admin_import`, after which the
+``scripts/neo4j-optimization`` constraints and indexes are applied.
+
+Typical flow::
+
+    writer = AdminImportWriter(Path("/tmp/canadagpt-import"))
+    export_hansard_full(writer, postgres_client)
+    importer = OpenParliamentBulkImporter(writer, pg_uri)
+    importer.import_mps(); importer.import_bills(); importer.import_committees()
+    plan = writer.finalize()
+    run_admin_import(plan, docker=True)
+    apply_optimizations(uri, user, password)
+"""
+
+import csv
+import gzip
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .neo4j_client import HASH_PROPERTY, VOLATILE_PROPERTIES, UpsertResult, content_hash
+from .progress import logger
+
+
+# Node ID property per label (the property the ingest modules MERGE/MATCH on).
+# A tuple is a compound key, written as the values joined by COMPOUND_ID_SEPARATOR.
+DEFAULT_ID_KEYS = {
+    "Committee": "code",
+    "Bill": ("number", "session"),
+}
+
+COMPOUND_ID_SEPARATOR = "|"
+
+# Rows buffered per label/type before a CSV part is written
+DEFAULT_ROWS_PER_FILE = 200000
+
+# Separator for list properties (neo4j-admin --array-delimiter)
+ARRAY_DELIMITER = ";"
+
+# Matches the docker-compose.yml service
+DOCKER_IMAGE = "neo4j:5.14-community"
+DOCKER_SERVICE = "neo4j"
+DOCKER_DATA_VOLUME = "canadagpt_neo4j_data"
+
+# Repository root (packages/data-pipeline/fedmcp_pipeline/utils/admin_import.py)
+REPO_ROOT = Path(__file__).resolve().parents[4]
+OPTIMIZATION_SCRIPT = REPO_ROOT / "scripts" / "neo4j-optimization" / "apply_optimizations.py"
+
+
+def _csv_type(value: Any) -> Optional[str]:
+    """neo4j-admin header type for a Python value (None = plain string)."""
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, (float, Decimal)):
+        return "double"
+    if isinstance(value, datetime):
+        return "datetime" if value.tzinfo else "localdatetime"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, (list, tuple)):
+        element = next((v for v in value if v is not None), "")
+        return f"{_csv_type(element) or 'string'}[]"
+    return None
+
+
+def _csv_value(value: Any) -> str:
+    """Serialize a property value for an import CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return ARRAY_DELIMITER.join(_csv_value(v) for v in value)
+    if isinstance(value, dict):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _header(columns: List[str], types: Dict[str, Optional[str]]) -> List[str]:
+    return [f"{col}:{types[col]}" if types.get(col) else col for col in columns]
+
+
+def _column_types(rows: List[Dict[str, Any]], columns: List[str]) -> Dict[str, Optional[str]]:
+    """First non-null type per column; columns with mixed types fall back to string."""
+    types: Dict[str, Optional[str]] = {}
+    for col in columns:
+        seen = {_csv_type(row[col]) for row in rows if row.get(col) is not None}
+        types[col] = seen.pop() if len(seen) == 1 else None
+    return types
+
+
+@dataclass
+class AdminImportPlan:
+    """Files produced by an AdminImportWriter, ready for neo4j-admin."""
+
+    directory: Path
+    nodes: Dict[str, List[str]] = field(default_factory=dict)
+    relationships: Dict[str, List[str]] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    def import_args(self, root: Optional[str] = None) -> List[str]:
+        """--nodes/--relationships arguments with file paths rooted at ``root``."""
+        root = root or str(self.directory)
+        args = []
+        for label, files in sorted(self.nodes.items()):
+            for name in files:
+                args.append(f"--nodes={label}={root}/{name}")
+        for rel_type, files in sorted(self.relationships.items()):
+            for name in files:
+                args.append(f"--relationships={rel_type}={root}/{name}")
+        return args
+
+    def save(self) -> Path:
+        path = self.directory / "import-plan.json"
+        path.write_text(json.dumps({
+            "nodes": self.nodes,
+            "relationships": self.relationships,
+            "counts": self.counts,
+        }, indent=2))
+        return path
+
+    @classmethod
+    def load(cls, directory: Path) -> "AdminImportPlan":
+        payload = json.loads((directory / "import-plan.json").read_text())
+        return cls(directory, payload["nodes"], payload["relationships"], payload.get("counts", {}))
+
+
+class AdminImportWriter:
+    """
+    Write nodes and relationships as neo4j-admin import CSVs.
+
+    Mirrors the batch API of Neo4jClient so ingest code can target either. Each
+    label gets its own ID space keyed by the label's ID property (``id`` unless
+    overridden in ``id_keys``). Relationships that look up an endpoint by some
+    other property (e.g. ``MP.openparliament_politician_id``) are resolved
+    against the written node files in :meth:`finalize`.
+
+    Duplicate node IDs keep the first occurrence (``--skip-duplicate-nodes``),
+    and relationships whose endpoint was never written are dropped.
+    ``batch_merge_relationships`` keeps one relationship per (type, start, end),
+    with properties combined as ``SET r += ...`` would.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        id_keys: Optional[Dict[str, str]] = None,
+        rows_per_file: int = DEFAULT_ROWS_PER_FILE,
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            directory: Output directory for CSV files (created if missing)
+            id_keys: Label -> ID property overrides (merged over DEFAULT_ID_KEYS)
+            rows_per_file: Rows buffered per label/type before a part is written
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.id_keys = {**DEFAULT_ID_KEYS, **(id_keys or {})}
+        self.rows_per_file = rows_per_file
+
+        self._node_buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._rel_buffers: Dict[Tuple[str, str, str, str, str], List[Dict[str, Any]]] = {}
+        # Merged relationships are held until finalize() so later rows can update earlier ones
+        self._merged_rels: Dict[Tuple[str, str, str, str, str], Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        # Relationship files whose endpoints still need resolving, by buffer key
+        self._pending: Dict[Tuple[str, str, str, str, str], List[str]] = {}
+        self._synthetic_ids: Dict[str, int] = {}
+        self.plan = AdminImportPlan(self.directory)
+
+    def id_key(self, label: str) -> Union[str, Tuple[str, ...]]:
+        return self.id_keys.get(label, "id")
+
+    def node_id(self, label: str, properties: Dict[str, Any]) -> Any:
+        """
+        Import ID of a ``label`` node with ``properties``.
+
+        Use this for relationship endpoints of labels with a compound ID key
+        (e.g. ``Bill``, keyed by number and session).
+
+        Args:
+            label: Node label
+            properties: Node properties, including the label's ID key
+
+        Returns:
+            The ID value, or None if a key property is missing
+        """
+        key = self.id_key(label)
+        if isinstance(key, str):
+            return properties.get(key)
+        values = [properties.get(prop) for prop in key]
+        if any(value is None for value in values):
+            return None
+        return COMPOUND_ID_SEPARATOR.join(_csv_value(value) for value in values)
+
+    # ============================================
+    # Neo4jClient-compatible batch API
+    # ============================================
+
+    def batch_create_nodes(self, label: str, properties_list: List[Dict[str, Any]], batch_size: int = 10000) -> int:
+        """Buffer nodes for ``label`` (same arguments as Neo4jClient)."""
+        buffer = self._node_buffers.setdefault(label, [])
+        buffer.extend(properties_list)
+        if len(buffer) >= self.rows_per_file:
+            self._flush_nodes(label)
+        self.plan.counts[label] = self.plan.counts.get(label, 0) + len(properties_list)
+        return len(properties_list)
+
+    def batch_merge_nodes(
+        self,
+        label: str,
+        properties_list: List[Dict[str, Any]],
+        merge_keys: List[str],
+        batch_size: int = 10000,
+    ) -> int:
+        """Buffer nodes; the merge keys become the label's ID key."""
+        if label not in self.id_keys:
+            self.id_keys[label] = merge_keys[0] if len(merge_keys) == 1 else tuple(merge_keys)
+        return self.batch_create_nodes(label, properties_list, batch_size)
+
+    def batch_upsert_nodes(
+        self,
+        label: str,
+        properties_list: List[Dict[str, Any]],
+        merge_keys: Optional[List[str]] = None,
+        volatile: Iterable[str] = VOLATILE_PROPERTIES,
+        batch_size: int = 10000,
+        hash_property: str = HASH_PROPERTY,
+    ) -> UpsertResult:
+        """Buffer nodes with their content hash and keys so later online upserts can skip them."""
+        hashed = [
+            {**props, hash_property: content_hash(props, volatile), f"{hash_property}_keys": sorted(props)}
+            for props in properties_list
+        ]
+        created = self.batch_merge_nodes(label, hashed, merge_keys or ["id"], batch_size)
+        return UpsertResult(created=created)
+
+    def batch_create_relationships(
+        self,
+        rel_type: str,
+        relationships: List[Dict[str, Any]],
+        from_label: str,
+        to_label: str,
+        from_key: str = "id",
+        to_key: str = "id",
+        batch_size: int = 10000,
+    ) -> int:
+        """Buffer relationships (``from_id``/``to_id``/``properties`` dicts, as Neo4jClient)."""
+        key = self._relationship_key(rel_type, from_label, from_key, to_label, to_key)
+        buffer = self._rel_buffers.setdefault(key, [])
+        buffer.extend(relationships)
+        if len(buffer) >= self.rows_per_file:
+            self._flush_relationships(key)
+        self.plan.counts[rel_type] = self.plan.counts.get(rel_type, 0) + len(relationships)
+        return len(relationships)
+
+    def batch_merge_relationships(
+        self,
+        rel_type: str,
+        relationships: List[Dict[str, Any]],
+        from_label: str,
+        to_label: str,
+        from_key: str = "id",
+        to_key: str = "id",
+        batch_size: int = 10000,
+    ) -> int:
+        """Buffer relationships, one per start/end pair; repeated pairs update its properties."""
+        key = self._relationship_key(rel_type, from_label, from_key, to_label, to_key)
+        merged = self._merged_rels.setdefault(key, {})
+        before = len(merged)
+        for rel in relationships:
+            pair = (_csv_value(rel["from_id"]), _csv_value(rel["to_id"]))
+            existing = merged.get(pair)
+            if existing is None:
+                merged[pair] = {**rel, "properties": dict(rel.get("properties") or {})}
+            else:
+                existing["properties"].update(rel.get("properties") or {})
+        self.plan.counts[rel_type] = self.plan.counts.get(rel_type, 0) + len(merged) - before
+        return len(relationships)
+
+    def _relationship_key(
+        self, rel_type: str, from_label: str, from_key: Any, to_label: str, to_key: Any
+    ) -> Tuple[str, str, Any, str, Any]:
+        # Compound endpoints can only be matched through the label's own ID key
+        for label, key in ((from_label, from_key), (to_label, to_key)):
+            if not isinstance(key, str) and key != self.id_key(label):
+                raise ValueError(f"{rel_type}: compound key {key} is not the ID key of {label}")
+        return (rel_type, from_label, from_key, to_label, to_key)
+
+    def run_query(
+        self, query: str, parameters: Optional[Dict[str, Any]] = None, rows: int = 0
+    ) -> List[Dict[str, Any]]:
+        raise NotImplementedError(
+            "AdminImportWriter only supports the batch_* API; port raw Cypher writes "
+            "to batch_create_nodes/batch_create_relationships for offline loads"
+        )
+
+    def close(self) -> None:
+        self.finalize()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.finalize()
+
+    # ============================================
+    # CSV output
+    # ============================================
+
+    def _part_name(self, prefix: str, files: List[str]) -> str:
+        return f"{prefix}-{len(files):04d}.csv.gz"
+
+    def _write_csv(self, name: str, header: List[str], rows: Iterable[List[str]]) -> None:
+        with gzip.open(self.directory / name, "wt", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+    def _flush_nodes(self, label: str) -> None:
+        rows = self._node_buffers.pop(label, [])
+        if not rows:
+            return
+        columns = sorted({col for row in rows for col in row})
+        types = _column_types(rows, columns)
+
+        def cells():
+            for row in rows:
+                node_id = self.node_id(label, row)
+                if node_id is None:
+                    # Not addressable by relationships, but neo4j-admin still needs an ID
+                    self._synthetic_ids[label] = self._synthetic_ids.get(label, 0) + 1
+                    node_id = f"__{label}-{self._synthetic_ids[label]}"
+                yield [_csv_value(node_id)] + [_csv_value(row.get(col)) for col in columns]
+
+        files = self.plan.nodes.setdefault(label, [])
+        name = self._part_name(f"nodes-{label}", files)
+        self._write_csv(name, [f":ID({label})"] + _header(columns, types), cells())
+        files.append(name)
+        logger.debug(f"Wrote {len(rows):,} {label} nodes to {name}")
+
+    def _flush_relationships(self, key: Tuple[str, str, str, str, str]) -> None:
+        rows = self._rel_buffers.pop(key, [])
+        if not rows:
+            return
+        rel_type, from_label, from_key, to_label, to_key = key
+        properties = [rel.get("properties") or {} for rel in rows]
+        columns = sorted({col for props in properties for col in props})
+        types = _column_types(properties, columns)
+
+        # Endpoints looked up by a non-ID property are written as pending and resolved in finalize()
+        resolved = from_key == self.id_key(from_label) and to_key == self.id_key(to_label)
+        if resolved:
+            files = self.plan.relationships.setdefault(rel_type, [])
+            name = self._part_name(f"rels-{rel_type}-{from_label}-{to_label}", files)
+        else:
+            files = self._pending.setdefault(key, [])
+            from_name, to_name = ("-".join(k) if isinstance(k, tuple) else k for k in (from_key, to_key))
+            name = self._part_name(f"pending-{rel_type}-{from_label}-{from_name}-{to_label}-{to_name}", files)
+        self._write_csv(
+            name,
+            [f":START_ID({from_label})", f":END_ID({to_label})"] + _header(columns, types),
+            (
+                [_csv_value(rel["from_id"]), _csv_value(rel["to_id"])]
+                + [_csv_value(props.get(col)) for col in columns]
+                for rel, props in zip(rows, properties)
+            ),
+        )
+        files.append(name)
+
+    def _property_lookup(self, label: str, prop: str) -> Dict[str, str]:
+        """Map ``label.prop`` values (as CSV text) to node IDs by scanning written node files."""
+        lookup: Dict[str, str] = {}
+        for name in self.plan.nodes.get(label, []):
+            with gzip.open(self.directory / name, "rt", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                header = [col.split(":")[0] for col in next(reader)]
+                if prop not in header:
+                    continue
+                index = header.index(prop)
+                for row in reader:
+                    if row[index]:
+                        lookup.setdefault(row[index], row[0])
+        return lookup
+
+    def _resolve_pending(self) -> None:
+        """Rewrite pending relationship files with endpoint values replaced by node IDs."""
+        lookups: Dict[Tuple[str, str], Optional[Dict[str, str]]] = {}
+
+        def lookup(label: str, key: str) -> Optional[Dict[str, str]]:
+            if key == self.id_key(label):
+                return None
+            if (label, key) not in lookups:
+                lookups[(label, key)] = self._property_lookup(label, key)
+            return lookups[(label, key)]
+
+        for (rel_type, from_label, from_key, to_label, to_key), files in self._pending.items():
+            from_lookup = lookup(from_label, from_key)
+            to_lookup = lookup(to_label, to_key)
+            out_files = self.plan.relationships.setdefault(rel_type, [])
+            dropped = 0
+            for name in files:
+                with gzip.open(self.directory / name, "rt", encoding="utf-8", newline="") as f:
+                    reader = csv.reader(f)
+                    header = next(reader)
+                    rows = []
+                    for row in reader:
+                        start = from_lookup.get(row[0]) if from_lookup is not None else row[0]
+                        end = to_lookup.get(row[1]) if to_lookup is not None else row[1]
+                        if start is None or end is None:
+                            dropped += 1
+                            continue
+                        rows.append([start, end] + row[2:])
+                resolved_name = name.replace("pending-", "rels-", 1)
+                self._write_csv(resolved_name, header, rows)
+                (self.directory / name).unlink()
+                out_files.append(resolved_name)
+            if dropped:
+                logger.warning(f"{rel_type}: dropped {dropped:,} relationships with no matching endpoint")
+        self._pending.clear()
+
+    def finalize(self) -> AdminImportPlan:
+        """Flush all buffers, resolve property-keyed relationships and write the plan file."""
+        for label in list(self._node_buffers):
+            self._flush_nodes(label)
+        for key, merged in self._merged_rels.items():
+            self._rel_buffers.setdefault(key, []).extend(merged.values())
+        self._merged_rels.clear()
+        for key in list(self._rel_buffers):
+            self._flush_relationships(key)
+        self._resolve_pending()
+        path = self.plan.save()
+        logger.info(f"Import files ready in {self.directory} ({path.name})")
+        return self.plan
+
+
+def run_admin_import(
+    plan: AdminImportPlan,
+    database: str = "neo4j",
+    docker: bool = True,
+    image: str = DOCKER_IMAGE,
+    data_volume: str = DOCKER_DATA_VOLUME,
+    service: str = DOCKER_SERVICE,
+    neo4j_admin: str = "neo4j-admin",
+) -> None:
+    """
+    Load an import plan with ``neo4j-admin database import full``.
+
+    This replaces the target database. With ``docker=True`` the docker-compose
+    Neo4j service is stopped, the import runs in a one-off container against the
+    service's data volume, and the service is started again. Otherwise
+    ``neo4j_admin`` is run directly against a stopped local installation.
+
+    Args:
+        plan: Plan returned by AdminImportWriter.finalize()
+        database: Target database name
+        docker: Use the docker-compose service (default) instead of a local install
+        image: Neo4j image (must match the server version)
+        data_volume: Docker volume mounted at /data by the service
+        service: docker-compose service name
+        neo4j_admin: Path to neo4j-admin for local installs
+
+    Raises:
+        subprocess.CalledProcessError: If any step fails
+    """
+    options = [
+        "--overwrite-destination=true",
+        "--skip-duplicate-nodes=true",
+        "--skip-bad-relationships=true",
+        f"--array-delimiter={ARRAY_DELIMITER}",
+        "--multiline-fields=true",
+        "--high-parallel-io=on",
+    ]
+
+    if docker:
+        import_args = plan.import_args(root="/import")
+        command = [
+            "docker", "run", "--rm",
+            "-v", f"{data_volume}:/data",
+            "-v", f"{plan.directory.resolve()}:/import:ro",
+            image,
+            "neo4j-admin", "database", "import", "full", *options, *import_args, database,
+        ]
+        logger.info(f"Stopping docker-compose service '{service}'...")
+        subprocess.run(["docker", "compose", "stop", service], cwd=REPO_ROOT, check=True)
+        try:
+            logger.info("Running neo4j-admin database import...")
+            started = time.time()
+            subprocess.run(command, check=True)
+            logger.success(f"✅ neo4j-admin import finished in {time.time() - started:,.0f}s")
+        finally:
+            subprocess.run(["docker", "compose", "start", service], cwd=REPO_ROOT, check=True)
+    else:
+        command = [neo4j_admin, "database", "import", "full", *options, *plan.import_args(), database]
+        logger.info("Running neo4j-admin database import...")
+        started = time.time()
+        subprocess.run(command, check=True)
+        logger.success(f"✅ neo4j-admin import finished in {time.time() - started:,.0f}s")
+
+
+def wait_for_neo4j(uri: str, user: str, password: str, timeout: float = 300.0) -> None:
+    """Block until the server accepts Bolt connections (after a restart)."""
+    from neo4j import GraphDatabase
+    from neo4j.exceptions import ServiceUnavailable
+
+    deadline = time.time() + timeout
+    while True:
+        try:
+            with GraphDatabase.driver(uri, auth=(user, password)) as driver:
+                driver.verify_connectivity()
+            return
+        except ServiceUnavailable:
+            if time.time() > deadline:
+                raise
+            time.sleep(2)
+
+
+def apply_optimizations(uri: str, user: str, password: str, script: Path = OPTIMIZATION_SCRIPT) -> None:
+    """Apply the scripts/neo4j-optimization constraints and indexes to the loaded database."""
+    wait_for_neo4j(uri, user, password)
+    logger.info("Applying constraints and indexes...")
+    subprocess.run(
+        [sys.executable, str(script), "--uri", uri, "--username", user, "--password", password],
+        check=True,
+        env={**os.environ, "NEO4J_URI": uri},
+    )
@@ -0,0 +1,204 @@
+"""Resumable ingestion: per-stage checkpoints and a dead-letter queue for failed batches.
+
+Long imports (Hansard statements, member votes, Lipad) record the position of
+the last committed batch in a small JSON checkpoint, so a crashed or
+interrupted run restarts from there instead of from the first row. A batch
+whose Neo4j write fails is appended, with its error, to an on-disk dead-letter
+file instead of aborting the run; ``canadagpt-ingest --replay-dead-letters``
+retries exactly those batches later.
+
+Both live under ``~/.cache/fedmcp/pipeline`` (override with
+``PIPELINE_STATE_DIR``) rather than in Neo4j, because they have to be
+readable exactly when Neo4j is the thing that went away.
+
+A queue can also hold entries that are not Neo4j writes, such as the source
+files an importer failed to parse; replay leaves those for the importer, which
+retries them when its stage is rerun.
+"""
+
+import json
+import os
+import threading
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+
+from .progress import logger
+from .run_report import record_retry
+
+STATE_DIR = Path(os.getenv("PIPELINE_STATE_DIR", Path.home() / ".cache" / "fedmcp" / "pipeline"))
+
+
+class Checkpoint:
+    """
+    Last committed position of one ingestion stage.
+
+    Example:
+        >>> checkpoint = Checkpoint("hansard_statements")
+        >>> last_id = checkpoint.load().get("last_id", 0)
+        >>> checkpoint.save(last_id=4123456)
+        >>> checkpoint.clear()  # run completed
+    """
+
+    def __init__(self, name: str, state_dir: Optional[Path] = None):
+        self.name = name
+        self.path = (state_dir or STATE_DIR) / "checkpoints" / f"{name}.json"
+
+    def load(self) -> Dict[str, Any]:
+        """Saved position ({} when starting fresh)."""
+        if not self.path.exists():
+            return {}
+        with open(self.path) as f:
+            state = json.load(f)
+        logger.info(f"Resuming {self.name} from checkpoint saved {state.get('saved_at')}")
+        return state
+
+    def save(self, **state: Any) -> None:
+        """Record the position after a committed batch (atomic replace)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state["saved_at"] = datetime.now().isoformat(timespec="seconds")
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        """Forget the position once the stage has completed."""
+        self.path.unlink(missing_ok=True)
+
+
+class DeadLetterQueue:
+    """
+    Failed Neo4j batches for one stage, one JSON line per batch.
+
+    Each entry records the ``Neo4jClient`` method and keyword arguments of the
+    failed write (including the rows), so it can be replayed verbatim.
+    """
+
+    def __init__(self, name: str, state_dir: Optional[Path] = None):
+        self.name = name
+        self.path = (state_dir or STATE_DIR) / "dead_letters" / f"{name}.jsonl"
+        # Writer threads push while an importer removes retried entries
+        self._lock = threading.Lock()
+
+    def push(self, method: str, kwargs: Dict[str, Any], error: BaseException) -> None:
+        """Append a failed batch."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "method": method,
+            "kwargs": kwargs,
+            "error": f"{type(error).__name__}: {error}",
+            "traceback": "".join(traceback.format_exception(type(error), error, error.__traceback__)),
+            "failed_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        with self._lock, open(self.path, "a") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Stored failed batches, oldest first."""
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.entries())
+
+    def _rewrite(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the stored entries (atomic; the file is removed when empty)."""
+        if entries:
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, default=str) + "\n")
+            os.replace(tmp, self.path)
+        else:
+            self.path.unlink(missing_ok=True)
+
+    def remove(self, predicate: Callable[[Dict[str, Any]], bool]) -> None:
+        """Drop the stored entries matching ``predicate`` (e.g. files retried successfully)."""
+        with self._lock:
+            if self.path.exists():
+                self._rewrite([entry for entry in self.entries() if not predicate(entry)])
+
+    def replay(self, neo4j_client) -> Tuple[int, int]:
+        """
+        Retry every stored batch; batches that fail again stay queued.
+
+        Entries that are not ``neo4j_client`` methods (failed source files)
+        are kept for their importer to retry.
+
+        Returns:
+            (batches replayed, batches still failing)
+        """
+        remaining: List[Dict[str, Any]] = []
+        replayed = 0
+        deferred = 0
+        for entry in self.entries():
+            write = getattr(neo4j_client, entry["method"], None)
+            if write is None:
+                remaining.append(entry)
+                deferred += 1
+                continue
+            try:
+                write(**entry["kwargs"])
+                replayed += 1
+            except Exception as e:
+                entry["error"] = f"{type(e).__name__}: {e}"
+                entry["failed_at"] = datetime.now().isoformat(timespec="seconds")
+                remaining.append(entry)
+
+        self._rewrite(remaining)
+
+        failing = len(remaining) - deferred
+        logger.info(f"Dead letters {self.name}: {replayed:,} replayed, {failing:,} still failing")
+        if deferred:
+            logger.info(f"Dead letters {self.name}: {deferred:,} left for a rerun of the stage")
+        return replayed, failing
+
+    @classmethod
+    def all(cls, state_dir: Optional[Path] = None) -> List["DeadLetterQueue"]:
+        """Every stage with queued dead letters."""
+        directory = (state_dir or STATE_DIR) / "dead_letters"
+        return [cls(path.stem, state_dir) for path in sorted(directory.glob("*.jsonl"))]
+
+
+def write_or_dead_letter(
+    client,
+    dead_letters: DeadLetterQueue,
+    method: str,
+    retries: int = 3,
+    **kwargs: Any,
+) -> Any:
+    """
+    Call ``client.<method>(**kwargs)``; on failure queue the batch and return None.
+
+    Use for batch writes where one bad batch should not abort a multi-hour run.
+    Transient errors (deadlocks, leader switches) are retried with backoff first.
+    If the database itself is unreachable the error is raised after the retries:
+    dead-lettering every remaining batch would be pointless, and the caller's
+    checkpoint lets the rerun resume at this batch.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return getattr(client, method)(**kwargs)
+        except (ServiceUnavailable, SessionExpired):
+            if attempt == retries:
+                raise
+        except TransientError as e:
+            if attempt == retries:
+                logger.error(f"Batch write {method} failed, queued to {dead_letters.path.name}: {e}")
+                dead_letters.push(method, kwargs, e)
+                return None
+        except Exception as e:
+            logger.error(f"Batch write {method} failed, queued to {dead_letters.path.name}: {e}")
+            dead_letters.push(method, kwargs, e)
+            return None
+        record_retry()
+        time.sleep(2 ** attempt)
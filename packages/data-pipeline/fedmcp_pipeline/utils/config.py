@@ -50,6 +50,18 @@ class Config:
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.incremental_lookback_days = int(os.getenv("INCREMENTAL_LOOKBACK_DAYS", "7"))
 
+        # Stage scheduling (--full): concurrent stages per resource, and how
+        # recently a stage must have completed to be skipped (0 = never skip)
+        self.http_concurrency = int(os.getenv("PIPELINE_HTTP_CONCURRENCY", "4"))
+        self.neo4j_write_concurrency = int(os.getenv("PIPELINE_NEO4J_CONCURRENCY", "2"))
+        self.stage_fresh_hours = float(os.getenv("PIPELINE_STAGE_FRESH_HOURS", "20"))
+
+        # Run reports: relative slowdown versus the previous run that is logged as a regression
+        self.report_regression_threshold = float(os.getenv("PIPELINE_REPORT_THRESHOLD", "0.25"))
+
+        # Where statement/bill text bodies go: inline, nodes or blob (see utils/content_store.py)
+        self.content_storage = os.getenv("PIPELINE_CONTENT_STORAGE", "inline")
+
     def validate(self) -> None:
         """Validate configuration and test Neo4j connection."""
         from .neo4j_client import Neo4jClient
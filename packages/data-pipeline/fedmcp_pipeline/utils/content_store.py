@@ -0,0 +1,262 @@
+"""Storage of large text bodies (Hansard speech text, full bill text).
+
+By default statement and bill text bodies are stored inline, as properties of
+the ``Statement`` and ``BillText`` nodes. A speech is often tens of kilobytes,
+so traversals that never read it (threading, MP -> statement counts, document
+linking) still page those property records in. Two alternatives keep the hot
+nodes small; they keep only metadata plus a short ``<field>_preview``:
+
+    inline  Bodies on the node itself (default, the historical layout)
+    nodes   Bodies on a linked content node: (Statement)-[:HAS_CONTENT]->(StatementContent)
+            and (BillText)-[:HAS_CONTENT]->(BillTextContent), with the same ids
+    blob    Bodies zlib-compressed in a local SQLite file keyed by id, outside Neo4j
+
+The mode comes from ``PIPELINE_CONTENT_STORAGE``; the blob store lives in
+``PIPELINE_CONTENT_DIR`` (default ~/.cache/fedmcp/content).
+
+Example:
+    >>> store = ContentBlobStore()
+    >>> store.get_many("Statement", [4012345])[4012345]["content_en"]
+"""
+
+import json
+import os
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .progress import logger
+
+
+CONTENT_STORAGE_MODES = ("inline", "nodes", "blob")
+
+# Body properties per node label, and the label of the node that holds them in "nodes" mode
+CONTENT_FIELDS = {
+    "Statement": ("content_en", "content_fr"),
+    "BillText": ("text_en", "text_fr"),
+}
+CONTENT_LABELS = {
+    "Statement": "StatementContent",
+    "BillText": "BillTextContent",
+}
+
+PREVIEW_CHARS = 280
+
+CONTENT_DIR = Path(os.getenv("PIPELINE_CONTENT_DIR", "~/.cache/fedmcp/content")).expanduser()
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_CHUNK = 900
+
+
+def content_storage_mode(mode: Optional[str] = None) -> str:
+    """
+    Resolve the content storage mode.
+
+    Args:
+        mode: "inline", "nodes" or "blob"; None reads PIPELINE_CONTENT_STORAGE
+
+    Returns:
+        The validated mode
+    """
+    mode = (mode or os.getenv("PIPELINE_CONTENT_STORAGE") or "inline").strip().lower()
+    if mode not in CONTENT_STORAGE_MODES:
+        raise ValueError(
+            f"Unknown content storage mode {mode!r} (expected one of {', '.join(CONTENT_STORAGE_MODES)})"
+        )
+    return mode
+
+
+def preview(text: Optional[str], length: int = PREVIEW_CHARS) -> Optional[str]:
+    """First ``length`` characters of ``text``, cut at a word boundary."""
+    if not text or len(text) <= length:
+        return text
+    cut = text[:length]
+    space = cut.rfind(" ")
+    if space > length // 2:
+        cut = cut[:space]
+    return cut.rstrip() + "…"
+
+
+def split_content(label: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Move body properties off node rows, leaving a preview of each in their place.
+
+    ``rows`` are modified in place: each body field (e.g. ``content_en``) is
+    removed and ``<field>_preview`` added.
+
+    Args:
+        label: Node label with an entry in CONTENT_FIELDS
+        rows: Node property dicts with an ``id``
+
+    Returns:
+        Body rows (``id`` plus the body fields), one per node row
+    """
+    fields = CONTENT_FIELDS[label]
+    bodies = []
+    for row in rows:
+        body = {"id": row["id"]}
+        for field in fields:
+            body[field] = row.pop(field, None)
+            row[f"{field}_preview"] = preview(body[field])
+        bodies.append(body)
+    return bodies
+
+
+def content_node_query(label: str) -> str:
+    """UNWIND query writing ``$bodies`` rows to content nodes linked from ``label`` nodes."""
+    content_label = CONTENT_LABELS[label]
+    assignments = ",\n            ".join(f"c.{field} = body.{field}" for field in CONTENT_FIELDS[label])
+    return f"""
+        UNWIND $bodies AS body
+        MERGE (n:{label} {{id: body.id}})
+        MERGE (c:{content_label} {{id: body.id}})
+        SET {assignments}
+        MERGE (n)-[:HAS_CONTENT]->(c)
+    """
+
+
+def create_content_constraints(neo4j_client, label: str) -> None:
+    """Unique constraint on the content node id for ``label`` ("nodes" mode)."""
+    content_label = CONTENT_LABELS[label]
+    neo4j_client.run_query(f"""
+        CREATE CONSTRAINT {content_label.lower()}_id IF NOT EXISTS
+        FOR (c:{content_label}) REQUIRE c.id IS UNIQUE
+    """)
+
+
+class ContentBlobStore:
+    """
+    Compressed bodies keyed by node id, one SQLite table per label.
+
+    Each row holds the zlib-compressed JSON of that node's body fields. SQLite
+    gives atomic batch upserts and indexed point lookups without a server;
+    speech text compresses roughly 3:1.
+    """
+
+    def __init__(self, directory: Path = CONTENT_DIR):
+        """
+        Open (creating if needed) the blob store.
+
+        Args:
+            directory: Directory holding content.sqlite3
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / "content.sqlite3"
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._tables = set()
+
+    def _table(self, label: str) -> str:
+        if label not in CONTENT_FIELDS:
+            raise ValueError(f"No content fields defined for label {label!r}")
+        table = f"{label.lower()}_content"
+        if table not in self._tables:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, body BLOB NOT NULL)")
+            self._tables.add(table)
+        return table
+
+    def put_many(self, label: str, bodies: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or replace bodies.
+
+        Args:
+            label: Node label the bodies belong to
+            bodies: Rows with an ``id`` and the label's body fields
+
+        Returns:
+            Number of bodies written
+        """
+        table = self._table(label)
+        rows = [
+            (
+                body["id"],
+                zlib.compress(
+                    json.dumps({k: v for k, v in body.items() if k != "id"}, ensure_ascii=False).encode("utf-8")
+                ),
+            )
+            for body in bodies
+        ]
+        with self._conn:
+            self._conn.executemany(f"INSERT OR REPLACE INTO {table} (id, body) VALUES (?, ?)", rows)
+        return len(rows)
+
+    def get(self, label: str, node_id: int) -> Optional[Dict[str, Any]]:
+        """Body fields of one node, or None if not stored."""
+        return self.get_many(label, [node_id]).get(node_id)
+
+    def get_many(self, label: str, node_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Body fields of several nodes.
+
+        Args:
+            label: Node label
+            node_ids: Node ids
+
+        Returns:
+            Mapping of id to body fields; ids without a stored body are omitted
+        """
+        table = self._table(label)
+        ids = list(node_ids)
+        found = {}
+        for start in range(0, len(ids), _LOOKUP_CHUNK):
+            chunk = ids[start:start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for node_id, body in self._conn.execute(
+                f"SELECT id, body FROM {table} WHERE id IN ({placeholders})", chunk
+            ):
+                found[node_id] = json.loads(zlib.decompress(body))
+        return found
+
+    def count(self, label: str) -> int:
+        """Number of bodies stored for ``label``."""
+        return self._conn.execute(f"SELECT count(*) FROM {self._table(label)}").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def store_content(
+    neo4j_client,
+    label: str,
+    bodies: List[Dict[str, Any]],
+    mode: str,
+    blob_store: Optional[ContentBlobStore] = None,
+) -> int:
+    """
+    Write bodies split off by split_content to content nodes or the blob store.
+
+    Args:
+        neo4j_client: Neo4j client instance ("nodes" mode)
+        label: Node label the bodies belong to
+        bodies: Rows returned by split_content
+        mode: "nodes" or "blob"
+        blob_store: Open blob store ("blob" mode)
+
+    Returns:
+        Number of bodies written
+    """
+    if not bodies:
+        return 0
+    if mode == "nodes":
+        return neo4j_client.batch_write(content_node_query(label), bodies, param="bodies")
+    if mode == "blob":
+        return blob_store.put_many(label, bodies)
+    raise ValueError(f"Content storage mode {mode!r} keeps bodies inline")
+
+
+def log_content_storage(label: str, mode: str, blob_store: Optional[ContentBlobStore] = None) -> None:
+    """Log where ``label`` bodies are being written."""
+    if mode == "nodes":
+        logger.info(f"{label} bodies stored on linked {CONTENT_LABELS[label]} nodes")
+    elif mode == "blob":
+        logger.info(f"{label} bodies stored compressed in {blob_store.path}")
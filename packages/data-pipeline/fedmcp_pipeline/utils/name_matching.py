@@ -0,0 +1,340 @@
+"""In-memory resolution of people's names to MP ids.
+
+Expense reports ("Sgro, Hon. Judy A."), committee pages, LEGISinfo sponsors
+("Hon. Mark Carney") and lobbying DPOH lists all name MPs differently.
+``MPNameResolver`` is built once from the MP table and resolves whole batches
+of names without touching the graph:
+
+1. Every MP is indexed under precomputed variant keys: full name, given +
+   family, first + last without middle names, nickname/formal first names,
+   first initial + surname, and the parts of compound or hyphenated surnames.
+   Each variant carries a confidence; a key shared by two MPs at the same
+   confidence is ambiguous and dropped.
+2. A query name is cleaned (honorifics, "Last, First" order, accents) and its
+   own variants are looked up in the same index.
+3. Names that still miss fall back to fuzzy matching, compared only against
+   MPs that share a surname token or surname prefix (the blocking index).
+"""
+
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .progress import logger
+
+# Common nickname -> formal first name mappings for Canadian MPs
+NICKNAMES = {
+    "bobby": "robert",
+    "rob": "robert",
+    "bob": "robert",
+    "bill": "william",
+    "dick": "richard",
+    "jim": "james",
+    "joe": "joseph",
+    "mike": "michael",
+    "tony": "anthony",
+    "shuv": "shuvaloy",
+    "dan": "daniel",
+    "dave": "david",
+    "chris": "christopher",
+    "ken": "kenneth",
+    "steve": "steven",
+    "tom": "thomas",
+    "ron": "ronald",
+    "pat": "patrick",
+    "andy": "andrew",
+    "alex": "alexander",
+}
+
+FORMAL_TO_NICKNAMES: Dict[str, List[str]] = defaultdict(list)
+for _nickname, _formal in NICKNAMES.items():
+    FORMAL_TO_NICKNAMES[_formal].append(_nickname)
+
+# Titles stripped before matching (compared after normalization, so no periods)
+HONORIFICS = {"right", "rt", "hon", "honourable", "honorable", "dr", "rev", "prof",
+              "mr", "mrs", "ms", "miss", "mp", "pc", "sen", "senator", "the"}
+
+# Confidence of each kind of variant key
+EXACT = 1.0
+CORE = 0.95
+SURNAME_PART = 0.9
+NICKNAME = 0.9
+INITIAL = 0.8
+
+# Fuzzy fallback: minimum similarity, and lead required over the runner-up
+FUZZY_THRESHOLD = 0.85
+FUZZY_MARGIN = 0.05
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for matching by:
+    - Removing accents/diacritics
+    - Converting to lowercase
+    - Removing periods and extra whitespace
+
+    Args:
+        name: Name to normalize
+
+    Returns:
+        Normalized name string
+    """
+    if not name:
+        return ""
+
+    # Remove accents: é → e, è → e, ñ → n, etc.
+    name = "".join(
+        char for char in unicodedata.normalize("NFD", name)
+        if unicodedata.category(char) != "Mn"
+    )
+
+    # Remove periods (for middle initials like "S." or "A.")
+    name = name.replace(".", "")
+
+    return " ".join(name.lower().split())
+
+
+def clean_name(name: str) -> str:
+    """
+    Normalize a name as it appears in a source document.
+
+    Reorders "Last, First" to "First Last" and strips honorifics such as
+    "Hon.", "Rt. Hon." and "Dr.".
+
+    Example:
+        >>> clean_name("Sgro, Hon. Judy A.")
+        'judy a sgro'
+    """
+    if not name:
+        return ""
+    # Drop comma-separated segments that are only titles ("..., P.C., M.P.")
+    segments = [
+        [token for token in normalize_name(segment).split() if token not in HONORIFICS]
+        for segment in name.split(",")
+    ]
+    segments = [segment for segment in segments if segment]
+    if len(segments) == 2:
+        segments.reverse()
+    return " ".join(token for segment in segments for token in segment)
+
+
+def _surname_parts(family: str) -> List[str]:
+    """Tokens of a compound or hyphenated surname ("rempel garner" -> ["rempel", "garner"])."""
+    return [part for part in family.replace("-", " ").split() if part]
+
+
+def _first_name_forms(first: str) -> List[Tuple[str, float]]:
+    """A first name plus its nickname/formal alternatives, with confidence."""
+    forms = [(first, EXACT)]
+    if first in NICKNAMES:
+        forms.append((NICKNAMES[first], NICKNAME))
+    forms.extend((nickname, NICKNAME) for nickname in FORMAL_TO_NICKNAMES.get(first, []))
+    return forms
+
+
+def name_variants(first: str, middle: List[str], family: str, initials: bool = True) -> Dict[str, float]:
+    """
+    Variant keys for one person and the confidence of each.
+
+    Args:
+        first: Normalized first name
+        middle: Normalized middle names/initials
+        family: Normalized family name (may be compound or hyphenated)
+        initials: Also emit "first initial + surname" keys (index side only;
+            a full query name must not match a different person by initial)
+
+    Returns:
+        Dict of variant key -> confidence (highest confidence kept per key)
+    """
+    variants: Dict[str, float] = {}
+
+    def add(key: str, confidence: float) -> None:
+        key = " ".join(key.split())
+        if key and confidence > variants.get(key, 0.0):
+            variants[key] = confidence
+
+    parts = _surname_parts(family)
+    surnames = [(family, EXACT)]
+    if len(parts) > 1:
+        surnames.append((" ".join(parts), EXACT))
+        surnames.extend((part, SURNAME_PART) for part in parts)
+
+    add(" ".join([first, *middle, family]), EXACT)
+    for first_form, first_confidence in _first_name_forms(first):
+        for surname, surname_confidence in surnames:
+            add(f"{first_form} {surname}", min(first_confidence, surname_confidence, CORE if middle else EXACT))
+    for surname, _ in surnames:
+        if initials and first:
+            add(f"{first[0]} {surname}", INITIAL)
+    return variants
+
+
+@dataclass
+class NameMatch:
+    """An MP id resolved from a name, with how it was found."""
+
+    mp_id: str
+    confidence: float
+    method: str  # exact | variant | fuzzy
+
+
+class MPNameResolver:
+    """
+    Resolve names to MP ids entirely in memory.
+
+    Example:
+        >>> resolver = MPNameResolver.from_neo4j(neo4j_client)
+        >>> matches = resolver.resolve_many(["Aboultaif, Ziad", "Hon. Bobby Morrissey"])
+        >>> matches["Aboultaif, Ziad"].mp_id
+        'ziad-aboultaif'
+    """
+
+    def __init__(self, mps: Iterable[Dict[str, Any]]):
+        """
+        Args:
+            mps: MP records with ``id``, ``name`` and optionally ``given_name``/``family_name``
+        """
+        self.names: Dict[str, str] = {}
+        index: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._blocks: Dict[str, Set[str]] = defaultdict(set)
+
+        for mp in mps:
+            mp_id = mp.get("id")
+            if not mp_id:
+                continue
+            name = normalize_name(mp.get("name") or "")
+            given = normalize_name(mp.get("given_name") or "")
+            family = normalize_name(mp.get("family_name") or "")
+            if given and family:
+                splits = [(given, family)]
+            else:
+                # Only a full name: the surname may be any trailing run of tokens
+                # ("michelle rempel garner" -> "rempel garner" or "garner")
+                tokens = name.split()
+                if len(tokens) < 2:
+                    continue
+                splits = [
+                    (" ".join(tokens[:i]), " ".join(tokens[i:]))
+                    for i in range(1, len(tokens))
+                    if i == len(tokens) - 1 or len(tokens[i]) > 1
+                ]
+                given, family = splits[-1]
+
+            self.names[mp_id] = name or f"{given} {family}"
+            if name:
+                index[name][mp_id] = EXACT
+            for given, family in splits:
+                given_tokens = given.split()
+                for key, confidence in name_variants(given_tokens[0], given_tokens[1:], family).items():
+                    index[key][mp_id] = max(confidence, index[key].get(mp_id, 0.0))
+                for part in _surname_parts(family):
+                    self._blocks[part].add(mp_id)
+                    self._blocks[part[:3]].add(mp_id)
+
+        # Keep each key's best candidate; drop keys where two MPs tie
+        self._index: Dict[str, Tuple[str, float]] = {}
+        for key, candidates in index.items():
+            ranked = sorted(candidates.items(), key=lambda item: item[1], reverse=True)
+            if len(ranked) > 1 and ranked[0][1] == ranked[1][1]:
+                continue
+            self._index[key] = ranked[0]
+        self._cache: Dict[str, Optional[NameMatch]] = {}
+
+    @classmethod
+    def from_neo4j(cls, neo4j_client, current_only: bool = False) -> "MPNameResolver":
+        """Build a resolver from the MP nodes in Neo4j (one query)."""
+        where = "WHERE m.current = true" if current_only else ""
+        records = neo4j_client.run_query(f"""
+            MATCH (m:MP)
+            {where}
+            RETURN m.id AS id, m.name AS name, m.given_name AS given_name, m.family_name AS family_name
+        """)
+        resolver = cls(records)
+        logger.info(f"Indexed {len(resolver.names):,} MPs under {len(resolver._index):,} name variants")
+        return resolver
+
+    def resolve(self, name: str) -> Optional[NameMatch]:
+        """Best MP match for ``name`` (None if nothing is confident enough)."""
+        if name not in self._cache:
+            self._cache[name] = self._resolve(clean_name(name))
+        return self._cache[name]
+
+    def _resolve(self, cleaned: str) -> Optional[NameMatch]:
+        tokens = cleaned.split()
+        if not tokens:
+            return None
+        if cleaned in self._index:
+            mp_id, confidence = self._index[cleaned]
+            return NameMatch(mp_id, confidence, "exact" if confidence == EXACT else "variant")
+        if len(tokens) < 2:
+            return None
+
+        # Query-side variants: drop middle names, try nicknames, split surnames
+        best: Optional[NameMatch] = None
+        for key, query_confidence in name_variants(tokens[0], tokens[1:-1], tokens[-1], initials=False).items():
+            if key in self._index:
+                mp_id, confidence = self._index[key]
+                confidence = min(confidence, query_confidence)
+                if best is None or confidence > best.confidence:
+                    best = NameMatch(mp_id, confidence, "variant")
+        for split in range(2, len(tokens)):
+            # "Jessica Fancy Landry" or "Michelle Rempel Garner" as a multi-word surname
+            key = f"{tokens[0]} {' '.join(tokens[split - 1:])}"
+            if key in self._index and (best is None or self._index[key][1] > best.confidence):
+                best = NameMatch(*self._index[key], "variant")
+        if best:
+            return best
+        return self._fuzzy(cleaned, tokens)
+
+    def _fuzzy(self, cleaned: str, tokens: List[str]) -> Optional[NameMatch]:
+        candidates: Set[str] = set()
+        for token in tokens[1:]:
+            if len(token) > 1:
+                candidates |= self._blocks.get(token, set())
+        if not candidates:
+            candidates = self._blocks.get(tokens[-1][:3], set())
+
+        scored = sorted(
+            ((SequenceMatcher(None, cleaned, self.names[mp_id]).ratio(), mp_id) for mp_id in candidates),
+            reverse=True,
+        )
+        if not scored or scored[0][0] < FUZZY_THRESHOLD:
+            return None
+        if len(scored) > 1 and scored[0][0] - scored[1][0] < FUZZY_MARGIN:
+            return None
+        score, mp_id = scored[0]
+        return NameMatch(mp_id, round(score, 3), "fuzzy")
+
+    def resolve_many(
+        self,
+        names: Iterable[str],
+        min_confidence: float = 0.0,
+        label: str = "names",
+    ) -> Dict[str, Optional[NameMatch]]:
+        """
+        Resolve a batch of names, logging a summary of how they matched.
+
+        Args:
+            names: Names as they appear in the source (duplicates are resolved once)
+            min_confidence: Treat matches below this confidence as unresolved
+            label: What the names are, for the log line
+
+        Returns:
+            Dict of name -> NameMatch (None if unresolved)
+        """
+        results: Dict[str, Optional[NameMatch]] = {}
+        methods: Counter = Counter()
+        for name in names:
+            if name in results:
+                continue
+            match = self.resolve(name)
+            if match and match.confidence < min_confidence:
+                match = None
+            results[name] = match
+            methods[match.method if match else "unresolved"] += 1
+
+        summary = ", ".join(f"{count:,} {method}" for method, count in methods.most_common())
+        logger.info(f"Resolved {len(results):,} distinct {label} to MPs ({summary or 'none'})")
+        return results
@@ -1,11 +1,60 @@
 """Neo4j client with batch operations support."""
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from neo4j import GraphDatabase, Driver, Session, Result
-from neo4j.exceptions import ServiceUnavailable, AuthError
+from neo4j import GraphDatabase, Driver, Session, Result, ResultSummary
+from neo4j.exceptions import ServiceUnavailable, AuthError, Neo4jError
 
+from .batch_sizing import AdaptiveBatchSizer, is_overload_error
 from .progress import logger
+from .run_report import record_retry, record_write
+
+
+# Properties that change on every run and must not affect the content hash
+VOLATILE_PROPERTIES = ("updated_at",)
+
+# Node property holding the content hash written by batch_upsert_nodes; the keys
+# it covered are stored alongside as "<hash property>_keys"
+HASH_PROPERTY = "content_hash"
+
+
+def content_hash(properties: Dict[str, Any], exclude: Iterable[str] = VOLATILE_PROPERTIES) -> str:
+    """Stable hash of a node's properties, ignoring volatile fields."""
+    skip = set(exclude) | {HASH_PROPERTY, f"{HASH_PROPERTY}_keys"}
+    payload = {k: v for k, v in properties.items() if k not in skip}
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def stable_id(prefix: str, *parts: Any) -> str:
+    """Deterministic node id for records that have no natural key."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f"{prefix}-{digest[:16]}"
+
+
+@dataclass
+class UpsertResult:
+    """Outcome of a change-detecting upsert."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.created + self.updated + self.unchanged
+
+    @property
+    def written(self) -> int:
+        return self.created + self.updated
+
+    def __str__(self) -> str:
+        return f"{self.created:,} created, {self.updated:,} updated, {self.unchanged:,} unchanged"
 
 
 class Neo4jClient:
@@ -26,6 +75,9 @@ class Neo4jClient:
         password: str,
         max_connection_lifetime: int = 3600,
         max_connection_pool_size: int = 50,
+        adaptive_batching: bool = True,
+        target_tx_seconds: float = 2.0,
+        max_tx_bytes: int = 16 * 1024 * 1024,
     ):
         """
         Initialize Neo4j driver.
@@ -36,9 +88,18 @@ class Neo4jClient:
             password: Password
             max_connection_lifetime: Max lifetime of pooled connections (seconds)
             max_connection_pool_size: Max number of pooled connections
+            adaptive_batching: Tune batch sizes per query at runtime (see batch_sizing.py);
+                the ``batch_size`` passed to batch methods is then only the starting size
+            target_tx_seconds: Commit latency adaptive batching aims for
+            max_tx_bytes: Upper bound on the estimated parameter payload per transaction
         """
         self.uri = uri
         self.user = user
+        self.adaptive_batching = adaptive_batching
+        self.target_tx_seconds = target_tx_seconds
+        self.max_tx_bytes = max_tx_bytes
+        self._sizers: Dict[str, AdaptiveBatchSizer] = {}
+        self._sizers_lock = threading.Lock()
 
         try:
             self.driver: Driver = GraphDatabase.driver(
@@ -102,6 +163,103 @@ class Neo4jClient:
     # Batch Operations (UNWIND)
     # ============================================
 
+    def _sizer(self, query: str, batch_size: int) -> Optional[AdaptiveBatchSizer]:
+        """Batch sizer for ``query``, shared by every call so later calls start tuned."""
+        if not self.adaptive_batching:
+            return None
+        with self._sizers_lock:
+            if query not in self._sizers:
+                self._sizers[query] = AdaptiveBatchSizer(
+                    initial=batch_size,
+                    target_seconds=self.target_tx_seconds,
+                    max_payload_bytes=self.max_tx_bytes,
+                )
+            return self._sizers[query]
+
+    def _run_batches(
+        self,
+        session: Session,
+        query: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int,
+        param: str = "batch",
+        prepare: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None,
+    ) -> Iterator[Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Optional[ResultSummary]]]:
+        """
+        Run an UNWIND ``query`` over ``rows`` one transaction per batch.
+
+        Batch sizes come from the query's AdaptiveBatchSizer (or are fixed at
+        ``batch_size`` without adaptive batching). A batch that fails with a
+        memory-limit or timeout error is retried at half the size.
+
+        Args:
+            session: Open session
+            query: Cypher taking the batch as ``$<param>``
+            rows: All rows to write
+            batch_size: Starting (or fixed) batch size
+            param: Query parameter name for the batch
+            prepare: Optional hook turning a slice of rows into the rows actually
+                written (e.g. dropping unchanged ones); an empty result skips the write
+
+        Yields:
+            (slice of rows, rows written, summary or None if nothing was written)
+        """
+        sizer = self._sizer(query, batch_size)
+        start = 0
+        while start < len(rows):
+            size = sizer.next_size(rows, start) if sizer else batch_size
+            batch = rows[start : start + size]
+            payload = prepare(batch) if prepare else batch
+
+            summary = None
+            if payload:
+                began = time.monotonic()
+                try:
+                    summary = session.run(query, {param: payload}).consume()
+                except Neo4jError as e:
+                    if sizer and is_overload_error(e) and sizer.shrink(e, len(payload)):
+                        record_retry()
+                        continue
+                    raise
+                elapsed = time.monotonic() - began
+                record_write(len(payload), summary.counters, elapsed)
+                if sizer:
+                    sizer.record(len(batch), elapsed)
+
+            start += len(batch)
+            yield batch, payload, summary
+
+    def batch_write(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        param: str = "batch",
+        batch_size: int = 10000,
+    ) -> int:
+        """
+        Run a custom UNWIND write query over ``rows`` with adaptive batching.
+
+        Args:
+            query: Cypher taking the batch as ``$<param>``
+            rows: Rows to write
+            param: Query parameter name for the batch
+            batch_size: Starting batch size
+
+        Returns:
+            Number of rows written
+
+        Example:
+            >>> client.batch_write(
+            ...     "UNWIND $statements AS stmt MERGE (s:Statement {id: stmt.id}) SET s += stmt",
+            ...     statements, param="statements",
+            ... )
+        """
+        written = 0
+        with self.driver.session() as session:
+            for batch, _, _ in self._run_batches(session, query, rows, batch_size, param=param):
+                written += len(batch)
+        return written
+
     def batch_create_nodes(
         self,
         label: str,
@@ -114,7 +272,7 @@ class Neo4jClient:
         Args:
             label: Node label (e.g., "MP", "Bill")
             properties_list: List of property dicts for each node
-            batch_size: Number of nodes per transaction
+            batch_size: Number of nodes per transaction (starting size with adaptive batching)
 
         Returns:
             Total number of nodes created
@@ -134,15 +292,10 @@ class Neo4jClient:
         """
 
         with self.driver.session() as session:
-            for i in range(0, len(properties_list), batch_size):
-                batch = properties_list[i : i + batch_size]
-                result = session.run(query, batch=batch)
-                summary = result.consume()
+            for batch, _, summary in self._run_batches(session, query, properties_list, batch_size):
                 created = summary.counters.nodes_created
                 total_created += created
-                logger.debug(
-                    f"Created {created} {label} nodes (batch {i // batch_size + 1})"
-                )
+                logger.debug(f"Created {created} {label} nodes (batch of {len(batch):,})")
 
         logger.info(f"Created {total_created:,} {label} nodes total")
         return total_created
@@ -182,21 +335,112 @@ class Neo4jClient:
         """
 
         with self.driver.session() as session:
-            for i in range(0, len(properties_list), batch_size):
-                batch = properties_list[i : i + batch_size]
-                result = session.run(query, batch=batch)
-                summary = result.consume()
+            for batch, _, summary in self._run_batches(session, query, properties_list, batch_size):
                 created = summary.counters.nodes_created
                 props_set = summary.counters.properties_set
                 total_processed += len(batch)
                 logger.debug(
                     f"Merged {label} nodes: {created} created, "
-                    f"{props_set} properties set (batch {i // batch_size + 1})"
+                    f"{props_set} properties set (batch of {len(batch):,})"
                 )
 
         logger.info(f"Merged {total_processed:,} {label} nodes total")
         return total_processed
 
+    def batch_upsert_nodes(
+        self,
+        label: str,
+        properties_list: List[Dict[str, Any]],
+        merge_keys: Optional[List[str]] = None,
+        volatile: Iterable[str] = VOLATILE_PROPERTIES,
+        batch_size: int = 10000,
+        hash_property: str = HASH_PROPERTY,
+    ) -> UpsertResult:
+        """
+        Upsert nodes, writing only rows whose content changed since the last run.
+
+        Each node stores a hash of its properties (excluding ``volatile`` ones
+        such as ``updated_at``) in ``hash_property``, and the property names it
+        covered in ``<hash_property>_keys``. Stored hashes are read back per batch
+        and only new or changed rows are sent to MERGE, so a daily refresh writes
+        just the delta. A property written last time but missing from the new row
+        (e.g. dropped as None at the source) is set to null, which removes it.
+        Rows missing a merge key are skipped.
+
+        Args:
+            label: Node label
+            properties_list: List of property dicts
+            merge_keys: Properties identifying the node (default: ["id"])
+            volatile: Properties ignored when hashing (still written with changed rows)
+            batch_size: Nodes per transaction
+            hash_property: Property holding the hash. Give each source its own when
+                several write different properties to the same nodes, so they do
+                not rewrite (or remove) each other's properties.
+
+        Returns:
+            UpsertResult with created/updated/unchanged counts
+
+        Example:
+            >>> result = client.batch_upsert_nodes("MP", mps_data)
+            >>> logger.info(f"MPs: {result}")
+        """
+        merge_keys = merge_keys or ["id"]
+        result = UpsertResult()
+        if len(merge_keys) == 1:
+            self.ensure_index(label, merge_keys[0])
+
+        keys_property = f"{hash_property}_keys"
+        match_props = ", ".join(f"{k}: key.{k}" for k in merge_keys)
+        lookup_query = f"""
+        UNWIND $keys AS key
+        MATCH (n:{label} {{{match_props}}})
+        RETURN key, n.{hash_property} AS hash, n.{keys_property} AS written
+        """
+        merge_props = ", ".join(f"{k}: properties.{k}" for k in merge_keys)
+        write_query = f"""
+        UNWIND $batch AS properties
+        MERGE (n:{label} {{{merge_props}}})
+        SET n += properties
+        """
+
+        def identity(props: Dict[str, Any]) -> tuple:
+            return tuple(props.get(k) for k in merge_keys)
+
+        rows = [props for props in properties_list if None not in identity(props)]
+        if len(rows) < len(properties_list):
+            logger.warning(f"Skipped {len(properties_list) - len(rows):,} {label} rows missing {merge_keys}")
+
+        with self.driver.session() as session:
+
+            def changed_rows(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                keys = [{k: props[k] for k in merge_keys} for props in batch]
+                existing = {
+                    identity(record["key"]): (record["hash"], record["written"] or [])
+                    for record in session.run(lookup_query, keys=keys)
+                }
+                changed = []
+                for props in batch:
+                    digest = content_hash(props, volatile)
+                    stored_hash, stored_keys = existing.get(identity(props), (None, []))
+                    if stored_hash == digest:
+                        continue
+                    removed = {key: None for key in stored_keys if key not in props}
+                    changed.append({**removed, **props, hash_property: digest, keys_property: sorted(props)})
+                return changed
+
+            for batch, changed, summary in self._run_batches(
+                session, write_query, rows, batch_size, prepare=changed_rows
+            ):
+                result.unchanged += len(batch) - len(changed)
+                if summary is None:
+                    continue
+                created = summary.counters.nodes_created
+                result.created += created
+                result.updated += len(changed) - created
+
+        logger.info(f"Upserted {label} nodes: {result}")
+        return result
+
     def batch_create_relationships(
         self,
         rel_type: str,
@@ -247,15 +491,10 @@ class Neo4jClient:
         """
 
         with self.driver.session() as session:
-            for i in range(0, len(relationships), batch_size):
-                batch = relationships[i : i + batch_size]
-                result = session.run(query, batch=batch)
-                summary = result.consume()
+            for batch, _, summary in self._run_batches(session, query, relationships, batch_size):
                 created = summary.counters.relationships_created
                 total_created += created
-                logger.debug(
-                    f"Created {created} {rel_type} relationships (batch {i // batch_size + 1})"
-                )
+                logger.debug(f"Created {created} {rel_type} relationships (batch of {len(batch):,})")
 
         logger.info(f"Created {total_created:,} {rel_type} relationships total")
         return total_created
@@ -286,32 +525,180 @@ class Neo4jClient:
         """
 
         with self.driver.session() as session:
-            for i in range(0, len(relationships), batch_size):
-                batch = relationships[i : i + batch_size]
-                result = session.run(query, batch=batch)
-                summary = result.consume()
+            for batch, _, summary in self._run_batches(session, query, relationships, batch_size):
                 created = summary.counters.relationships_created
                 props_set = summary.counters.properties_set
                 total_processed += len(batch)
                 logger.debug(
                     f"Merged {rel_type} relationships: {created} created, "
-                    f"{props_set} properties set (batch {i // batch_size + 1})"
+                    f"{props_set} properties set (batch of {len(batch):,})"
                 )
 
         logger.info(f"Merged {total_processed:,} {rel_type} relationships total")
         return total_processed
 
+    def ensure_index(self, label: str, prop: str) -> None:
+        """Create a range index on (label.prop) if one does not already exist."""
+        index_name = f"{label.lower()}_{prop.lower()}"
+        try:
+            self.run_query(f"CREATE INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON (n.{prop})")
+        except Exception as e:
+            # An equivalent index or uniqueness constraint under another name already exists
+            logger.debug(f"Index {index_name} not created: {e}")
+
+    def link_by_keyset(
+        self,
+        rel_type: str,
+        source_label: str,
+        source_prop: str,
+        target_label: str,
+        target_prop: str,
+        source_key: str = "id",
+        reverse: bool = False,
+        rel_properties: Optional[Dict[str, str]] = None,
+        batch_size: int = 10000,
+        resume: bool = True,
+        start_after: Any = None,
+    ) -> int:
+        """
+        Link existing nodes by walking the source label in key order (keyset pagination).
+
+        Each page reads the next ``batch_size`` source nodes with
+        ``source_key > last_key``, joins them to targets on the indexed
+        ``target_prop`` and MERGEs the relationship. Every node is visited exactly
+        once, so the total cost is linear in the node count and the loop always
+        terminates, whether or not a node finds a match. The last key of each page
+        is recorded on a ``LinkProgress`` node so an interrupted run resumes where
+        it stopped; the marker is removed once the walk completes.
+
+        Args:
+            rel_type: Relationship type to MERGE (e.g., "MADE_BY")
+            source_label: Label of the nodes being walked
+            source_prop: Source property holding the join value
+            target_label: Label of the nodes being linked to
+            target_prop: Target property matched against ``source_prop``
+            source_key: Unique, orderable source property used for pagination
+            reverse: Create (target)-[rel]->(source) instead of (source)-[rel]->(target)
+            rel_properties: Relationship property -> source property to copy onto the relationship
+            batch_size: Source nodes per page
+            resume: Continue from a previously recorded position if one exists
+            start_after: Only walk source nodes with ``source_key`` greater than this
+                (e.g. rows added since an incremental watermark)
+
+        Returns:
+            Number of relationships created
+
+        Example:
+            >>> client.link_by_keyset(
+            ...     "MADE_BY", "Statement", "politician_id",
+            ...     "MP", "openparliament_politician_id",
+            ... )
+        """
+        progress_name = f"{source_label}-{rel_type}-{target_label}"
+        self.ensure_index(source_label, source_key)
+        self.ensure_index(target_label, target_prop)
+
+        last_key = start_after
+        if resume:
+            result = self.run_query(
+                "MATCH (p:LinkProgress {name: $name}) RETURN p.last_key AS last_key",
+                {"name": progress_name},
+            )
+            if result and result[0]["last_key"] is not None:
+                last_key = result[0]["last_key"]
+                logger.info(f"Resuming {rel_type} linking after {source_key}={last_key!r}")
+
+        pattern = "(t)-[r:%s]->(s)" if reverse else "(s)-[r:%s]->(t)"
+        set_clause = ""
+        if rel_properties:
+            assignments = ", ".join(f"r.{rel_prop} = s.{src_prop}" for rel_prop, src_prop in rel_properties.items())
+            set_clause = f"SET {assignments}"
+
+        # The first page has no lower bound; later pages use a plain range
+        # predicate so the planner can seek the source_key index (an
+        # "$last_key IS NULL OR ..." disjunction forces a full scan and sort per page)
+        def page_query(key_filter: str) -> str:
+            return f"""
+            MATCH (s:{source_label})
+            WHERE {key_filter}
+            WITH s ORDER BY s.{source_key} LIMIT $batch_size
+            WITH collect(s) AS page
+            CALL {{
+                WITH page
+                UNWIND page AS s
+                WITH s WHERE s.{source_prop} IS NOT NULL
+                MATCH (t:{target_label}) WHERE t.{target_prop} = s.{source_prop}
+                MERGE {pattern % rel_type}
+                {set_clause}
+                RETURN count(r) AS linked
+            }}
+            RETURN size(page) AS scanned, page[-1].{source_key} AS last_key, linked
+            """
+
+        first_query = page_query(f"s.{source_key} IS NOT NULL")
+        next_query = page_query(f"s.{source_key} > $last_key")
+
+        total_scanned = 0
+        total_linked = 0
+        total_created = 0
+        with self.driver.session() as session:
+            while True:
+                began = time.monotonic()
+                query = first_query if last_key is None else next_query
+                result = session.run(query, last_key=last_key, batch_size=batch_size)
+                record = result.single()
+                counters = result.consume().counters
+                scanned = record["scanned"] if record else 0
+                linked = record["linked"] if record else 0
+                # Rows written are the relationships MERGEd (new or existing);
+                # how many were new comes from the counters alone
+                record_write(linked, counters, time.monotonic() - began)
+                if scanned == 0:
+                    break
+
+                total_scanned += scanned
+                total_linked += linked
+                total_created += counters.relationships_created
+                last_key = record["last_key"]
+                session.run(
+                    "MERGE (p:LinkProgress {name: $name}) SET p.last_key = $last_key, p.updated_at = datetime()",
+                    name=progress_name,
+                    last_key=last_key,
+                ).consume()
+                logger.debug(
+                    f"{rel_type}: scanned {total_scanned:,} {source_label} nodes, "
+                    f"{total_linked:,} linked, {total_created:,} relationships created"
+                )
+                if scanned < batch_size:
+                    break
+
+            session.run("MATCH (p:LinkProgress {name: $name}) DELETE p", name=progress_name).consume()
+
+        logger.info(
+            f"Scanned {total_scanned:,} {source_label} nodes: {total_linked:,} {rel_type} relationships "
+            f"merged, {total_created:,} created"
+        )
+        return total_created
+
     # ============================================
     # Query Utilities
     # ============================================
 
-    def run_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def run_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        rows: int = 0,
+    ) -> List[Dict[str, Any]]:
         """
         Execute a Cypher query and return results as a list.
 
         Args:
             query: Cypher query string
             parameters: Query parameters (optional)
+            rows: Source rows a write covers, for the run report (e.g. ``len(batch)``
+                for an UNWIND batch). Set-based writes leave it at 0 and are
+                measured by their Neo4j counters.
 
         Returns:
             List of records as dictionaries
@@ -321,8 +708,13 @@ class Neo4jClient:
             >>> count = result[0]["count"]
         """
         with self.driver.session() as session:
+            began = time.monotonic()
             result = session.run(query, parameters or {})
-            return [dict(record) for record in result]
+            records = [dict(record) for record in result]
+            counters = result.consume().counters
+            if counters.contains_updates:
+                record_write(rows, counters, time.monotonic() - began)
+            return records
 
     def count_nodes(self, label: str) -> int:
         """Count nodes with given label."""
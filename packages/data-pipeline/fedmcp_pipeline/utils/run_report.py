@@ -0,0 +1,491 @@
+"""Structured run reports: per-stage throughput, memory and Neo4j counters.
+
+``ProgressTracker`` and the log lines show a run while it happens; a
+``RunReport`` keeps a durable record of it. Every stage run inside
+``report.stage(name)`` (``StageRunner`` does this for each of its stages)
+collects:
+
+- wall time
+- rows extracted (counted by ``PostgresClient`` and by ``record_extracted``
+  at the HTTP fetch points) and rows written to Neo4j, with rates per second
+- peak RSS while the stage was running
+- Neo4j ``summary.counters`` summed over its write transactions
+- retries (Neo4j batches retried after overload or transient errors)
+
+The stage is carried in a context variable, so the Neo4j and PostgreSQL
+clients attribute their work to it without any changes to the ingest
+functions. Work done on threads a stage starts itself is counted under
+``(unattributed)``.
+
+At the end of the run the report is written as JSON to
+``~/.cache/fedmcp/pipeline/reports/<name>/`` and compared with the previous
+report of the same name; regressions beyond the threshold are logged and
+listed in the report. ``canadagpt-ingest --compare-reports [BASE] HEAD``
+compares two reports by hand and exits 1 on regressions.
+"""
+
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .progress import logger
+
+# summary.counters fields kept per stage
+NEO4J_COUNTERS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "labels_added",
+    "labels_removed",
+    "indexes_added",
+    "constraints_added",
+)
+
+RSS_SAMPLE_SECONDS = 0.5
+
+# Reports kept per run name (oldest are deleted)
+REPORTS_KEPT = 90
+
+# Stages shorter than this are too noisy to flag as regressions
+MIN_COMPARED_SECONDS = 5.0
+
+# (metric, True if a higher value is worse)
+COMPARED_METRICS = (
+    ("seconds", True),
+    ("extracted_per_second", False),
+    ("written_per_second", False),
+    ("peak_rss_mib", True),
+)
+
+UNATTRIBUTED = "(unattributed)"
+
+
+@dataclass
+class StageMetrics:
+    """Counters for one stage of a run."""
+
+    name: str
+    status: str = "pending"  # running | completed | failed | skipped | blocked
+    started_at: Optional[str] = None
+    seconds: float = 0.0
+    rows_extracted: int = 0
+    rows_written: int = 0
+    transactions: int = 0
+    neo4j_seconds: float = 0.0
+    retries: int = 0
+    peak_rss_mib: float = 0.0
+    neo4j_counters: Counter = field(default_factory=Counter)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "started_at": self.started_at,
+            "seconds": round(self.seconds, 3),
+            "rows_extracted": self.rows_extracted,
+            "rows_written": self.rows_written,
+            "extracted_per_second": _rate(self.rows_extracted, self.seconds),
+            "written_per_second": _rate(self.rows_written, self.seconds),
+            "transactions": self.transactions,
+            "neo4j_seconds": round(self.neo4j_seconds, 3),
+            "retries": self.retries,
+            "peak_rss_mib": round(self.peak_rss_mib, 1),
+            "neo4j_counters": {name: self.neo4j_counters[name] for name in NEO4J_COUNTERS if self.neo4j_counters[name]},
+            "error": self.error,
+        }
+
+
+_current_stage: ContextVar[Optional[StageMetrics]] = ContextVar("pipeline_stage", default=None)
+_active_report: Optional["RunReport"] = None
+_lock = threading.Lock()
+
+
+def _rate(rows: int, seconds: float) -> Optional[float]:
+    return round(rows / seconds, 1) if seconds > 0 and rows else None
+
+
+def _rss_mib() -> float:
+    """Current resident set size (falls back to the process peak off Linux)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and KiB elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _target() -> Optional[StageMetrics]:
+    stage = _current_stage.get()
+    if stage is None and _active_report is not None:
+        stage = _active_report._stage_entry(UNATTRIBUTED)
+    return stage
+
+
+def record_extracted(rows: int) -> None:
+    """Count rows read from a source (PostgreSQL, an API, a file) in the current stage."""
+    stage = _target()
+    if stage is not None and rows:
+        with _lock:
+            stage.rows_extracted += rows
+
+
+def record_write(rows: int, counters: Any = None, seconds: float = 0.0) -> None:
+    """
+    Count one Neo4j write transaction in the current stage.
+
+    Args:
+        rows: Rows sent in the transaction
+        counters: ``ResultSummary.counters`` of the transaction (optional)
+        seconds: Time the transaction took
+    """
+    stage = _target()
+    if stage is None:
+        return
+    with _lock:
+        stage.rows_written += rows
+        stage.transactions += 1
+        stage.neo4j_seconds += seconds
+        if counters is not None:
+            for name in NEO4J_COUNTERS:
+                stage.neo4j_counters[name] += getattr(counters, name, 0)
+
+
+def record_retry(count: int = 1) -> None:
+    """Count a retried batch or request in the current stage."""
+    stage = _target()
+    if stage is not None:
+        with _lock:
+            stage.retries += count
+
+
+@contextmanager
+def stage_scope(name: str) -> Iterator[Optional[StageMetrics]]:
+    """``report.stage(name)`` on the active report; does nothing when no report is open."""
+    if _active_report is None:
+        yield None
+        return
+    with _active_report.stage(name) as stage:
+        yield stage
+
+
+def mark_stage(name: str, status: str) -> None:
+    """``report.mark(name, status)`` on the active report, if any."""
+    if _active_report is not None:
+        _active_report.mark(name, status)
+
+
+class RunReport:
+    """
+    Per-stage metrics for one pipeline run, written as JSON when the run ends.
+
+    Example:
+        >>> with RunReport("incremental") as report:
+        ...     with report.stage("hansard"):
+        ...         ingest_hansard_incremental(client, postgres_client)
+        >>> report.regressions
+        []
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: float = 0.25,
+        state_dir: Optional[Path] = None,
+        settings: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            name: Run type (e.g. "full", "incremental"); reports are compared within a name
+            threshold: Relative change treated as a regression when comparing with the previous run
+            state_dir: Base directory for reports (default: the pipeline state directory)
+            settings: Run configuration recorded in the report (batch size, concurrency, ...)
+        """
+        from .checkpoints import STATE_DIR
+
+        self.name = name
+        self.threshold = threshold
+        self.directory = (state_dir or STATE_DIR) / "reports" / name
+        self.settings = settings or {}
+        self.stages: Dict[str, StageMetrics] = {}
+        self.graph: Dict[str, Any] = {}
+        self.regressions: List[Dict[str, Any]] = []
+        self.path: Optional[Path] = None
+        self.status = "running"
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._seconds = 0.0
+        self._running: Dict[str, StageMetrics] = {}
+        self._peak_rss_mib = 0.0
+        self._http_before = _http_totals()
+        self._http: Dict[str, Dict[str, float]] = {}
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample_rss, name="rss-sampler", daemon=True)
+
+    def __enter__(self) -> "RunReport":
+        global _active_report
+        if _active_report is not None:
+            raise RuntimeError(f"Run report {_active_report.name} is already open")
+        _active_report = self
+        self._sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        global _active_report
+        self._stop.set()
+        self._sampler.join()
+        _active_report = None
+        self._seconds = time.perf_counter() - self._start
+        self._http = _http_delta(self._http_before, _http_totals())
+        self.status = "failed" if exc_type else "completed"
+        try:
+            self.finish()
+        except Exception as e:
+            # The report must never turn a successful run into a failed one
+            logger.warning(f"Could not write run report: {e}")
+        return False
+
+    def _stage_entry(self, name: str) -> StageMetrics:
+        with _lock:
+            if name not in self.stages:
+                self.stages[name] = StageMetrics(name)
+            return self.stages[name]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """Attribute everything recorded inside the block (on this thread) to stage ``name``."""
+        stage = self._stage_entry(name)
+        stage.status = "running"
+        stage.started_at = datetime.now().isoformat(timespec="seconds")
+        stage.peak_rss_mib = _rss_mib()
+        with _lock:
+            self._running[name] = stage
+        token = _current_stage.set(stage)
+        began = time.perf_counter()
+        try:
+            yield stage
+        except BaseException as e:
+            stage.status = "failed"
+            stage.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            stage.seconds += time.perf_counter() - began
+            if stage.status == "running":
+                stage.status = "completed"
+            _current_stage.reset(token)
+            with _lock:
+                self._running.pop(name, None)
+                stage.peak_rss_mib = max(stage.peak_rss_mib, _rss_mib())
+
+    def mark(self, name: str, status: str) -> None:
+        """Record a stage that did not run (skipped or blocked)."""
+        stage = self._stage_entry(name)
+        if stage.status == "pending":
+            stage.status = status
+
+    def _sample_rss(self) -> None:
+        while not self._stop.wait(RSS_SAMPLE_SECONDS):
+            rss = _rss_mib()
+            with _lock:
+                self._peak_rss_mib = max(self._peak_rss_mib, rss)
+                for stage in self._running.values():
+                    stage.peak_rss_mib = max(stage.peak_rss_mib, rss)
+
+    def to_dict(self) -> Dict[str, Any]:
+        stages = {name: stage.to_dict() for name, stage in self.stages.items()}
+        extracted = sum(stage.rows_extracted for stage in self.stages.values())
+        written = sum(stage.rows_written for stage in self.stages.values())
+        counters: Counter = Counter()
+        for stage in self.stages.values():
+            counters.update(stage.neo4j_counters)
+        return {
+            "name": self.name,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "seconds": round(self._seconds, 3),
+            "settings": self.settings,
+            "totals": {
+                "rows_extracted": extracted,
+                "rows_written": written,
+                "retries": sum(stage.retries for stage in self.stages.values()),
+                "peak_rss_mib": round(max(self._peak_rss_mib, _rss_mib()), 1),
+                "neo4j_counters": {name: counters[name] for name in NEO4J_COUNTERS if counters[name]},
+            },
+            "stages": stages,
+            "http": self._http,
+            "graph": self.graph,
+            "previous": None,
+            "regressions": self.regressions,
+        }
+
+    def finish(self) -> Path:
+        """Write the report, compare it with the previous run and log both."""
+        report = self.to_dict()
+        previous_path = latest_report(self.directory)
+        rows = []
+        if previous_path:
+            rows = diff_reports(load_report(previous_path), report)
+            report["previous"] = previous_path.name
+            self.regressions[:] = find_regressions(rows, self.threshold)
+            report["regressions"] = self.regressions
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f"{self.started_at:%Y%m%dT%H%M%S}.json"
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        os.replace(tmp, self.path)
+        for old in sorted(self.directory.glob("*.json"))[:-REPORTS_KEPT]:
+            old.unlink()
+
+        log_report(report)
+        if previous_path:
+            logger.info(f"Compared with {previous_path.name}:")
+            log_diff(rows, self.threshold)
+        logger.info(f"Run report written to {self.path}")
+        return self.path
+
+
+def _http_totals() -> Dict[str, Dict[str, float]]:
+    """Upstream requests/retries per host so far, from the fedmcp clients' metrics."""
+    try:
+        from fedmcp.metrics import metrics
+    except ImportError:
+        return {}
+    return {
+        host: {
+            "requests": upstream["latency_seconds"]["count"],
+            "retries": upstream["retries"],
+            "rate_limit_wait_seconds": upstream["rate_limit_wait_seconds"],
+        }
+        for host, upstream in metrics.snapshot()["upstream"].items()
+    }
+
+
+def _http_delta(before: Dict[str, Dict[str, float]], after: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    delta = {}
+    for host, counts in after.items():
+        changed = {key: round(value - before.get(host, {}).get(key, 0), 3) for key, value in counts.items()}
+        if any(changed.values()):
+            delta[host] = changed
+    return delta
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def latest_report(directory: Path) -> Optional[Path]:
+    """Most recent report in ``directory`` (None if there is none)."""
+    reports = sorted(directory.glob("*.json"))
+    return reports[-1] if reports else None
+
+
+def diff_reports(previous: Dict[str, Any], current: Dict[str, Any]) -> List[Tuple[str, str, float, float, float]]:
+    """
+    Relative change of each compared metric for stages that completed in both runs.
+
+    Stages shorter than MIN_COMPARED_SECONDS in both runs are left out.
+
+    Returns:
+        Rows of (stage, metric, previous value, current value, relative change)
+    """
+    rows = []
+    for name, stage in current["stages"].items():
+        before = previous["stages"].get(name)
+        if not before or before["status"] != "completed" or stage["status"] != "completed":
+            continue
+        if max(before["seconds"], stage["seconds"]) < MIN_COMPARED_SECONDS:
+            continue
+        for metric, _ in COMPARED_METRICS:
+            old, new = before.get(metric), stage.get(metric)
+            if not old or new is None:
+                continue
+            rows.append((name, metric, old, new, (new - old) / old))
+    return rows
+
+
+def find_regressions(rows: List[Tuple[str, str, float, float, float]], threshold: float) -> List[Dict[str, Any]]:
+    """Diff rows that got worse by more than ``threshold``."""
+    higher_is_worse = dict(COMPARED_METRICS)
+    regressions = []
+    for name, metric, old, new, change in rows:
+        worse = change > threshold if higher_is_worse[metric] else change < -threshold
+        if worse:
+            regressions.append({"stage": name, "metric": metric, "previous": old, "current": new, "change": round(change, 3)})
+    return regressions
+
+
+def log_report(report: Dict[str, Any]) -> None:
+    """Log a per-stage table of a report."""
+    logger.info("=" * 100)
+    logger.info(f"RUN REPORT: {report['name']} ({report['status']}, {report['seconds']:.1f}s)")
+    logger.info(
+        f"{'Stage':<28} {'Status':<10} {'Time':>8} {'Extracted/s':>12} {'Written/s':>10} "
+        f"{'Peak RSS':>9} {'Retries':>7}  Neo4j"
+    )
+    for name, stage in sorted(report["stages"].items(), key=lambda item: item[1]["started_at"] or "~"):
+        counters = ", ".join(f"{key}={value:,}" for key, value in stage["neo4j_counters"].items())
+        logger.info(
+            f"{name:<28} {stage['status']:<10} {stage['seconds']:7.1f}s "
+            f"{stage['extracted_per_second'] or 0:12,.0f} {stage['written_per_second'] or 0:10,.0f} "
+            f"{stage['peak_rss_mib']:6.0f}MiB {stage['retries']:7,}  {counters}"
+        )
+    for host, counts in report["http"].items():
+        logger.info(f"HTTP {host}: {counts.get('requests', 0):,.0f} requests, {counts.get('retries', 0):,.0f} retries")
+    logger.info("=" * 100)
+
+
+def log_diff(rows: List[Tuple[str, str, float, float, float]], threshold: float) -> None:
+    """Log a comparison with the previous run, warning on regressions."""
+    regressions = {(r["stage"], r["metric"]) for r in find_regressions(rows, threshold)}
+    for name, metric, old, new, change in rows:
+        line = f"  {name:<28} {metric:<22} {old:>12,.1f} -> {new:>12,.1f}  {change:+7.1%}"
+        if (name, metric) in regressions:
+            logger.warning(f"{line}  ✗ regression")
+        else:
+            logger.info(line)
+    if regressions:
+        logger.warning(f"{len(regressions)} metric(s) regressed by more than {threshold:.0%} since the previous run")
+    else:
+        logger.info(f"No regressions beyond {threshold:.0%} since the previous run")
+
+
+def compare_reports(paths: List[Path], threshold: float = 0.25) -> int:
+    """
+    Log the comparison of two reports.
+
+    Args:
+        paths: [HEAD] or [BASE, HEAD]; BASE defaults to the report before HEAD in its directory
+        threshold: Relative change treated as a regression
+
+    Returns:
+        Number of regressed metrics
+    """
+    head_path = paths[-1]
+    if len(paths) > 1:
+        base_path = paths[0]
+    else:
+        earlier = [path for path in sorted(head_path.parent.glob("*.json")) if path.name < head_path.name]
+        if not earlier:
+            raise ValueError(f"No earlier report next to {head_path}")
+        base_path = earlier[-1]
+
+    logger.info(f"Comparing {base_path.name} -> {head_path.name}")
+    rows = diff_reports(load_report(base_path), load_report(head_path))
+    log_diff(rows, threshold)
+    return len(find_regressions(rows, threshold))
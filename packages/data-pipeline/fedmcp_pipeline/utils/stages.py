@@ -0,0 +1,288 @@
+"""Dependency-aware stage scheduler for pipeline runs.
+
+Stages declare what they depend on and which shared resources they use
+("http" for external sources, "neo4j" for graph writes). ``StageRunner``
+starts every stage whose dependencies have finished as soon as a slot for
+each of its resources is free, so independent work (e.g. lobbying and
+finances) overlaps and a full refresh takes roughly as long as its critical
+path instead of the sum of all stages.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .neo4j_client import Neo4jClient
+from .progress import logger
+from .run_report import mark_stage, stage_scope
+
+
+@dataclass
+class Stage:
+    """
+    One unit of pipeline work.
+
+    Attributes:
+        name: Unique stage name
+        run: Callable executed with no arguments; its return value is kept as the stage result
+        depends_on: Names of stages that must finish first
+        resources: Resource tags the stage holds while running (e.g. "http", "neo4j")
+        max_age: Skip the stage if it last completed within this window and
+            none of its dependencies ran in this pipeline run (None = always run)
+    """
+
+    name: str
+    run: Callable[[], Any]
+    depends_on: Sequence[str] = ()
+    resources: Sequence[str] = ("neo4j",)
+    max_age: Optional[timedelta] = None
+
+
+@dataclass
+class StageResult:
+    """Outcome of one stage in a pipeline run."""
+
+    name: str
+    status: str = "pending"  # completed | skipped | failed | blocked
+    start: float = 0.0
+    end: float = 0.0
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def duration(self) -> float:
+        return max(self.end - self.start, 0.0)
+
+
+@dataclass
+class PipelineRun:
+    """Per-stage results plus the run's wall-clock span."""
+
+    results: Dict[str, StageResult] = field(default_factory=dict)
+    start: float = 0.0
+    end: float = 0.0
+
+    @property
+    def failed(self) -> List[str]:
+        return [name for name, r in self.results.items() if r.status in ("failed", "blocked")]
+
+    def critical_path(self, stages: Dict[str, Stage]) -> Tuple[List[str], float]:
+        """Longest chain of dependent stage durations: the floor on wall-clock time."""
+        finish: Dict[str, Tuple[float, List[str]]] = {}
+
+        def longest(name: str) -> Tuple[float, List[str]]:
+            if name not in finish:
+                best: Tuple[float, List[str]] = (0.0, [])
+                for dep in stages[name].depends_on:
+                    candidate = longest(dep)
+                    if candidate[0] > best[0]:
+                        best = candidate
+                finish[name] = (best[0] + self.results[name].duration, best[1] + [name])
+            return finish[name]
+
+        total, path = max((longest(name) for name in stages), key=lambda item: item[0], default=(0.0, []))
+        return path, total
+
+    def log_report(self, stages: Dict[str, Stage]) -> None:
+        """Log a per-stage timing table and the critical path."""
+        wall = self.end - self.start
+        serial = sum(r.duration for r in self.results.values())
+        path, path_time = self.critical_path(stages)
+
+        logger.info("=" * 60)
+        logger.info("PIPELINE STAGE TIMINGS")
+        logger.info(f"{'Stage':<28} {'Status':<10} {'Start':>8} {'Duration':>9}")
+        for r in sorted(self.results.values(), key=lambda r: (r.start or float("inf"), r.name)):
+            offset = f"{r.start - self.start:7.1f}s" if r.start else "-"
+            logger.info(f"{r.name:<28} {r.status:<10} {offset:>8} {r.duration:8.1f}s")
+        logger.info(f"Wall clock: {wall:.1f}s (stages back-to-back: {serial:.1f}s)")
+        logger.info(f"Critical path ({path_time:.1f}s): {' → '.join(path)}")
+        logger.info("=" * 60)
+
+
+class StageStateStore:
+    """Completion times per stage, stored on ``(:PipelineStage {name})`` nodes."""
+
+    def __init__(self, neo4j_client: Neo4jClient):
+        self.neo4j = neo4j_client
+
+    def age(self, name: str) -> Optional[timedelta]:
+        """Time since ``name`` last completed (None if it never has)."""
+        result = self.neo4j.run_query(
+            """
+            MATCH (s:PipelineStage {name: $name})
+            RETURN duration.inSeconds(s.completed_at, datetime()).seconds AS age
+            """,
+            {"name": name},
+        )
+        if not result or result[0]["age"] is None:
+            return None
+        return timedelta(seconds=result[0]["age"])
+
+    def mark_completed(self, name: str, duration: float) -> None:
+        self.neo4j.run_query(
+            """
+            MERGE (s:PipelineStage {name: $name})
+            SET s.completed_at = datetime(), s.duration_seconds = $duration
+            """,
+            {"name": name, "duration": duration},
+        )
+
+
+class StageRunner:
+    """
+    Run a set of stages concurrently, respecting dependencies and resource limits.
+
+    Example:
+        >>> runner = StageRunner(
+        ...     [Stage("mps", ingest_mps_fn, resources=("http", "neo4j")),
+        ...      Stage("parties", ingest_parties_fn, depends_on=["mps"])],
+        ...     limits={"http": 4, "neo4j": 2},
+        ... )
+        >>> run = runner.run()
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        limits: Optional[Dict[str, int]] = None,
+        state: Optional[StageStateStore] = None,
+        force: bool = False,
+    ):
+        """
+        Args:
+            stages: Stages to run
+            limits: Maximum concurrent stages per resource tag (tags not listed are unlimited)
+            state: Store used to skip stages that are still fresh (None = never skip)
+            force: Run every stage regardless of ``max_age``
+        """
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            self.stages[stage.name] = stage
+        for stage in stages:
+            missing = [dep for dep in stage.depends_on if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown stage(s): {', '.join(missing)}")
+        self._check_acyclic()
+
+        self.limits = dict(limits or {})
+        if any(limit < 1 for limit in self.limits.values()):
+            raise ValueError(f"Resource limits must be at least 1: {self.limits}")
+        self.state = state
+        self.force = force
+
+    def _check_acyclic(self) -> None:
+        visiting, done = set(), set()
+
+        def visit(name: str, chain: List[str]) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Stage dependency cycle: {' → '.join(chain + [name])}")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep, chain + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name, [])
+
+    def _is_fresh(self, stage: Stage, run: PipelineRun) -> bool:
+        if self.force or self.state is None or stage.max_age is None:
+            return False
+        if any(run.results[dep].status == "completed" for dep in stage.depends_on):
+            return False
+        age = self.state.age(stage.name)
+        return age is not None and age < stage.max_age
+
+    def _has_capacity(self, stage: Stage, in_use: Dict[str, int]) -> bool:
+        return all(
+            in_use.get(tag, 0) < self.limits[tag]
+            for tag in stage.resources
+            if tag in self.limits
+        )
+
+    def _execute(self, stage: Stage, result: StageResult) -> StageResult:
+        result.start = time.time()
+        logger.info(f"▶️  Stage {stage.name} started")
+        with stage_scope(stage.name) as stage_metrics:
+            try:
+                result.result = stage.run()
+                result.status = "completed"
+            except Exception as e:
+                result.status = "failed"
+                result.error = e
+                if stage_metrics:
+                    stage_metrics.status = "failed"
+                    stage_metrics.error = f"{type(e).__name__}: {e}"
+        result.end = time.time()
+        return result
+
+    def run(self) -> PipelineRun:
+        """
+        Execute all stages.
+
+        A failing stage does not stop unrelated stages; its dependents are marked
+        "blocked". Check ``PipelineRun.failed`` for the outcome.
+
+        Returns:
+            PipelineRun with per-stage results
+        """
+        run = PipelineRun(results={name: StageResult(name) for name in self.stages}, start=time.time())
+        pending = dict(self.stages)
+        in_use: Dict[str, int] = {}
+        running: Dict[Future, Stage] = {}
+        checked = set()  # stages whose freshness has been looked up
+        workers = max(1, min(len(self.stages), sum(self.limits.values()) or len(self.stages)))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stage") as executor:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    statuses = [run.results[dep].status for dep in stage.depends_on]
+                    if any(s in ("failed", "blocked") for s in statuses):
+                        run.results[name].status = "blocked"
+                        logger.warning(f"⏭️  Stage {name} blocked by a failed dependency")
+                        del pending[name]
+                    elif all(s in ("completed", "skipped") for s in statuses):
+                        if name not in checked:
+                            checked.add(name)
+                            if self._is_fresh(stage, run):
+                                run.results[name].status = "skipped"
+                                logger.info(f"⏭️  Stage {name} up to date, skipping")
+                                del pending[name]
+                                continue
+                        if self._has_capacity(stage, in_use):
+                            for tag in stage.resources:
+                                in_use[tag] = in_use.get(tag, 0) + 1
+                            running[executor.submit(self._execute, stage, run.results[name])] = stage
+                            del pending[name]
+
+                if not running:
+                    # Everything left was just skipped or blocked; loop again to cascade
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    for tag in stage.resources:
+                        in_use[tag] -= 1
+                    result = future.result()
+                    if result.status == "completed":
+                        logger.success(f"✅ Stage {stage.name} finished in {result.duration:.1f}s")
+                        if self.state is not None:
+                            self.state.mark_completed(stage.name, result.duration)
+                    else:
+                        logger.opt(exception=result.error).error(
+                            f"❌ Stage {stage.name} failed after {result.duration:.1f}s: {result.error}"
+                        )
+
+        run.end = time.time()
+        for name, result in run.results.items():
+            if result.status in ("skipped", "blocked"):
+                mark_stage(name, result.status)
+        return run
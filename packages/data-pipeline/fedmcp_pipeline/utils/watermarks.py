@@ -0,0 +1,80 @@
+"""Ingestion watermarks: last-ingested position per PostgreSQL source table.
+
+Watermarks are stored in Neo4j on ``(:IngestWatermark {source})`` nodes rather
+than in a local file, so they live and die with the graph they describe: a
+wiped or bulk-rebuilt database starts from scratch instead of silently skipping
+history, and scheduled jobs running in throwaway containers share one state.
+"""
+
+from typing import Any, Dict, List
+
+from .neo4j_client import Neo4jClient
+from .progress import logger
+
+
+class WatermarkRegistry:
+    """
+    Read and advance per-source ingestion watermarks.
+
+    A watermark is a small set of properties (e.g. ``{"id": 4123456}`` or
+    ``{"id": 9001, "election_id": 45}``) recording how far a source table has
+    been ingested. Incremental ingest functions extract only rows beyond it.
+
+    Example:
+        >>> watermarks = WatermarkRegistry(neo4j_client)
+        >>> last_id = watermarks.get("hansards_statement").get("id", 0)
+        >>> watermarks.advance("hansards_statement", id=4200000)
+    """
+
+    def __init__(self, neo4j_client: Neo4jClient):
+        self.neo4j = neo4j_client
+
+    def get(self, source: str) -> Dict[str, Any]:
+        """Current watermark for ``source`` ({} if never ingested)."""
+        result = self.neo4j.run_query(
+            "MATCH (w:IngestWatermark {source: $source}) RETURN properties(w) AS w",
+            {"source": source},
+        )
+        if not result:
+            return {}
+        values = dict(result[0]["w"])
+        values.pop("source", None)
+        values.pop("updated_at", None)
+        return values
+
+    def advance(self, source: str, **values: Any) -> None:
+        """
+        Move the watermark forward.
+
+        Each value only ever increases: a lower value than the stored one (e.g.
+        from a re-run over an older slice) leaves that property unchanged.
+        """
+        values = {k: v for k, v in values.items() if v is not None}
+        if not values:
+            return
+        assignments = ", ".join(
+            f"w.{key} = CASE WHEN w.{key} IS NULL OR w.{key} < $values.{key} THEN $values.{key} ELSE w.{key} END"
+            for key in values
+        )
+        self.neo4j.run_query(
+            f"""
+            MERGE (w:IngestWatermark {{source: $source}})
+            SET {assignments}, w.updated_at = datetime()
+            """,
+            {"source": source, "values": values},
+        )
+        logger.debug(f"Watermark {source}: {values}")
+
+    def reset(self, source: str) -> None:
+        """Forget the watermark so the next incremental run re-reads the whole table."""
+        self.neo4j.run_query(
+            "MATCH (w:IngestWatermark {source: $source}) DELETE w",
+            {"source": source},
+        )
+
+    def all(self) -> List[Dict[str, Any]]:
+        """All watermarks, for status reporting."""
+        result = self.neo4j.run_query(
+            "MATCH (w:IngestWatermark) RETURN properties(w) AS w ORDER BY w.source"
+        )
+        return [dict(record["w"]) for record in result]
@@ -8,6 +8,9 @@ Updates only critical data that changes frequently:
 - New bills introduced
 - Recent votes (last 24 hours)
 
+Bills and votes are read newest first and paging stops at the cutoff; each
+check diffs against Neo4j in memory and writes only the changes.
+
 Designed to be fast (<1 minute) and low-memory (<200MB).
 """
 
@@ -15,7 +18,7 @@ import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 # Add packages to path
 SCRIPT_DIR = Path(__file__).parent
@@ -25,6 +28,7 @@ sys.path.insert(0, str(PIPELINE_DIR))
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 from fedmcp_pipeline.utils.config import Config
 from fedmcp_pipeline.utils.progress import logger
+from fedmcp_pipeline.utils.run_report import RunReport, record_extracted, stage_scope
 
 # Add fedmcp clients
 FEDMCP_PATH = PIPELINE_DIR.parent / "fedmcp" / "src"
@@ -33,12 +37,51 @@ sys.path.insert(0, str(FEDMCP_PATH))
 from fedmcp.clients.openparliament import OpenParliamentClient
 
 
+# Listing page size for the OpenParliament API (fewer round trips than the default 20)
+PAGE_SIZE = 100
+
+
+def _mp_slug(mp_data: Dict[str, Any]) -> Optional[str]:
+    """MP id (OpenParliament slug) from a politician listing entry."""
+    parts = mp_data.get("url", "").rstrip("/").split("/")
+    return parts[-1] or None
+
+
+def _party_name(mp_data: Dict[str, Any]) -> Optional[str]:
+    # OpenParliament API returns short_name as either a string or dict {'en': 'Party Name'}
+    party_data = (mp_data.get("current_party") or {}).get("short_name")
+    return party_data.get("en") if isinstance(party_data, dict) else party_data
+
+
+def _take_recent(listing: Iterable[Dict[str, Any]], date_key: str, cutoff: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield listing entries until the first one older than ``cutoff``.
+
+    OpenParliament lists bills and votes newest first, so once an entry falls
+    before the cutoff no later page can contain a newer one and the remaining
+    pages are never requested.
+    """
+    for item in listing:
+        date = item.get(date_key)
+        if not date:
+            continue
+        if date < cutoff:
+            return
+        yield item
+
+
 class LightweightUpdater:
-    """Fast hourly updates for critical parliamentary data."""
+    """Fast hourly updates for critical parliamentary data.
+
+    Each check fetches what changed from OpenParliament, reads the matching
+    keys from Neo4j in a single query, diffs in memory and applies the
+    changes as one UNWIND batch.
+    """
 
     def __init__(self, neo4j_client: Neo4jClient):
         self.neo4j = neo4j_client
         self.op_client = OpenParliamentClient()
+        self._mps: Optional[List[Dict[str, Any]]] = None
         self.stats = {
             "mps_updated": 0,
             "party_changes": [],
@@ -47,6 +90,14 @@ class LightweightUpdater:
             "new_votes": 0,
         }
 
+    def current_mps(self) -> List[Dict[str, Any]]:
+        """Current MPs from OpenParliament, fetched once per run."""
+        if self._mps is None:
+            self._mps = list(self.op_client.list_mps(limit=PAGE_SIZE))
+            logger.info(f"Fetched {len(self._mps)} current MPs from OpenParliament")
+            record_extracted(len(self._mps))
+        return self._mps
+
     def update_mp_parties(self) -> int:
         """
         Update MP party affiliations.
@@ -55,32 +106,24 @@ class LightweightUpdater:
         """
         logger.info("Checking for MP party changes...")
 
-        updated_count = 0
-
-        # Fetch all current MPs from OpenParliament
-        mps_list = list(self.op_client.list_mps())
-        logger.info(f"Fetched {len(mps_list)} current MPs from OpenParliament")
-
-        # Get current party affiliations from Neo4j for comparison
-        current_parties_query = """
-        MATCH (m:MP)
-        RETURN m.id as id, m.name as name, m.party as party
-        """
-        current_parties = {row["id"]: row for row in self.neo4j.run_query(current_parties_query)}
+        current_parties = {
+            row["id"]: row
+            for row in self.neo4j.run_query("MATCH (m:MP) RETURN m.id AS id, m.name AS name, m.party AS party")
+        }
 
-        for mp_data in mps_list:
-            mp_id = mp_data.get("url", "").split("/")[-2]
+        changed = []
+        for mp_data in self.current_mps():
+            mp_id = _mp_slug(mp_data)
             mp_name = mp_data.get("name")
-            # OpenParliament API returns short_name as either a string or dict {'en': 'Party Name'}
-            party_data = mp_data.get("current_party", {}).get("short_name")
-            new_party = party_data.get("en") if isinstance(party_data, dict) else party_data
+            new_party = _party_name(mp_data)
 
-            if not mp_id or not new_party:
+            if not mp_id or not new_party or mp_id not in current_parties:
                 continue
 
-            # Check if party changed
-            old_record = current_parties.get(mp_id, {})
+            old_record = current_parties[mp_id]
             old_party = old_record.get("party")
+            if old_party == new_party and old_record.get("name") == mp_name:
+                continue
 
             if old_party and old_party != new_party:
                 logger.warning(f"🔄 Party change detected: {mp_name} ({old_party} → {new_party})")
@@ -90,24 +133,19 @@ class LightweightUpdater:
                     "new_party": new_party,
                     "timestamp": datetime.utcnow().isoformat()
                 })
+            changed.append({"id": mp_id, "party": new_party, "name": mp_name})
 
-            # Update MP record
-            update_query = """
-            MATCH (m:MP {id: $id})
-            SET m.party = $party,
-                m.name = $name,
-                m.updated_at = datetime()
-            RETURN m
+        updated_count = self.neo4j.batch_write(
             """
-
-            result = self.neo4j.run_query(update_query, {
-                "id": mp_id,
-                "party": new_party,
-                "name": mp_name
-            })
-
-            if result:
-                updated_count += 1
+            UNWIND $mps AS mp
+            MATCH (m:MP {id: mp.id})
+            SET m.party = mp.party,
+                m.name = mp.name,
+                m.updated_at = datetime()
+            """,
+            changed,
+            param="mps",
+        ) if changed else 0
 
         logger.success(f"✅ Updated {updated_count} MP records")
         return updated_count
@@ -120,87 +158,83 @@ class LightweightUpdater:
         """
         logger.info("Checking for cabinet changes...")
 
-        updated_count = 0
-
-        # Get current cabinet positions from Neo4j
-        current_cabinet_query = """
-        MATCH (m:MP)
-        WHERE m.cabinet_position IS NOT NULL
-        RETURN m.id as id, m.name as name, m.cabinet_position as position
-        """
-        current_cabinet = {row["id"]: row for row in self.neo4j.run_query(current_cabinet_query)}
-
-        # Fetch MPs with cabinet roles from OpenParliament
-        mps_list = list(self.op_client.list_mps())
+        current_cabinet = {
+            row["id"]: row["position"]
+            for row in self.neo4j.run_query("""
+                MATCH (m:MP)
+                WHERE m.cabinet_position IS NOT NULL
+                RETURN m.id AS id, m.cabinet_position AS position
+            """)
+        }
 
-        for mp_data in mps_list:
-            mp_id = mp_data.get("url", "").split("/")[-2]
+        appointed = []
+        removed = []
+        for mp_data in self.current_mps():
+            mp_id = _mp_slug(mp_data)
             mp_name = mp_data.get("name")
             current_role = mp_data.get("current_role")
 
             if not mp_id:
                 continue
 
-            # Extract cabinet position if exists
-            new_position = None
-            if current_role and "Minister" in current_role:
-                new_position = current_role
-
-            old_record = current_cabinet.get(mp_id, {})
-            old_position = old_record.get("position")
-
-            # Detect changes
-            if old_position != new_position:
-                if old_position and not new_position:
-                    logger.warning(f"📉 Cabinet exit: {mp_name} (was {old_position})")
-                    self.stats["cabinet_changes"].append({
-                        "mp_name": mp_name,
-                        "type": "exit",
-                        "old_position": old_position,
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-                elif not old_position and new_position:
-                    logger.warning(f"📈 New cabinet minister: {mp_name} → {new_position}")
-                    self.stats["cabinet_changes"].append({
-                        "mp_name": mp_name,
-                        "type": "appointment",
-                        "new_position": new_position,
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-                elif old_position and new_position:
-                    logger.warning(f"🔄 Cabinet shuffle: {mp_name} ({old_position} → {new_position})")
-                    self.stats["cabinet_changes"].append({
-                        "mp_name": mp_name,
-                        "type": "shuffle",
-                        "old_position": old_position,
-                        "new_position": new_position,
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-
-            # Update record
-            if new_position:
-                update_query = """
-                MATCH (m:MP {id: $id})
-                SET m.cabinet_position = $position,
+            new_position = current_role if current_role and "Minister" in current_role else None
+            old_position = current_cabinet.get(mp_id)
+
+            if old_position == new_position:
+                continue
+
+            if old_position and not new_position:
+                logger.warning(f"📉 Cabinet exit: {mp_name} (was {old_position})")
+                self.stats["cabinet_changes"].append({
+                    "mp_name": mp_name,
+                    "type": "exit",
+                    "old_position": old_position,
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+                removed.append({"id": mp_id})
+            elif not old_position and new_position:
+                logger.warning(f"📈 New cabinet minister: {mp_name} → {new_position}")
+                self.stats["cabinet_changes"].append({
+                    "mp_name": mp_name,
+                    "type": "appointment",
+                    "new_position": new_position,
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+                appointed.append({"id": mp_id, "position": new_position})
+            else:
+                logger.warning(f"🔄 Cabinet shuffle: {mp_name} ({old_position} → {new_position})")
+                self.stats["cabinet_changes"].append({
+                    "mp_name": mp_name,
+                    "type": "shuffle",
+                    "old_position": old_position,
+                    "new_position": new_position,
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+                appointed.append({"id": mp_id, "position": new_position})
+
+        updated_count = 0
+        if appointed:
+            updated_count += self.neo4j.batch_write(
+                """
+                UNWIND $mps AS mp
+                MATCH (m:MP {id: mp.id})
+                SET m.cabinet_position = mp.position,
                     m.updated_at = datetime()
-                RETURN m
+                """,
+                appointed,
+                param="mps",
+            )
+        if removed:
+            updated_count += self.neo4j.batch_write(
                 """
-            else:
-                # Remove cabinet position if no longer in cabinet
-                update_query = """
-                MATCH (m:MP {id: $id})
+                UNWIND $mps AS mp
+                MATCH (m:MP {id: mp.id})
                 REMOVE m.cabinet_position
                 SET m.updated_at = datetime()
-                RETURN m
-                """
-
-            result = self.neo4j.run_query(update_query, {
-                "id": mp_id,
-                "position": new_position
-            } if new_position else {"id": mp_id})
-
-            if result:
-                updated_count += 1
+                """,
+                removed,
+                param="mps",
+            )
 
         logger.success(f"✅ Updated {updated_count} cabinet positions")
         return updated_count
@@ -217,54 +251,52 @@ class LightweightUpdater:
         logger.info(f"Checking for bills introduced in last {since_hours} hours...")
 
         cutoff_date = (datetime.utcnow() - timedelta(hours=since_hours)).date().isoformat()
-        new_count = 0
-
-        # Get latest bills from OpenParliament
-        for bill in self.op_client.list_bills():
-            introduced_date = bill.get("introduced")
+        listing = self.op_client.list_bills(introduced__gte=cutoff_date, limit=PAGE_SIZE)
+        recent = list(_take_recent(listing, "introduced", cutoff_date))
+        record_extracted(len(recent))
+        if not recent:
+            logger.success("✅ Found 0 new bills")
+            return 0
+
+        keys = [{"number": bill.get("number"), "session": bill.get("session")} for bill in recent]
+        existing = {
+            (row["number"], row["session"])
+            for row in self.neo4j.run_query(
+                """
+                UNWIND $keys AS key
+                MATCH (b:Bill {number: key.number, session: key.session})
+                RETURN b.number AS number, b.session AS session
+                """,
+                {"keys": keys},
+            )
+        }
 
-            if not introduced_date or introduced_date < cutoff_date:
+        new_bills = []
+        for bill in recent:
+            if (bill.get("number"), bill.get("session")) in existing:
                 continue
-
-            # Check if bill already exists in Neo4j
-            bill_number = bill.get("number")
-            bill_session = bill.get("session")
-
-            check_query = """
-            MATCH (b:Bill {number: $number, session: $session})
-            RETURN b
+            # Same properties as ingest_bills, so the nightly run and this job agree
+            bill_props = {
+                "number": bill.get("number"),
+                "session": bill.get("session"),
+                "title": (bill.get("name") or {}).get("en"),
+                "introduced_date": bill.get("introduced"),
+                "sponsor_politician_url": bill.get("sponsor_politician_url"),
+                "status_code": bill.get("status_code"),
+            }
+            new_bills.append({k: v for k, v in bill_props.items() if v is not None})
+            logger.info(f"📜 New bill: {bill.get('number')} - {(bill.get('name') or {}).get('en', 'Unknown')}")
+
+        new_count = self.neo4j.batch_write(
             """
-
-            existing = self.neo4j.run_query(check_query, {
-                "number": bill_number,
-                "session": bill_session
-            })
-
-            if not existing:
-                # Create new bill node
-                create_query = """
-                MERGE (b:Bill {number: $number, session: $session})
-                SET b.name_en = $name_en,
-                    b.name_fr = $name_fr,
-                    b.introduced = $introduced,
-                    b.sponsor_politician_id = $sponsor_id,
-                    b.status_code = $status,
-                    b.updated_at = datetime()
-                RETURN b
-                """
-
-                self.neo4j.run_query(create_query, {
-                    "number": bill_number,
-                    "session": bill_session,
-                    "name_en": bill.get("name", {}).get("en"),
-                    "name_fr": bill.get("name", {}).get("fr"),
-                    "introduced": introduced_date,
-                    "sponsor_id": bill.get("sponsor_politician_url", "").split("/")[-2] if bill.get("sponsor_politician_url") else None,
-                    "status": bill.get("status_code")
-                })
-
-                new_count += 1
-                logger.info(f"📜 New bill: {bill_number} - {bill.get('name', {}).get('en', 'Unknown')}")
+            UNWIND $bills AS bill
+            MERGE (b:Bill {number: bill.number, session: bill.session})
+            SET b += bill,
+                b.updated_at = datetime()
+            """,
+            new_bills,
+            param="bills",
+        ) if new_bills else 0
 
         logger.success(f"✅ Found {new_count} new bills")
         return new_count
@@ -281,52 +313,54 @@ class LightweightUpdater:
         logger.info(f"Checking for votes in last {since_hours} hours...")
 
         cutoff_date = (datetime.utcnow() - timedelta(hours=since_hours)).date().isoformat()
-        new_count = 0
-
-        for vote in self.op_client.list_votes():
-            vote_date = vote.get("date")
+        listing = self.op_client.list_votes(date__gte=cutoff_date, limit=PAGE_SIZE)
+        recent = list(_take_recent(listing, "date", cutoff_date))
+        record_extracted(len(recent))
+        if not recent:
+            logger.success("✅ Found 0 new votes")
+            return 0
+
+        ids = [f"{vote.get('session')}-{vote.get('number')}" for vote in recent]
+        existing = {
+            row["id"]
+            for row in self.neo4j.run_query(
+                """
+                UNWIND $ids AS id
+                MATCH (v:Vote {id: id})
+                RETURN v.id AS id
+                """,
+                {"ids": ids},
+            )
+        }
 
-            if not vote_date or vote_date < cutoff_date:
+        new_votes = []
+        for vote_id, vote in zip(ids, recent):
+            if vote_id in existing:
                 continue
-
-            # Check if vote already exists
-            vote_id = f"{vote.get('session')}-{vote.get('number')}"
-
-            check_query = """
-            MATCH (v:Vote {id: $id})
-            RETURN v
+            vote_props = {
+                "id": vote_id,
+                "number": vote.get("number"),
+                "session": vote.get("session"),
+                "date": vote.get("date"),
+                "result": vote.get("result"),
+                "yeas": vote.get("yea_total"),  # OpenParliament uses yea_total, not yeas
+                "nays": vote.get("nay_total"),
+                "paired": vote.get("paired_total"),
+                "bill_url": vote.get("bill_url"),
+            }
+            new_votes.append({k: v for k, v in vote_props.items() if v is not None})
+            logger.info(f"🗳️  New vote: {vote_id} - {vote.get('result')}")
+
+        new_count = self.neo4j.batch_write(
             """
-
-            existing = self.neo4j.run_query(check_query, {"id": vote_id})
-
-            if not existing:
-                # Create new vote node
-                create_query = """
-                MERGE (v:Vote {id: $id})
-                SET v.number = $number,
-                    v.session = $session,
-                    v.date = $date,
-                    v.result = $result,
-                    v.yeas = $yeas,
-                    v.nays = $nays,
-                    v.paired = $paired,
-                    v.updated_at = datetime()
-                RETURN v
-                """
-
-                self.neo4j.run_query(create_query, {
-                    "id": vote_id,
-                    "number": vote.get("number"),
-                    "session": vote.get("session"),
-                    "date": vote_date,
-                    "result": vote.get("result"),
-                    "yeas": vote.get("yeas"),
-                    "nays": vote.get("nays"),
-                    "paired": vote.get("paired")
-                })
-
-                new_count += 1
-                logger.info(f"🗳️  New vote: {vote_id} - {vote.get('result')}")
+            UNWIND $votes AS vote
+            MERGE (v:Vote {id: vote.id})
+            SET v += vote,
+                v.updated_at = datetime()
+            """,
+            new_votes,
+            param="votes",
+        ) if new_votes else 0
 
         logger.success(f"✅ Found {new_count} new votes")
         return new_count
@@ -345,16 +379,20 @@ class LightweightUpdater:
         logger.info("=" * 60)
 
         # Update MP parties (most important - catches floor-crossers)
-        self.stats["mps_updated"] = self.update_mp_parties()
+        with stage_scope("mp_parties"):
+            self.stats["mps_updated"] = self.update_mp_parties()
 
         # Update cabinet positions
-        cabinet_count = self.update_cabinet_positions()
+        with stage_scope("cabinet_positions"):
+            cabinet_count = self.update_cabinet_positions()
 
         # Check for new bills (last 24 hours)
-        self.stats["new_bills"] = self.check_new_bills(since_hours=24)
+        with stage_scope("new_bills"):
+            self.stats["new_bills"] = self.check_new_bills(since_hours=24)
 
         # Check for new votes (last 24 hours)
-        self.stats["new_votes"] = self.check_recent_votes(since_hours=24)
+        with stage_scope("recent_votes"):
+            self.stats["new_votes"] = self.check_recent_votes(since_hours=24)
 
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
@@ -408,9 +446,10 @@ def main():
     )
 
     try:
-        # Run lightweight updates
-        updater = LightweightUpdater(neo4j_client)
-        stats = updater.run_all()
+        # Run lightweight updates, recording a run report
+        with RunReport("lightweight_update", threshold=config.report_regression_threshold):
+            updater = LightweightUpdater(neo4j_client)
+            stats = updater.run_all()
 
         # Return success
         logger.success("Lightweight update completed successfully")
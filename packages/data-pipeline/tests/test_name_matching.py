@@ -0,0 +1,34 @@
+"""Tests for in-memory MP name resolution (fedmcp_pipeline/utils/name_matching)."""
+
+import pytest
+
+from fedmcp_pipeline.utils.name_matching import MPNameResolver
+
+
+@pytest.fixture
+def resolver():
+    return MPNameResolver([
+        {"id": "michelle-rempel-garner", "name": "Michelle Rempel Garner"},
+        {"id": "judy-sgro", "name": "Judy A. Sgro"},
+        {"id": "ziad-aboultaif", "name": "Ziad Aboultaif", "given_name": "Ziad", "family_name": "Aboultaif"},
+    ])
+
+
+@pytest.mark.parametrize("name", [
+    "Michelle Rempel Garner",
+    "Rempel Garner, Hon. Michelle",
+    "Michelle Rempel",
+    "Michelle Garner",
+])
+def test_name_only_record_matches_every_trailing_surname(resolver, name):
+    assert resolver.resolve(name).mp_id == "michelle-rempel-garner"
+
+
+def test_middle_initial_is_not_a_surname(resolver):
+    assert resolver.resolve("Sgro, Hon. Judy A.").mp_id == "judy-sgro"
+    assert resolver.resolve("Judy A") is None
+
+
+def test_given_and_family_names(resolver):
+    match = resolver.resolve("Aboultaif, Ziad")
+    assert (match.mp_id, match.method) == ("ziad-aboultaif", "exact")
@@ -0,0 +1,135 @@
+"""Tests for the local BM25 Hansard index (fedmcp_pipeline/search)."""
+
+import pytest
+
+from fedmcp_pipeline.search import HansardIndex
+
+
+def statement(statement_id, content_en, content_fr="", **extra):
+    """Minimal statement_row-shaped dict."""
+    row = {
+        "id": statement_id,
+        "document_id": extra.pop("document_id", 1),
+        "time": extra.pop("time", "2023-05-01T14:00:00"),
+        "politician_id": extra.pop("politician_id", 10),
+        "who_en": extra.pop("who_en", "Jane Doe"),
+        "who_fr": None,
+        "content_en": content_en,
+        "content_fr": content_fr,
+        "h1_en": None,
+        "h1_fr": None,
+        "h2_en": None,
+        "h2_fr": None,
+        "h3_en": None,
+        "h3_fr": None,
+    }
+    row.update(extra)
+    return row
+
+
+def build(directory, statements, **kwargs):
+    index = HansardIndex(directory, **kwargs)
+    index.add_statements(statements)
+    index.commit()
+    return index
+
+
+def ids(hits):
+    return sorted(hit.statement_id for hit in hits)
+
+
+@pytest.fixture
+def index(tmp_path):
+    return build(tmp_path / "index", [
+        statement(1, "The carbon pricing plan is in the budget."),
+        statement(2, "The carbon housing plan is in the budget."),
+        statement(3, "Pricing of groceries keeps rising."),
+        statement(4, "Budget housing carbon pricing budget budget."),
+    ])
+
+
+def test_match_all_requires_every_term(index):
+    assert ids(index.search("carbon pricing budget")) == [1, 4]
+
+
+def test_match_all_with_four_terms(index):
+    # Statement 2 lacks "pricing", statement 1 lacks "housing"
+    assert ids(index.search("carbon housing pricing budget")) == [4]
+
+
+def test_match_any(index):
+    assert ids(index.search("groceries housing", match_all=False)) == [2, 3, 4]
+
+
+def test_missing_term_matches_nothing(index):
+    assert index.search("carbon spaceship") == []
+    assert ids(index.search("carbon spaceship", match_all=False)) == [1, 2, 4]
+
+
+def test_phrase(index):
+    assert ids(index.search('"carbon pricing"')) == [1, 4]
+    assert ids(index.search('"carbon pricing" housing')) == [4]
+    assert index.search('"pricing carbon"') == []
+
+
+def test_ranking_prefers_higher_term_frequency(index):
+    hits = index.search("budget")
+    assert hits[0].statement_id == 4
+    assert hits == sorted(hits, key=lambda hit: hit.score, reverse=True)
+
+
+def test_stemming(index):
+    assert ids(index.search("grocery")) == [3]
+    assert ids(index.search("priced")) == [1, 3, 4]
+
+
+def test_filters(tmp_path):
+    index = build(tmp_path / "index", [
+        statement(1, "Dairy supply management", party="Liberal", politician_id=1, who_en="Ann Lee"),
+        statement(2, "Dairy supply management", party="Bloc", politician_id=2, who_en="Luc Roy",
+                  time="2015-03-02T10:00:00", document_id=7),
+        statement(3, "Dairy supply management", party="NDP", politician_id=3, who_en="Sam Park"),
+    ])
+    assert ids(index.search("dairy", party="bloc")) == [2]
+    assert ids(index.search("dairy", speaker="roy")) == [2]
+    assert ids(index.search("dairy", speaker=3)) == [3]
+    assert ids(index.search("dairy", date_to="2016-01-01")) == [2]
+    assert ids(index.search("dairy", date_from="2020-01-01")) == [1, 3]
+    assert ids(index.search("dairy", document_id=7)) == [2]
+
+
+def test_french(tmp_path):
+    index = build(tmp_path / "index", [
+        statement(1, "Housing", "Le logement abordable est une priorité."),
+        statement(2, "Taxes", "Les impôts augmentent."),
+    ])
+    assert ids(index.search("logements abordables", language="fr")) == [1]
+    with pytest.raises(ValueError):
+        index.search("logement", language="de")
+
+
+def test_reindexed_statement_replaces_old_copy(index):
+    index.add_statements([statement(2, "The carbon pricing plan was dropped from the budget.")])
+    index.commit()
+    assert ids(index.search("carbon pricing budget")) == [1, 2, 4]
+    assert index.stats()["docs"] == 4
+
+
+def test_segments_merge_and_reopen(tmp_path):
+    directory = tmp_path / "index"
+    index = HansardIndex(directory, merge_factor=2, max_buffered_docs=2)
+    index.add_statements(statement(i, f"carbon pricing report number {i}") for i in range(1, 8))
+    index.add_statements([statement(8, "housing budget")])
+    index.commit()
+    expected = list(range(1, 8))
+    assert ids(index.search("carbon pricing report", limit=20)) == expected
+
+    index.optimize()
+    assert len(index.segments) == 1
+    reopened = HansardIndex(directory)
+    assert ids(reopened.search("carbon pricing report", limit=20)) == expected
+    assert reopened.max_statement_id == 8
+
+
+def test_limit(index):
+    assert len(index.search("budget", limit=1)) == 1
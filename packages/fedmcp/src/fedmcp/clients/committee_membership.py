@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
 from bs4 import BeautifulSoup
@@ -58,6 +59,37 @@ class CommitteeMembershipClient:
 
         return self._parse_members(response.text)
 
+    def get_members_for_committees(
+        self,
+        committee_codes: Iterable[str],
+        max_workers: int = 4,
+    ) -> Tuple[Dict[str, List[CommitteeMember]], Dict[str, str]]:
+        """
+        Fetch several committees' members concurrently.
+
+        Every page is on ourcommons.ca, so ``max_workers`` is the number of
+        concurrent requests to that host; the session's rate limit still applies.
+
+        Args:
+            committee_codes: Committee acronyms
+            max_workers: Maximum concurrent page fetches
+
+        Returns:
+            (members by committee code, error message by committee code for pages that failed)
+        """
+        codes = list(dict.fromkeys(committee_codes))
+        members: Dict[str, List[CommitteeMember]] = {}
+        errors: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.get_committee_members, code): code for code in codes}
+            for future in as_completed(futures):
+                code = futures[future]
+                try:
+                    members[code] = future.result()
+                except Exception as e:
+                    errors[code] = str(e)
+        return {code: members[code] for code in codes if code in members}, errors
+
     def _parse_members(self, html: str) -> List[CommitteeMember]:
         """Parse committee members from HTML."""
         soup = BeautifulSoup(html, 'html.parser')
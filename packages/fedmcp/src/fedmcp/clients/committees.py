@@ -10,6 +10,7 @@ This client scrapes these pages to extract:
 - Member roles (Chair, Vice-Chair, Member)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 import re
@@ -291,21 +292,21 @@ class CommitteeClient:
                     return party
         return None
 
-    def get_all_committee_members(self) -> List[Dict]:
+    def get_all_committee_members(self, max_workers: int = 4) -> List[Dict]:
         """
         Fetch membership data for all committees.
 
-        Returns:
-            List of committee dicts with membership info
-        """
-        results = []
+        Pages are fetched concurrently (at most ``max_workers`` requests to
+        parl.ca at a time, still subject to the session's rate limit).
 
-        for committee in self.list_committees():
-            code = committee['code']
-            print(f"Fetching members for {code}...")
+        Args:
+            max_workers: Maximum concurrent page fetches
 
-            members_data = self.get_committee_members(code)
-            if members_data['members']:
-                results.append(members_data)
+        Returns:
+            List of committee dicts with membership info, in COMMITTEE_CODES order
+        """
+        codes = [committee['code'] for committee in self.list_committees()]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            committees = list(executor.map(self.get_committee_members, codes))
 
-        return results
+        return [members_data for members_data in committees if members_data['members']]
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fedmcp.http import RateLimitedSession
+from fedmcp.metrics import tracked_load
 
 
 # Travel expenses dataset
@@ -200,6 +201,7 @@ class DepartmentalExpensesClient:
         except ValueError:
             return None
 
+    @tracked_load("departmental_travel", "_travel")
     def _load_travel(self) -> List[DepartmentalTravel]:
         """Load travel data from cache or download if needed."""
         if self._travel is not None:
@@ -238,6 +240,7 @@ class DepartmentalExpensesClient:
         print(f"Loaded {len(travel_records):,} departmental travel records")
         return self._travel
 
+    @tracked_load("departmental_hospitality", "_hospitality")
     def _load_hospitality(self) -> List[DepartmentalHospitality]:
         """Load hospitality data from cache or download if needed."""
         if self._hospitality is not None:
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fedmcp.http import RateLimitedSession
+from fedmcp.metrics import tracked_load
 
 
 BASE_URL = "https://open.canada.ca/data/en/dataset/432527ab-7aac-45b5-81d6-7597107a7013"
@@ -126,6 +127,7 @@ class GrantsContributionsClient:
         except ValueError:
             return 0.0
 
+    @tracked_load("grants", "_grants")
     def _load_grants(self) -> List[GrantContribution]:
         """Load grant data from cache or download if needed."""
         if self._grants is not None:
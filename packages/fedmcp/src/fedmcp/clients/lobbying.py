@@ -4,6 +4,7 @@ from __future__ import annotations
 import csv
 import io
 import os
+import threading
 import zipfile
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -11,6 +12,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fedmcp.http import RateLimitedSession
+from fedmcp.metrics import tracked_load
 
 
 # Official lobbycanada.gc.ca sources (primary, most up-to-date)
@@ -122,6 +124,9 @@ class LobbyingRegistryClient:
         self._subject_matters: Optional[Dict[str, List[str]]] = None
         self._government_institutions: Optional[Dict[str, List[str]]] = None
 
+        # Serializes the first load so concurrent lookups share one download/parse
+        self._load_lock = threading.Lock()
+
     def _should_download(self, file_path: Path) -> bool:
         """Check if file should be downloaded."""
         if not file_path.exists():
@@ -150,11 +155,18 @@ class LobbyingRegistryClient:
 
         return extract_dir
 
+    @tracked_load("lobbying_registrations", "_registrations")
     def _load_registrations(self) -> List[LobbyingRegistration]:
         """Load registration data from cache or download if needed."""
         if self._registrations is not None:
             return self._registrations
+        with self._load_lock:
+            if self._registrations is None:
+                self._registrations = self._read_registrations()
+        return self._registrations
 
+    def _read_registrations(self) -> List[LobbyingRegistration]:
+        """Download (if needed) and parse the registration export."""
         zip_name = f"registrations_{self.source}.zip"
         extract_dir = self._download_and_extract(self.registrations_url, zip_name)
 
@@ -202,14 +214,20 @@ class LobbyingRegistryClient:
                         if institution not in registrations_dict[reg_id].government_institutions:
                             registrations_dict[reg_id].government_institutions.append(institution)
 
-        self._registrations = list(registrations_dict.values())
-        return self._registrations
+        return list(registrations_dict.values())
 
+    @tracked_load("lobbying_communications", "_communications")
     def _load_communications(self) -> List[LobbyingCommunication]:
         """Load communication reports from cache or download if needed."""
         if self._communications is not None:
             return self._communications
+        with self._load_lock:
+            if self._communications is None:
+                self._communications = self._read_communications()
+        return self._communications
 
+    def _read_communications(self) -> List[LobbyingCommunication]:
+        """Download (if needed) and parse the communication export."""
         zip_name = f"communications_{self.source}.zip"
         extract_dir = self._download_and_extract(self.communications_url, zip_name)
 
@@ -262,8 +280,7 @@ class LobbyingRegistryClient:
                     if comlog_id in communications_dict and description:
                         communications_dict[comlog_id].subject_matters.append(description)
 
-        self._communications = list(communications_dict.values())
-        return self._communications
+        return list(communications_dict.values())
 
     def search_registrations(
         self,
@@ -0,0 +1,339 @@
+"""Batch conflict-of-interest scan over every organization in the financial datasets.
+
+``conflict_of_interest_check`` evaluates one entity per call. This module runs the
+same overlap checks (political contributions, government contracts and grants,
+lobbying) for every canonical entity in the :mod:`fedmcp.entities` index at once,
+adds dollar totals and the timing between lobbying activity and subsequent
+awards, and writes a ranked flag table to disk. The server loads that table to
+answer "top flagged entities" queries and per-entity lookups without rescanning.
+
+Run ``python -m fedmcp.conflicts`` to (re)build the table.
+"""
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import math
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from fedmcp.entities import CACHE_DIR, EntityResolver
+
+
+# Bump when the row layout changes
+TABLE_VERSION = 1
+
+DEFAULT_TABLE_PATH = CACHE_DIR / "conflict_flags.json.gz"
+
+# Awards signed within this many days after lobbying activity are flagged
+DEFAULT_WINDOW_DAYS = 180
+
+# Minimum contract/grant amount counted as a high-value award (matches the tool default)
+DEFAULT_THRESHOLD_AMOUNT = 100000.0
+
+# Flag codes and their human-readable descriptions
+FLAG_DESCRIPTIONS = {
+    "contributions_and_funds": "Made political contributions AND received government funds",
+    "contributions_and_lobbying": "Made political contributions AND engaged in lobbying",
+    "contracts_and_lobbying": "Received government contracts AND engaged in lobbying",
+    "award_after_lobbying": "Received a high-value award shortly after lobbying activity",
+}
+
+
+@dataclass
+class ConflictFlag:
+    """Precomputed conflict-of-interest row for one canonical entity."""
+
+    entity_id: str
+    name: str
+    contribution_count: int = 0
+    contribution_total: float = 0.0
+    contract_count: int = 0
+    contract_total: float = 0.0
+    grant_count: int = 0
+    grant_total: float = 0.0
+    high_value_awards: int = 0
+    lobbying_registrations: int = 0
+    lobbying_communications: int = 0
+    awards_after_lobbying: int = 0
+    min_days_lobbying_to_award: Optional[int] = None
+    flags: List[str] = field(default_factory=list)
+    score: float = 0.0
+    rank: int = 0
+
+    @property
+    def funds_total(self) -> float:
+        """Contracts plus grants received."""
+        return self.contract_total + self.grant_total
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse the leading YYYY-MM-DD of a dataset date string."""
+    if not value or len(value) < 10:
+        return None
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _score(row: ConflictFlag) -> float:
+    """Rank score: flag count dominates, money and timing break ties."""
+    score = 10.0 * len(row.flags)
+    score += math.log10(1.0 + row.funds_total)
+    score += math.log10(1.0 + row.contribution_total)
+    if row.awards_after_lobbying:
+        score += 2.0 + math.log2(1.0 + row.awards_after_lobbying)
+    return round(score, 3)
+
+
+def evaluate_entity(
+    entity_id: str,
+    name: str,
+    records: Dict[str, List[Any]],
+    *,
+    threshold_amount: float = DEFAULT_THRESHOLD_AMOUNT,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+) -> ConflictFlag:
+    """
+    Compute overlap flags, totals and lobbying/award timing for one entity.
+
+    Args:
+        entity_id: Canonical entity id
+        name: Display name
+        records: Dataset name -> records attributed to the entity
+        threshold_amount: Minimum contract/grant value treated as high-value
+        window_days: Max days between lobbying and an award to flag proximity
+
+    Returns:
+        ConflictFlag row (rank is assigned by :func:`scan_conflicts`)
+    """
+    contributions = records.get("contributions", [])
+    contracts = records.get("contracts", [])
+    grants = records.get("grants", [])
+    registrations = records.get("lobbying_registrations", [])
+    communications = records.get("lobbying_communications", [])
+
+    row = ConflictFlag(entity_id=entity_id, name=name)
+    row.contribution_count = len(contributions)
+    row.contribution_total = sum(c.contribution_amount for c in contributions)
+    row.contract_count = len(contracts)
+    row.contract_total = sum(c.contract_value for c in contracts)
+    row.grant_count = len(grants)
+    row.grant_total = sum(g.agreement_value for g in grants)
+    row.lobbying_registrations = len(registrations)
+    row.lobbying_communications = len(communications)
+
+    high_value_contracts = [c for c in contracts if c.contract_value >= threshold_amount]
+    high_value_grants = [g for g in grants if g.agreement_value >= threshold_amount]
+    row.high_value_awards = len(high_value_contracts) + len(high_value_grants)
+    lobbied = bool(registrations or communications)
+
+    # Same overlap rules as the single-entity conflict_of_interest_check tool
+    if contributions and (high_value_contracts or high_value_grants):
+        row.flags.append("contributions_and_funds")
+    if contributions and registrations:
+        row.flags.append("contributions_and_lobbying")
+    if high_value_contracts and registrations:
+        row.flags.append("contracts_and_lobbying")
+
+    # Timing: days from the most recent lobbying activity to each high-value award
+    if lobbied and row.high_value_awards:
+        lobbying_dates = sorted(
+            d for d in (
+                [_parse_date(c.comm_date) for c in communications]
+                + [_parse_date(r.effective_date) for r in registrations]
+            ) if d
+        )
+        award_dates = [
+            d for d in (
+                [_parse_date(c.contract_date) for c in high_value_contracts]
+                + [_parse_date(g.agreement_date) for g in high_value_grants]
+            ) if d
+        ]
+        gaps = []
+        for award_date in award_dates:
+            i = bisect.bisect_right(lobbying_dates, award_date)
+            if i:
+                gaps.append((award_date - lobbying_dates[i - 1]).days)
+        if gaps:
+            row.min_days_lobbying_to_award = min(gaps)
+            row.awards_after_lobbying = sum(1 for gap in gaps if gap <= window_days)
+            if row.awards_after_lobbying:
+                row.flags.append("award_after_lobbying")
+
+    row.score = _score(row)
+    return row
+
+
+def scan_conflicts(
+    resolver: EntityResolver,
+    *,
+    threshold_amount: float = DEFAULT_THRESHOLD_AMOUNT,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+) -> List[ConflictFlag]:
+    """
+    Evaluate every entity that appears in at least two dataset groups.
+
+    Entities seen only in a single source (e.g. only as a donor) cannot produce
+    an overlap flag and are skipped without loading their records.
+
+    Args:
+        resolver: EntityResolver configured with all financial clients
+        threshold_amount: Minimum contract/grant value treated as high-value
+        window_days: Max days between lobbying and an award to flag proximity
+
+    Returns:
+        Flagged rows sorted by descending score, with ranks assigned
+    """
+    index = resolver.ensure_index()
+    groups = {
+        "contributions": "contributions",
+        "contracts": "funds",
+        "grants": "funds",
+        "lobbying_registrations": "lobbying",
+        "lobbying_communications": "lobbying",
+    }
+
+    rows: List[ConflictFlag] = []
+    for entity in index.entities.values():
+        if len({groups[dataset] for dataset in entity.records if dataset in groups}) < 2:
+            continue
+        records = {
+            dataset: resolver.records_at(dataset, positions)
+            for dataset, positions in entity.records.items()
+        }
+        row = evaluate_entity(
+            entity.entity_id,
+            entity.name,
+            records,
+            threshold_amount=threshold_amount,
+            window_days=window_days,
+        )
+        if row.flags:
+            rows.append(row)
+
+    rows.sort(key=lambda r: (r.score, r.funds_total), reverse=True)
+    for rank, row in enumerate(rows, 1):
+        row.rank = rank
+    return rows
+
+
+class ConflictFlagTable:
+    """Ranked, on-disk table of precomputed conflict flags."""
+
+    def __init__(
+        self,
+        rows: Iterable[ConflictFlag],
+        *,
+        generated_at: Optional[str] = None,
+        threshold_amount: float = DEFAULT_THRESHOLD_AMOUNT,
+        window_days: int = DEFAULT_WINDOW_DAYS,
+    ) -> None:
+        self.rows: List[ConflictFlag] = list(rows)
+        self.generated_at = generated_at or datetime.now().isoformat(timespec="seconds")
+        self.threshold_amount = threshold_amount
+        self.window_days = window_days
+        self._by_entity: Dict[str, ConflictFlag] = {row.entity_id: row for row in self.rows}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, entity_id: str) -> Optional[ConflictFlag]:
+        """Look up the row for a canonical entity id."""
+        return self._by_entity.get(entity_id)
+
+    def top(self, limit: int = 20, flag: Optional[str] = None) -> List[ConflictFlag]:
+        """Highest-ranked rows, optionally restricted to one flag code."""
+        rows = self.rows if flag is None else [row for row in self.rows if flag in row.flags]
+        return rows[:limit]
+
+    def save(self, path: Path = DEFAULT_TABLE_PATH) -> None:
+        """Write the table as gzipped JSON (column names stored once)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = list(ConflictFlag.__dataclass_fields__)
+        payload = {
+            "version": TABLE_VERSION,
+            "generated_at": self.generated_at,
+            "threshold_amount": self.threshold_amount,
+            "window_days": self.window_days,
+            "columns": columns,
+            "rows": [[asdict(row)[column] for column in columns] for row in self.rows],
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_TABLE_PATH) -> Optional["ConflictFlagTable"]:
+        """Load a table written by :meth:`save`, or None if missing/outdated."""
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != TABLE_VERSION:
+            return None
+
+        columns = payload["columns"]
+        rows = [ConflictFlag(**dict(zip(columns, values))) for values in payload["rows"]]
+        return cls(
+            rows,
+            generated_at=payload.get("generated_at"),
+            threshold_amount=payload.get("threshold_amount", DEFAULT_THRESHOLD_AMOUNT),
+            window_days=payload.get("window_days", DEFAULT_WINDOW_DAYS),
+        )
+
+
+def build_conflict_table(
+    resolver: EntityResolver,
+    *,
+    path: Path = DEFAULT_TABLE_PATH,
+    threshold_amount: float = DEFAULT_THRESHOLD_AMOUNT,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+) -> ConflictFlagTable:
+    """Run the batch scan and persist the resulting table."""
+    rows = scan_conflicts(resolver, threshold_amount=threshold_amount, window_days=window_days)
+    table = ConflictFlagTable(rows, threshold_amount=threshold_amount, window_days=window_days)
+    table.save(path)
+    return table
+
+
+def main() -> None:
+    """Build the conflict flag table from the default clients."""
+    import argparse
+
+    from fedmcp.clients.federal_contracts import FederalContractsClient
+    from fedmcp.clients.grants_contributions import GrantsContributionsClient
+    from fedmcp.clients.lobbying import LobbyingRegistryClient
+    from fedmcp.clients.political_contributions import PoliticalContributionsClient
+
+    parser = argparse.ArgumentParser(description="Build the precomputed conflict-of-interest flag table")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_AMOUNT,
+                        help="Minimum contract/grant amount treated as high-value")
+    parser.add_argument("--window-days", type=int, default=DEFAULT_WINDOW_DAYS,
+                        help="Days after lobbying within which an award is flagged")
+    parser.add_argument("--output", type=Path, default=DEFAULT_TABLE_PATH,
+                        help="Output path for the flag table")
+    args = parser.parse_args()
+
+    resolver = EntityResolver(
+        contracts_client=FederalContractsClient(),
+        grants_client=GrantsContributionsClient(),
+        contributions_client=PoliticalContributionsClient(),
+        lobbying_client=LobbyingRegistryClient(),
+    )
+    table = build_conflict_table(
+        resolver, path=args.output, threshold_amount=args.threshold, window_days=args.window_days
+    )
+    print(f"Flagged {len(table):,} entities -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
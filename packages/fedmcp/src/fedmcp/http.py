@@ -1,11 +1,14 @@
 """HTTP utility helpers shared across client implementations."""
 from __future__ import annotations
 
+import threading
 import time
 from typing import Any, Callable, Dict, Iterator, Optional
 
 import requests
 
+from .metrics import metrics
+
 
 class RateLimitedSession:
     """A thin wrapper around :class:`requests.Session` with retry/backoff and rate limiting support.
@@ -43,6 +46,7 @@ class RateLimitedSession:
         self.min_request_interval = min_request_interval
         self.default_timeout = default_timeout
         self._last_request_time: Optional[float] = None
+        self._rate_lock = threading.Lock()
 
     def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
         """Perform a request with rate limiting and retry logic.
@@ -52,15 +56,18 @@ class RateLimitedSession:
 
         The default timeout can be overridden by passing timeout= in kwargs.
         """
-        # Proactive rate limiting: enforce minimum interval between requests
-        if self.min_request_interval is not None and self._last_request_time is not None:
-            time_since_last = time.time() - self._last_request_time
-            if time_since_last < self.min_request_interval:
-                sleep_time = self.min_request_interval - time_since_last
-                time.sleep(sleep_time)
-
-        # Update last request time
-        self._last_request_time = time.time()
+        # Proactive rate limiting: enforce minimum interval between requests.
+        # The next request slot is reserved under a lock so concurrent threads
+        # sharing this session still respect the interval.
+        with self._rate_lock:
+            now = time.time()
+            start_at = now
+            if self.min_request_interval is not None and self._last_request_time is not None:
+                start_at = max(now, self._last_request_time + self.min_request_interval)
+            self._last_request_time = start_at
+        rate_wait = max(start_at - now, 0.0)
+        if rate_wait:
+            time.sleep(rate_wait)
 
         # Set default timeout if not provided
         if 'timeout' not in kwargs:
@@ -68,17 +75,25 @@ class RateLimitedSession:
 
         # Reactive retry logic: retry on 429/5xx with exponential backoff
         attempt = 0
-        while True:
-            attempt += 1
-            response = self.session.request(method, url, **kwargs)
-            if response.status_code not in {429, 500, 502, 503, 504}:
-                return response
-
-            if attempt >= self.max_attempts:
-                response.raise_for_status()
-
-            sleep_for = self.backoff_factor * 2 ** (attempt - 1)
-            time.sleep(sleep_for)
+        started = time.perf_counter()
+        try:
+            while True:
+                attempt += 1
+                status = None
+                response = self.session.request(method, url, **kwargs)
+                status = response.status_code
+                if response.status_code not in {429, 500, 502, 503, 504}:
+                    return response
+
+                if attempt >= self.max_attempts:
+                    response.raise_for_status()
+
+                sleep_for = self.backoff_factor * 2 ** (attempt - 1)
+                time.sleep(sleep_for)
+        finally:
+            metrics.record_upstream(
+                url, time.perf_counter() - started, status, rate_wait=rate_wait, retries=attempt - 1
+            )
 
     def get(self, url: str, **kwargs: Any) -> requests.Response:
         return self.request("GET", url, **kwargs)
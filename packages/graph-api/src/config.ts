@@ -33,6 +33,7 @@ export interface Config {
   cors: {
     origins: string[];
   };
+  contentStorage: string;  // Pipeline content storage mode: "inline", "nodes" or "blob"
   nodeEnv: string;
 }
 
@@ -70,6 +71,7 @@ export const config: Config = {
   cors: {
     origins: getEnv('CORS_ORIGINS', 'http://localhost:3000').split(/[,;]/),
   },
+  contentStorage: getEnv('PIPELINE_CONTENT_STORAGE', 'inline').toLowerCase(),
   nodeEnv: getEnv('NODE_ENV', 'development'),
 };
 
@@ -78,6 +80,7 @@ export function validateConfig(): void {
   console.log(`Neo4j URI: ${config.neo4j.uri}`);
   console.log(`Server Port: ${config.server.port}`);
   console.log(`Environment: ${config.nodeEnv}`);
+  console.log(`Content storage: ${config.contentStorage}`);
 
   // Validate CORS origins
   console.log(`CORS Origins (raw): ${JSON.stringify(config.cors.origins)}`);
@@ -5,6 +5,40 @@
  * The @neo4j/graphql library generates resolvers, filters, and pagination.
  */
 
+import { config } from './config.js';
+
+/**
+ * Full-text lookup of Hansard statements, yielding (s, score).
+ *
+ * Follows the pipeline's PIPELINE_CONTENT_STORAGE mode: "inline" searches
+ * the statement_content_en/fr indexes on Statement; "nodes" searches
+ * statement_body_en/fr on StatementContent and maps each hit back to its
+ * Statement through HAS_CONTENT. "blob" mode has no full-text index.
+ */
+function statementSearch(queryParam: string): string {
+  if (config.contentStorage === 'nodes') {
+    return `
+        CALL {
+          WITH ${queryParam} AS query, $language AS language
+          CALL db.index.fulltext.queryNodes(
+            CASE WHEN language = 'fr' THEN 'statement_body_fr' ELSE 'statement_body_en' END,
+            query
+          ) YIELD node, score
+          MATCH (s:Statement)-[:HAS_CONTENT]->(node)
+          RETURN s, score
+        }`;
+  }
+  return `
+        CALL {
+          WITH ${queryParam} AS query, $language AS language
+          CALL db.index.fulltext.queryNodes(
+            CASE WHEN language = 'fr' THEN 'statement_content_fr' ELSE 'statement_content_en' END,
+            query
+          ) YIELD node, score
+          RETURN node AS s, score
+        }`;
+}
+
 export const typeDefs = `#graphql
   # ============================================
   # People & Organizations
@@ -280,6 +314,8 @@ export const typeDefs = `#graphql
     who_fr: String
     content_en: String  # Full statement text in English
     content_fr: String  # Full statement text in French
+    content_en_preview: String  # First 280 characters when the body is stored off-node
+    content_fr_preview: String
     h1_en: String  # Top-level heading (e.g., "Government Orders")
     h1_fr: String
     h2_en: String  # Sub-heading (e.g., "Budget Implementation Act, 2024")
@@ -332,6 +368,14 @@ export const typeDefs = `#graphql
     mentions: Bill @relationship(type: "MENTIONS", direction: OUT, properties: "MentionsProperties")
     replyTo: Statement @relationship(type: "REPLIES_TO", direction: OUT)
     replies: [Statement!]! @relationship(type: "REPLIES_TO", direction: IN)
+    content: StatementContent @relationship(type: "HAS_CONTENT", direction: OUT)
+  }
+
+  # Statement body when the pipeline runs with PIPELINE_CONTENT_STORAGE=nodes
+  type StatementContent @node {
+    id: ID! @unique
+    content_en: String
+    content_fr: String
   }
 
   # Relationship properties for Statement → Bill (MENTIONS)
@@ -1256,16 +1300,8 @@ export const typeDefs = `#graphql
       language: String = "en"  # "en" or "fr"
     ): [Statement!]!
       @cypher(
-        statement: """
-        CALL {
-          WITH $query AS query, $language AS language
-          CALL db.index.fulltext.queryNodes(
-            CASE WHEN language = 'fr' THEN 'statement_content_fr' ELSE 'statement_content_en' END,
-            query
-          ) YIELD node, score
-          RETURN node, score
-        }
-        WITH node AS s, score
+        statement: """${statementSearch('$query')}
+        WITH s, score
         ORDER BY score DESC, s.time DESC
         LIMIT $limit
         RETURN s
@@ -1451,16 +1487,8 @@ export const typeDefs = `#graphql
       language: String = "en"
     ): [Statement!]!
       @cypher(
-        statement: """
-        CALL {
-          WITH $searchTerm AS query, $language AS language
-          CALL db.index.fulltext.queryNodes(
-            CASE WHEN language = 'fr' THEN 'statement_content_fr' ELSE 'statement_content_en' END,
-            query
-          ) YIELD node, score
-          RETURN node, score
-        }
-        WITH node AS s, score
+        statement: """${statementSearch('$searchTerm')}
+        WITH s, score
         WHERE s.h2_en CONTAINS 'Questions on the Order Paper'
           AND s.h3_en IS NOT NULL
           AND s.h3_en <> ''
@@ -11,6 +11,7 @@
  */
 
 import { getDriver, initializeDriver, closeDriver } from '../neo4j.js';
+import { config } from '../config.js';
 
 interface IndexDefinition {
   name: string;
@@ -350,22 +351,48 @@ const indexes: IndexDefinition[] = [
   },
 ];
 
+/**
+ * Full-text indexes over Hansard statement bodies, by pipeline content storage
+ * mode (PIPELINE_CONTENT_STORAGE). "nodes" keeps bodies on StatementContent;
+ * "blob" keeps them outside Neo4j, so there is nothing to index.
+ */
+const statementFulltextIndexes: Record<string, any[]> = {
+  inline: [
+    {
+      name: 'statement_content_en',
+      labels: ['Statement'],
+      properties: ['content_en', 'h1_en', 'h2_en', 'h3_en'],
+      description: 'English full-text search across Hansard statements'
+    },
+    {
+      name: 'statement_content_fr',
+      labels: ['Statement'],
+      properties: ['content_fr', 'h1_fr', 'h2_fr', 'h3_fr'],
+      description: 'French full-text search across Hansard statements'
+    },
+  ],
+  nodes: [
+    {
+      name: 'statement_body_en',
+      labels: ['StatementContent'],
+      properties: ['content_en'],
+      description: 'English full-text search across Hansard statement bodies'
+    },
+    {
+      name: 'statement_body_fr',
+      labels: ['StatementContent'],
+      properties: ['content_fr'],
+      description: 'French full-text search across Hansard statement bodies'
+    },
+  ],
+  blob: [],
+};
+
 /**
  * Full-text search indexes for content queries
  */
 const fulltextIndexes = [
-  {
-    name: 'statement_content_en',
-    labels: ['Statement'],
-    properties: ['content_en', 'h1_en', 'h2_en', 'h3_en'],
-    description: 'English full-text search across Hansard statements'
-  },
-  {
-    name: 'statement_content_fr',
-    labels: ['Statement'],
-    properties: ['content_fr', 'h1_fr', 'h2_fr', 'h3_fr'],
-    description: 'French full-text search across Hansard statements'
-  },
+  ...(statementFulltextIndexes[config.contentStorage] ?? statementFulltextIndexes.inline),
   {
     name: 'bill_search',
     labels: ['Bill'],
@@ -0,0 +1,174 @@
+"""Precomputed per-MP activity summaries for the scorecard tools.
+
+``get_mp_activity_scorecard`` and ``compare_mp_performance`` otherwise assemble
+every metric on each call from four live sources: bills from OpenParliament,
+the petitions feed, the quarterly expenditure reports and the lobbying
+registry. The data pipeline materializes the same metrics from the graph and
+the petitions feed instead (``canadagpt-ingest --activity-summary``). It keeps
+one compact record per MP in ``~/.cache/fedmcp/activity/mp_activity.json.gz``
+and recomputes only the MPs touched by new data on each run, so the tools
+answer from a dictionary lookup whether or not the upstream services are up.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import unicodedata
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Bump when the record layout changes
+SUMMARY_VERSION = 1
+
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "activity"
+DEFAULT_SUMMARY_PATH = CACHE_DIR / "mp_activity.json.gz"
+
+# Lobbying communications are counted from this date, like the live tools
+LOBBY_SINCE = "2024-01-01"
+
+# Inputs recorded in ActivitySummaries.sources once they have been materialized
+SOURCES = ("graph", "petitions")
+
+
+def expense_period(fiscal_year: int, quarter: int) -> str:
+    """Label of a fiscal quarter: (2026, 1) -> 'FY 2025-2026 Q1'."""
+    return f"FY {fiscal_year - 1}-{fiscal_year} Q{quarter}"
+
+
+def _fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def _slug_from(value: str) -> str:
+    """'/politicians/pierre-poilievre/' or 'pierre-poilievre' -> 'pierre-poilievre'."""
+    value = value.strip().strip("/")
+    return value.split("/")[-1].lower()
+
+
+@dataclass
+class MPActivitySummary:
+    """Scorecard metrics for one MP, keyed by the MP node id (OpenParliament slug)."""
+    mp_id: str
+    name: str
+    party: Optional[str] = None
+    riding: Optional[str] = None
+    current: bool = False
+    bills_sponsored: int = 0
+    bills_passed: int = 0
+    petitions_sponsored: int = 0
+    petition_signatures: int = 0
+    petitions_responded: int = 0
+    expenses_period: Optional[str] = None
+    expenses_total: float = 0.0
+    expenses_travel: float = 0.0
+    expenses_hospitality: float = 0.0
+    lobby_communications: int = 0
+    lobby_organizations: int = 0
+    updated_at: str = ""
+
+    @property
+    def politician_url(self) -> str:
+        return f"/politicians/{self.mp_id}/"
+
+    @property
+    def activity_score(self) -> int:
+        """Bills + petitions + lobbying communications, as the scorecard reports it."""
+        return self.bills_sponsored + self.petitions_sponsored + self.lobby_communications
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ActivitySummaries:
+    """
+    All MP activity records, with the time each input was last materialized.
+
+    ``sources`` maps each input in SOURCES to the UTC timestamp of the run that
+    last read it; the pipeline uses the "graph" timestamp as the watermark for
+    finding MPs touched by newer data.
+    """
+
+    def __init__(
+        self,
+        records: Optional[Dict[str, MPActivitySummary]] = None,
+        generated_at: Optional[str] = None,
+        sources: Optional[Dict[str, str]] = None,
+    ):
+        self.records = records or {}
+        self.generated_at = generated_at
+        self.sources = sources or {}
+        self._names: Optional[List[tuple]] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, mp_id: str) -> bool:
+        return mp_id in self.records
+
+    def get(self, mp_id: str) -> Optional[MPActivitySummary]:
+        return self.records.get(mp_id)
+
+    def has_source(self, source: str) -> bool:
+        """Whether ``source`` (one of SOURCES) has been materialized at least once."""
+        return source in self.sources
+
+    def find(self, query: str) -> Optional[MPActivitySummary]:
+        """Record by politician URL, MP id or (part of) name, preferring sitting MPs."""
+        if not query:
+            return None
+        slug = _slug_from(str(query))
+        if slug in self.records:
+            return self.records[slug]
+        if self._names is None:
+            self._names = [(_fold(record.name), record) for record in self.records.values()]
+        wanted = _fold(str(query).strip())
+        exact = [record for name, record in self._names if name == wanted]
+        matches = exact or [record for name, record in self._names if wanted in name]
+        return max(matches, key=lambda record: (record.current, record.updated_at), default=None)
+
+    def update(self, records: Iterable[MPActivitySummary]) -> int:
+        """Replace the records of the given MPs; returns how many were written."""
+        count = 0
+        for record in records:
+            self.records[record.mp_id] = record
+            count += 1
+        self._names = None
+        return count
+
+    def save(self, path: Path = DEFAULT_SUMMARY_PATH) -> None:
+        """Write all records as gzipped JSON (column names once, then one row per MP)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = [f.name for f in fields(MPActivitySummary)]
+        payload = {
+            "version": SUMMARY_VERSION,
+            "generated_at": self.generated_at,
+            "sources": self.sources,
+            "columns": columns,
+            "rows": [[getattr(record, column) for column in columns] for record in self.records.values()],
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_SUMMARY_PATH) -> Optional["ActivitySummaries"]:
+        """Load summaries written by :meth:`save`, or None if missing/outdated."""
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != SUMMARY_VERSION:
+            return None
+
+        records = {}
+        for row in payload["rows"]:
+            record = MPActivitySummary(**dict(zip(payload["columns"], row)))
+            records[record.mp_id] = record
+        return cls(records, generated_at=payload.get("generated_at"), sources=payload.get("sources"))
@@ -0,0 +1,616 @@
+"""Precomputed MP x vote ballot matrix for party-cohesion and voting-similarity analytics.
+
+``analyze_party_discipline`` and ``analyze_mp_voting_participation`` page through
+ballots one vote or one MP at a time over the OpenParliament API. This module
+keeps every recorded division in one compact matrix instead: a byte per
+(vote, MP) cell, holding the MP's party at the time in the high five bits and
+their position in the low three. Analytics run over whole rows and columns at
+once with C-level bytes operations:
+
+- per-vote party tallies with one ``bytes.count`` per (party, position) code
+- positions and parties masked with ``bytes.translate`` and counted the same way
+- pairwise agreement from per-MP yea/nay bitsets (``int & int``, ``int.bit_count``)
+
+so "who breaks ranks most this session" or "which MPs vote most alike" take
+milliseconds rather than thousands of requests.
+
+The matrix is built from the ``bills_membervote`` rows that ``import_member_votes.py``
+loads as CAST_VOTE relationships (``canadagpt-ingest --ballot-matrix`` in the data
+pipeline) and written to ``~/.cache/fedmcp/ballots/ballot_matrix.bin.gz``.
+"""
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Bump when the file layout or cell encoding changes
+MATRIX_VERSION = 1
+
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "ballots"
+DEFAULT_MATRIX_PATH = CACHE_DIR / "ballot_matrix.bin.gz"
+
+# Cell positions (low three bits); NOT_MEMBER cells were not sitting MPs at the time
+NOT_MEMBER, YEA, NAY, PAIRED, ABSENT = range(5)
+POSITION_CODES = {"Y": YEA, "N": NAY, "P": PAIRED, "A": ABSENT}
+POSITION_NAMES = {YEA: "Yea", NAY: "Nay", PAIRED: "Paired", ABSENT: "Absent"}
+
+# Party index (high five bits); 0 = unknown or no party
+MAX_PARTIES = 31
+PARTY_SHIFT = 3
+
+# Parties without a party line to break
+NO_PARTY_LINE = re.compile(r"^(independent|ind\.?|no affiliation)", re.IGNORECASE)
+
+
+def _table(predicate) -> bytes:
+    """256-byte translate table mapping each cell code to predicate(code)."""
+    return bytes(predicate(code) for code in range(256))
+
+
+POSITION_OF = _table(lambda code: code & 7)
+PARTY_OF = _table(lambda code: code >> PARTY_SHIFT)
+# ASCII '1'/'0' so a translated column parses straight into a bitset with int(..., 2)
+YEA_BITS = _table(lambda code: ord("1") if code & 7 == YEA else ord("0"))
+NAY_BITS = _table(lambda code: ord("1") if code & 7 == NAY else ord("0"))
+
+
+@dataclass
+class MatrixMP:
+    """A column of the matrix."""
+    politician_id: int
+    name: str
+    slug: str
+
+
+@dataclass
+class MatrixVote:
+    """A row of the matrix (one recorded division)."""
+    vote_id: int
+    session: str
+    number: int
+    date: str
+    description: str = ""
+    result: str = ""
+    bill_number: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return f"/votes/{self.session}/{self.number}/"
+
+
+@dataclass
+class PartyTally:
+    """One party's positions on one vote."""
+    party: str
+    yea: int
+    nay: int
+    paired: int
+    absent: int
+
+    @property
+    def cast(self) -> int:
+        return self.yea + self.nay
+
+    @property
+    def majority(self) -> Optional[int]:
+        """YEA or NAY when most of the party's votes went one way (None on a tie)."""
+        if self.yea > self.nay:
+            return YEA
+        if self.nay > self.yea:
+            return NAY
+        return None
+
+    @property
+    def rice_index(self) -> Optional[float]:
+        """|yea - nay| / (yea + nay): 1.0 when the party voted as one, 0.0 when split evenly."""
+        return abs(self.yea - self.nay) / self.cast if self.cast else None
+
+
+@dataclass
+class MPVotingRecord:
+    """Participation and party-line statistics for one MP over a range of votes."""
+    mp: MatrixMP
+    party: Optional[str]
+    eligible: int = 0
+    yea: int = 0
+    nay: int = 0
+    paired: int = 0
+    absent: int = 0
+    party_line_votes: int = 0
+    broke_ranks: int = 0
+
+    @property
+    def cast(self) -> int:
+        return self.yea + self.nay
+
+    @property
+    def participation_rate(self) -> Optional[float]:
+        return self.cast / self.eligible if self.eligible else None
+
+    @property
+    def break_rate(self) -> Optional[float]:
+        """Share of the MP's votes with a party majority that went against it."""
+        return self.broke_ranks / self.party_line_votes if self.party_line_votes else None
+
+
+@dataclass
+class SimilarityPair:
+    """Agreement between two MPs on the votes both cast."""
+    first: MatrixMP
+    second: MatrixMP
+    first_party: Optional[str]
+    second_party: Optional[str]
+    agreed: int
+    shared_votes: int
+
+    @property
+    def similarity(self) -> float:
+        return self.agreed / self.shared_votes if self.shared_votes else 0.0
+
+
+def _iso_date(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()[:10]
+    return str(value)[:10] if value else ""
+
+
+def _slug_from(value: str) -> str:
+    """'/politicians/pierre-poilievre/' or 'pierre-poilievre' -> 'pierre-poilievre'."""
+    value = value.strip().strip("/")
+    return value.split("/")[-1].lower()
+
+
+class BallotMatrix:
+    """
+    Every recorded division as a vote-major byte matrix.
+
+    Row ``v`` (``cells[v * n_mps:(v + 1) * n_mps]``) holds vote ``v`` for every MP;
+    ``column(i)`` is MP ``i``'s record across all votes. Votes are ordered by date,
+    so a session or date range is a contiguous slice of rows.
+
+    Example:
+        >>> matrix = BallotMatrix.load()
+        >>> votes = matrix.vote_range(session="44-1")
+        >>> rebels = matrix.mp_records(votes)
+        >>> pairs = matrix.similar_pairs(votes, cross_party=True)
+    """
+
+    def __init__(
+        self,
+        cells: bytes,
+        mps: Sequence[MatrixMP],
+        votes: Sequence[MatrixVote],
+        parties: Sequence[str],
+        *,
+        generated_at: Optional[str] = None,
+    ) -> None:
+        if len(cells) != len(mps) * len(votes):
+            raise ValueError(f"Matrix has {len(cells):,} cells for {len(votes):,} votes x {len(mps):,} MPs")
+        self.cells = bytes(cells)
+        self.mps: List[MatrixMP] = list(mps)
+        self.votes: List[MatrixVote] = list(votes)
+        self.parties: List[str] = list(parties)
+        self.generated_at = generated_at or datetime.now().isoformat(timespec="seconds")
+
+        self._dates = [vote.date for vote in self.votes]
+        self._sessions: Dict[str, range] = {}
+        for index, vote in enumerate(self.votes):
+            first = self._sessions.get(vote.session, range(index, index)).start
+            self._sessions[vote.session] = range(first, index + 1)
+        self._by_slug = {mp.slug: i for i, mp in enumerate(self.mps) if mp.slug}
+        self._by_id = {mp.politician_id: i for i, mp in enumerate(self.mps)}
+        self._vote_index = {(vote.session, vote.number): i for i, vote in enumerate(self.votes)}
+        self._columns: Optional[List[bytes]] = None
+        self._party_line = bytes(
+            0 if i == 0 or NO_PARTY_LINE.match(name or "") else 1 for i, name in enumerate(self.parties)
+        )
+
+    def __len__(self) -> int:
+        return len(self.votes)
+
+    @property
+    def n_mps(self) -> int:
+        return len(self.mps)
+
+    @property
+    def sessions(self) -> List[str]:
+        """Sessions in chronological order."""
+        return list(self._sessions)
+
+    @property
+    def latest_session(self) -> Optional[str]:
+        return self.votes[-1].session if self.votes else None
+
+    # Building and persistence
+    # ------------------------
+
+    @classmethod
+    def build(
+        cls,
+        votes: Iterable[MatrixVote],
+        mps: Iterable[MatrixMP],
+        ballots: Iterable[Tuple[int, int, str, Optional[str]]],
+        terms: Iterable[Tuple[int, str, Optional[str], Optional[str]]] = (),
+    ) -> "BallotMatrix":
+        """
+        Assemble the matrix from extracted rows.
+
+        Args:
+            votes: Recorded divisions (any order; sorted by date, session and number)
+            mps: Politicians (MPs without any ballot or term are dropped)
+            ballots: (vote_id, politician_id, position code Y/N/P/A, party) per ballot
+            terms: (politician_id, party, start date, end date or None) per seat held.
+                Members sitting on a vote's date without a ballot are recorded as absent.
+
+        Returns:
+            The assembled matrix
+        """
+        votes = sorted(votes, key=lambda v: (v.date, v.session, v.number))
+        vote_rows = {vote.vote_id: row for row, vote in enumerate(votes)}
+        mps_by_id = {mp.politician_id: mp for mp in mps}
+
+        parties: Dict[str, int] = {"": 0}
+
+        def party_code(name: Optional[str]) -> int:
+            if not name:
+                return 0
+            if name not in parties:
+                if len(parties) > MAX_PARTIES:
+                    return 0
+                parties[name] = len(parties)
+            return parties[name]
+
+        ballot_cells: Dict[Tuple[int, int], int] = {}
+        for vote_id, politician_id, position, party in ballots:
+            row = vote_rows.get(vote_id)
+            if row is None or politician_id not in mps_by_id:
+                continue
+            code = POSITION_CODES.get((position or "").upper())
+            if code is None:
+                continue
+            ballot_cells[(row, politician_id)] = party_code(party) << PARTY_SHIFT | code
+
+        term_list = [
+            (politician_id, party_code(party), _iso_date(start), _iso_date(end) if end else "9999-12-31")
+            for politician_id, party, start, end in terms
+            if politician_id in mps_by_id and start
+        ]
+
+        politician_ids = sorted({pid for _, pid in ballot_cells} | {term[0] for term in term_list})
+        columns = {pid: i for i, pid in enumerate(politician_ids)}
+        n_mps = len(politician_ids)
+        cells = bytearray(len(votes) * n_mps)
+
+        # Sitting members first (absent unless a ballot says otherwise)
+        dates = [vote.date for vote in votes]
+        for politician_id, party, start, end in term_list:
+            column = columns[politician_id]
+            absent = party << PARTY_SHIFT | ABSENT
+            for row in range(bisect.bisect_left(dates, start), bisect.bisect_right(dates, end)):
+                cells[row * n_mps + column] = absent
+        for (row, politician_id), code in ballot_cells.items():
+            cells[row * n_mps + columns[politician_id]] = code
+
+        party_names = [name for name, _ in sorted(parties.items(), key=lambda item: item[1])]
+        return cls(bytes(cells), [mps_by_id[pid] for pid in politician_ids], votes, party_names)
+
+    def save(self, path: Path = DEFAULT_MATRIX_PATH) -> None:
+        """Write the matrix as gzip: one JSON header line, then the raw cells."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            "version": MATRIX_VERSION,
+            "generated_at": self.generated_at,
+            "parties": self.parties,
+            "mp_columns": list(MatrixMP.__dataclass_fields__),
+            "mps": [[getattr(mp, column) for column in MatrixMP.__dataclass_fields__] for mp in self.mps],
+            "vote_columns": list(MatrixVote.__dataclass_fields__),
+            "votes": [[getattr(vote, column) for column in MatrixVote.__dataclass_fields__] for vote in self.votes],
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+            f.write(self.cells)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MATRIX_PATH) -> Optional["BallotMatrix"]:
+        """Load a matrix written by :meth:`save`, or None if missing/outdated."""
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rb") as f:
+                header = json.loads(f.readline())
+                cells = f.read()
+        except (OSError, ValueError):
+            return None
+        if header.get("version") != MATRIX_VERSION:
+            return None
+
+        mps = [MatrixMP(**dict(zip(header["mp_columns"], values))) for values in header["mps"]]
+        votes = [MatrixVote(**dict(zip(header["vote_columns"], values))) for values in header["votes"]]
+        return cls(cells, mps, votes, header["parties"], generated_at=header.get("generated_at"))
+
+    # Lookups
+    # -------
+
+    def vote_range(
+        self,
+        session: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> range:
+        """Row range of the votes in a session and/or date range (all votes by default)."""
+        rows = self._sessions.get(session, range(0)) if session else range(len(self.votes))
+        start, stop = rows.start, rows.stop
+        if date_from:
+            start = max(start, bisect.bisect_left(self._dates, _iso_date(date_from)))
+        if date_to:
+            stop = min(stop, bisect.bisect_right(self._dates, _iso_date(date_to)))
+        return range(start, max(start, stop))
+
+    def find_vote(self, session: str, number: int) -> Optional[int]:
+        return self._vote_index.get((session, int(number)))
+
+    def find_mp(self, query: str) -> Optional[int]:
+        """Column of an MP by politician URL, slug, id or (part of) name."""
+        if not query:
+            return None
+        query = str(query).strip()
+        if query.isdigit() and int(query) in self._by_id:
+            return self._by_id[int(query)]
+        slug = _slug_from(query)
+        if slug in self._by_slug:
+            return self._by_slug[slug]
+        wanted = query.casefold()
+        matches = [i for i, mp in enumerate(self.mps) if wanted in mp.name.casefold()]
+        # Prefer the most recently active MP among namesakes
+        return max(matches, key=self._last_active, default=None)
+
+    def _last_active(self, column: int) -> int:
+        """Row after the MP's last vote as a sitting member."""
+        return len(self.column(column).translate(POSITION_OF).rstrip(bytes([NOT_MEMBER])))
+
+    def vote_row(self, row: int) -> bytes:
+        return self.cells[row * self.n_mps:(row + 1) * self.n_mps]
+
+    def column(self, column: int) -> bytes:
+        """MP ``column``'s cells across all votes."""
+        if self._columns is None:
+            self._columns = [self.cells[i::self.n_mps] for i in range(self.n_mps)]
+        return self._columns[column]
+
+    def party_of(self, column: int, votes: range) -> Optional[str]:
+        """The party an MP sat with for most of ``votes``."""
+        parties = self.column(column)[votes.start:votes.stop].translate(PARTY_OF)
+        count, party = max(((parties.count(party), party) for party in range(1, len(self.parties))), default=(0, 0))
+        return self.parties[party] if count else None
+
+    # Analytics
+    # ---------
+
+    def party_tallies(self, row: int) -> Dict[int, PartyTally]:
+        """Positions per party on one vote, keyed by party index."""
+        cells = self.vote_row(row)
+        tallies = {}
+        for party, name in enumerate(self.parties):
+            code = party << PARTY_SHIFT
+            counts = [cells.count(code | position) for position in (YEA, NAY, PAIRED, ABSENT)]
+            if any(counts):
+                tallies[party] = PartyTally(name or "Unknown", *counts)
+        return tallies
+
+    def dissenters(self, row: int, tallies: Optional[Dict[int, PartyTally]] = None) -> Dict[int, List[int]]:
+        """Columns of MPs who voted against their party's majority, keyed by party index."""
+        tallies = tallies if tallies is not None else self.party_tallies(row)
+        cells = self.vote_row(row)
+        result = {}
+        for party, tally in tallies.items():
+            majority = tally.majority
+            if majority is None or not self._party_line[party]:
+                continue
+            other = party << PARTY_SHIFT | (NAY if majority == YEA else YEA)
+            minority = tally.nay if majority == YEA else tally.yea
+            if not minority:
+                continue
+            needle = bytes([other])
+            columns, position = [], cells.find(needle)
+            while position >= 0:
+                columns.append(position)
+                position = cells.find(needle, position + 1)
+            result[party] = columns
+        return result
+
+    def party_cohesion(self, votes: range) -> Dict[str, Dict[str, Any]]:
+        """
+        Average Rice index and dissent counts per party over a range of votes.
+
+        Returns:
+            {party: {"votes", "average_rice_index", "unanimous_votes", "votes_with_dissent", "dissenting_ballots"}}
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for row in votes:
+            tallies = self.party_tallies(row)
+            dissent = self.dissenters(row, tallies)
+            for party, tally in tallies.items():
+                if tally.rice_index is None or not self._party_line[party]:
+                    continue
+                entry = summary.setdefault(tally.party, {
+                    "votes": 0, "rice_total": 0.0, "unanimous_votes": 0,
+                    "votes_with_dissent": 0, "dissenting_ballots": 0,
+                })
+                entry["votes"] += 1
+                entry["rice_total"] += tally.rice_index
+                entry["unanimous_votes"] += tally.rice_index == 1.0
+                if dissent.get(party):
+                    entry["votes_with_dissent"] += 1
+                    entry["dissenting_ballots"] += len(dissent[party])
+        for entry in summary.values():
+            entry["average_rice_index"] = entry.pop("rice_total") / entry["votes"]
+        return summary
+
+    def least_cohesive_votes(self, votes: range, party: Optional[str] = None, limit: int = 10) -> List[Tuple[MatrixVote, PartyTally]]:
+        """Votes where a party (any party by default) was most divided."""
+        wanted = party.casefold() if party else None
+        ranked = []
+        for row in votes:
+            for index, tally in self.party_tallies(row).items():
+                if not self._party_line[index] or tally.rice_index is None or tally.cast < 2:
+                    continue
+                if wanted and tally.party.casefold() != wanted:
+                    continue
+                ranked.append((tally.rice_index, -tally.cast, row, tally))
+        ranked.sort(key=lambda item: item[:3])
+        return [(self.votes[row], tally) for _, _, row, tally in ranked[:limit]]
+
+    def mp_records(self, votes: range, party: Optional[str] = None) -> List[MPVotingRecord]:
+        """
+        Participation and party-line statistics for every MP sitting during ``votes``.
+
+        Args:
+            votes: Row range (see :meth:`vote_range`)
+            party: Only MPs who mostly sat with this party
+
+        Returns:
+            One record per MP with at least one eligible vote
+        """
+        records: Dict[int, MPVotingRecord] = {}
+        for column in range(self.n_mps):
+            positions = self.column(column)[votes.start:votes.stop].translate(POSITION_OF)
+            eligible = len(positions) - positions.count(NOT_MEMBER)
+            if not eligible:
+                continue
+            yea, nay = positions.count(YEA), positions.count(NAY)
+            records[column] = MPVotingRecord(
+                mp=self.mps[column],
+                party=self.party_of(column, votes),
+                eligible=eligible,
+                yea=yea,
+                nay=nay,
+                paired=positions.count(PAIRED),
+                absent=positions.count(ABSENT),
+                party_line_votes=yea + nay,
+            )
+
+        # Dissent is rare, so only dissenters and MPs without a party line to follow
+        # (ties, independents) are located cell by cell
+        for row in votes:
+            tallies = self.party_tallies(row)
+            for columns in self.dissenters(row, tallies).values():
+                for column in columns:
+                    records[column].broke_ranks += 1
+            cells = self.vote_row(row)
+            for index, tally in tallies.items():
+                if tally.majority is not None and self._party_line[index]:
+                    continue
+                for code in (index << PARTY_SHIFT | YEA, index << PARTY_SHIFT | NAY):
+                    needle = bytes([code])
+                    position = cells.find(needle)
+                    while position >= 0:
+                        records[position].party_line_votes -= 1
+                        position = cells.find(needle, position + 1)
+
+        result = list(records.values())
+        if party:
+            wanted = party.casefold()
+            result = [record for record in result if (record.party or "").casefold() == wanted]
+        return result
+
+    def _bitsets(self, column: int, votes: range) -> Tuple[int, int]:
+        cells = self.column(column)[votes.start:votes.stop]
+        if not cells:
+            return 0, 0
+        return int(cells.translate(YEA_BITS), 2), int(cells.translate(NAY_BITS), 2)
+
+    def similarity(self, first: int, second: int, votes: range) -> SimilarityPair:
+        """Agreement between two MPs on the votes both cast."""
+        yea_a, nay_a = self._bitsets(first, votes)
+        yea_b, nay_b = self._bitsets(second, votes)
+        return SimilarityPair(
+            self.mps[first], self.mps[second],
+            self.party_of(first, votes), self.party_of(second, votes),
+            agreed=((yea_a & yea_b) | (nay_a & nay_b)).bit_count(),
+            shared_votes=((yea_a | nay_a) & (yea_b | nay_b)).bit_count(),
+        )
+
+    def similar_pairs(
+        self,
+        votes: range,
+        mp: Optional[int] = None,
+        party: Optional[str] = None,
+        cross_party: bool = False,
+        min_shared: int = 10,
+        limit: int = 20,
+        least: bool = False,
+    ) -> List[SimilarityPair]:
+        """
+        Rank MP pairs by how often they voted the same way.
+
+        Args:
+            votes: Row range (see :meth:`vote_range`)
+            mp: Only pairs including this MP column
+            party: Only MPs who mostly sat with this party
+            cross_party: Only pairs of MPs from different parties
+            min_shared: Minimum votes both MPs cast
+            limit: Maximum pairs
+            least: Rank by lowest similarity instead
+
+        Returns:
+            Pairs ordered by similarity (then shared votes)
+        """
+        wanted = party.casefold() if party else None
+        members = []
+        for column in range(self.n_mps):
+            yea, nay = self._bitsets(column, votes)
+            if (yea | nay).bit_count() < min_shared:
+                continue
+            member_party = self.party_of(column, votes)
+            if wanted and column != mp and (member_party or "").casefold() != wanted:
+                continue
+            members.append((column, member_party, yea, nay, yea | nay))
+
+        scored = []
+        if mp is not None:
+            anchors = [member for member in members if member[0] == mp]
+            if not anchors:
+                return []
+            candidate_pairs = ((anchors[0], other) for other in members if other[0] != mp)
+        else:
+            candidate_pairs = (
+                (members[i], members[j]) for i in range(len(members)) for j in range(i + 1, len(members))
+            )
+        for (col_a, party_a, yea_a, nay_a, cast_a), (col_b, party_b, yea_b, nay_b, cast_b) in candidate_pairs:
+            if cross_party and party_a == party_b:
+                continue
+            shared = (cast_a & cast_b).bit_count()
+            if shared < min_shared:
+                continue
+            agreed = ((yea_a & yea_b) | (nay_a & nay_b)).bit_count()
+            scored.append((agreed / shared, shared, col_a, col_b, party_a, party_b, agreed))
+
+        scored.sort(key=lambda item: (item[0], item[1]) if least else (-item[0], -item[1]))
+        return [
+            SimilarityPair(self.mps[a], self.mps[b], party_a, party_b, agreed, shared)
+            for _, shared, a, b, party_a, party_b, agreed in scored[:limit]
+        ]
+
+
+def build_ballot_matrix(
+    votes: Iterable[MatrixVote],
+    mps: Iterable[MatrixMP],
+    ballots: Iterable[Tuple[int, int, str, Optional[str]]],
+    terms: Iterable[Tuple[int, str, Optional[str], Optional[str]]] = (),
+    *,
+    path: Path = DEFAULT_MATRIX_PATH,
+) -> BallotMatrix:
+    """Assemble the matrix from extracted rows and persist it."""
+    matrix = BallotMatrix.build(votes, mps, ballots, terms)
+    matrix.save(path)
+    return matrix
+
@@ -3,14 +3,136 @@ from __future__ import annotations
 
 import csv
 import io
-from typing import Any, Dict, List, Optional
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
 from fedmcp.http import RateLimitedSession
+from fedmcp.metrics import metrics
 
 
 BASE_URL = "https://www.ourcommons.ca/proactivedisclosure/en/members"
 
+# Local append-only archive of quarterly expenditure CSVs
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "expenditures"
+
+# First fiscal year backfilled by default (FY 2020-2021)
+FIRST_FISCAL_YEAR = 2021
+
+# Open (current/previous) quarters are re-fetched after this many hours
+OPEN_QUARTER_REFRESH_HOURS = 24
+
+Quarter = Tuple[int, int]
+
+
+def fiscal_quarter_for(day: Optional[date] = None) -> Quarter:
+    """Return (fiscal_year, quarter) for a date.
+
+    The federal fiscal year runs April-March and is named after the year it ends,
+    so 2025-05-01 is FY 2026 Q1 and 2026-02-01 is FY 2026 Q4.
+    """
+    day = day or date.today()
+    if day.month >= 4:
+        return day.year + 1, (day.month - 4) // 3 + 1
+    return day.year, 4
+
+
+def previous_quarter(fiscal_year: int, quarter: int) -> Quarter:
+    """Return the fiscal quarter before (fiscal_year, quarter)."""
+    if quarter == 1:
+        return fiscal_year - 1, 4
+    return fiscal_year, quarter - 1
+
+
+def quarter_range(start: Quarter, end: Quarter) -> List[Quarter]:
+    """All fiscal quarters from start to end inclusive, in chronological order."""
+    quarters = []
+    fiscal_year, quarter = start
+    while (fiscal_year, quarter) <= end:
+        quarters.append((fiscal_year, quarter))
+        if quarter == 4:
+            fiscal_year, quarter = fiscal_year + 1, 1
+        else:
+            quarter += 1
+    return quarters
+
+
+def recent_quarters(count: int, day: Optional[date] = None) -> List[Quarter]:
+    """The last ``count`` fiscal quarters up to and including the current one."""
+    quarters = [fiscal_quarter_for(day)]
+    while len(quarters) < count:
+        quarters.append(previous_quarter(*quarters[-1]))
+    return list(reversed(quarters))
+
+
+class ExpenditureArchive:
+    """Append-only on-disk archive of quarterly expenditure CSVs keyed by (fiscal_year, quarter).
+
+    Closed quarters are written once and never re-fetched. The current and
+    previous fiscal quarters are still being published/revised, so they are
+    considered stale after ``refresh_hours``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        refresh_hours: float = OPEN_QUARTER_REFRESH_HOURS,
+    ) -> None:
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh_hours = refresh_hours
+
+    def path(self, fiscal_year: int, quarter: int) -> Path:
+        """CSV path for a quarter."""
+        return self.cache_dir / f"{fiscal_year}-q{quarter}.csv"
+
+    def has(self, fiscal_year: int, quarter: int) -> bool:
+        """Check whether a quarter has been archived."""
+        return self.path(fiscal_year, quarter).exists()
+
+    def is_open(self, fiscal_year: int, quarter: int, today: Optional[date] = None) -> bool:
+        """Open quarters (current or previous) may still change upstream."""
+        current = fiscal_quarter_for(today)
+        return (fiscal_year, quarter) >= previous_quarter(*current)
+
+    def is_stale(self, fiscal_year: int, quarter: int) -> bool:
+        """True if the quarter is missing, or open and older than the refresh window."""
+        path = self.path(fiscal_year, quarter)
+        if not path.exists():
+            return True
+        if not self.is_open(fiscal_year, quarter):
+            return False
+        age_hours = (datetime.now().timestamp() - path.stat().st_mtime) / 3600
+        return age_hours > self.refresh_hours
+
+    def read(self, fiscal_year: int, quarter: int) -> Optional[str]:
+        """Return archived CSV text for a quarter, or None."""
+        path = self.path(fiscal_year, quarter)
+        if not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def write(self, fiscal_year: int, quarter: int, csv_text: str) -> None:
+        """Atomically store CSV text for a quarter."""
+        path = self.path(fiscal_year, quarter)
+        tmp_path = path.with_suffix(".csv.tmp")
+        tmp_path.write_text(csv_text, encoding="utf-8")
+        tmp_path.replace(path)
+
+    def quarters(self) -> List[Quarter]:
+        """All archived quarters in chronological order."""
+        quarters = []
+        for path in self.cache_dir.glob("*-q*.csv"):
+            match = re.fullmatch(r"(\d{4})-q([1-4])", path.stem)
+            if match:
+                quarters.append((int(match.group(1)), int(match.group(2))))
+        return sorted(quarters)
+
 
 @dataclass
 class MPExpenditure:
@@ -50,9 +172,32 @@ class MPExpenditure:
 class MPExpenditureClient:
     """Client for fetching MP expenditure data from House of Commons."""
 
-    def __init__(self, *, session: Optional[RateLimitedSession] = None) -> None:
+    def __init__(
+        self,
+        *,
+        session: Optional[RateLimitedSession] = None,
+        cache_dir: Optional[Path] = None,
+        use_archive: bool = True,
+    ) -> None:
+        """
+        Initialize the expenditure client.
+
+        Args:
+            session: Optional HTTP session
+            cache_dir: Directory for the quarterly CSV archive
+            use_archive: If False, always fetch from ourcommons.ca (no disk archive)
+        """
         self.session = session or RateLimitedSession()
         self.base_url = BASE_URL
+        self.archive = ExpenditureArchive(cache_dir) if use_archive else None
+
+        # Parsed quarters kept in memory for the life of the client
+        self._summaries: Dict[Quarter, List[MPExpenditure]] = {}
+        # Quarters that failed to fetch (usually not yet published) -> time of failure
+        self._unavailable: Dict[Quarter, float] = {}
+        self._lock = threading.Lock()
+        # One lock per quarter so concurrent callers share a single download
+        self._quarter_locks: Dict[Quarter, threading.Lock] = {}
 
     def _parse_amount(self, value: str) -> float:
         """Parse monetary amount from string, handling empty values."""
@@ -80,7 +225,71 @@ class MPExpenditureClient:
 
         Returns:
             List of MPExpenditure objects
+
+        Quarters are served from memory or the local archive when available;
+        only missing quarters, and open quarters past their refresh window, are
+        fetched from ourcommons.ca.
         """
+        if summary_id:
+            csv_text = self._fetch_csv(fiscal_year, quarter, summary_id)
+            return self._parse_csv(csv_text, fiscal_year, quarter)
+
+        key = (fiscal_year, quarter)
+        with self._lock:
+            quarter_lock = self._quarter_locks.setdefault(key, threading.Lock())
+        with quarter_lock:
+            return self._load_quarter(fiscal_year, quarter)
+
+    def _load_quarter(self, fiscal_year: int, quarter: int) -> List[MPExpenditure]:
+        """Serve a quarter from memory, the archive, or ourcommons.ca (caller holds the quarter lock)."""
+        key = (fiscal_year, quarter)
+        stale = self.archive.is_stale(fiscal_year, quarter) if self.archive else True
+
+        with self._lock:
+            cached = self._summaries.get(key)
+        if cached is not None and (self.archive is None or not stale):
+            metrics.record_cache("expenditure", hit=True)
+            return cached
+
+        metrics.record_cache("expenditure", hit=False)
+        start = time.perf_counter()
+        if self.archive and not stale:
+            csv_text = self.archive.read(fiscal_year, quarter)
+        else:
+            with self._lock:
+                failed_at = self._unavailable.get(key)
+            archived = self.archive.read(fiscal_year, quarter) if self.archive else None
+            recently_failed = (
+                failed_at is not None
+                and (datetime.now().timestamp() - failed_at) / 3600 < OPEN_QUARTER_REFRESH_HOURS
+            )
+            if recently_failed:
+                # Don't hammer ourcommons.ca for quarters that are not published yet
+                if archived is None:
+                    raise ValueError(f"Expenditure data for FY {fiscal_year} Q{quarter} is not available yet")
+                csv_text = archived
+            else:
+                try:
+                    csv_text = self._fetch_csv(fiscal_year, quarter)
+                except Exception:
+                    with self._lock:
+                        self._unavailable[key] = datetime.now().timestamp()
+                    # Serve the last archived copy of an open quarter if the refresh fails
+                    csv_text = archived
+                    if csv_text is None:
+                        raise
+                else:
+                    if self.archive:
+                        self.archive.write(fiscal_year, quarter, csv_text)
+
+        summary = self._parse_csv(csv_text, fiscal_year, quarter)
+        with self._lock:
+            self._summaries[key] = summary
+        metrics.record_dataset_load("expenditure", time.perf_counter() - start)
+        return summary
+
+    def _fetch_csv(self, fiscal_year: int, quarter: int, summary_id: Optional[str] = None) -> str:
+        """Download the CSV text for a quarter from ourcommons.ca."""
         # If summary_id not provided, fetch the main page to get the CSV UUID
         if not summary_id:
             # Fetch the quarter page to extract the CSV download UUID
@@ -90,7 +299,6 @@ class MPExpenditureClient:
 
             # Extract CSV UUID from the page HTML
             # Look for pattern: /proactivedisclosure/en/members/<UUID>/csv
-            import re
             match = re.search(r'/proactivedisclosure/en/members/([a-f0-9\-]{36})/csv', page_response.text)
             if match:
                 csv_uuid = match.group(1)
@@ -106,10 +314,117 @@ class MPExpenditureClient:
         response = self.session.get(url)
         response.raise_for_status()
 
-        # Parse CSV
         # Note: CSV may have UTF-8 BOM, decode with utf-8-sig
-        csv_text = response.content.decode('utf-8-sig')
-        return self._parse_csv(csv_text, fiscal_year, quarter)
+        return response.content.decode('utf-8-sig')
+
+    def backfill(
+        self,
+        quarters: Optional[Iterable[Quarter]] = None,
+        max_workers: int = 4,
+    ) -> Dict[Quarter, Optional[str]]:
+        """
+        Load many quarters concurrently, fetching only those missing or stale.
+
+        Args:
+            quarters: (fiscal_year, quarter) pairs (default: FY 2021 Q1 to the current quarter)
+            max_workers: Maximum concurrent downloads
+
+        Returns:
+            Dict mapping each quarter to None on success or an error message
+            (e.g. for quarters that have not been published yet)
+        """
+        if quarters is None:
+            quarters = quarter_range((FIRST_FISCAL_YEAR, 1), fiscal_quarter_for())
+        quarters = list(quarters)
+
+        results: Dict[Quarter, Optional[str]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_quarterly_summary, fiscal_year, quarter): (fiscal_year, quarter)
+                for fiscal_year, quarter in quarters
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                    results[key] = None
+                except Exception as e:
+                    results[key] = str(e)
+        return {key: results[key] for key in quarters}
+
+    def available_quarters(self) -> List[Quarter]:
+        """Quarters available locally (archived or loaded in memory)."""
+        quarters = set(self._summaries)
+        if self.archive:
+            quarters.update(self.archive.quarters())
+        return sorted(quarters)
+
+    def get_mp_series(
+        self,
+        name: str,
+        quarters: Optional[Iterable[Quarter]] = None,
+    ) -> List[MPExpenditure]:
+        """
+        Get an MP's quarterly expenditures across many quarters.
+
+        Args:
+            name: Full or partial MP name (case-insensitive)
+            quarters: Quarters to include (default: every locally available quarter)
+
+        Returns:
+            Matching MPExpenditure rows in chronological order
+        """
+        name_lower = name.lower()
+        series = []
+        for fiscal_year, quarter in self._series_quarters(quarters):
+            series.extend(
+                exp for exp in self.get_quarterly_summary(fiscal_year, quarter)
+                if name_lower in exp.name.lower()
+            )
+        return series
+
+    def get_caucus_series(
+        self,
+        caucus: str,
+        quarters: Optional[Iterable[Quarter]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a caucus's aggregate expenditures per quarter.
+
+        Args:
+            caucus: Party/caucus name (case-insensitive substring)
+            quarters: Quarters to include (default: every locally available quarter)
+
+        Returns:
+            One dict per quarter with member count and category totals
+        """
+        caucus_lower = caucus.lower()
+        series = []
+        for fiscal_year, quarter in self._series_quarters(quarters):
+            members = [
+                exp for exp in self.get_quarterly_summary(fiscal_year, quarter)
+                if caucus_lower in exp.caucus.lower()
+            ]
+            if not members:
+                continue
+            series.append({
+                'fiscal_year': fiscal_year,
+                'quarter': quarter,
+                'count': len(members),
+                'salaries': sum(e.salaries for e in members),
+                'travel': sum(e.travel for e in members),
+                'hospitality': sum(e.hospitality for e in members),
+                'contracts': sum(e.contracts for e in members),
+                'total': sum(e.total for e in members),
+            })
+        return series
+
+    def _series_quarters(self, quarters: Optional[Iterable[Quarter]]) -> List[Quarter]:
+        """Resolve the quarters for a series query, skipping unpublished ones."""
+        if quarters is None:
+            return self.available_quarters()
+        failures = self.backfill(quarters)
+        return [key for key, error in failures.items() if error is None]
 
     def _parse_csv(self, csv_text: str, fiscal_year: int, quarter: int) -> List[MPExpenditure]:
         """Parse CSV text into list of MPExpenditure objects."""
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 
 from fedmcp.http import RateLimitedSession
+from fedmcp.metrics import tracked_load
 
 
 BASE_URL = "https://open.canada.ca/data/en/dataset/d8f85d91-7dec-4fd1-8055-483b77225d8b"
@@ -127,6 +128,7 @@ class FederalContractsClient:
         except ValueError:
             return 0.0
 
+    @tracked_load("contracts", "_contracts")
     def _load_contracts(self) -> List[FederalContract]:
         """Load contract data from cache or download if needed."""
         if self._contracts is not None:
@@ -2,15 +2,30 @@
 from __future__ import annotations
 
 import re
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 from xml.etree import ElementTree as ET
 
 from fedmcp.http import RateLimitedSession
+from fedmcp.metrics import metrics
 
 
 BASE_URL = "https://www.ourcommons.ca/petitions/en/Petition/Search"
 
+# How long a downloaded petitions feed is reused before it is refreshed
+DEFAULT_CACHE_TTL = 3600
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens for the petition text index."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
 
 @dataclass
 class PetitionSponsor:
@@ -96,12 +111,237 @@ class Petition:
         }
 
 
+class PetitionIndex:
+    """In-memory indexes over one downloaded petitions feed.
+
+    Petitions are kept in feed order; every index maps to positions in that
+    list so filtered results preserve the original ordering.
+    """
+
+    def __init__(self, petitions: List[Petition]) -> None:
+        self.petitions = petitions
+        self.by_number: Dict[str, int] = {}
+        self.by_sponsor: Dict[str, List[int]] = {}
+        self.by_status: Dict[str, List[int]] = {}
+        self.by_term: Dict[str, List[int]] = {}
+        self.tokens: Dict[str, Set[int]] = {}
+
+        for position, petition in enumerate(petitions):
+            self.by_number[petition.petition_number.lower()] = position
+            if petition.sponsor:
+                self.by_sponsor.setdefault(petition.sponsor.full_name.lower(), []).append(position)
+            self.by_status.setdefault(petition.status_name.lower(), []).append(position)
+            for term in petition.index_terms:
+                self.by_term.setdefault(term.lower(), []).append(position)
+
+            text_tokens = set(_tokenize(petition.title))
+            text_tokens.update(_tokenize(petition.prayer_text))
+            text_tokens.update(_tokenize(petition.grievances_text))
+            for term in petition.index_terms:
+                text_tokens.update(_tokenize(term))
+            for token in text_tokens:
+                self.tokens.setdefault(token, set()).add(position)
+
+        self.vocabulary = sorted(self.tokens)
+
+    def select(self, positions: Iterable[int]) -> List[Petition]:
+        """Petitions at the given positions, in feed order."""
+        return [self.petitions[i] for i in sorted(set(positions))]
+
+    def get(self, petition_number: str) -> Optional[Petition]:
+        """Look up a petition by number (case-insensitive)."""
+        position = self.by_number.get(petition_number.lower())
+        return self.petitions[position] if position is not None else None
+
+    def sponsor_positions(self, sponsor_name: str) -> Set[int]:
+        """Positions of petitions whose sponsor name contains sponsor_name.
+
+        Only the distinct sponsor names (a few hundred MPs) are scanned, not the
+        petitions themselves.
+        """
+        sponsor_lower = sponsor_name.lower()
+        positions: Set[int] = set()
+        for full_name, sponsor_positions in self.by_sponsor.items():
+            if sponsor_lower in full_name:
+                positions.update(sponsor_positions)
+        return positions
+
+    def status_positions(self, status: str) -> Set[int]:
+        """Positions of petitions whose status name contains status."""
+        status_lower = status.lower()
+        positions: Set[int] = set()
+        for name, status_positions in self.by_status.items():
+            if status_lower in name:
+                positions.update(status_positions)
+        return positions
+
+    def term_positions(self, topic: str) -> Set[int]:
+        """Positions of petitions with an index term containing topic."""
+        topic_lower = topic.lower()
+        positions: Set[int] = set()
+        for term, term_positions in self.by_term.items():
+            if topic_lower in term:
+                positions.update(term_positions)
+        return positions
+
+    def keyword_positions(self, keyword: str) -> Set[int]:
+        """Positions of petitions whose text contains keyword (case-insensitive substring).
+
+        Every word of keyword must occur inside some token of a matching
+        petition ("care" matches "healthcare"), so candidates come from scanning
+        the distinct tokens rather than the petition texts. Multi-word keywords
+        are then verified as a phrase against the candidate petitions only.
+        """
+        keyword_lower = keyword.lower()
+        words = _tokenize(keyword)
+        if not words:
+            return {
+                i for i, petition in enumerate(self.petitions)
+                if _petition_contains(petition, keyword_lower)
+            }
+
+        candidates: Optional[Set[int]] = None
+        for word in words:
+            matches: Set[int] = set()
+            for token in self.vocabulary:
+                if word in token:
+                    matches |= self.tokens[token]
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return set()
+
+        if len(words) == 1:
+            return candidates
+
+        return {
+            i for i in candidates
+            if _petition_contains(self.petitions[i], keyword_lower)
+        }
+
+
+def _petition_contains(petition: Petition, keyword_lower: str) -> bool:
+    """Substring match over the searchable petition fields."""
+    return (
+        keyword_lower in petition.title.lower()
+        or (petition.prayer_text is not None and keyword_lower in petition.prayer_text.lower())
+        or (petition.grievances_text is not None and keyword_lower in petition.grievances_text.lower())
+        or any(keyword_lower in term.lower() for term in petition.index_terms)
+    )
+
+
 class PetitionsClient:
-    """Client for fetching House of Commons petition data."""
+    """Client for fetching House of Commons petition data.
+
+    Each category feed is downloaded and parsed at most once per ``cache_ttl``
+    seconds and indexed by number, sponsor, status, index term and text tokens,
+    so lookups no longer re-download the full XML feed per call.
+    """
 
-    def __init__(self, *, session: Optional[RateLimitedSession] = None) -> None:
+    def __init__(
+        self,
+        *,
+        session: Optional[RateLimitedSession] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """
+        Initialize the petitions client.
+
+        Args:
+            session: Optional HTTP session
+            cache_ttl: Seconds to reuse a downloaded feed before refreshing it
+        """
         self.session = session or RateLimitedSession()
         self.base_url = BASE_URL
+        self.cache_ttl = cache_ttl
+
+        # Per-category indexed feeds, download times and HTTP validators
+        self._stores: Dict[str, PetitionIndex] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        # One download per category at a time; concurrent callers wait for it
+        self._loading: Dict[str, threading.Lock] = {}
+
+    def _cached_index(self, category: str) -> Optional[PetitionIndex]:
+        """The category's index if it is within the TTL (call with ``self._lock`` held)."""
+        index = self._stores.get(category)
+        if index is not None and time.time() - self._fetched_at.get(category, 0.0) < self.cache_ttl:
+            metrics.record_cache("petitions", hit=True)
+            return index
+        return None
+
+    def _get_index(self, category: str = "All") -> PetitionIndex:
+        """Return the indexed feed for a category, refreshing it if the TTL expired.
+
+        The client lock only guards the cache entries: the feed is downloaded
+        and indexed outside it (so other categories and cached lookups are not
+        held up), then swapped in. A per-category lock makes concurrent misses
+        share one download: later callers wait and then find the fresh index.
+        """
+        with self._lock:
+            index = self._cached_index(category)
+            if index is not None:
+                return index
+            loading = self._loading.setdefault(category, threading.Lock())
+
+        with loading:
+            with self._lock:
+                index = self._cached_index(category)
+                if index is not None:
+                    return index
+                index = self._stores.get(category)
+                validators = self._validators.get(category, {}) if index is not None else {}
+            return self._download_index(category, index, validators)
+
+    def _download_index(
+        self,
+        category: str,
+        index: Optional[PetitionIndex],
+        validators: Dict[str, str],
+    ) -> PetitionIndex:
+        """Fetch (or revalidate) one category feed, index it and store it."""
+        params = {
+            'Category': category,
+            'output': 'xml'
+        }
+        headers = {}
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        start = time.perf_counter()
+        response = self.session.get(self.base_url, params=params, headers=headers)
+        if response.status_code == 304 and index is not None:
+            # Feed unchanged since the last download
+            metrics.record_cache("petitions", hit=True)
+            with self._lock:
+                self._fetched_at[category] = time.time()
+            return index
+        response.raise_for_status()
+
+        index = PetitionIndex(self._parse_xml(response.text))
+        metrics.record_cache("petitions", hit=False)
+        metrics.record_dataset_load("petitions", time.perf_counter() - start)
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+
+        with self._lock:
+            self._stores[category] = index
+            self._fetched_at[category] = time.time()
+            self._validators[category] = validators
+        return index
+
+    def refresh(self, category: Optional[str] = None) -> None:
+        """Force the next lookup to re-fetch one category (or all) from the feed."""
+        with self._lock:
+            if category is None:
+                self._fetched_at.clear()
+            else:
+                self._fetched_at.pop(category, None)
 
     def list_petitions(
         self,
@@ -118,19 +358,11 @@ class PetitionsClient:
         Returns:
             List of Petition objects
         """
-        params = {
-            'Category': category,
-            'output': 'xml'
-        }
-
-        response = self.session.get(self.base_url, params=params)
-        response.raise_for_status()
-
-        petitions = self._parse_xml(response.text)
+        petitions = self._get_index(category).petitions
 
         if limit:
             return petitions[:limit]
-        return petitions
+        return list(petitions)
 
     def search_petitions(
         self,
@@ -151,28 +383,18 @@ class PetitionsClient:
         Returns:
             List of matching Petition objects
         """
-        # Fetch all petitions in the category
-        all_petitions = self.list_petitions(category=category)
-
-        # Apply client-side filtering
-        results = all_petitions
-
-        if keyword:
-            keyword_lower = keyword.lower()
-            results = [
-                p for p in results
-                if (keyword_lower in p.title.lower()
-                    or (p.prayer_text and keyword_lower in p.prayer_text.lower())
-                    or (p.grievances_text and keyword_lower in p.grievances_text.lower())
-                    or any(keyword_lower in term.lower() for term in p.index_terms))
-            ]
-
-        if sponsor_name:
-            sponsor_lower = sponsor_name.lower()
-            results = [
-                p for p in results
-                if p.sponsor and sponsor_lower in p.sponsor.full_name.lower()
-            ]
+        index = self._get_index(category)
+
+        if not keyword and not sponsor_name:
+            results = list(index.petitions)
+        else:
+            positions: Optional[Set[int]] = None
+            if sponsor_name:
+                positions = index.sponsor_positions(sponsor_name)
+            if keyword:
+                keyword_matches = index.keyword_positions(keyword)
+                positions = keyword_matches if positions is None else positions & keyword_matches
+            results = index.select(positions or ())
 
         if limit:
             return results[:limit]
@@ -188,14 +410,7 @@ class PetitionsClient:
         Returns:
             Petition object if found, None otherwise
         """
-        # Fetch all petitions and filter
-        all_petitions = self.list_petitions()
-
-        for petition in all_petitions:
-            if petition.petition_number.lower() == petition_number.lower():
-                return petition
-
-        return None
+        return self._get_index().get(petition_number)
 
     def search_by_topic(
         self,
@@ -214,14 +429,16 @@ class PetitionsClient:
         Returns:
             List of matching Petition objects
         """
-        all_petitions = self.list_petitions(category=category)
+        index = self._get_index(category)
         topic_lower = topic.lower()
 
-        matching = [
-            p for p in all_petitions
-            if any(topic_lower in term.lower() for term in p.index_terms)
-            or topic_lower in p.title.lower()
-        ]
+        # Index terms via the term index; titles via the token index, verified by substring
+        positions = index.term_positions(topic)
+        positions |= {
+            i for i in index.keyword_positions(topic)
+            if topic_lower in index.petitions[i].title.lower()
+        }
+        matching = index.select(positions)
 
         if limit:
             return matching[:limit]
@@ -242,7 +459,31 @@ class PetitionsClient:
         Returns:
             List of Petition objects sponsored by the MP
         """
-        return self.search_petitions(sponsor_name=mp_name, category=category)
+        index = self._get_index(category)
+        return index.select(index.sponsor_positions(mp_name))
+
+    def get_petitions_by_status(
+        self,
+        status: str,
+        category: str = "All",
+        limit: Optional[int] = None
+    ) -> List[Petition]:
+        """
+        Get petitions whose status name contains a term (e.g., "Government response tabled").
+
+        Args:
+            status: Status name (full or partial, case-insensitive)
+            category: One of "All", "Open", "Closed", "Responses"
+            limit: Maximum number of results
+
+        Returns:
+            List of matching Petition objects
+        """
+        index = self._get_index(category)
+        results = index.select(index.status_positions(status))
+        if limit:
+            return results[:limit]
+        return results
 
     def _parse_xml(self, xml_text: str) -> List[Petition]:
         """Parse petition XML into list of Petition objects."""
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fedmcp.http import RateLimitedSession
+from fedmcp.metrics import tracked_load
 
 
 # Direct ZIP download URLs from Elections Canada
@@ -131,6 +132,7 @@ class PoliticalContributionsClient:
         except ValueError:
             return 0.0
 
+    @tracked_load("political_contributions", "_contributions")
     def _load_contributions(self) -> List[PoliticalContribution]:
         """Load contribution data from cache or download if needed."""
         if self._contributions is not None:
@@ -0,0 +1,487 @@
+"""Cross-dataset entity resolution for contractors, grant recipients, donors and lobbying clients.
+
+The financial datasets (federal contracts, grants and contributions, political
+contributions and the lobbying registry) each spell organization names their own
+way: "Acme Inc.", "ACME INCORPORATED", "Acmé Inc" and "The Acme Company" all refer
+to the same entity. This module normalizes those names into comparison keys,
+groups records that share a key under a canonical entity id, and keeps a
+persisted entity -> records index so cross-dataset tools can do one lookup per
+dataset instead of a substring scan over every row.
+"""
+from __future__ import annotations
+
+import bisect
+import difflib
+import gzip
+import hashlib
+import json
+import re
+import unicodedata
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from fedmcp.metrics import tracked_load
+
+
+# Cache directory for the persisted entity index
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "entities"
+
+# Bump when normalization rules change so stale indexes are rebuilt
+INDEX_VERSION = 1
+
+# Dataset names, in the order tools usually report them
+DATASETS = (
+    "contributions",
+    "lobbying_registrations",
+    "lobbying_communications",
+    "contracts",
+    "grants",
+)
+
+# Legal-form variants mapped to a single canonical token
+LEGAL_SUFFIXES = {
+    "incorporated": "inc",
+    "incorporee": "inc",
+    "inc": "inc",
+    "limited": "ltd",
+    "limitee": "ltd",
+    "ltee": "ltd",
+    "ltd": "ltd",
+    "corporation": "corp",
+    "corp": "corp",
+    "company": "co",
+    "compagnie": "co",
+    "cie": "co",
+    "co": "co",
+    "llc": "llc",
+    "llp": "llp",
+    "lp": "lp",
+    "plc": "plc",
+    "ulc": "ulc",
+    "gmbh": "gmbh",
+    "sa": "sa",
+    "sarl": "sarl",
+    "senc": "senc",
+    "sencrl": "sencrl",
+    "srl": "srl",
+}
+
+# Leading tokens that carry no identity ("The Acme Company")
+LEADING_STOPWORDS = {"the", "la", "le", "les", "l"}
+
+# Minimum similarity for the fuzzy (blocked) fallback
+FUZZY_THRESHOLD = 0.88
+
+
+def normalize_entity_name(name: Optional[str]) -> str:
+    """Normalize an organization or person name for comparison.
+
+    Strips accents, lowercases, joins dotted abbreviations ("S.N.C." -> "snc"),
+    turns remaining punctuation into spaces and canonicalizes legal-form words
+    ("Incorporated" -> "inc", "Limitée" -> "ltd").
+
+    Args:
+        name: Raw name as it appears in a dataset
+
+    Returns:
+        Space-separated normalized tokens (empty string for blank input)
+    """
+    if not name:
+        return ""
+
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = text.replace("&", " and ")
+    text = re.sub(r"[.'’`]", "", text)
+    text = re.sub(r"[^\w]+", " ", text)
+
+    tokens = [LEGAL_SUFFIXES.get(token, token) for token in text.split()]
+    return " ".join(tokens)
+
+
+def entity_key(name: Optional[str]) -> str:
+    """Build the blocking/grouping key for a name.
+
+    The key is the normalized name with leading articles and trailing legal-form
+    tokens removed, so "The Acme Company Ltd." and "ACME" share the key "acme".
+    Names that consist only of legal-form words keep their normalized form.
+    """
+    tokens = normalize_entity_name(name).split()
+    core = list(tokens)
+    while core and core[0] in LEADING_STOPWORDS:
+        core.pop(0)
+    while core and core[-1] in LEGAL_SUFFIXES.values():
+        core.pop()
+    return " ".join(core or tokens)
+
+
+def entity_id_for_key(key: str) -> str:
+    """Return the stable canonical entity id for a key."""
+    return "ent-" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def _block_key(key: str) -> str:
+    """Coarse blocking key used to limit fuzzy comparisons."""
+    return key[:3]
+
+
+def _fingerprint(names: Sequence[str]) -> str:
+    """Cheap content fingerprint of a dataset's name column."""
+    crc = 0
+    for name in names:
+        crc = zlib.crc32((name or "").encode("utf-8", "replace"), crc)
+        crc = zlib.crc32(b"\x00", crc)
+    return f"{len(names)}:{crc:08x}"
+
+
+@dataclass
+class Entity:
+    """A canonical entity and the dataset records attributed to it."""
+
+    entity_id: str
+    key: str
+    name: str
+    records: Dict[str, List[int]] = field(default_factory=dict)
+
+    def record_count(self, dataset: Optional[str] = None) -> int:
+        """Number of records attributed to this entity (optionally for one dataset)."""
+        if dataset:
+            return len(self.records.get(dataset, []))
+        return sum(len(positions) for positions in self.records.values())
+
+
+@dataclass
+class EntityMatch:
+    """Result of resolving a name across datasets."""
+
+    query: str
+    entities: List[Entity]
+    records: Dict[str, List[Any]]
+    fuzzy: bool = False
+
+    @property
+    def entity_names(self) -> List[str]:
+        """Display names of the matched entities."""
+        return [entity.name for entity in self.entities]
+
+
+class EntityIndex:
+    """In-memory entity -> records index with token and blocking lookups.
+
+    Records are referenced by their position in each dataset's loaded list, so an
+    index is only valid for the dataset contents it was built from; the stored
+    fingerprints detect when a dataset has been re-downloaded.
+    """
+
+    def __init__(self) -> None:
+        self.entities: Dict[str, Entity] = {}
+        self.fingerprints: Dict[str, str] = {}
+        self._by_key: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._blocks: Dict[str, List[str]] = {}
+
+    @classmethod
+    def build(cls, names_by_dataset: Dict[str, Sequence[str]]) -> "EntityIndex":
+        """Build an index from each dataset's name column.
+
+        Args:
+            names_by_dataset: Mapping of dataset name to the list of entity names,
+                in the same order as the dataset's loaded records
+
+        Returns:
+            Populated EntityIndex
+        """
+        index = cls()
+        key_cache: Dict[str, str] = {}
+
+        for dataset, names in names_by_dataset.items():
+            index.fingerprints[dataset] = _fingerprint(names)
+            for position, raw_name in enumerate(names):
+                if not raw_name or raw_name in ("N/A", "null"):
+                    continue
+                key = key_cache.get(raw_name)
+                if key is None:
+                    key = entity_key(raw_name)
+                    key_cache[raw_name] = key
+                if not key:
+                    continue
+
+                entity_id = index._by_key.get(key)
+                if entity_id is None:
+                    entity_id = entity_id_for_key(key)
+                    index._by_key[key] = entity_id
+                    index.entities[entity_id] = Entity(
+                        entity_id=entity_id, key=key, name=raw_name.strip()
+                    )
+                index.entities[entity_id].records.setdefault(dataset, []).append(position)
+
+        index._build_lookups()
+        return index
+
+    def _build_lookups(self) -> None:
+        """(Re)build token postings, sorted vocabulary and fuzzy blocks."""
+        self._by_key = {entity.key: entity_id for entity_id, entity in self.entities.items()}
+        self._postings = {}
+        self._blocks = {}
+        for entity_id, entity in self.entities.items():
+            for token in set(entity.key.split()):
+                self._postings.setdefault(token, set()).add(entity_id)
+            self._blocks.setdefault(_block_key(entity.key), []).append(entity_id)
+        self._vocabulary = sorted(self._postings)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Write the index to a gzipped JSON file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": INDEX_VERSION,
+            "fingerprints": self.fingerprints,
+            "entities": [
+                [entity.entity_id, entity.key, entity.name, entity.records]
+                for entity in self.entities.values()
+            ],
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["EntityIndex"]:
+        """Load an index written by :meth:`save`, or None if missing/outdated."""
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != INDEX_VERSION:
+            return None
+
+        index = cls()
+        index.fingerprints = payload.get("fingerprints", {})
+        for entity_id, key, name, records in payload.get("entities", []):
+            index.entities[entity_id] = Entity(entity_id=entity_id, key=key, name=name, records=records)
+        index._build_lookups()
+        return index
+
+    def matches_fingerprints(self, names_by_dataset: Dict[str, Sequence[str]]) -> bool:
+        """Check whether the index was built from exactly these dataset contents."""
+        return all(
+            self.fingerprints.get(dataset) == _fingerprint(names)
+            for dataset, names in names_by_dataset.items()
+        )
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def resolve(self, name: str) -> Tuple[List[Entity], bool]:
+        """Resolve a free-text name to canonical entities.
+
+        Resolution order:
+        1. Exact key match ("Acme Incorporated" -> key "acme")
+        2. Token match: every query token appears in the entity key, with the last
+           token treated as a prefix ("bombard" matches "bombardier")
+        3. Fuzzy fallback within the query's block for misspellings
+
+        Args:
+            name: Name to resolve
+
+        Returns:
+            Tuple of (matched entities sorted by record count, used_fuzzy_fallback)
+        """
+        key = entity_key(name)
+        if not key:
+            return [], False
+
+        entity_ids: Set[str] = set()
+        exact = self._by_key.get(key)
+        if exact:
+            entity_ids.add(exact)
+
+        tokens = key.split()
+        candidate_sets: List[Set[str]] = []
+        for token in tokens[:-1]:
+            candidate_sets.append(self._postings.get(token, set()))
+        candidate_sets.append(self._prefix_postings(tokens[-1]))
+        candidate_sets.sort(key=len)
+        token_matches = set(candidate_sets[0])
+        for candidates in candidate_sets[1:]:
+            if not token_matches:
+                break
+            token_matches &= candidates
+        entity_ids |= token_matches
+
+        fuzzy = False
+        if not entity_ids:
+            for entity_id in self._blocks.get(_block_key(key), []):
+                candidate_key = self.entities[entity_id].key
+                ratio = difflib.SequenceMatcher(None, key, candidate_key).ratio()
+                if ratio >= FUZZY_THRESHOLD:
+                    entity_ids.add(entity_id)
+            fuzzy = bool(entity_ids)
+
+        entities = [self.entities[entity_id] for entity_id in entity_ids]
+        entities.sort(key=lambda e: e.record_count(), reverse=True)
+        return entities, fuzzy
+
+    def _prefix_postings(self, prefix: str) -> Set[str]:
+        """Union of postings for every vocabulary token starting with prefix.
+
+        Very short prefixes fall back to an exact token match so a stray initial
+        does not expand to half the vocabulary.
+        """
+        if len(prefix) < 3:
+            return set(self._postings.get(prefix, set()))
+        result: Set[str] = set()
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            result |= self._postings[token]
+        return result
+
+    def positions(self, entities: Iterable[Entity], dataset: str) -> List[int]:
+        """Record positions in one dataset for a set of entities."""
+        positions: List[int] = []
+        for entity in entities:
+            positions.extend(entity.records.get(dataset, []))
+        return sorted(positions)
+
+
+class EntityResolver:
+    """Resolve names across the financial datasets using a persisted EntityIndex.
+
+    The first lookup loads every dataset (which the cross-dataset tools needed
+    anyway), then reuses the index from disk if its fingerprints still match or
+    rebuilds and saves it otherwise. Subsequent lookups are dictionary and
+    posting-list operations.
+    """
+
+    def __init__(
+        self,
+        *,
+        contracts_client: Any = None,
+        grants_client: Any = None,
+        contributions_client: Any = None,
+        lobbying_client: Any = None,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialize the resolver.
+
+        Args:
+            contracts_client: FederalContractsClient
+            grants_client: GrantsContributionsClient
+            contributions_client: PoliticalContributionsClient
+            lobbying_client: LobbyingRegistryClient
+            cache_dir: Directory for the persisted index
+        """
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.index_path = self.cache_dir / "entity_index.json.gz"
+
+        # dataset -> (record loader, name getter)
+        self._sources: Dict[str, Tuple[Callable[[], List[Any]], Callable[[Any], str]]] = {}
+        if contributions_client is not None:
+            self._sources["contributions"] = (
+                contributions_client._load_contributions, lambda c: c.contributor_name
+            )
+        if lobbying_client is not None:
+            self._sources["lobbying_registrations"] = (
+                lobbying_client._load_registrations, lambda r: r.client_org_name
+            )
+            self._sources["lobbying_communications"] = (
+                lobbying_client._load_communications, lambda c: c.client_org_name
+            )
+        if contracts_client is not None:
+            self._sources["contracts"] = (contracts_client._load_contracts, lambda c: c.vendor_name)
+        if grants_client is not None:
+            self._sources["grants"] = (grants_client._load_grants, lambda g: g.recipient_name)
+
+        self._index: Optional[EntityIndex] = None
+        self._records: Dict[str, List[Any]] = {}
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the index is built/loaded in this process."""
+        return self._index is not None
+
+    @tracked_load("entity_index", "_index")
+    def ensure_index(self) -> EntityIndex:
+        """Load datasets and return a valid index, rebuilding it if stale."""
+        if self._index is not None:
+            return self._index
+
+        names_by_dataset: Dict[str, List[str]] = {}
+        for dataset, (loader, get_name) in self._sources.items():
+            records = loader()
+            self._records[dataset] = records
+            names_by_dataset[dataset] = [get_name(record) for record in records]
+
+        index = EntityIndex.load(self.index_path)
+        if index is None or not index.matches_fingerprints(names_by_dataset):
+            print("Building cross-dataset entity index...")
+            index = EntityIndex.build(names_by_dataset)
+            index.save(self.index_path)
+            print(f"Indexed {len(index.entities):,} entities")
+
+        self._index = index
+        return index
+
+    def search(self, name: str, datasets: Optional[Iterable[str]] = None) -> EntityMatch:
+        """
+        Find every record attributed to the entities matching a name.
+
+        Args:
+            name: Organization or person name
+            datasets: Datasets to return records for (default: all configured)
+
+        Returns:
+            EntityMatch with matched entities and records per dataset, in source order
+        """
+        index = self.ensure_index()
+        entities, fuzzy = index.resolve(name)
+        wanted = list(datasets) if datasets is not None else list(self._sources)
+
+        records: Dict[str, List[Any]] = {}
+        for dataset in wanted:
+            if dataset not in self._records:
+                continue
+            records[dataset] = self.records_at(dataset, index.positions(entities, dataset))
+
+        return EntityMatch(query=name, entities=entities, records=records, fuzzy=fuzzy)
+
+    def records_at(self, dataset: str, positions: Iterable[int]) -> List[Any]:
+        """Return loaded records of a dataset by index position."""
+        self.ensure_index()
+        dataset_records = self._records.get(dataset, [])
+        return [dataset_records[i] for i in positions]
+
+
+def main() -> None:
+    """Build (or refresh) the persisted entity index from the default clients."""
+    from fedmcp.clients.federal_contracts import FederalContractsClient
+    from fedmcp.clients.grants_contributions import GrantsContributionsClient
+    from fedmcp.clients.lobbying import LobbyingRegistryClient
+    from fedmcp.clients.political_contributions import PoliticalContributionsClient
+
+    resolver = EntityResolver(
+        contracts_client=FederalContractsClient(),
+        grants_client=GrantsContributionsClient(),
+        contributions_client=PoliticalContributionsClient(),
+        lobbying_client=LobbyingRegistryClient(),
+    )
+    index = resolver.ensure_index()
+    print(f"Entity index ready: {len(index.entities):,} entities at {resolver.index_path}")
+
+
+if __name__ == "__main__":
+    main()
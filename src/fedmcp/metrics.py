@@ -0,0 +1,473 @@
+"""In-process instrumentation for the MCP server.
+
+``metrics`` (a ``MetricsRegistry``) records, per tool:
+
+- a latency histogram and call counts by outcome (ok / invalid_input / error /
+  unknown_tool / exception)
+- time spent queueing for a worker thread versus waiting on upstream HTTP
+- upstream requests per host with their latency, rate-limit waits and retries
+- response size
+
+plus dataset loads and cache hits/misses reported by the clients. The tool
+being served is carried in a context variable, which ``asyncio.to_thread``
+copies into worker threads, so ``RateLimitedSession`` attributes each request
+to the tool that issued it without any client changes.
+
+Export with ``metrics.render_prometheus()`` (Prometheus text format) or
+``metrics.snapshot()`` (JSON-ready dict); the server exposes both through the
+``get_server_metrics`` tool.
+
+Setting ``FEDMCP_SLOW_CALL_MS`` enables a sampling profiler: while a tool call
+runs, the stacks of its worker threads are sampled every
+``FEDMCP_PROFILE_INTERVAL_MS`` (default 10), and calls slower than the
+threshold keep their most frequent stacks in ``snapshot()["slow_calls"]``.
+Callables registered with ``add_slow_call_hook`` receive each slow-call profile.
+"""
+from __future__ import annotations
+
+import contextvars
+import functools
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Slow-call profiles kept in memory, and stacks kept per profile
+SLOW_CALLS_KEPT = 20
+TOP_STACKS = 10
+MAX_STACK_DEPTH = 40
+SAMPLER_IDLE_SECONDS = 1.0
+
+# Label used for upstream requests made outside any tool call (e.g. client-owned thread pools)
+UNATTRIBUTED = "-"
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile (None if empty)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            yield _format_bound(bound), seen
+        yield "+Inf", self.count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(self.cumulative()),
+        }
+
+
+@dataclass
+class ToolCall:
+    """One in-flight tool call."""
+
+    tool: str
+    call_id: int
+    started: float = field(default_factory=time.perf_counter)
+    queue_seconds: float = 0.0
+    upstream_seconds: float = 0.0
+    upstream_requests: int = 0
+    threads: Set[int] = field(default_factory=set)
+    samples: Counter = field(default_factory=Counter)
+
+
+_current_call: contextvars.ContextVar[Optional[ToolCall]] = contextvars.ContextVar(
+    "fedmcp_current_call", default=None
+)
+
+
+class MetricsRegistry:
+    """Thread-safe store for server, upstream, dataset and cache metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._active: Dict[int, ToolCall] = {}
+        self._slow_call_hooks: List[Callable[[Dict[str, Any]], None]] = []
+        self._profiler: Optional[_StackSampler] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all recorded metrics (active calls and hooks are kept)."""
+        with self._lock:
+            self.started_at = datetime.now()
+            self.tool_latency: Dict[str, Histogram] = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+            self.tool_calls: Counter = Counter()  # (tool, outcome)
+            self.tool_queue_seconds: Counter = Counter()
+            self.tool_upstream_seconds: Counter = Counter()
+            self.tool_upstream_requests: Counter = Counter()  # (tool, host)
+            self.response_bytes: Dict[str, Histogram] = defaultdict(lambda: Histogram(SIZE_BUCKETS))
+            self.upstream_latency: Dict[str, Histogram] = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+            self.upstream_responses: Counter = Counter()  # (host, status class)
+            self.upstream_rate_wait_seconds: Counter = Counter()
+            self.upstream_retries: Counter = Counter()
+            self.dataset_loads: Dict[str, Histogram] = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+            self.cache_lookups: Counter = Counter()  # (cache, hit|miss)
+            self.slow_calls: Deque[Dict[str, Any]] = deque(maxlen=SLOW_CALLS_KEPT)
+
+    # ------------------------------------------------------------------
+    # Tool calls
+    # ------------------------------------------------------------------
+    def start_call(self, tool: str) -> Tuple[ToolCall, contextvars.Token]:
+        """Begin timing a tool call and make it current for this context."""
+        call = ToolCall(tool=tool, call_id=next(self._ids))
+        with self._lock:
+            self._active[call.call_id] = call
+        if self._profiler:
+            self._profiler.ensure_running()
+        return call, _current_call.set(call)
+
+    def finish_call(
+        self,
+        call: ToolCall,
+        token: contextvars.Token,
+        outcome: str,
+        response_bytes: int = 0,
+    ) -> None:
+        """Record a finished tool call."""
+        _current_call.reset(token)
+        elapsed = time.perf_counter() - call.started
+        if outcome == "unknown_tool":
+            # Client-supplied names would otherwise grow the label set without bound
+            call.tool = "unknown"
+        with self._lock:
+            self._active.pop(call.call_id, None)
+            self.tool_latency[call.tool].observe(elapsed)
+            self.tool_calls[(call.tool, outcome)] += 1
+            self.tool_queue_seconds[call.tool] += call.queue_seconds
+            self.tool_upstream_seconds[call.tool] += call.upstream_seconds
+            self.response_bytes[call.tool].observe(response_bytes)
+        if self._profiler and elapsed * 1000 >= self._profiler.threshold_ms:
+            self._record_slow_call(call, elapsed, outcome)
+
+    def record_queue_wait(self, seconds: float) -> None:
+        """Time a tool's work waited for a worker thread."""
+        call = _current_call.get()
+        if call:
+            with self._lock:
+                call.queue_seconds += seconds
+
+    @contextmanager
+    def bind_thread(self) -> Iterator[None]:
+        """Mark the current worker thread as running the current tool call (for the profiler)."""
+        call = _current_call.get()
+        ident = threading.get_ident()
+        if call:
+            with self._lock:
+                call.threads.add(ident)
+        try:
+            yield
+        finally:
+            if call:
+                with self._lock:
+                    call.threads.discard(ident)
+
+    # ------------------------------------------------------------------
+    # Upstream HTTP, datasets and caches
+    # ------------------------------------------------------------------
+    def record_upstream(
+        self,
+        url: str,
+        seconds: float,
+        status: Optional[int],
+        rate_wait: float = 0.0,
+        retries: int = 0,
+    ) -> None:
+        """Record one upstream request (including its retries) against the current tool."""
+        host = urlsplit(url).hostname or "unknown"
+        status_class = f"{status // 100}xx" if status else "error"
+        call = _current_call.get()
+        tool = call.tool if call else UNATTRIBUTED
+        with self._lock:
+            self.upstream_latency[host].observe(seconds)
+            self.upstream_responses[(host, status_class)] += 1
+            self.upstream_rate_wait_seconds[host] += rate_wait
+            self.upstream_retries[host] += retries
+            self.tool_upstream_requests[(tool, host)] += 1
+            if call:
+                call.upstream_requests += 1
+                call.upstream_seconds += seconds + rate_wait
+
+    def record_dataset_load(self, dataset: str, seconds: float) -> None:
+        """Record a bulk dataset being downloaded/parsed into memory."""
+        with self._lock:
+            self.dataset_loads[dataset].observe(seconds)
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            self.cache_lookups[(cache, "hit" if hit else "miss")] += 1
+
+    # ------------------------------------------------------------------
+    # Slow-call profiling
+    # ------------------------------------------------------------------
+    def enable_profiler(self, threshold_ms: float, interval_ms: float = 10.0) -> None:
+        """Sample worker-thread stacks of running calls; keep profiles of calls over ``threshold_ms``."""
+        self._profiler = _StackSampler(self, threshold_ms, interval_ms)
+
+    def add_slow_call_hook(self, hook: Callable[[Dict[str, Any]], None]) -> None:
+        """Call ``hook(profile)`` for every call slower than the profiler threshold."""
+        self._slow_call_hooks.append(hook)
+
+    def _record_slow_call(self, call: ToolCall, elapsed: float, outcome: str) -> None:
+        with self._lock:
+            samples = call.samples.most_common(TOP_STACKS)
+            total = sum(call.samples.values())
+        profile = {
+            "tool": call.tool,
+            "outcome": outcome,
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "seconds": round(elapsed, 3),
+            "queue_seconds": round(call.queue_seconds, 3),
+            "upstream_seconds": round(call.upstream_seconds, 3),
+            "upstream_requests": call.upstream_requests,
+            "samples": total,
+            "top_stacks": [{"stack": stack, "samples": count} for stack, count in samples],
+        }
+        with self._lock:
+            self.slow_calls.append(profile)
+        hottest = samples[0][0].rsplit(";", 1)[-1] if samples else "no samples"
+        logger.warning(f"Slow tool call {call.tool}: {elapsed:.2f}s (hottest frame: {hottest})")
+        for hook in list(self._slow_call_hooks):
+            try:
+                hook(profile)
+            except Exception:
+                logger.exception("Slow call hook failed")
+
+    def _sample_active_calls(self) -> bool:
+        """Take one stack sample of every bound worker thread; False when no call is running."""
+        frames = sys._current_frames()
+        with self._lock:
+            if not self._active:
+                return False
+            for call in self._active.values():
+                for ident in call.threads:
+                    frame = frames.get(ident)
+                    if frame is not None:
+                        call.samples[_collapse_stack(frame)] += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as a JSON-serializable dict."""
+        with self._lock:
+            tools = {}
+            for tool, histogram in self.tool_latency.items():
+                outcomes = {outcome: n for (name, outcome), n in self.tool_calls.items() if name == tool}
+                tools[tool] = {
+                    "calls": histogram.count,
+                    "outcomes": outcomes,
+                    "errors": sum(n for outcome, n in outcomes.items() if outcome != "ok"),
+                    "latency_seconds": histogram.to_dict(),
+                    "queue_seconds": round(self.tool_queue_seconds[tool], 6),
+                    "upstream_seconds": round(self.tool_upstream_seconds[tool], 6),
+                    "upstream_requests": {
+                        host: n for (name, host), n in self.tool_upstream_requests.items() if name == tool
+                    },
+                    "response_bytes": self.response_bytes[tool].to_dict(),
+                }
+            upstream = {
+                host: {
+                    "latency_seconds": histogram.to_dict(),
+                    "responses": {cls: n for (name, cls), n in self.upstream_responses.items() if name == host},
+                    "rate_limit_wait_seconds": round(self.upstream_rate_wait_seconds[host], 6),
+                    "retries": self.upstream_retries[host],
+                }
+                for host, histogram in self.upstream_latency.items()
+            }
+            caches: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hit": 0, "miss": 0})
+            for (cache, result), n in self.cache_lookups.items():
+                caches[cache][result] = n
+            return {
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "uptime_seconds": round((datetime.now() - self.started_at).total_seconds(), 1),
+                "active_calls": len(self._active),
+                "tools": tools,
+                "upstream": upstream,
+                "datasets": {name: histogram.to_dict() for name, histogram in self.dataset_loads.items()},
+                "caches": dict(caches),
+                "slow_calls": list(self.slow_calls),
+                "profiler": (
+                    {"threshold_ms": self._profiler.threshold_ms, "interval_ms": self._profiler.interval_ms}
+                    if self._profiler else None
+                ),
+            }
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, labels: Dict[str, str], hist: Histogram) -> None:
+            for bound, count in hist.cumulative():
+                lines.append(f"{name}_bucket{_labels({**labels, 'le': bound})} {count}")
+            lines.append(f"{name}_sum{_labels(labels)} {hist.sum:.6f}")
+            lines.append(f"{name}_count{_labels(labels)} {hist.count}")
+
+        with self._lock:
+            family("fedmcp_tool_calls_total", "counter", "Tool calls by outcome")
+            for (tool, outcome), n in sorted(self.tool_calls.items()):
+                lines.append(f"fedmcp_tool_calls_total{_labels({'tool': tool, 'outcome': outcome})} {n}")
+            family("fedmcp_tool_latency_seconds", "histogram", "End-to-end tool call latency")
+            for tool, hist in sorted(self.tool_latency.items()):
+                histogram("fedmcp_tool_latency_seconds", {"tool": tool}, hist)
+            family("fedmcp_tool_queue_seconds_total", "counter", "Time tool work waited for a worker thread")
+            for tool, seconds in sorted(self.tool_queue_seconds.items()):
+                lines.append(f"fedmcp_tool_queue_seconds_total{_labels({'tool': tool})} {seconds:.6f}")
+            family("fedmcp_tool_upstream_seconds_total", "counter", "Time tool calls spent on upstream HTTP")
+            for tool, seconds in sorted(self.tool_upstream_seconds.items()):
+                lines.append(f"fedmcp_tool_upstream_seconds_total{_labels({'tool': tool})} {seconds:.6f}")
+            family("fedmcp_tool_response_bytes", "histogram", "Tool response size")
+            for tool, hist in sorted(self.response_bytes.items()):
+                histogram("fedmcp_tool_response_bytes", {"tool": tool}, hist)
+            family("fedmcp_upstream_requests_total", "counter", "Upstream HTTP requests by tool and host")
+            for (tool, host), n in sorted(self.tool_upstream_requests.items()):
+                lines.append(f"fedmcp_upstream_requests_total{_labels({'tool': tool, 'host': host})} {n}")
+            family("fedmcp_upstream_responses_total", "counter", "Upstream responses by host and status class")
+            for (host, status_class), n in sorted(self.upstream_responses.items()):
+                lines.append(f"fedmcp_upstream_responses_total{_labels({'host': host, 'status': status_class})} {n}")
+            family("fedmcp_upstream_latency_seconds", "histogram", "Upstream request latency including retries")
+            for host, hist in sorted(self.upstream_latency.items()):
+                histogram("fedmcp_upstream_latency_seconds", {"host": host}, hist)
+            family("fedmcp_upstream_rate_limit_wait_seconds_total", "counter", "Time spent waiting on client-side rate limits")
+            for host, seconds in sorted(self.upstream_rate_wait_seconds.items()):
+                lines.append(f"fedmcp_upstream_rate_limit_wait_seconds_total{_labels({'host': host})} {seconds:.6f}")
+            family("fedmcp_upstream_retries_total", "counter", "Upstream retries after 429/5xx responses")
+            for host, n in sorted(self.upstream_retries.items()):
+                lines.append(f"fedmcp_upstream_retries_total{_labels({'host': host})} {n}")
+            family("fedmcp_dataset_load_seconds", "histogram", "Bulk dataset loads into memory")
+            for dataset, hist in sorted(self.dataset_loads.items()):
+                histogram("fedmcp_dataset_load_seconds", {"dataset": dataset}, hist)
+            family("fedmcp_cache_lookups_total", "counter", "Client cache lookups by result")
+            for (cache, result), n in sorted(self.cache_lookups.items()):
+                lines.append(f"fedmcp_cache_lookups_total{_labels({'cache': cache, 'result': result})} {n}")
+            family("fedmcp_active_tool_calls", "gauge", "Tool calls currently running")
+            lines.append(f"fedmcp_active_tool_calls {len(self._active)}")
+        return "\n".join(lines) + "\n"
+
+
+class _StackSampler:
+    """Background thread sampling worker stacks while tool calls are running."""
+
+    def __init__(self, registry: MetricsRegistry, threshold_ms: float, interval_ms: float) -> None:
+        self.registry = registry
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def ensure_running(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="fedmcp-profiler", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        # Exit after a second with no running call; the next start_call restarts the thread
+        idle_since = None
+        while idle_since is None or time.perf_counter() - idle_since < SAMPLER_IDLE_SECONDS:
+            if self.registry._sample_active_calls():
+                idle_since = None
+            elif idle_since is None:
+                idle_since = time.perf_counter()
+            time.sleep(self.interval_ms / 1000)
+
+
+def _collapse_stack(frame) -> str:
+    """Root-first ``file:function`` frames joined with ';' (flamegraph collapsed format)."""
+    parts = []
+    while frame is not None and len(parts) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+def _format_bound(bound: float) -> str:
+    return str(int(bound)) if float(bound).is_integer() else str(bound)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def tracked_load(dataset: str, cached_attr: str) -> Callable:
+    """
+    Decorate a client's ``_load_*`` method to record cache hits and load times.
+
+    A call finding ``self.<cached_attr>`` already populated is a cache hit;
+    otherwise the call is timed as a dataset load.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if getattr(self, cached_attr, None) is not None:
+                metrics.record_cache(dataset, hit=True)
+                return func(self, *args, **kwargs)
+            metrics.record_cache(dataset, hit=False)
+            start = time.perf_counter()
+            result = func(self, *args, **kwargs)
+            metrics.record_dataset_load(dataset, time.perf_counter() - start)
+            return result
+        return wrapper
+    return decorator
+
+
+metrics = MetricsRegistry()
+
+if os.getenv("FEDMCP_SLOW_CALL_MS"):
+    metrics.enable_profiler(
+        float(os.environ["FEDMCP_SLOW_CALL_MS"]),
+        float(os.getenv("FEDMCP_PROFILE_INTERVAL_MS", "10")),
+    )
@@ -2,7 +2,9 @@
 
 import os
 import asyncio
+import json
 import logging
+import time
 from typing import Any, Optional
 from dataclasses import asdict
 from itertools import islice
@@ -36,13 +38,18 @@ from .clients import (
     CanLIIClient,
     RepresentClient,
 )
-from .clients.expenditure import MPExpenditureClient
+from .clients.expenditure import MPExpenditureClient, recent_quarters
 from .clients.petitions import PetitionsClient
 from .clients.lobbying import LobbyingRegistryClient
 from .clients.federal_contracts import FederalContractsClient
 from .clients.political_contributions import PoliticalContributionsClient
 from .clients.grants_contributions import GrantsContributionsClient
 from .clients.departmental_expenses import DepartmentalExpensesClient
+from .entities import EntityResolver
+from .conflicts import ConflictFlagTable, FLAG_DESCRIPTIONS, DEFAULT_TABLE_PATH
+from .ballots import BallotMatrix, DEFAULT_MATRIX_PATH
+from .activity import ActivitySummaries, MPActivitySummary, DEFAULT_SUMMARY_PATH
+from .metrics import metrics as server_metrics
 
 # Initialize clients
 op_client = OpenParliamentClient()
@@ -57,6 +64,108 @@ political_contrib_client = PoliticalContributionsClient()
 grants_client = GrantsContributionsClient()
 dept_expenses_client = DepartmentalExpensesClient()
 
+# Cross-dataset entity resolution (index is built/loaded on first use)
+entity_resolver = EntityResolver(
+    contracts_client=contracts_client,
+    grants_client=grants_client,
+    contributions_client=political_contrib_client,
+    lobbying_client=lobbying_client,
+)
+
+# Precomputed conflict flag table (built offline with `python -m fedmcp.conflicts`)
+conflict_table: Optional[ConflictFlagTable] = None
+conflict_table_mtime: Optional[float] = None
+
+
+def get_conflict_table() -> Optional[ConflictFlagTable]:
+    """Load the conflict flag table, reloading it when the file has been rebuilt."""
+    global conflict_table, conflict_table_mtime
+    try:
+        mtime = DEFAULT_TABLE_PATH.stat().st_mtime
+    except OSError:
+        return conflict_table
+    if conflict_table is not None and mtime == conflict_table_mtime:
+        server_metrics.record_cache("conflict_table", hit=True)
+        return conflict_table
+    server_metrics.record_cache("conflict_table", hit=False)
+    start = time.perf_counter()
+    loaded = ConflictFlagTable.load(DEFAULT_TABLE_PATH)
+    server_metrics.record_dataset_load("conflict_table", time.perf_counter() - start)
+    if loaded is not None:
+        conflict_table, conflict_table_mtime = loaded, mtime
+    return conflict_table
+
+
+# Precomputed MP x vote ballot matrix (built offline with `canadagpt-ingest --ballot-matrix`)
+ballot_matrix: Optional[BallotMatrix] = None
+ballot_matrix_mtime: Optional[float] = None
+
+
+def get_ballot_matrix() -> Optional[BallotMatrix]:
+    """Load the ballot matrix, reloading it when the file has been rebuilt."""
+    global ballot_matrix, ballot_matrix_mtime
+    try:
+        mtime = DEFAULT_MATRIX_PATH.stat().st_mtime
+    except OSError:
+        return ballot_matrix
+    if ballot_matrix is not None and mtime == ballot_matrix_mtime:
+        server_metrics.record_cache("ballot_matrix", hit=True)
+        return ballot_matrix
+    server_metrics.record_cache("ballot_matrix", hit=False)
+    start = time.perf_counter()
+    loaded = BallotMatrix.load()
+    server_metrics.record_dataset_load("ballot_matrix", time.perf_counter() - start)
+    if loaded is not None:
+        ballot_matrix, ballot_matrix_mtime = loaded, mtime
+    return ballot_matrix
+
+
+# Precomputed per-MP activity summaries (built offline with `canadagpt-ingest --activity-summary`)
+activity_summaries: Optional[ActivitySummaries] = None
+activity_summaries_mtime: Optional[float] = None
+
+
+def get_activity_summaries() -> Optional[ActivitySummaries]:
+    """Load the MP activity summaries, reloading them when the file has been rewritten."""
+    global activity_summaries, activity_summaries_mtime
+    try:
+        mtime = DEFAULT_SUMMARY_PATH.stat().st_mtime
+    except OSError:
+        return activity_summaries
+    if activity_summaries is not None and mtime == activity_summaries_mtime:
+        server_metrics.record_cache("activity_summaries", hit=True)
+        return activity_summaries
+    server_metrics.record_cache("activity_summaries", hit=False)
+    start = time.perf_counter()
+    loaded = ActivitySummaries.load()
+    server_metrics.record_dataset_load("activity_summaries", time.perf_counter() - start)
+    if loaded is not None:
+        activity_summaries, activity_summaries_mtime = loaded, mtime
+    return activity_summaries
+
+
+BALLOT_MATRIX_MISSING = (
+    "The ballot matrix has not been built yet. Run `canadagpt-ingest --ballot-matrix` "
+    "(data pipeline, needs the OpenParliament PostgreSQL mirror) to generate it."
+)
+
+
+def ballot_vote_range(matrix: BallotMatrix, arguments: dict) -> tuple[range, str]:
+    """Vote rows selected by the session/date_from/date_to arguments, with a label for output."""
+    session = arguments.get("session")
+    date_from = arguments.get("date_from")
+    date_to = arguments.get("date_to")
+    if not (session or date_from or date_to):
+        session = matrix.latest_session
+    if session and session not in matrix.sessions:
+        recent = ", ".join(matrix.sessions[-5:])
+        raise ValueError(f"unknown session '{session}' (most recent: {recent})")
+    votes = matrix.vote_range(session=session, date_from=date_from, date_to=date_to)
+    label = f"session {session}" if session else "all sessions"
+    if date_from or date_to:
+        label += f", {date_from or 'start'} to {date_to or 'latest'}"
+    return votes, label
+
 # Initialize CanLII client if API key is available
 canlii_api_key = os.getenv("CANLII_API_KEY")
 canlii_client = CanLIIClient(api_key=canlii_api_key) if canlii_api_key else None
@@ -81,10 +190,128 @@ app = Server(
 )
 
 
+# Per-source timeout (seconds) for tools that fan out to several upstream services
+SOURCE_TIMEOUT = float(os.getenv("FEDMCP_SOURCE_TIMEOUT", "30"))
+
+
 # Helper functions
 async def run_sync(func, *args, **kwargs):
-    """Run a synchronous function in a thread pool to avoid blocking the event loop."""
-    return await asyncio.to_thread(func, *args, **kwargs)
+    """Run a synchronous function in a thread pool to avoid blocking the event loop.
+
+    Time spent waiting for a free worker is recorded against the current tool,
+    and the worker is bound to the call so the slow-call profiler can sample it.
+    """
+    submitted = time.perf_counter()
+
+    def run():
+        server_metrics.record_queue_wait(time.perf_counter() - submitted)
+        with server_metrics.bind_thread():
+            return func(*args, **kwargs)
+
+    return await asyncio.to_thread(run)
+
+
+async def run_source(func, *args, timeout: float = SOURCE_TIMEOUT, **kwargs):
+    """Run one upstream lookup of a multi-source tool with a timeout.
+
+    Returns None instead of raising when the source fails or times out, so the
+    caller can report partial results. A timed-out thread keeps running and
+    still warms any client-side cache for the next call.
+    """
+    try:
+        return await asyncio.wait_for(run_sync(func, *args, **kwargs), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"{getattr(func, '__name__', func)} timed out after {timeout:.0f}s")
+    except Exception as e:
+        logger.warning(f"{getattr(func, '__name__', func)} failed: {sanitize_error_message(e)}")
+    return None
+
+
+async def gather_mp_metrics(pol_name: str, politician_url: Optional[str], lobby_limit: int = 50) -> dict:
+    """Fetch bills, petitions, expenses and lobbying for one MP concurrently.
+
+    Shared inputs (the petitions feed, the expense quarter and the lobbying
+    export) are loaded once by their clients and reused by concurrent calls.
+    Each value is None when its source failed or timed out.
+    """
+    def get_bills():
+        return list(op_client.list_bills(sponsor=politician_url, limit=50))
+
+    bills, petitions, expenses, lobby_comms = await asyncio.gather(
+        run_source(get_bills),
+        run_source(petitions_client.get_petitions_by_mp, pol_name, category="All"),
+        run_source(expenditure_client.search_by_name, pol_name, 2026, 1),
+        run_source(
+            lobbying_client.search_communications,
+            official_name=pol_name,
+            date_from="2024-01-01",
+            limit=lobby_limit
+        ),
+    )
+    return {
+        "bills": bills,
+        "petitions": petitions,
+        "expenses": expenses,
+        "lobby_comms": lobby_comms,
+    }
+
+
+def live_activity_metrics(metrics: dict) -> dict:
+    """Scorecard metrics from gather_mp_metrics results, keyed like MPActivitySummary.
+
+    Every metric of a source that failed is None.
+    """
+    bills = metrics["bills"]
+    petitions = metrics["petitions"]
+    expenses = metrics["expenses"]
+    lobby_comms = metrics["lobby_comms"]
+
+    data = {}
+    if bills is None:
+        data["bills_sponsored"] = data["bills_passed"] = None
+    else:
+        data["bills_sponsored"] = len(bills)
+        data["bills_passed"] = sum(1 for b in bills if 'royal assent' in b.get('status', '').lower())
+    if petitions is None:
+        data["petitions_sponsored"] = data["petition_signatures"] = data["petitions_responded"] = None
+    else:
+        data["petitions_sponsored"] = len(petitions)
+        data["petition_signatures"] = sum(p.signature_count for p in petitions)
+        data["petitions_responded"] = sum(1 for p in petitions if p.government_response_date)
+    if expenses is None:
+        data["expenses_period"] = None
+        data["expenses_total"] = data["expenses_travel"] = data["expenses_hospitality"] = None
+    elif expenses:
+        data["expenses_period"] = "FY 2025-2026 Q1"
+        data["expenses_total"] = expenses[0].total
+        data["expenses_travel"] = expenses[0].travel
+        data["expenses_hospitality"] = expenses[0].hospitality
+    else:
+        data["expenses_period"] = None
+        data["expenses_total"] = data["expenses_travel"] = data["expenses_hospitality"] = 0
+    if lobby_comms is None:
+        data["lobby_communications"] = data["lobby_organizations"] = None
+    else:
+        data["lobby_communications"] = len(lobby_comms)
+        data["lobby_organizations"] = len(set(c.client_org_name for c in lobby_comms))
+    return data
+
+
+def summary_activity_metrics(summaries: ActivitySummaries, record: MPActivitySummary) -> dict:
+    """Scorecard metrics from a precomputed summary (petitions None until the feed has been read)."""
+    data = record.to_dict()
+    if not summaries.has_source("petitions"):
+        data["petitions_sponsored"] = data["petition_signatures"] = data["petitions_responded"] = None
+    return data
+
+
+# Scorecard sources and the metric that is None when each is unavailable
+ACTIVITY_SOURCES = [
+    ("bills", "bills_sponsored"),
+    ("petitions", "petitions_sponsored"),
+    ("expenses", "expenses_total"),
+    ("lobbying", "lobby_communications"),
+]
 
 
 def validate_limit(limit: Optional[int], min_val: int = 1, max_val: int = 50, default: int = 10) -> int:
@@ -412,6 +639,39 @@ async def list_tools() -> list[Tool]:
                 "required": ["mode"],
             },
         ),
+        Tool(
+            name="get_mp_expense_trend",
+            description="Quarter-over-quarter MP or caucus expenditure trends from the local proactive-disclosure archive. Shows each quarter's spending and the change from the previous quarter.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "search_term": {
+                        "type": "string",
+                        "description": "MP name (e.g., 'Poilievre') or caucus (e.g., 'Liberal')",
+                    },
+                    "search_type": {
+                        "type": "string",
+                        "description": "'name' for a single MP's series, 'party' for caucus totals",
+                        "enum": ["name", "party"],
+                        "default": "name",
+                    },
+                    "quarters": {
+                        "type": "integer",
+                        "description": "Number of most recent fiscal quarters to include (2-20)",
+                        "default": 8,
+                        "minimum": 2,
+                        "maximum": 20,
+                    },
+                    "category": {
+                        "type": "string",
+                        "description": "Expense category to trend",
+                        "enum": ["salaries", "travel", "hospitality", "contracts", "total"],
+                        "default": "total",
+                    },
+                },
+                "required": ["search_term"],
+            },
+        ),
         Tool(
             name="list_votes",
             description="List recent parliamentary votes from OpenParliament with optional date and result filtering.",
@@ -979,6 +1239,134 @@ async def list_tools() -> list[Tool]:
                 "required": ["politician_url"],
             },
         ),
+        Tool(
+            name="rank_mp_voting_records",
+            description="Rank MPs by how often they break ranks with their party's majority, or by voting participation, across every recorded division in a session or date range. Uses the precomputed ballot matrix, so whole-session rankings return in milliseconds.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Parliamentary session (e.g., '44-1'). Defaults to the latest session unless a date range is given.",
+                    },
+                    "date_from": {
+                        "type": "string",
+                        "description": "Only votes on or after this date (YYYY-MM-DD)",
+                    },
+                    "date_to": {
+                        "type": "string",
+                        "description": "Only votes on or before this date (YYYY-MM-DD)",
+                    },
+                    "party": {
+                        "type": "string",
+                        "description": "Only MPs of this party (short name, e.g., 'Liberal', 'NDP')",
+                    },
+                    "sort_by": {
+                        "type": "string",
+                        "description": "'break_rate' (share of votes against the party majority), 'broke_ranks' (count), 'lowest_participation' or 'highest_participation'",
+                        "enum": ["break_rate", "broke_ranks", "lowest_participation", "highest_participation"],
+                        "default": "break_rate",
+                    },
+                    "min_votes": {
+                        "type": "integer",
+                        "description": "Minimum votes an MP must have been eligible for (default: 20)",
+                        "default": 20,
+                        "minimum": 1,
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Number of MPs to return (1-50)",
+                        "default": 20,
+                        "minimum": 1,
+                        "maximum": 50,
+                    },
+                },
+            },
+        ),
+        Tool(
+            name="get_party_cohesion",
+            description="Party cohesion across every recorded division in a session or date range: average Rice index per party, how many votes saw dissent, and the votes on which parties were most divided. Uses the precomputed ballot matrix.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Parliamentary session (e.g., '44-1'). Defaults to the latest session unless a date range is given.",
+                    },
+                    "date_from": {
+                        "type": "string",
+                        "description": "Only votes on or after this date (YYYY-MM-DD)",
+                    },
+                    "date_to": {
+                        "type": "string",
+                        "description": "Only votes on or before this date (YYYY-MM-DD)",
+                    },
+                    "party": {
+                        "type": "string",
+                        "description": "Only list divided votes for this party (short name)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Number of most-divided votes to list (1-50)",
+                        "default": 10,
+                        "minimum": 1,
+                        "maximum": 50,
+                    },
+                },
+            },
+        ),
+        Tool(
+            name="find_similar_voting_mps",
+            description="Find which MPs vote most (or least) alike, by agreement on the votes both cast. Give a politician to rank everyone against them, or omit it for the most similar pairs overall. Uses the precomputed ballot matrix.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "politician": {
+                        "type": "string",
+                        "description": "Politician URL, slug or name (e.g., '/politicians/pierre-poilievre/'). Omit to rank all pairs.",
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Parliamentary session (e.g., '44-1'). Defaults to the latest session unless a date range is given.",
+                    },
+                    "date_from": {
+                        "type": "string",
+                        "description": "Only votes on or after this date (YYYY-MM-DD)",
+                    },
+                    "date_to": {
+                        "type": "string",
+                        "description": "Only votes on or before this date (YYYY-MM-DD)",
+                    },
+                    "party": {
+                        "type": "string",
+                        "description": "Only compare MPs of this party (short name)",
+                    },
+                    "cross_party": {
+                        "type": "boolean",
+                        "description": "Only pairs of MPs from different parties",
+                        "default": False,
+                    },
+                    "least_similar": {
+                        "type": "boolean",
+                        "description": "Rank by lowest agreement instead",
+                        "default": False,
+                    },
+                    "min_shared_votes": {
+                        "type": "integer",
+                        "description": "Minimum votes both MPs cast (default: 20)",
+                        "default": 20,
+                        "minimum": 1,
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Number of pairs to return (1-50)",
+                        "default": 20,
+                        "minimum": 1,
+                        "maximum": 50,
+                    },
+                },
+            },
+        ),
         Tool(
             name="search_topic_across_sources",
             description="Search for a topic or keyword across all data sources (debates, bills, Hansard, votes). Provides comprehensive coverage of parliamentary discussion on a topic.",
@@ -1585,13 +1973,24 @@ async def list_tools() -> list[Tool]:
             ),
             Tool(
                 name="conflict_of_interest_check",
-                description="Cross-reference political contributions, lobbying activities, and government contracts/grants to identify potential conflicts of interest or concerning patterns.",
+                description="Cross-reference political contributions, lobbying activities, and government contracts/grants to identify potential conflicts of interest or concerning patterns. Use mode='top_flagged' to list the highest-ranked entities from the precomputed flag table.",
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "entity_name": {
                             "type": "string",
-                            "description": "Name of person or organization to check",
+                            "description": "Name of person or organization to check (required for mode='entity')",
+                        },
+                        "mode": {
+                            "type": "string",
+                            "description": "'entity' checks one entity; 'top_flagged' returns the top flagged entities from the precomputed table",
+                            "enum": ["entity", "top_flagged"],
+                            "default": "entity",
+                        },
+                        "flag": {
+                            "type": "string",
+                            "description": "Only return entities with this flag (mode='top_flagged')",
+                            "enum": list(FLAG_DESCRIPTIONS),
                         },
                         "year": {
                             "type": "integer",
@@ -1602,17 +2001,71 @@ async def list_tools() -> list[Tool]:
                             "description": "Minimum contract/grant amount to flag (default: $100,000)",
                             "default": 100000,
                         },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Number of flagged entities to return (mode='top_flagged')",
+                            "default": 20,
+                            "minimum": 1,
+                            "maximum": 50,
+                        },
                     },
-                    "required": ["entity_name"],
                 },
             ),
         ])
 
+    tools.append(
+        Tool(
+            name="get_server_metrics",
+            description="Diagnostics: per-tool latency, error counts, upstream requests per host, dataset loads, cache hit rates and slow-call profiles recorded since the server started.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "description": "'json' for a snapshot, 'prometheus' for the Prometheus text format",
+                        "enum": ["json", "prometheus"],
+                        "default": "json",
+                    },
+                },
+            },
+        )
+    )
+
     return tools
 
 
+# Response prefixes the tool handlers use for rejected input and failures
+INVALID_INPUT_PREFIXES = ("Invalid input", "Invalid search", "Missing required", "Please provide")
+
+
+def classify_outcome(result: Optional[list[TextContent]]) -> str:
+    """Outcome label for a tool response (handlers report failures as text)."""
+    if not result:
+        return "exception"
+    text = getattr(result[0], "text", "") or ""
+    if text.startswith(INVALID_INPUT_PREFIXES):
+        return "invalid_input"
+    if text.startswith("Unknown tool"):
+        return "unknown_tool"
+    if text.startswith("Error"):
+        return "error"
+    return "ok"
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Handle tool calls, recording per-tool metrics around the dispatch."""
+    call, token = server_metrics.start_call(name)
+    result = None
+    try:
+        result = await dispatch_tool(name, arguments)
+        return result
+    finally:
+        size = sum(len(getattr(content, "text", "").encode("utf-8")) for content in result or [])
+        server_metrics.finish_call(call, token, classify_outcome(result), size)
+
+
+async def dispatch_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls.
 
     Note: All client operations are synchronous (using requests library),
@@ -2387,6 +2840,63 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 logger.exception(f"Unexpected error in search_mp_expenses")
                 return [TextContent(type="text", text=f"Error searching MP expenses: {sanitize_error_message(e)}")]
 
+        elif name == "get_mp_expense_trend":
+            try:
+                search_term = arguments["search_term"]
+                search_type = arguments.get("search_type", "name")
+                num_quarters = validate_limit(arguments.get("quarters"), min_val=2, max_val=20, default=8)
+                category = arguments.get("category", "total")
+                if category not in ("salaries", "travel", "hospitality", "contracts", "total"):
+                    raise ValueError(f"Invalid category: {category}")
+                logger.info(f"get_mp_expense_trend called with search_term='{search_term}', search_type={search_type}, quarters={num_quarters}")
+
+                quarters = recent_quarters(num_quarters)
+                if search_type == "name":
+                    rows = await run_sync(expenditure_client.get_mp_series, search_term, quarters)
+                    series: dict = {}
+                    for exp in rows:
+                        series.setdefault(exp.name, []).append(
+                            (exp.fiscal_year, exp.quarter, exp.total if category == "total" else getattr(exp, category))
+                        )
+                elif search_type == "party":
+                    rows = await run_sync(expenditure_client.get_caucus_series, search_term, quarters)
+                    series = {
+                        search_term: [(r['fiscal_year'], r['quarter'], r[category]) for r in rows]
+                    } if rows else {}
+                else:
+                    return [TextContent(type="text", text=f"Invalid search_type: {search_type}")]
+
+                if not series:
+                    return [TextContent(type="text", text=f"No expenditure data found for '{search_term}' ({search_type}) in the last {num_quarters} quarters.")]
+
+                output = f"Expenditure Trend - {category.title()}\n"
+                output += f"Search: '{search_term}' ({search_type})\n\n"
+                for label, points in list(series.items())[:10]:
+                    output += f"{label}\n"
+                    previous = None
+                    for fiscal_year, quarter, amount in points:
+                        line = f"  FY {fiscal_year-1}-{fiscal_year} Q{quarter}: ${amount:>14,.2f}"
+                        if previous is not None:
+                            change = amount - previous
+                            pct = f" ({change / previous * 100:+.1f}%)" if previous else ""
+                            line += f"  {'+' if change >= 0 else '-'}${abs(change):,.2f}{pct}"
+                        output += line + "\n"
+                        previous = amount
+                    if len(points) > 1:
+                        output += f"  Average per quarter: ${sum(p[2] for p in points) / len(points):,.2f}\n"
+                    output += "\n"
+                if len(series) > 10:
+                    output += f"... and {len(series) - 10} more matching MPs\n"
+
+                return [TextContent(type="text", text=output)]
+
+            except ValueError as e:
+                logger.warning(f"Invalid input for get_mp_expense_trend: {e}")
+                return [TextContent(type="text", text=f"Invalid input: {str(e)}")]
+            except Exception as e:
+                logger.exception(f"Unexpected error in get_mp_expense_trend")
+                return [TextContent(type="text", text=f"Error getting expense trend: {sanitize_error_message(e)}")]
+
         elif name == "list_votes":
             try:
                 limit = validate_limit(arguments.get("limit"), default=10, max_val=100)
@@ -2407,7 +2917,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
                 # Run synchronous API call in thread pool to avoid blocking
                 # Use islice to properly limit results (limit param only controls page size, not total)
-                votes = await asyncio.to_thread(lambda: list(islice(op_client.list_votes(**params), limit)))
+                votes = await run_sync(lambda: list(islice(op_client.list_votes(**params), limit)))
 
                 return [TextContent(
                     type="text",
@@ -2433,7 +2943,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
                 # Run synchronous API call in thread pool to avoid blocking
                 # Use islice to properly limit results
-                committees = await asyncio.to_thread(lambda: list(islice(op_client.list_committees(), limit)))
+                committees = await run_sync(lambda: list(islice(op_client.list_committees(), limit)))
 
                 return [TextContent(
                     type="text",
@@ -3216,7 +3726,14 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 if not politician_url and not mp_name:
                     return [TextContent(type="text", text="Please provide either mp_name or politician_url.")]
 
-                if not politician_url:
+                # Precomputed summary first; live sources only for MPs it does not cover
+                summaries = get_activity_summaries()
+                record = summaries.find(politician_url or mp_name) if summaries else None
+
+                if record:
+                    pol_name = record.name
+                    data = summary_activity_metrics(summaries, record)
+                elif not politician_url:
                     def search_pol():
                         return list(op_client.search_politician(mp_name))
                     politicians = await run_sync(search_pol)
@@ -3230,62 +3747,59 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 else:
                     pol_name = mp_name or "MP"
 
-                # Gather data from multiple sources
+                if not record:
+                    # Gather data from all sources concurrently
+                    data = live_activity_metrics(await gather_mp_metrics(pol_name, politician_url, lobby_limit=10))
+                unavailable = [label for label, key in ACTIVITY_SOURCES if data[key] is None]
+
                 output = f"MP Activity Scorecard: {pol_name}\n"
                 output += "=" * 60 + "\n\n"
 
                 # Bills sponsored
-                def get_bills():
-                    return list(op_client.list_bills(sponsor=politician_url, limit=50))
-                bills = await run_sync(get_bills)
                 output += f"📜 Legislative Activity:\n"
-                output += f"  Bills Sponsored: {len(bills)}\n"
-                if bills:
-                    passed = sum(1 for b in bills if 'royal assent' in b.get('status', '').lower())
-                    output += f"  Passed into Law: {passed}\n"
+                if data["bills_sponsored"] is None:
+                    output += f"  Bills Sponsored: unavailable\n"
+                else:
+                    output += f"  Bills Sponsored: {data['bills_sponsored']}\n"
+                    if data["bills_sponsored"]:
+                        output += f"  Passed into Law: {data['bills_passed']}\n"
                 output += "\n"
 
                 # Petitions
-                petitions = await run_sync(petitions_client.get_petitions_by_mp, pol_name, category="All")
                 output += f"✉️  Citizen Engagement:\n"
-                output += f"  Petitions Sponsored: {len(petitions)}\n"
-                if petitions:
-                    total_sigs = sum(p.signature_count for p in petitions)
-                    with_response = sum(1 for p in petitions if p.government_response_date)
-                    output += f"  Total Signatures Represented: {total_sigs:,}\n"
-                    output += f"  With Government Response: {with_response}\n"
+                if data["petitions_sponsored"] is None:
+                    output += f"  Petitions Sponsored: unavailable\n"
+                else:
+                    output += f"  Petitions Sponsored: {data['petitions_sponsored']}\n"
+                    if data["petitions_sponsored"]:
+                        output += f"  Total Signatures Represented: {data['petition_signatures']:,}\n"
+                        output += f"  With Government Response: {data['petitions_responded']}\n"
                 output += "\n"
 
                 # Expenses
-                try:
-                    expenses = await run_sync(expenditure_client.search_by_name, pol_name, 2026, 1)
-                    if expenses:
-                        exp = expenses[0]
-                        output += f"💰 Expenditures (FY 2025-2026 Q1):\n"
-                        output += f"  Total: ${exp.total:,.2f}\n"
-                        output += f"  Travel: ${exp.travel:,.2f}\n"
-                        output += f"  Hospitality: ${exp.hospitality:,.2f}\n"
-                        output += "\n"
-                except:
-                    pass
+                if data["expenses_period"]:
+                    output += f"💰 Expenditures ({data['expenses_period']}):\n"
+                    output += f"  Total: ${data['expenses_total']:,.2f}\n"
+                    output += f"  Travel: ${data['expenses_travel']:,.2f}\n"
+                    output += f"  Hospitality: ${data['expenses_hospitality']:,.2f}\n"
+                    output += "\n"
 
                 # Lobbying connections (if any)
-                lobby_comms = await run_sync(
-                    lobbying_client.search_communications,
-                    official_name=pol_name,
-                    date_from="2024-01-01",
-                    limit=10
-                )
-                if lobby_comms:
+                if data["lobby_communications"]:
                     output += f"🤝 Lobbying Meetings (since 2024):\n"
-                    output += f"  Communications Recorded: {len(lobby_comms)}\n"
-                    unique_clients = len(set(c.client_org_name for c in lobby_comms))
-                    output += f"  Unique Organizations: {unique_clients}\n"
+                    output += f"  Communications Recorded: {data['lobby_communications']}\n"
+                    output += f"  Unique Organizations: {data['lobby_organizations']}\n"
                     output += "\n"
 
                 output += f"Activity Summary:\n"
-                activity_score = len(bills) + len(petitions) + (len(lobby_comms) if lobby_comms else 0)
+                activity_score = sum(
+                    data[key] or 0 for key in ("bills_sponsored", "petitions_sponsored", "lobby_communications")
+                )
                 output += f"  Combined Activity Score: {activity_score}\n"
+                if unavailable:
+                    output += f"\n⚠️  Partial results - unavailable sources: {', '.join(unavailable)}\n"
+                if record:
+                    output += f"\nPrecomputed summary, updated {record.updated_at[:16].replace('T', ' ')} UTC\n"
 
                 return [TextContent(type="text", text=output)]
 
@@ -3389,6 +3903,19 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                     for client, count in sorted(client_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
                         if client and client not in ["", "null"]:
                             output += f"    • {client}: {count} meetings\n"
+                            # Cross-reference funding only when the entity index is already
+                            # loaded, so this tool never triggers the large dataset downloads
+                            if entity_resolver.is_ready:
+                                match = await run_sync(
+                                    entity_resolver.search, client, ["contracts", "grants", "contributions"]
+                                )
+                                contract_total = sum(c.contract_value for c in match.records.get("contracts", []))
+                                grant_total = sum(g.agreement_value for g in match.records.get("grants", []))
+                                contrib_total = sum(c.contribution_amount for c in match.records.get("contributions", []))
+                                if contract_total or grant_total:
+                                    output += f"      ⚠️  Also received ${contract_total:,.0f} in contracts and ${grant_total:,.0f} in grants\n"
+                                if contrib_total:
+                                    output += f"      ⚠️  Political contributions: ${contrib_total:,.0f}\n"
                     output += "\n"
 
                 # Check expenses
@@ -3527,81 +4054,84 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 output = f"MP Performance Comparison\n"
                 output += "=" * 60 + "\n\n"
 
-                mp_data = []
-
-                for mp_name in mp_names:
-                    # Search for politician
-                    def search_pol():
-                        return list(op_client.search_politician(mp_name))
-                    politicians = await run_sync(search_pol)
-
+                # Precomputed summaries first; live sources only for MPs they do not cover
+                summaries = get_activity_summaries()
+                records = [summaries.find(mp_name) if summaries else None for mp_name in mp_names]
+                live_names = [mp_name for mp_name, record in zip(mp_names, records) if record is None]
+
+                # Resolve the remaining MPs concurrently
+                def search_pol(query):
+                    return list(op_client.search_politician(query))
+                searches = await asyncio.gather(*(run_source(search_pol, mp_name) for mp_name in live_names))
+
+                found = {}
+                for mp_name, politicians in zip(live_names, searches):
+                    if politicians is None:
+                        # The search itself failed or timed out (see run_source)
+                        output += f"⚠️  {mp_name}: MP search source unavailable, try again later\n\n"
+                        continue
                     if not politicians:
                         output += f"⚠️  {mp_name}: Not found\n\n"
                         continue
-
                     politician = politicians[0]
-                    pol_name = politician.get('name', mp_name)
-                    politician_url = politician.get('url')
+                    found[mp_name] = (politician.get('name', mp_name), politician.get('url'))
 
-                    # Gather metrics
-                    data = {"name": pol_name}
+                # Fan out every remaining MP's source lookups at once
+                all_metrics = await asyncio.gather(*(
+                    gather_mp_metrics(pol_name, politician_url) for pol_name, politician_url in found.values()
+                ))
+                live_metrics = dict(zip(found, all_metrics))
 
-                    # Bills
-                    def get_bills():
-                        return list(op_client.list_bills(sponsor=politician_url, limit=50))
-                    bills = await run_sync(get_bills)
-                    data["bills_total"] = len(bills)
-                    data["bills_passed"] = sum(1 for b in bills if 'royal assent' in b.get('status', '').lower())
-
-                    # Petitions
-                    petitions = await run_sync(petitions_client.get_petitions_by_mp, pol_name, category="All")
-                    data["petitions_total"] = len(petitions)
-                    data["petitions_signatures"] = sum(p.signature_count for p in petitions)
-
-                    # Expenses
-                    try:
-                        expenses = await run_sync(expenditure_client.search_by_name, pol_name, 2026, 1)
-                        if expenses:
-                            data["expenses_total"] = expenses[0].total
-                        else:
-                            data["expenses_total"] = 0
-                    except:
-                        data["expenses_total"] = 0
-
-                    # Lobbying meetings
-                    lobby_comms = await run_sync(
-                        lobbying_client.search_communications,
-                        official_name=pol_name,
-                        date_from="2024-01-01",
-                        limit=50
-                    )
-                    data["lobby_meetings"] = len(lobby_comms) if lobby_comms else 0
+                mp_data = []
+                unavailable = []
+                for mp_name, record in zip(mp_names, records):
+                    if record:
+                        data = summary_activity_metrics(summaries, record)
+                    elif mp_name in found:
+                        data = live_activity_metrics(live_metrics[mp_name])
+                        data["name"] = found[mp_name][0]
+                    else:
+                        continue
 
+                    missing = [label for label, key in ACTIVITY_SOURCES if data[key] is None]
+                    if missing:
+                        unavailable.append(f"{data['name']} ({', '.join(missing)})")
                     mp_data.append(data)
 
+                def cell(value, fmt="", prefix=""):
+                    return "n/a".rjust(15) if value is None else f"{prefix}{value:{fmt}}".rjust(15)
+
                 # Format comparison table
                 if mp_data:
                     output += f"{'Metric':<30} " + " ".join([f"{d['name'][:15]:>15}" for d in mp_data]) + "\n"
                     output += "-" * 80 + "\n"
 
                     # Bills
-                    output += f"{'Bills Sponsored':<30} " + " ".join([f"{d['bills_total']:>15}" for d in mp_data]) + "\n"
-                    output += f"{'Bills Passed':<30} " + " ".join([f"{d['bills_passed']:>15}" for d in mp_data]) + "\n"
-                    if any(d['bills_total'] > 0 for d in mp_data):
+                    output += f"{'Bills Sponsored':<30} " + " ".join([cell(d['bills_sponsored']) for d in mp_data]) + "\n"
+                    output += f"{'Bills Passed':<30} " + " ".join([cell(d['bills_passed']) for d in mp_data]) + "\n"
+                    if any(d['bills_sponsored'] for d in mp_data):
                         output += f"{'Success Rate':<30} " + " ".join([
-                            f"{(d['bills_passed']/d['bills_total']*100 if d['bills_total'] > 0 else 0):.1f}%".rjust(15)
+                            cell(None) if d['bills_sponsored'] is None
+                            else f"{(d['bills_passed']/d['bills_sponsored']*100 if d['bills_sponsored'] > 0 else 0):.1f}%".rjust(15)
                             for d in mp_data
                         ]) + "\n"
 
                     # Petitions
-                    output += f"{'Petitions Sponsored':<30} " + " ".join([f"{d['petitions_total']:>15}" for d in mp_data]) + "\n"
-                    output += f"{'Total Signatures':<30} " + " ".join([f"{d['petitions_signatures']:>15,}" for d in mp_data]) + "\n"
+                    output += f"{'Petitions Sponsored':<30} " + " ".join([cell(d['petitions_sponsored']) for d in mp_data]) + "\n"
+                    output += f"{'Total Signatures':<30} " + " ".join([cell(d['petition_signatures'], ",") for d in mp_data]) + "\n"
 
-                    # Expenses
-                    output += f"{'Expenses (Q1 2025-26)':<30} " + " ".join([f"${d['expenses_total']:>14,.0f}" for d in mp_data]) + "\n"
+                    # Expenses (summaries hold each MP's latest reported quarter)
+                    periods = {d['expenses_period'] for d in mp_data if d['expenses_period']}
+                    expenses_label = f"Expenses ({periods.pop()})" if len(periods) == 1 else "Expenses (latest quarter)"
+                    output += f"{expenses_label:<30} " + " ".join([cell(d['expenses_total'], ",.0f", "$") for d in mp_data]) + "\n"
 
                     # Lobbying
-                    output += f"{'Lobby Meetings (2024+)':<30} " + " ".join([f"{d['lobby_meetings']:>15}" for d in mp_data]) + "\n"
+                    output += f"{'Lobby Meetings (2024+)':<30} " + " ".join([cell(d['lobby_communications']) for d in mp_data]) + "\n"
+
+                if unavailable:
+                    output += f"\n⚠️  Partial results - unavailable sources: {'; '.join(unavailable)}\n"
+                if any(records):
+                    output += f"\nPrecomputed summaries as of {summaries.generated_at[:16].replace('T', ' ')} UTC\n"
 
                 return [TextContent(type="text", text=output)]
 
@@ -4136,6 +4666,141 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 logger.exception(f"Unexpected error in analyze_mp_voting_participation")
                 return [TextContent(type="text", text=f"Error analyzing voting participation: {sanitize_error_message(e)}")]
 
+        elif name == "rank_mp_voting_records":
+            try:
+                matrix = await run_sync(get_ballot_matrix)
+                if matrix is None:
+                    return [TextContent(type="text", text=BALLOT_MATRIX_MISSING)]
+                sort_by = arguments.get("sort_by", "break_rate")
+                if sort_by not in ("break_rate", "broke_ranks", "lowest_participation", "highest_participation"):
+                    return [TextContent(type="text", text=f"Invalid input: unknown sort_by '{sort_by}'")]
+                min_votes = max(1, int(arguments.get("min_votes") or 20))
+                limit = validate_limit(arguments.get("limit"), default=20, max_val=50)
+                party = arguments.get("party")
+                votes, label = ballot_vote_range(matrix, arguments)
+                logger.info(f"rank_mp_voting_records called for {label}, party={party}, sort_by={sort_by}")
+
+                records = await run_sync(matrix.mp_records, votes, party)
+                records = [r for r in records if r.eligible >= min_votes]
+                if sort_by == "break_rate":
+                    records.sort(key=lambda r: (-(r.break_rate or 0), -r.broke_ranks))
+                elif sort_by == "broke_ranks":
+                    records.sort(key=lambda r: (-r.broke_ranks, -(r.break_rate or 0)))
+                else:
+                    records.sort(
+                        key=lambda r: (r.participation_rate or 0, -r.eligible),
+                        reverse=sort_by == "highest_participation",
+                    )
+
+                title = "Party-Line Breakers" if sort_by in ("break_rate", "broke_ranks") else "Voting Participation"
+                output = f"# {title}: {label}" + (f" ({party})" if party else "") + "\n\n"
+                output += f"{len(votes):,} recorded divisions; {len(records):,} MPs eligible for at least {min_votes} of them.\n\n"
+                if not records:
+                    output += "No MPs match these filters.\n"
+                for i, record in enumerate(records[:limit], 1):
+                    output += f"{i}. **{record.mp.name}** ({record.party or 'Unknown'})\n"
+                    if record.break_rate is not None:
+                        output += f"   - Broke ranks: {record.broke_ranks} of {record.party_line_votes} party-line votes ({record.break_rate:.1%})\n"
+                    if record.participation_rate is not None:
+                        output += f"   - Participation: voted in {record.cast} of {record.eligible} divisions ({record.participation_rate:.1%})"
+                        output += f"; paired {record.paired}, absent {record.absent}\n"
+                    output += f"   - Profile: /politicians/{record.mp.slug}/\n"
+                output += f"\n_Ballot matrix generated {matrix.generated_at}._\n"
+                return [TextContent(type="text", text=output)]
+            except ValueError as e:
+                logger.warning(f"Invalid input for rank_mp_voting_records: {e}")
+                return [TextContent(type="text", text=f"Invalid input: {str(e)}")]
+            except Exception as e:
+                logger.exception(f"Unexpected error in rank_mp_voting_records")
+                return [TextContent(type="text", text=f"Error ranking voting records: {sanitize_error_message(e)}")]
+
+        elif name == "get_party_cohesion":
+            try:
+                matrix = await run_sync(get_ballot_matrix)
+                if matrix is None:
+                    return [TextContent(type="text", text=BALLOT_MATRIX_MISSING)]
+                limit = validate_limit(arguments.get("limit"), default=10, max_val=50)
+                party = arguments.get("party")
+                votes, label = ballot_vote_range(matrix, arguments)
+                logger.info(f"get_party_cohesion called for {label}, party={party}")
+
+                summary = await run_sync(matrix.party_cohesion, votes)
+                divided = await run_sync(matrix.least_cohesive_votes, votes, party, limit)
+
+                output = f"# Party Cohesion: {label}\n\n"
+                output += f"{len(votes):,} recorded divisions. The Rice index is |yea - nay| / (yea + nay) within a party: 1.00 means the party voted as one.\n\n"
+                if not summary:
+                    output += "No party votes in this range.\n"
+                for party_name, entry in sorted(summary.items(), key=lambda item: -item[1]["votes"]):
+                    output += f"## {party_name}\n"
+                    output += f"- Average Rice index: {entry['average_rice_index']:.3f} over {entry['votes']:,} votes\n"
+                    output += f"- Unanimous votes: {entry['unanimous_votes']:,}\n"
+                    output += f"- Votes with dissent: {entry['votes_with_dissent']:,} ({entry['dissenting_ballots']:,} dissenting ballots)\n\n"
+
+                if divided:
+                    output += "## Most Divided Votes" + (f" ({party})" if party else "") + "\n\n"
+                    for vote, tally in divided:
+                        description = vote.description[:100] + ("..." if len(vote.description) > 100 else "")
+                        output += f"- **{vote.url}** ({vote.date}) {tally.party}: {tally.yea} yea / {tally.nay} nay (Rice {tally.rice_index:.2f})\n"
+                        if description:
+                            output += f"  {description}\n"
+                output += f"\n_Ballot matrix generated {matrix.generated_at}._\n"
+                return [TextContent(type="text", text=output)]
+            except ValueError as e:
+                logger.warning(f"Invalid input for get_party_cohesion: {e}")
+                return [TextContent(type="text", text=f"Invalid input: {str(e)}")]
+            except Exception as e:
+                logger.exception(f"Unexpected error in get_party_cohesion")
+                return [TextContent(type="text", text=f"Error analyzing party cohesion: {sanitize_error_message(e)}")]
+
+        elif name == "find_similar_voting_mps":
+            try:
+                matrix = await run_sync(get_ballot_matrix)
+                if matrix is None:
+                    return [TextContent(type="text", text=BALLOT_MATRIX_MISSING)]
+                limit = validate_limit(arguments.get("limit"), default=20, max_val=50)
+                min_shared = max(1, int(arguments.get("min_shared_votes") or 20))
+                politician = arguments.get("politician")
+                party = arguments.get("party")
+                cross_party = bool(arguments.get("cross_party", False))
+                least = bool(arguments.get("least_similar", False))
+                votes, label = ballot_vote_range(matrix, arguments)
+                logger.info(f"find_similar_voting_mps called for {label}, politician={politician}, party={party}")
+
+                column = None
+                if politician:
+                    column = matrix.find_mp(politician)
+                    if column is None:
+                        return [TextContent(type="text", text=f"Invalid input: no MP matching '{politician}' in the ballot matrix")]
+
+                pairs = await run_sync(
+                    matrix.similar_pairs, votes,
+                    mp=column, party=party, cross_party=cross_party,
+                    min_shared=min_shared, limit=limit, least=least,
+                )
+
+                ranking = "Least" if least else "Most"
+                if column is not None:
+                    output = f"# MPs Voting {ranking} Like {matrix.mps[column].name}: {label}\n\n"
+                else:
+                    output = f"# {ranking} Similar Voting Pairs: {label}\n\n"
+                output += f"Agreement = share of the votes both MPs cast (yea or nay) where they voted the same way; pairs need {min_shared}+ shared votes.\n\n"
+                if not pairs:
+                    output += "No pairs match these filters.\n"
+                for i, pair in enumerate(pairs, 1):
+                    first = f"{pair.first.name} ({pair.first_party or 'Unknown'})"
+                    second = f"{pair.second.name} ({pair.second_party or 'Unknown'})"
+                    subject = second if column is not None else f"{first} & {second}"
+                    output += f"{i}. **{subject}**: {pair.similarity:.1%} agreement on {pair.shared_votes:,} shared votes\n"
+                output += f"\n_Ballot matrix generated {matrix.generated_at}._\n"
+                return [TextContent(type="text", text=output)]
+            except ValueError as e:
+                logger.warning(f"Invalid input for find_similar_voting_mps: {e}")
+                return [TextContent(type="text", text=f"Invalid input: {str(e)}")]
+            except Exception as e:
+                logger.exception(f"Unexpected error in find_similar_voting_mps")
+                return [TextContent(type="text", text=f"Error comparing voting records: {sanitize_error_message(e)}")]
+
         elif name == "search_topic_across_sources":
             try:
                 topic = arguments["topic"]
@@ -4847,14 +5512,26 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 output = f"# Money Flow Analysis: {entity_name}\n\n"
                 found_any = False
 
-                # Search political contributions
+                # One entity-index lookup resolves the name across every dataset
+                match = await run_sync(entity_resolver.search, entity_name)
+                if match.entities:
+                    variants = match.entity_names[:5]
+                    output += f"Matched {len(match.entities)} entity name(s): {'; '.join(variants)}"
+                    if len(match.entities) > len(variants):
+                        output += f" (+{len(match.entities) - len(variants)} more)"
+                    if match.fuzzy:
+                        output += " [approximate match]"
+                    output += "\n\n"
+
+                # Political contributions
                 if include_contributions:
-                    contributions = await run_sync(
-                        political_contrib_client.search_contributions,
-                        contributor_name=entity_name,
-                        year=year,
-                        limit=20
-                    )
+                    contributions = [
+                        c for c in match.records.get("contributions", [])
+                        if year is None or c.contribution_year == year
+                    ]
+                    contributions = sorted(
+                        contributions, key=lambda x: (x.contribution_amount, x.contribution_date), reverse=True
+                    )[:20]
                     if contributions:
                         found_any = True
                         total = sum(c.contribution_amount for c in contributions)
@@ -4867,19 +5544,14 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                             output += f"... and {len(contributions) - 10} more\n"
                         output += "\n"
 
-                # Search lobbying activities
+                # Lobbying activities
                 if include_lobbying:
-                    registrations = await run_sync(
-                        lobbying_client.search_registrations,
-                        client_name=entity_name,
-                        active_only=False,
-                        limit=20
-                    )
-                    communications = await run_sync(
-                        lobbying_client.search_communications,
-                        client_name=entity_name,
-                        limit=20
-                    )
+                    registrations = match.records.get("lobbying_registrations", [])[:20]
+                    communications = sorted(
+                        match.records.get("lobbying_communications", []),
+                        key=lambda x: x.comm_date,
+                        reverse=True
+                    )[:20]
                     if registrations or communications:
                         found_any = True
                         output += f"## Lobbying Activities\n"
@@ -4898,14 +5570,13 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                                     output += f"  With: {', '.join(comm.institutions[:2])}\n"
                         output += "\n"
 
-                # Search government contracts
+                # Government contracts
                 if include_contracts:
-                    contracts = await run_sync(
-                        contracts_client.search_contracts,
-                        vendor_name=entity_name,
-                        year=year,
-                        limit=20
-                    )
+                    contracts = [
+                        c for c in match.records.get("contracts", [])
+                        if year is None or c.contract_year == year
+                    ]
+                    contracts = sorted(contracts, key=lambda x: x.contract_value, reverse=True)[:20]
                     if contracts:
                         found_any = True
                         total = sum(c.contract_value for c in contracts)
@@ -4918,14 +5589,13 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                             output += f"... and {len(contracts) - 10} more\n"
                         output += "\n"
 
-                # Search federal grants
+                # Federal grants
                 if include_grants:
-                    grants = await run_sync(
-                        grants_client.search_grants,
-                        recipient_name=entity_name,
-                        year=year,
-                        limit=20
-                    )
+                    grants = [
+                        g for g in match.records.get("grants", [])
+                        if year is None or g.agreement_year == year
+                    ]
+                    grants = sorted(grants, key=lambda x: x.agreement_value, reverse=True)[:20]
                     if grants:
                         found_any = True
                         total = sum(g.agreement_value for g in grants)
@@ -5102,41 +5772,75 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
         elif name == "conflict_of_interest_check":
             try:
-                entity_name = arguments["entity_name"]
+                mode = arguments.get("mode", "entity")
+                entity_name = arguments.get("entity_name")
                 year = arguments.get("year")
                 threshold_amount = arguments.get("threshold_amount", 100000)
+
+                if mode == "top_flagged":
+                    limit = validate_limit(arguments.get("limit"), default=20, max_val=50)
+                    flag = arguments.get("flag")
+                    logger.info(f"conflict_of_interest_check called in top_flagged mode, flag={flag}, limit={limit}")
+
+                    table = await run_sync(get_conflict_table)
+                    if table is None:
+                        return [TextContent(type="text", text="The precomputed conflict flag table has not been built yet. Run `python -m fedmcp.conflicts` to generate it.")]
+
+                    rows = table.top(limit=limit, flag=flag)
+                    output = f"# Top Flagged Entities\n\n"
+                    output += f"Flag table generated {table.generated_at} ({len(table):,} flagged entities, high-value threshold ${table.threshold_amount:,.0f})\n\n"
+                    if not rows:
+                        output += "No entities match this flag.\n"
+                    for row in rows:
+                        output += f"{row.rank}. **{row.name}** (score {row.score:.1f})\n"
+                        output += f"   - Contracts: ${row.contract_total:,.2f} ({row.contract_count}) | Grants: ${row.grant_total:,.2f} ({row.grant_count})\n"
+                        output += f"   - Contributions: ${row.contribution_total:,.2f} ({row.contribution_count}) | Lobbying: {row.lobbying_registrations} registration(s), {row.lobbying_communications} communication(s)\n"
+                        if row.min_days_lobbying_to_award is not None:
+                            output += f"   - Closest award after lobbying: {row.min_days_lobbying_to_award} day(s); {row.awards_after_lobbying} award(s) within {table.window_days} days\n"
+                        output += f"   - Flags: {', '.join(FLAG_DESCRIPTIONS.get(f, f) for f in row.flags)}\n\n"
+                    return [TextContent(type="text", text=output)]
+
+                if not entity_name:
+                    return [TextContent(type="text", text="Please provide entity_name (or use mode='top_flagged').")]
                 logger.info(f"conflict_of_interest_check called for entity='{entity_name}', threshold=${threshold_amount}")
 
                 output = f"# Conflict of Interest Analysis: {entity_name}\n\n"
                 flags = []
 
-                # Get all financial activities
-                contributions = await run_sync(
-                    political_contrib_client.search_contributions,
-                    contributor_name=entity_name,
-                    year=year,
-                    limit=50
-                )
-                contracts = await run_sync(
-                    contracts_client.search_contracts,
-                    vendor_name=entity_name,
-                    year=year,
-                    min_value=threshold_amount,
-                    limit=50
-                )
-                grants = await run_sync(
-                    grants_client.search_grants,
-                    recipient_name=entity_name,
-                    year=year,
-                    min_value=threshold_amount,
-                    limit=50
-                )
-                lobbying_regs = await run_sync(
-                    lobbying_client.search_registrations,
-                    client_name=entity_name,
-                    active_only=False,
-                    limit=50
+                # Get all financial activities with one entity-index lookup
+                match = await run_sync(
+                    entity_resolver.search,
+                    entity_name,
+                    ["contributions", "contracts", "grants", "lobbying_registrations"]
                 )
+                if match.entities:
+                    output += f"Resolved to: {'; '.join(match.entity_names[:5])}"
+                    if match.fuzzy:
+                        output += " [approximate match]"
+                    output += "\n\n"
+
+                contributions = sorted(
+                    [c for c in match.records["contributions"] if year is None or c.contribution_year == year],
+                    key=lambda x: (x.contribution_amount, x.contribution_date),
+                    reverse=True
+                )[:50]
+                contracts = sorted(
+                    [
+                        c for c in match.records["contracts"]
+                        if c.contract_value >= threshold_amount and (year is None or c.contract_year == year)
+                    ],
+                    key=lambda x: x.contract_value,
+                    reverse=True
+                )[:50]
+                grants = sorted(
+                    [
+                        g for g in match.records["grants"]
+                        if g.agreement_value >= threshold_amount and (year is None or g.agreement_year == year)
+                    ],
+                    key=lambda x: x.agreement_value,
+                    reverse=True
+                )[:50]
+                lobbying_regs = match.records["lobbying_registrations"][:50]
 
                 # Analyze for conflicts
                 if contributions and (contracts or grants):
@@ -5163,6 +5867,18 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 else:
                     output += "✅ No obvious conflicts of interest detected.\n\n"
 
+                # Ranking and lobbying/award timing from the precomputed flag table
+                table = await run_sync(get_conflict_table)
+                if table is not None:
+                    ranked = [row for row in (table.get(e.entity_id) for e in match.entities) if row]
+                    for row in sorted(ranked, key=lambda r: r.rank)[:3]:
+                        output += f"## Batch Scan Ranking: {row.name}\n\n"
+                        output += f"- Rank #{row.rank:,} of {len(table):,} flagged entities (score {row.score:.1f})\n"
+                        if row.min_days_lobbying_to_award is not None:
+                            output += f"- Closest high-value award after lobbying: {row.min_days_lobbying_to_award} day(s)\n"
+                            output += f"- Awards within {table.window_days} days of lobbying: {row.awards_after_lobbying}\n"
+                        output += "\n"
+
                 # Detail high-value transactions
                 if contracts:
                     output += f"## High-Value Contracts (>${threshold_amount:,.0f})\n\n"
@@ -5179,6 +5895,14 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 logger.exception(f"Error in conflict_of_interest_check")
                 return [TextContent(type="text", text=f"Error checking conflicts: {sanitize_error_message(e)}")]
 
+        elif name == "get_server_metrics":
+            output_format = arguments.get("format", "json")
+            if output_format == "prometheus":
+                return [TextContent(type="text", text=server_metrics.render_prometheus())]
+            if output_format != "json":
+                return [TextContent(type="text", text="Invalid input: format must be 'json' or 'prometheus'")]
+            return [TextContent(type="text", text=json.dumps(server_metrics.snapshot(), indent=2))]
+
         else:
             logger.warning(f"Unknown tool requested: {name}")
             return [TextContent(type="text", text=f"Unknown tool: {name}")]